@@ -129,6 +129,7 @@ from .optimizer import (
     OptimizationConfig,
     DesignOptimizer,
     create_beam_optimizer,
+    create_frame_sizing_optimizer,
     get_ai_optimization_suggestions,
 )
 
@@ -219,6 +220,7 @@ __all__ = [
     "OptimizationConfig",
     "DesignOptimizer",
     "create_beam_optimizer",
+    "create_frame_sizing_optimizer",
     "get_ai_optimization_suggestions",
     # Results Interpretation (NEW)
     "ResultsInterpreter",
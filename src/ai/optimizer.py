@@ -13,10 +13,18 @@ Date: 2026-01-22
 """
 
 from dataclasses import dataclass
-from typing import List, Dict, Optional, Tuple, Callable, Any
+from typing import List, Dict, Optional, Tuple, Callable, Any, TYPE_CHECKING
 from enum import Enum
 import math
 
+import numpy as np
+
+if TYPE_CHECKING:
+    from src.fem.reanalysis import LowRankReanalysis
+
+# Analytic gradient of a design function: {var_name: d/dx}
+GradientFunc = Callable[[Dict[str, float]], Dict[str, float]]
+
 
 class OptimizationObjective(Enum):
     """Optimization objective type."""
@@ -82,11 +90,13 @@ class OptimizationConstraint:
         constraint_func: Function that returns constraint value (g(x) <= 0)
         tolerance: Constraint tolerance
         weight: Penalty weight for constraint violation
+        gradient_func: Optional analytic gradient of g(x)
     """
     name: str
     constraint_func: Callable[[Dict[str, float]], float]
     tolerance: float = 1e-6
     weight: float = 1000.0  # High penalty for violations
+    gradient_func: Optional[GradientFunc] = None
     
     def is_satisfied(self, design_vars: Dict[str, float]) -> bool:
         """Check if constraint is satisfied."""
@@ -100,6 +110,16 @@ class OptimizationConstraint:
         """Calculate penalty for constraint violation."""
         violation = max(0.0, self.evaluate(design_vars))
         return self.weight * violation ** 2
+    
+    def penalty_gradient(self, design_vars: Dict[str, float]) -> Dict[str, float]:
+        """Analytic gradient of the penalty (requires gradient_func)."""
+        violation = max(0.0, self.evaluate(design_vars))
+        if violation == 0.0:
+            return {}
+        return {
+            name: 2.0 * self.weight * violation * value
+            for name, value in self.gradient_func(design_vars).items()
+        }
 
 
 @dataclass
@@ -116,6 +136,8 @@ class OptimizationResult:
         convergence_history: Objective value history
         improvement_percent: Improvement over initial design (%)
         ai_suggestions: AI-generated optimization suggestions
+        sensitivities: Analytic gradients at the optimum, {"objective" or
+            constraint name: {var_name: d/dx}}, when available
     """
     status: OptimizationStatus
     optimal_design: Dict[str, float]
@@ -125,6 +147,7 @@ class OptimizationResult:
     convergence_history: List[float]
     improvement_percent: float
     ai_suggestions: Optional[str] = None
+    sensitivities: Optional[Dict[str, Dict[str, float]]] = None
 
 
 @dataclass
@@ -174,6 +197,7 @@ class DesignOptimizer:
         self.design_vars: List[DesignVariable] = []
         self.constraints: List[OptimizationConstraint] = []
         self.objective_func: Optional[Callable[[Dict[str, float]], float]] = None
+        self.objective_gradient: Optional[GradientFunc] = None
         self.convergence_history: List[float] = []
     
     def add_design_variable(
@@ -211,7 +235,8 @@ class DesignOptimizer:
         name: str,
         constraint_func: Callable[[Dict[str, float]], float],
         tolerance: float = 1e-6,
-        weight: float = 1000.0
+        weight: float = 1000.0,
+        gradient_func: Optional[GradientFunc] = None
     ) -> None:
         """
         Add optimization constraint.
@@ -221,22 +246,32 @@ class DesignOptimizer:
             constraint_func: Function that returns g(x) <= 0
             tolerance: Constraint tolerance
             weight: Penalty weight
+            gradient_func: Optional analytic gradient {var_name: dg/dx}
         """
         self.constraints.append(
-            OptimizationConstraint(name, constraint_func, tolerance, weight)
+            OptimizationConstraint(name, constraint_func, tolerance, weight, gradient_func)
         )
     
     def set_objective(
         self,
-        objective_func: Callable[[Dict[str, float]], float]
+        objective_func: Callable[[Dict[str, float]], float],
+        gradient_func: Optional[GradientFunc] = None
     ) -> None:
         """
         Set objective function to minimize.
         
         Args:
             objective_func: Objective function f(x)
+            gradient_func: Optional analytic gradient {var_name: df/dx}
         """
         self.objective_func = objective_func
+        self.objective_gradient = gradient_func
+    
+    def has_analytic_gradient(self) -> bool:
+        """True if the objective and every constraint provide gradients."""
+        return self.objective_gradient is not None and all(
+            constraint.gradient_func is not None for constraint in self.constraints
+        )
     
     def _get_design_dict(self) -> Dict[str, float]:
         """Get current design variables as dictionary."""
@@ -264,13 +299,37 @@ class DesignOptimizer:
         
         return obj
     
+    def _analytic_gradient(self, design_dict: Dict[str, float]) -> Dict[str, float]:
+        """
+        Gradient of the penalized objective from analytic sensitivities.
+        
+        Args:
+            design_dict: Design variables
+            
+        Returns:
+            Gradient dict {var_name: df/dx}
+        """
+        gradient = {var.name: 0.0 for var in self.design_vars}
+        for name, value in self.objective_gradient(design_dict).items():
+            if name in gradient:
+                gradient[name] += value
+        for constraint in self.constraints:
+            for name, value in constraint.penalty_gradient(design_dict).items():
+                if name in gradient:
+                    gradient[name] += value
+        return gradient
+    
     def _estimate_gradient(self) -> Dict[str, float]:
         """
-        Estimate gradient using finite differences.
+        Estimate gradient, analytically when sensitivities are available,
+        otherwise using finite differences.
         
         Returns:
             Gradient dict {var_name: df/dx}
         """
+        if self.has_analytic_gradient():
+            return self._analytic_gradient(self._get_design_dict())
+        
         gradient = {}
         base_design = self._get_design_dict()
         base_obj = self._evaluate_objective(base_design)
@@ -399,6 +458,12 @@ class DesignOptimizer:
         # Calculate improvement
         improvement = 100 * (initial_obj - final_obj) / max(abs(initial_obj), 1e-8)
         
+        sensitivities = None
+        if self.has_analytic_gradient():
+            sensitivities = {"objective": self.objective_gradient(optimal_design)}
+            for constraint in self.constraints:
+                sensitivities[constraint.name] = constraint.gradient_func(optimal_design)
+        
         return OptimizationResult(
             status=status,
             optimal_design=optimal_design,
@@ -406,7 +471,8 @@ class DesignOptimizer:
             iterations=len(self.convergence_history) - 1,
             constraint_violations=violations,
             convergence_history=self.convergence_history,
-            improvement_percent=improvement
+            improvement_percent=improvement,
+            sensitivities=sensitivities
         )
 
 
@@ -471,6 +537,143 @@ def create_beam_optimizer(
     return optimizer
 
 
+def create_frame_sizing_optimizer(
+    reanalysis: "LowRankReanalysis",
+    group_sizes: Dict[str, Tuple[float, float]],
+    fcu: float,
+    max_displacement: float,
+    depth_bounds: Tuple[float, float] = (300.0, 1500.0),
+    step_size: float = 50.0,
+    utilization_limit: Optional[float] = None,
+    width_bounds: Tuple[float, float] = (200.0, 1500.0),
+) -> DesignOptimizer:
+    """
+    Create an FEM-in-the-loop optimizer for member widths and depths of element groups.
+    
+    Each design is solved with ``reanalysis`` (see src.fem.reanalysis), and
+    constraint gradients come from adjoint sensitivities
+    (src.fem.sensitivity), so one iteration costs one low-rank solve plus
+    one adjoint solve per constraint, independent of the number of groups.
+    
+    Args:
+        reanalysis: LowRankReanalysis over the element groups to size
+        group_sizes: Initial (width, depth) in mm per group name
+        fcu: Concrete cube strength of the groups (MPa)
+        max_displacement: Translation limit over all load cases (m)
+        depth_bounds: Depth bounds (mm)
+        step_size: Width and depth discretization (mm)
+        utilization_limit: Optional limit on the flexural utilization
+            M / (K' fcu b d²) of each group's governing moment
+        width_bounds: Width bounds (mm)
+        
+    Returns:
+        Configured optimizer with variables "<group>_width" and "<group>_depth"
+    """
+    from src.fem.sensitivity import SectionSensitivity, displacement_response
+    
+    sensitivity = SectionSensitivity(reanalysis, group_sizes)
+    node_tags = reanalysis.solver.system.node_tags
+    lengths = {name: float(reanalysis.group_lengths(name).sum()) for name in group_sizes}
+    size_vars = [f"{name}_{size}" for name in group_sizes for size in ("width", "depth")]
+    utilization_cache: Dict[str, Any] = {}
+    
+    def sync(design: Dict[str, float]) -> None:
+        sizes = {
+            name: (design[f"{name}_width"], design[f"{name}_depth"])
+            for name in group_sizes
+        }
+        if sizes != sensitivity.sizes:
+            sensitivity.set_sizes(sizes)
+            utilization_cache.clear()
+    
+    def governing_translation(design: Dict[str, float]):
+        sync(design)
+        u = sensitivity.displacements().reshape(len(node_tags), 6, -1)[:, :3, :]
+        node, dof, _ = np.unravel_index(np.argmax(np.abs(u)), u.shape)
+        return displacement_response(int(node_tags[node]), int(dof))
+    
+    def displacement_constraint(design: Dict[str, float]) -> float:
+        sync(design)
+        u = sensitivity.displacements().reshape(len(node_tags), 6, -1)[:, :3, :]
+        return float(np.abs(u).max(initial=0.0)) / max_displacement - 1.0
+    
+    def displacement_gradient(design: Dict[str, float]) -> Dict[str, float]:
+        result = sensitivity.gradients([governing_translation(design)])[0]
+        gradient = result.governing_gradient()
+        return {name: gradient[name] / max_displacement for name in size_vars}
+    
+    optimizer = DesignOptimizer()
+    for name, (width, depth) in group_sizes.items():
+        optimizer.add_design_variable(
+            f"{name}_width", width, width_bounds[0], width_bounds[1], step_size=step_size
+        )
+        optimizer.add_design_variable(
+            f"{name}_depth", depth, depth_bounds[0], depth_bounds[1], step_size=step_size
+        )
+    
+    def volume(design: Dict[str, float]) -> float:
+        """Concrete volume of the sized groups (m³)."""
+        return sum(
+            design[f"{name}_width"] * design[f"{name}_depth"] / 1e6 * lengths[name]
+            for name in group_sizes
+        )
+    
+    def volume_gradient(design: Dict[str, float]) -> Dict[str, float]:
+        gradient = {}
+        for name in group_sizes:
+            gradient[f"{name}_width"] = design[f"{name}_depth"] / 1e6 * lengths[name]
+            gradient[f"{name}_depth"] = design[f"{name}_width"] / 1e6 * lengths[name]
+        return gradient
+    
+    optimizer.set_objective(volume, volume_gradient)
+    optimizer.add_constraint(
+        "displacement_limit", displacement_constraint, gradient_func=displacement_gradient
+    )
+    
+    if utilization_limit is not None:
+        for group in group_sizes:
+            def utilization(design: Dict[str, float], group: str = group):
+                sync(design)
+                if group not in utilization_cache:
+                    utilization_cache[group] = sensitivity.flexural_utilization(group, fcu)
+                return utilization_cache[group]
+            
+            optimizer.add_constraint(
+                f"utilization_{group}",
+                lambda design, utilization=utilization: (
+                    float(np.abs(utilization(design).values).max()) / utilization_limit - 1.0
+                ),
+                gradient_func=lambda design, utilization=utilization: {
+                    name: value / utilization_limit
+                    for name, value in utilization(design).governing_gradient().items()
+                    if name in size_vars
+                },
+            )
+    return optimizer
+
+
+def _format_sensitivities(result: OptimizationResult) -> str:
+    """
+    Format analytic sensitivities at the optimum, one line per response.
+    
+    Args:
+        result: Optimization result
+        
+    Returns:
+        Formatted lines, or "" when the result has no sensitivities
+    """
+    if not result.sensitivities:
+        return ""
+    lines = []
+    for response, gradient in result.sensitivities.items():
+        if not gradient:
+            continue
+        ranked = sorted(gradient.items(), key=lambda item: abs(item[1]), reverse=True)
+        terms = ", ".join(f"d/d{var} = {value:.3e}" for var, value in ranked)
+        lines.append(f"- {response}: {terms}")
+    return "\n".join(lines) + "\n" if lines else ""
+
+
 def get_ai_optimization_suggestions(
     result: OptimizationResult,
     project_context: Optional[str] = None,
@@ -505,6 +708,10 @@ Optimal Design:
     if result.constraint_violations:
         summary += f"\nConstraint Violations: {', '.join(result.constraint_violations)}\n"
     
+    sensitivity_text = _format_sensitivities(result)
+    if sensitivity_text:
+        summary += f"\nDesign Sensitivities (per mm):\n{sensitivity_text}"
+    
     # AI-guided suggestions (if enabled)
     if use_ai:
         try:
@@ -530,6 +737,8 @@ Convergence History:
 - Initial Objective: {result.convergence_history[0]:.4f}
 - Final Objective: {result.convergence_history[-1]:.4f}
 """
+            if sensitivity_text:
+                opt_context += f"\nDesign Sensitivities (per mm):\n{sensitivity_text}"
             
             if project_context:
                 opt_context += f"\n\nProject Context:\n{project_context}"
@@ -590,6 +799,16 @@ def _get_rule_based_suggestions(result: OptimizationResult) -> str:
     if result.constraint_violations:
         suggestions += f"- Address constraint violations: {', '.join(result.constraint_violations)}\n"
     
+    # Sensitivity-based recommendations: the variable that moves each
+    # constraint most per mm is the cheapest lever to adjust
+    for name, gradient in (result.sensitivities or {}).items():
+        if name == "objective" or not gradient:
+            continue
+        var, value = max(gradient.items(), key=lambda item: abs(item[1]))
+        if value != 0.0:
+            direction = "increase" if value < 0 else "decrease"
+            suggestions += f"- {name} is most sensitive to {var} ({direction} to relieve it)\n"
+    
     # General recommendations
     suggestions += "- Verify constructability and material availability\n"
     suggestions += "- Check code compliance per HK Code 2013\n"
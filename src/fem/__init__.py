@@ -35,7 +35,9 @@ from src.fem.model_builder import (
     BeamSegment,
     trim_beam_segment_against_polygon,
 )
+from src.fem.result_tables import ElementForceTable, NodeResultTable
 from src.fem.solver import FEMSolver, AnalysisResult, analyze_model
+from src.fem.sparse_solver import SparseFEMSolver
 
 __all__ = [
     "ISectionCoreWall",
@@ -60,6 +62,9 @@ __all__ = [
     "FEMSolver",
     "AnalysisResult",
     "analyze_model",
+    "SparseFEMSolver",
+    "NodeResultTable",
+    "ElementForceTable",
     "create_floor_rigid_diaphragms",
     "apply_lateral_loads_to_diaphragms",
     "build_fem_model",
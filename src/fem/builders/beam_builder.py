@@ -27,7 +27,7 @@ from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 from src.core.constants import CONCRETE_DENSITY
 from src.core.data_models import CoreWallConfig, CoreWallGeometry, GeometryInput, ProjectData
 from src.fem.beam_trimmer import BeamConnectionType
-from src.fem.model_builder import BeamSegment, trim_beam_segment_against_polygon
+from src.fem.model_builder import BeamSegment, _interior_points, trim_beam_segment_against_polygon
 from src.fem.coupling_beam import CouplingBeamGenerator
 from src.fem.fem_engine import Element, ElementType, FEMModel, UniformLoad
 from src.fem.materials import ConcreteProperties, get_elastic_beam_section
@@ -82,6 +82,24 @@ class BeamBuilder:
         self.coupling_section_tag: Optional[int] = None
         self.beam_sizes: Optional[Dict[str, Tuple[float, float]]] = None
         self.beam_concrete: Optional[ConcreteProperties] = None
+        # Trimmed plan segments, shared across floors
+        self._segment_cache: Dict[Tuple, List[BeamSegment]] = {}
+
+    def _trim(
+        self,
+        start: Tuple[float, float],
+        end: Tuple[float, float],
+        polygon: Optional[List[Tuple[float, float]]],
+    ) -> List[BeamSegment]:
+        """Trim a plan beam line (mm) at the core, once per plan when layouts are shared."""
+        if not self.options.share_plan_layouts:
+            return trim_beam_segment_against_polygon(start=start, end=end, polygon=polygon)
+        key = (start, end, tuple(polygon) if polygon else None)
+        segments = self._segment_cache.get(key)
+        if segments is None:
+            segments = trim_beam_segment_against_polygon(start=start, end=end, polygon=polygon)
+            self._segment_cache[key] = segments
+        return segments
 
     def setup_materials_and_sections(
         self,
@@ -144,20 +162,11 @@ class BeamBuilder:
         floor_level = int(round(start_z / self.geometry.story_height))
         
         # Create 3 intermediate nodes + reuse start/end (total 5 nodes)
-        node_tags = [start_node]
-        
-        for i in range(1, NUM_SUBDIVISIONS):
-            t = i / NUM_SUBDIVISIONS  # 1/4, 2/4, 3/4
-            inter_x = start_x + t * (end_x - start_x)
-            inter_y = start_y + t * (end_y - start_y)
-            inter_z = start_z + t * (end_z - start_z)  # Same elevation for horizontal beams
-            
-            inter_node = self.registry.get_or_create(
-                inter_x, inter_y, inter_z, floor_level=floor_level
-            )
-            node_tags.append(inter_node)
-        
-        node_tags.append(end_node)
+        inter_nodes = self.registry.get_or_create_many(
+            _interior_points((start_x, start_y, start_z), (end_x, end_y, end_z), NUM_SUBDIVISIONS),
+            floor_levels=floor_level,
+        )
+        node_tags = [start_node, *inter_nodes.tolist(), end_node]
         
         # Track parent beam ID for logical grouping
         parent_beam_id = self.element_tag
@@ -317,7 +326,7 @@ class BeamBuilder:
                     x_end = (ix + 1) * self.geometry.bay_x
                     
                     # Trim beam at core wall if needed
-                    segments = trim_beam_segment_against_polygon(
+                    segments = self._trim(
                         start=(x_start * 1000.0, y * 1000.0),
                         end=(x_end * 1000.0, y * 1000.0),
                         polygon=core_outline_global if self.options.trim_beams_at_core else None,
@@ -346,7 +355,7 @@ class BeamBuilder:
                     y_end = (iy + 1) * self.geometry.bay_y
                     
                     # Trim beam at core wall if needed
-                    segments = trim_beam_segment_against_polygon(
+                    segments = self._trim(
                         start=(x * 1000.0, y_start * 1000.0),
                         end=(x * 1000.0, y_end * 1000.0),
                         polygon=core_outline_global if self.options.trim_beams_at_core else None,
@@ -413,7 +422,7 @@ class BeamBuilder:
                             y_start = iy * self.geometry.bay_y
                             y_end = (iy + 1) * self.geometry.bay_y
                             
-                            segments = trim_beam_segment_against_polygon(
+                            segments = self._trim(
                                 start=(x * 1000.0, y_start * 1000.0),
                                 end=(x * 1000.0, y_end * 1000.0),
                                 polygon=core_outline_global if self.options.trim_beams_at_core else None,
@@ -443,7 +452,7 @@ class BeamBuilder:
                             x_start = ix * self.geometry.bay_x
                             x_end = (ix + 1) * self.geometry.bay_x
                             
-                            segments = trim_beam_segment_against_polygon(
+                            segments = self._trim(
                                 start=(x_start * 1000.0, y * 1000.0),
                                 end=(x_end * 1000.0, y * 1000.0),
                                 polygon=core_outline_global if self.options.trim_beams_at_core else None,
@@ -11,6 +11,7 @@ from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple
 
 from src.core.data_models import GeometryInput, ProjectData
 from src.fem.fem_engine import Element, ElementType, FEMModel
+from src.fem.model_builder import _interior_points
 
 if TYPE_CHECKING:
     from src.fem.model_builder import ModelBuilderOptions, NodeRegistry
@@ -104,16 +105,13 @@ class ColumnBuilder:
                     node_tags = [start_node]
                     
                     if registry:
-                        for i in range(1, NUM_SUBDIVISIONS):
-                            t = i / NUM_SUBDIVISIONS  # 1/4 to 3/4
-                            inter_x = start_x + t * (end_x - start_x)
-                            inter_y = start_y + t * (end_y - start_y)
-                            inter_z = start_z + t * (end_z - start_z)  # Z is vertical for columns
-                            
-                            inter_node = registry.get_or_create(
-                                inter_x, inter_y, inter_z, floor_level=level
-                            )
-                            node_tags.append(inter_node)
+                        inter_nodes = registry.get_or_create_many(
+                            _interior_points(
+                                (start_x, start_y, start_z), (end_x, end_y, end_z), NUM_SUBDIVISIONS
+                            ),
+                            floor_levels=level,
+                        )
+                        node_tags.extend(inter_nodes.tolist())
                     
                     node_tags.append(end_node)
                     
@@ -12,6 +12,7 @@ from src.core.data_models import CoreWallGeometry, GeometryInput, ProjectData
 from src.core.constants import CONCRETE_DENSITY
 from src.fem.fem_engine import Element, ElementType, FEMModel, SurfaceLoad
 from src.fem.materials import ConcreteProperties, get_elastic_membrane_plate_section
+from src.fem.model_builder import _slab_base_node_tag
 if TYPE_CHECKING:
     from src.fem.model_builder import ModelBuilderOptions
 from src.fem.slab_element import SlabMeshGenerator, SlabPanel, SlabOpening
@@ -128,8 +129,9 @@ class SlabBuilder:
 
         # Create slab generator
         slab_generator = SlabMeshGenerator(
-            base_node_tag=60000,
+            base_node_tag=_slab_base_node_tag(self.geometry.floors),
             base_element_tag=60000,
+            reuse_layouts=self.options.share_plan_layouts,
         )
         shell_mesh_type = _normalize_shell_mesh_type(self.options.shell_mesh_type)
 
@@ -0,0 +1,264 @@
+"""
+Bounded cache of combined load-combination results.
+
+Combined ``AnalysisResult`` objects are kept in least-recently-used order
+under a byte budget, keyed by a content fingerprint of the solved load
+cases plus the combination factors. Combinations the user is likely to
+look at next can be combined ahead of time on a background thread.
+"""
+
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import CancelledError, Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Mapping, Optional, Tuple
+
+import numpy as np
+
+from src.fem.combination_processor import combine_results
+from src.fem.load_combinations import LoadCombinationDefinition
+from src.fem.solver import AnalysisResult
+from src.fem.wind_case_synthesizer import SynthesizedWindCases
+
+logger = logging.getLogger(__name__)
+
+# Default memory budget for cached combinations (bytes)
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+CacheKey = Tuple[str, str, Tuple[Tuple[str, float], ...]]
+
+
+@dataclass
+class CacheStats:
+    """Counters for a ``CombinedResultsCache``.
+
+    Attributes:
+        hits: Lookups served from the cache (including finished prefetches)
+        misses: Lookups that had to combine on the calling thread
+        evictions: Entries dropped to stay within the byte budget
+        prefetched: Combinations computed in the background
+    """
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    prefetched: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+def results_fingerprint(results: Mapping[str, AnalysisResult]) -> str:
+    """Content hash of solved load-case results.
+
+    Hashes case names, success flags, the displacement, reaction and
+    frame-force arrays and the non-frame (shell) element forces. Lazily synthesized W1-W24 cases are represented by
+    their Wx/Wy/Wtz components and are not materialized.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    if isinstance(results, SynthesizedWindCases):
+        digest.update(b"W1-W24\0")
+        solved: Mapping[str, AnalysisResult] = {**results.components, **results.base_results}
+    else:
+        solved = results
+
+    for name in sorted(solved):
+        result = solved[name]
+        digest.update(name.encode("utf-8") + b"\0")
+        if result is None or not result.success:
+            digest.update(b"-")
+            continue
+        for table in (
+            result.node_displacements,
+            result.node_reactions,
+            result.element_forces.frames,
+        ):
+            digest.update(table.tags.tobytes())
+            digest.update(table.array.tobytes())
+        _update_other_forces(digest, result.element_forces.other)
+    return digest.hexdigest()
+
+
+def _update_other_forces(digest: Any, other: Mapping[int, Mapping[str, float]]) -> None:
+    """Feed non-frame element force dicts into ``digest`` in a stable order."""
+    digest.update(len(other).to_bytes(8, "little"))
+    for tag in sorted(other):
+        forces = other[tag]
+        names = sorted(forces)
+        digest.update(int(tag).to_bytes(8, "little", signed=True))
+        digest.update("\0".join(names).encode("utf-8") + b"\0")
+        digest.update(np.array([forces[name] for name in names], dtype=np.float64).tobytes())
+
+
+def estimate_result_nbytes(result: AnalysisResult) -> int:
+    """Approximate memory held by the result tables of ``result``."""
+    return (
+        result.node_displacements.nbytes
+        + result.node_reactions.nbytes
+        + result.element_forces.nbytes
+    )
+
+
+class CombinedResultsCache:
+    """LRU cache of ``combine_results`` output under a byte budget.
+
+    Entries are keyed by (results fingerprint, combination name, load
+    factors), so re-running the analysis or editing a combination never
+    returns a stale result. The fingerprint of the last results mapping is
+    memoized by identity; replace the mapping rather than mutating it in
+    place when results change.
+
+    Attributes:
+        max_bytes: Byte budget for cached results
+        stats: Hit/miss/eviction counters
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES, prefetch: bool = True):
+        if max_bytes <= 0:
+            raise ValueError("max_bytes must be positive")
+        self.max_bytes = max_bytes
+        self.stats = CacheStats()
+        self._prefetch_enabled = prefetch
+        self._entries: "OrderedDict[CacheKey, Tuple[AnalysisResult, int]]" = OrderedDict()
+        self._pending: Dict[CacheKey, Future] = {}
+        self._current_bytes = 0
+        self._lock = threading.RLock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._closed = False
+        self._fingerprint_source: Any = None
+        self._fingerprint = ""
+
+    @property
+    def current_bytes(self) -> int:
+        return self._current_bytes
+
+    def fingerprint(self, results: Mapping[str, AnalysisResult]) -> str:
+        with self._lock:
+            if results is not self._fingerprint_source:
+                self._fingerprint = results_fingerprint(results)
+                self._fingerprint_source = results
+            return self._fingerprint
+
+    def key_for(self,
+                results: Mapping[str, AnalysisResult],
+                combination: LoadCombinationDefinition) -> CacheKey:
+        factors = tuple(sorted(
+            (getattr(component, "value", str(component)), float(factor))
+            for component, factor in combination.load_factors.items()
+        ))
+        return self.fingerprint(results), combination.name, factors
+
+    def get(self,
+            results: Mapping[str, AnalysisResult],
+            combination: LoadCombinationDefinition) -> AnalysisResult:
+        """Return the combined result, combining and caching it on a miss."""
+        key = self.key_for(results, combination)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.stats.hits += 1
+                return entry[0]
+            pending = self._pending.get(key)
+
+        if pending is not None:
+            try:
+                result = pending.result()
+            except CancelledError:
+                pass  # prefetch cancelled by close(); combine here instead
+            else:
+                with self._lock:
+                    self.stats.hits += 1
+                return result
+
+        with self._lock:
+            self.stats.misses += 1
+        logger.debug("Combination cache miss for %s", combination.name)
+        result = combine_results(results, combination)
+        self._store(key, result)
+        return result
+
+    def prefetch(self,
+                 results: Mapping[str, AnalysisResult],
+                 combinations: Iterable[LoadCombinationDefinition]) -> None:
+        """Combine ``combinations`` on a background thread if not cached."""
+        if not self._prefetch_enabled or self._closed:
+            return
+        for combination in combinations:
+            key = self.key_for(results, combination)
+            with self._lock:
+                if self._closed:
+                    return
+                if key in self._entries or key in self._pending:
+                    continue
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=1, thread_name_prefix="combination-cache"
+                    )
+                self._pending[key] = self._executor.submit(
+                    self._compute, key, results, combination
+                )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._current_bytes = 0
+            self._fingerprint_source = None
+            self._fingerprint = ""
+
+    def close(self) -> None:
+        """Stop background prefetching and release the worker thread.
+
+        Queued prefetches are cancelled and a running one is not waited for.
+        ``get`` keeps working after ``close``, combining on the calling thread.
+        """
+        with self._lock:
+            self._closed = True
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _compute(self,
+                 key: CacheKey,
+                 results: Mapping[str, AnalysisResult],
+                 combination: LoadCombinationDefinition) -> AnalysisResult:
+        try:
+            result = combine_results(results, combination)
+            self._store(key, result)
+            with self._lock:
+                self.stats.prefetched += 1
+            return result
+        finally:
+            with self._lock:
+                self._pending.pop(key, None)
+
+    def _store(self, key: CacheKey, result: AnalysisResult) -> None:
+        size = estimate_result_nbytes(result)
+        with self._lock:
+            if size > self.max_bytes:
+                logger.debug("Combined result of %d bytes exceeds cache budget", size)
+                return
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._current_bytes -= previous[1]
+            self._entries[key] = (result, size)
+            self._current_bytes += size
+            while self._current_bytes > self.max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._current_bytes -= evicted_size
+                self.stats.evictions += 1
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        return (
+            f"CombinedResultsCache(entries={len(self)}, bytes={self._current_bytes}, "
+            f"max_bytes={self.max_bytes}, hits={self.stats.hits}, misses={self.stats.misses})"
+        )
@@ -2,12 +2,24 @@
 
 from __future__ import annotations
 
-from typing import Dict, Iterable, List, Tuple
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
 
 from src.core.data_models import EnvelopeValue
+from src.fem.force_envelope import ForceEnvelope
 from src.fem.load_combinations import LoadCombinationDefinition, LoadComponentType
+from src.fem.result_tables import (
+    ElementForceTable,
+    NodeResultTable,
+    stack_node_tables,
+    superpose_element_tables,
+    superpose_force_dicts,
+    superpose_node_tables,
+)
 from src.fem.results_processor import ElementForceEnvelope
 from src.fem.solver import AnalysisResult
+from src.fem.wind_case_synthesizer import SynthesizedWindCases
 
 
 COMPONENT_TO_SOLVER_KEY: Dict[LoadComponentType, str] = {
@@ -17,12 +29,14 @@ COMPONENT_TO_SOLVER_KEY: Dict[LoadComponentType, str] = {
     LoadComponentType.WX: "Wx",
     LoadComponentType.WY: "Wy",
     LoadComponentType.WTZ: "Wtz",
+    LoadComponentType.E1: "E1",
+    LoadComponentType.E2: "E2",
+    LoadComponentType.E3: "E3",
 }
 COMPONENT_TO_SOLVER_KEY.update(
     {getattr(LoadComponentType, f"W{i}"): f"W{i}" for i in range(1, 25)}
 )
 
-_N_DOF = 6
 _FORCE_COMPONENTS: Tuple[str, ...] = ("N", "Vy", "Vz", "T", "My", "Mz")
 _ENVELOPE_FIELD_MAP = {
     "N": ("N_max", "N_min"),
@@ -62,18 +76,129 @@ def combine_results(
     )
 
 
+def build_factor_matrix(
+    combinations: Sequence[LoadCombinationDefinition],
+    case_keys: Sequence[str],
+) -> np.ndarray:
+    """Load factors of each combination as a (n_combinations, n_cases) matrix.
+
+    Components without a solver key, or whose case is not in ``case_keys``,
+    get no column and so contribute zero.
+    """
+    column_of = {key: column for column, key in enumerate(case_keys)}
+    factors = np.zeros((len(combinations), len(case_keys)), dtype=np.float64)
+    for row, combination in enumerate(combinations):
+        for component, factor in combination.load_factors.items():
+            column = column_of.get(COMPONENT_TO_SOLVER_KEY.get(component))
+            if column is not None:
+                factors[row, column] += factor
+    return factors
+
+
+def combine_results_batch(
+    solver_results: Dict[str, AnalysisResult],
+    combinations: Sequence[LoadCombinationDefinition],
+    chunk_size: Optional[int] = None,
+) -> Dict[str, AnalysisResult]:
+    """Superpose many combinations at once; see ``iter_combined_results``.
+
+    Returns:
+        Dict of {combination name: AnalysisResult}, equal to calling
+        ``combine_results`` for each combination.
+    """
+    return dict(iter_combined_results(solver_results, combinations, chunk_size))
+
+
+def iter_combined_results(
+    solver_results: Dict[str, AnalysisResult],
+    combinations: Sequence[LoadCombinationDefinition],
+    chunk_size: Optional[int] = None,
+) -> Iterator[Tuple[str, AnalysisResult]]:
+    """Yield combined results evaluated as one tensor product per chunk.
+
+    Successful load cases are stacked into (n_cases, n_entities, n_comp)
+    tensors for displacements, reactions and frame end forces. Each chunk of
+    combinations is then evaluated with a single ``einsum`` against the
+    (n_combinations, n_cases) factor matrix. Lazily synthesized W1-W24 cases
+    (``SynthesizedWindCases``) are folded into the factors on Wx/Wy/Wtz and
+    never materialized. Non-frame element forces (shell force vectors) are
+    still superposed per combination.
+
+    Args:
+        solver_results: Solved load cases keyed by solver key ("DL", "Wx", ...)
+        combinations: Combinations to evaluate
+        chunk_size: Combinations per tensor product. Bounds the peak memory
+            of the combined arrays to ``chunk_size`` results; None evaluates
+            everything in one product.
+    """
+    combinations = list(combinations)
+    if not combinations:
+        return
+
+    case_keys, cases, expansion = _resolve_cases(solver_results)
+    factors = build_factor_matrix(combinations, case_keys) @ expansion
+
+    stacks = {
+        "node_displacements": stack_node_tables([case.node_displacements for case in cases]),
+        "node_reactions": stack_node_tables([case.node_reactions for case in cases]),
+        "frames": stack_node_tables([case.element_forces.frames for case in cases]),
+    }
+
+    step = max(1, chunk_size or len(combinations))
+    for start in range(0, len(combinations), step):
+        block = factors[start:start + step]
+        combined = {
+            name: np.einsum("kc,cnm->knm", block, values)
+            for name, (_, values, _) in stacks.items()
+        }
+
+        for offset, combination in enumerate(combinations[start:start + step]):
+            active = block[offset] != 0.0
+            tables: Dict[str, NodeResultTable] = {}
+            for name, (tags, _, present) in stacks.items():
+                rows = present[active].any(axis=0)
+                values = combined[name][offset]
+                if rows.all():
+                    tables[name] = NodeResultTable.from_arrays(tags, values)
+                else:
+                    tables[name] = NodeResultTable.from_arrays(tags[rows], values[rows])
+
+            other = superpose_force_dicts(
+                (factor, case.element_forces.other)
+                for factor, case in zip(block[offset], cases)
+            )
+            weighted = [case for case, is_active in zip(cases, active) if is_active]
+
+            yield combination.name, AnalysisResult(
+                success=True,
+                message=f"{combination.name}: {combination.to_equation()}",
+                converged=all(case.converged for case in weighted),
+                iterations=max((case.iterations for case in weighted), default=0),
+                node_displacements=tables["node_displacements"],
+                node_reactions=tables["node_reactions"],
+                element_forces=ElementForceTable.from_parts(tables["frames"], other),
+            )
+
+
 def compute_envelope(
     combined_results: Dict[str, AnalysisResult],
-) -> Dict[int, ElementForceEnvelope]:
-    """Compute element force envelopes over multiple combined results."""
-    envelopes: Dict[int, ElementForceEnvelope] = {}
+) -> ForceEnvelope:
+    """Compute element force envelopes over multiple combined results.
+
+    Frame elements are enveloped in one vectorized pass (see
+    ``ForceEnvelope``); envelopes are materialized per element on lookup.
+    Non-frame force layouts are still enveloped key by key.
+    """
+    other_envelopes: Dict[int, ElementForceEnvelope] = {}
 
     for combination_name, result in combined_results.items():
         if not result.success:
             continue
 
-        for element_id, force_dict in result.element_forces.items():
-            envelope = envelopes.setdefault(element_id, ElementForceEnvelope(element_id=element_id))
+        for element_id, force_dict in result.element_forces.other.items():
+            envelope = other_envelopes.setdefault(
+                element_id, ElementForceEnvelope(element_id=element_id)
+            )
 
             for component in _FORCE_COMPONENTS:
                 key_i = f"{component}_i"
@@ -83,27 +208,12 @@ def compute_envelope(
 
                 value_i = force_dict.get(key_i, 0.0)
                 value_j = force_dict.get(key_j, 0.0)
-                max_abs = max(abs(value_i), abs(value_j))
-                avg_signed = 0.5 * (value_i + value_j)
-
-                max_field, min_field = _ENVELOPE_FIELD_MAP[component]
-                max_envelope = _get_or_create_envelope_value(envelope, max_field)
-                min_envelope = _get_or_create_envelope_value(envelope, min_field)
-
-                if max_abs > max_envelope.max_value:
-                    max_envelope.max_value = max_abs
-                    max_envelope.governing_max_case_name = combination_name
-                    max_envelope.governing_max_location = element_id
+                _update_envelope(
+                    envelope, component, max(abs(value_i), abs(value_j)),
+                    0.5 * (value_i + value_j), combination_name, element_id,
+                )
 
-                if (
-                    avg_signed < min_envelope.min_value
-                    or min_envelope.governing_min_case_name is None
-                ):
-                    min_envelope.min_value = avg_signed
-                    min_envelope.governing_min_case_name = combination_name
-                    min_envelope.governing_min_location = element_id
-
-    return envelopes
+    return ForceEnvelope.from_results(combined_results, extra=other_envelopes)
 
 
 def get_applicable_combinations(
@@ -143,6 +253,14 @@ def _iter_weighted_results(
         if solver_key is None:
             continue
 
+        weights = _synthesized_weights(solver_results, solver_key)
+        if weights is not None:
+            # Lazy W-case: superpose its Wx/Wy/Wtz components directly
+            for component_key, coefficient in weights.items():
+                if coefficient != 0.0:
+                    yield factor * coefficient, solver_results.components[component_key]
+            continue
+
         component_result = solver_results.get(solver_key)
         if component_result is None or not component_result.success:
             continue
@@ -150,40 +268,98 @@ def _iter_weighted_results(
         yield factor, component_result
 
 
-def _combine_vector_field(
-    weighted_results: List[Tuple[float, AnalysisResult]],
-    field_name: str,
-) -> Dict[int, List[float]]:
-    combined: Dict[int, List[float]] = {}
+def _synthesized_weights(solver_results, solver_key: str) -> Optional[Dict[str, float]]:
+    if isinstance(solver_results, SynthesizedWindCases):
+        return solver_results.component_weights(solver_key)
+    return None
+
 
-    for factor, result in weighted_results:
-        vector_map = getattr(result, field_name, {})
-        for node_tag, values in vector_map.items():
-            if node_tag not in combined:
-                combined[node_tag] = [0.0] * _N_DOF
+def _resolve_cases(
+    solver_results: Dict[str, AnalysisResult],
+) -> Tuple[List[str], List[AnalysisResult], np.ndarray]:
+    """Split results into solved cases and an expansion onto them.
+
+    Returns:
+        Tuple of (case_keys, solved, expansion). ``expansion`` has shape
+        (len(case_keys), len(solved)): identity rows for solved cases and
+        coefficient rows for lazily synthesized W-cases, so that
+        ``build_factor_matrix(..., case_keys) @ expansion`` gives factors on
+        the solved cases only.
+    """
+    solved: List[AnalysisResult] = []
+    solved_index: Dict[str, int] = {}
+    synthesized: Dict[str, Dict[str, float]] = {}
+
+    for key in solver_results:
+        weights = _synthesized_weights(solver_results, key)
+        if weights is not None:
+            synthesized[key] = weights
+            continue
+        result = solver_results[key]
+        if result is None or not result.success:
+            continue
+        solved_index[key] = len(solved)
+        solved.append(result)
+
+    case_keys = list(solved_index) + list(synthesized)
+    if synthesized:
+        for key, result in solver_results.components.items():
+            if key not in solved_index:
+                solved_index[key] = len(solved)
+                solved.append(result)
+
+    expansion = np.zeros((len(case_keys), len(solved)), dtype=np.float64)
+    for row, key in enumerate(case_keys):
+        weights = synthesized.get(key)
+        if weights is None:
+            expansion[row, solved_index[key]] = 1.0
+        else:
+            for component_key, coefficient in weights.items():
+                expansion[row, solved_index[component_key]] += coefficient
+    return case_keys, solved, expansion
 
-            for dof_idx in range(min(len(values), _N_DOF)):
-                combined[node_tag][dof_idx] += factor * values[dof_idx]
 
-    return combined
+def _combine_vector_field(
+    weighted_results: List[Tuple[float, AnalysisResult]],
+    field_name: str,
+) -> NodeResultTable:
+    return superpose_node_tables(
+        (factor, getattr(result, field_name, {})) for factor, result in weighted_results
+    )
 
 
 def _combine_element_forces(
     weighted_results: List[Tuple[float, AnalysisResult]],
-) -> Dict[int, Dict[str, float]]:
-    combined: Dict[int, Dict[str, float]] = {}
-
-    for factor, result in weighted_results:
-        for element_id, force_dict in result.element_forces.items():
-            if element_id not in combined:
-                combined[element_id] = {}
+) -> ElementForceTable:
+    return superpose_element_tables(
+        (factor, result.element_forces) for factor, result in weighted_results
+    )
 
-            for force_key, force_value in force_dict.items():
-                if force_key not in combined[element_id]:
-                    combined[element_id][force_key] = 0.0
-                combined[element_id][force_key] += factor * force_value
 
-    return combined
+def _update_envelope(
+    envelope: ElementForceEnvelope,
+    component: str,
+    max_abs: float,
+    avg_signed: float,
+    combination_name: str,
+    element_id: int,
+) -> None:
+    max_field, min_field = _ENVELOPE_FIELD_MAP[component]
+    max_envelope = _get_or_create_envelope_value(envelope, max_field)
+    min_envelope = _get_or_create_envelope_value(envelope, min_field)
+
+    if max_abs > max_envelope.max_value:
+        max_envelope.max_value = max_abs
+        max_envelope.governing_max_case_name = combination_name
+        max_envelope.governing_max_location = element_id
+
+    if (
+        avg_signed < min_envelope.min_value
+        or min_envelope.governing_min_case_name is None
+    ):
+        min_envelope.min_value = avg_signed
+        min_envelope.governing_min_case_name = combination_name
+        min_envelope.governing_min_location = element_id
 
 
 def _get_or_create_envelope_value(
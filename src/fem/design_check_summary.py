@@ -4,7 +4,7 @@ from dataclasses import dataclass
 from math import hypot
 from typing import Any, Dict, List, Optional, Sequence, Tuple
 
-from src.fem.combination_processor import combine_results, compute_envelope, get_applicable_combinations
+from src.fem.combination_processor import compute_envelope, get_applicable_combinations
 from src.fem.design_checks import (
     FlexuralCheckResult,
     GoverningItem,
@@ -20,6 +20,7 @@ from src.fem.design_checks import (
     shear_stress_check,
 )
 from src.fem.load_combinations import LoadCombinationLibrary
+from src.fem.pattern_loading import combine_with_live_load_bounds
 
 
 ORDERED_TYPE_LABELS: Tuple[str, ...] = (
@@ -157,9 +158,7 @@ def compute_design_checks_summary(
         applicable_defs = get_applicable_combinations(all_defs, available_cases)
         warnings.append("Selected combinations were not applicable; used available canonical combinations instead")
 
-    combined_results: Dict[str, Any] = {}
-    for comb in applicable_defs:
-        combined_results[comb.name] = combine_results(results_by_case, comb)
+    combined_results: Dict[str, Any] = combine_with_live_load_bounds(results_by_case, applicable_defs)
 
     if not combined_results:
         return DesignChecksSummary(
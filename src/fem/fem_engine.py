@@ -5,14 +5,37 @@ This module provides a high-level interface for structural finite element modeli
 using OpenSeesPy, tailored for tall building structural analysis with HK Code 2013.
 """
 
+import bisect
+import hashlib
+import itertools
 import logging
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import List, Dict, Tuple, Optional
+from typing import TYPE_CHECKING, Iterable, List, Dict, Tuple, Optional
 import numpy as np
 
+if TYPE_CHECKING:
+    from src.fem.model_validation import ValidationReport
+
 _logger = logging.getLogger(__name__)
 
+# Token of the FEMModel build that currently owns the global OpenSees domain
+_OPS_BUILD_COUNTER = itertools.count(1)
+_active_ops_token = 0
+
+
+def _claim_ops_domain() -> int:
+    """Issue a new token for a full OpenSees build and mark it active."""
+    global _active_ops_token
+    _active_ops_token = next(_OPS_BUILD_COUNTER)
+    return _active_ops_token
+
+
+# Section parameters pushed with setParameter on patched elements
+_BEAM_SECTION_PARAMETERS_3D = ("A", "E", "G", "J", "Iy", "Iz")
+_BEAM_SECTION_PARAMETERS_2D = ("A", "E", "Iz")
+_PLATE_SECTION_PARAMETERS = ("E", "nu", "h")
+
 
 class ElementType(Enum):
     """FEM element types for structural analysis."""
@@ -174,6 +197,136 @@ class RigidDiaphragm:
             raise ValueError("Master node cannot also be a slave node in the diaphragm")
 
 
+class FloorIndex:
+    """Node tags bucketed by elevation within a tolerance.
+    
+    Level keys are kept in a sorted list so each insertion is a bisect
+    rather than a scan over every known level. Grouping follows the
+    first-seen rule: a node joins the earliest-created level within
+    tolerance, and a new level is keyed by the elevation of the node that
+    opened it. Levels and their node lists keep insertion order.
+    
+    Attributes:
+        tolerance: Elevation tolerance (m) for matching a level
+    """
+    
+    def __init__(self, tolerance: float = 1e-6):
+        if tolerance < 0:
+            raise ValueError("FloorIndex tolerance must be non-negative")
+        self.tolerance = tolerance
+        self._sorted: List[float] = []
+        self._rank: Dict[float, int] = {}
+        self._members: Dict[float, List[int]] = {}
+        self._node_z: Dict[int, float] = {}
+        self._node_seq: Dict[int, int] = {}
+    
+    @classmethod
+    def from_nodes(cls, nodes: Iterable[Node], tolerance: float = 1e-6) -> "FloorIndex":
+        """Build an index over ``nodes`` in iteration order.
+        
+        Elevations are sorted once; when every run of closely spaced values
+        fits inside the tolerance (the usual case of exact floor levels) the
+        runs are the levels and no per-node search is needed.
+        """
+        index = cls(tolerance)
+        nodes = list(nodes)
+        if not nodes:
+            return index
+        z = np.fromiter((node.z for node in nodes), dtype=float, count=len(nodes))
+        order = np.argsort(z, kind="stable")
+        z_sorted = z[order]
+        breaks = np.flatnonzero(np.diff(z_sorted) > tolerance) + 1
+        starts = np.concatenate(([0], breaks))
+        ends = np.concatenate((breaks, [len(z_sorted)]))
+        if np.any(z_sorted[ends - 1] - z_sorted[starts] > tolerance):
+            for node in nodes:
+                index.add(node.z, node.tag)
+            return index
+        
+        run_of = np.empty(len(nodes), dtype=np.int64)
+        run_of[order] = np.repeat(np.arange(len(starts)), ends - starts)
+        first = np.minimum.reduceat(order, starts)
+        # Runs are ascending, each keyed by the elevation of its first node
+        levels = [nodes[pos].z for pos in first.tolist()]
+        index._sorted = list(levels)
+        for rank, run in enumerate(np.argsort(first, kind="stable").tolist()):
+            index._rank[levels[run]] = rank
+            index._members[levels[run]] = []
+        for seq, (node, run) in enumerate(zip(nodes, run_of.tolist())):
+            index._node_seq[node.tag] = seq
+            index._node_z[node.tag] = node.z
+            index._members[levels[run]].append(node.tag)
+        return index
+    
+    def __len__(self) -> int:
+        """Number of node tags indexed."""
+        return len(self._node_z)
+    
+    def _candidates(self, z: float, reach: float) -> List[float]:
+        lo = bisect.bisect_left(self._sorted, z - reach)
+        hi = bisect.bisect_right(self._sorted, z + reach)
+        # Widen by one slot on each side so rounding in z +/- reach never
+        # hides a level that passes the exact abs() test below
+        return self._sorted[max(lo - 1, 0):hi + 1]
+    
+    def match(self, z: float) -> Optional[float]:
+        """Return the earliest-created level within tolerance of ``z``."""
+        best: Optional[float] = None
+        for level in self._candidates(z, self.tolerance):
+            if abs(level - z) <= self.tolerance and (
+                best is None or self._rank[level] < self._rank[best]
+            ):
+                best = level
+        return best
+    
+    def add(self, z: float, tag: Optional[int] = None) -> float:
+        """Place an elevation (and optional node tag) and return its level key."""
+        level = self.match(z)
+        if level is None:
+            level = z
+            bisect.insort(self._sorted, level)
+            self._rank[level] = len(self._rank)
+            self._members[level] = []
+        if tag is not None:
+            self._node_seq[tag] = len(self._node_seq)
+            self._node_z[tag] = z
+            self._members[level].append(tag)
+        return level
+    
+    @property
+    def levels(self) -> List[float]:
+        """Level keys in creation order."""
+        return list(self._members)
+    
+    def sorted_levels(self) -> List[float]:
+        """Level keys in ascending elevation."""
+        return list(self._sorted)
+    
+    def groups(self) -> Dict[float, List[int]]:
+        """Copy of the level -> node tags mapping in creation order."""
+        return {level: list(tags) for level, tags in self._members.items()}
+    
+    def nodes_at(self, level: float) -> List[int]:
+        """Tags of nodes at ``level`` in insertion order.
+        
+        ``level`` need not be a key of the index: every indexed node whose
+        own elevation lies within tolerance of it is returned.
+        """
+        tol = self.tolerance
+        picked: List[int] = []
+        buckets = 0
+        for key in self._candidates(level, 2.0 * tol):
+            if abs(key - level) > 2.0 * tol:
+                continue
+            members = [tag for tag in self._members[key] if abs(self._node_z[tag] - level) <= tol]
+            if members:
+                buckets += 1
+                picked.extend(members)
+        if buckets > 1:
+            picked.sort(key=self._node_seq.__getitem__)
+        return picked
+
+
 class FEMModel:
     """OpenSeesPy FEM model manager.
     
@@ -202,6 +355,20 @@ class FEMModel:
         self.omitted_columns: List[Dict] = []  # Ghost columns for visualization: [{"x": float, "y": float, "id": str}]
         self._is_built = False
         self._ops_initialized = False
+        self._ops_token = 0
+        self._dirty_sections: set = set()
+        self._floor_indexes: Dict[float, FloorIndex] = {}
+        self._revision = 0
+        self._validation: Optional[Tuple[Tuple[int, ...], "ValidationReport"]] = None
+    
+    def mark_modified(self) -> None:
+        """Record an in-place edit of model objects.
+        
+        Every ``add_*`` method and ``update_section`` bumps the revision itself;
+        code that mutates a Node or Element directly must call this so cached
+        derived data (validation) is recomputed.
+        """
+        self._revision += 1
     
     def add_node(self, node: Node) -> None:
         """Add node to model.
@@ -214,7 +381,30 @@ class FEMModel:
         """
         if node.tag in self.nodes:
             raise ValueError(f"Node tag {node.tag} already exists")
+        for index in self._floor_indexes.values():
+            if len(index) == len(self.nodes):
+                index.add(node.z, node.tag)
         self.nodes[node.tag] = node
+        self._revision += 1
+    
+    def floor_index(self, tolerance: float = 1e-6) -> FloorIndex:
+        """Index of node tags by floor elevation.
+        
+        The index is cached per tolerance and kept current by ``add_node``.
+        If ``nodes`` was edited directly the node count no longer matches
+        and the index is rebuilt on the next call.
+        
+        Args:
+            tolerance: Elevation tolerance (m) for grouping nodes on a floor
+            
+        Returns:
+            FloorIndex covering every node in the model
+        """
+        index = self._floor_indexes.get(tolerance)
+        if index is None or len(index) != len(self.nodes):
+            index = FloorIndex.from_nodes(self.nodes.values(), tolerance)
+            self._floor_indexes[tolerance] = index
+        return index
     
     def add_element(self, element: Element) -> None:
         """Add element to model.
@@ -234,6 +424,7 @@ class FEMModel:
                 raise ValueError(f"Node {node_tag} does not exist")
         
         self.elements[element.tag] = element
+        self._revision += 1
     
     def add_material(self, tag: int, material_params: Dict) -> None:
         """Add material definition to model.
@@ -245,6 +436,7 @@ class FEMModel:
         if tag in self.materials:
             raise ValueError(f"Material tag {tag} already exists")
         self.materials[tag] = material_params
+        self._revision += 1
     
     def add_section(self, tag: int, section_params: Dict) -> None:
         """Add section definition to model.
@@ -256,6 +448,42 @@ class FEMModel:
         if tag in self.sections:
             raise ValueError(f"Section tag {tag} already exists")
         self.sections[tag] = section_params
+        self._revision += 1
+
+    def update_section(self, tag: int, section_params: Dict) -> None:
+        """Replace the parameters of an existing section.
+
+        Topology is untouched. If this model's OpenSees domain is still live,
+        the next ``build_openseespy_model(rebuild_structure=False)`` pushes the
+        new values into the existing elements instead of rebuilding them.
+
+        Args:
+            tag: Section tag
+            section_params: Section parameters of the same section type
+
+        Raises:
+            ValueError: If the section does not exist or changes type
+        """
+        if tag not in self.sections:
+            raise ValueError(f"Section tag {tag} does not exist")
+        if section_params.get('section_type') != self.sections[tag].get('section_type'):
+            raise ValueError(f"Section {tag} cannot change type in place")
+        self.sections[tag] = section_params
+        self._dirty_sections.add(tag)
+        self._revision += 1
+
+    def has_live_ops_domain(self) -> bool:
+        """Whether the global OpenSees domain still holds this model's structure."""
+        if not self._ops_initialized or self._ops_token != _active_ops_token:
+            return False
+        try:
+            import openseespy.opensees as ops
+            return (
+                len(ops.getNodeTags()) == len(self.nodes)
+                and len(ops.getEleTags()) == len(self.elements)
+            )
+        except Exception:
+            return False
     
     def add_load(self, load: Load) -> None:
         """Add point load to model.
@@ -266,6 +494,7 @@ class FEMModel:
         if load.node_tag not in self.nodes:
             raise ValueError(f"Node {load.node_tag} does not exist")
         self.loads.append(load)
+        self._revision += 1
     
     def add_uniform_load(self, uniform_load: UniformLoad) -> None:
         """Add distributed load to model.
@@ -276,6 +505,7 @@ class FEMModel:
         if uniform_load.element_tag not in self.elements:
             raise ValueError(f"Element {uniform_load.element_tag} does not exist")
         self.uniform_loads.append(uniform_load)
+        self._revision += 1
     
     def add_surface_load(self, surface_load: SurfaceLoad) -> None:
         """Add surface pressure load to model.
@@ -286,6 +516,7 @@ class FEMModel:
         if surface_load.element_tag not in self.elements:
             raise ValueError(f"Element {surface_load.element_tag} does not exist")
         self.surface_loads.append(surface_load)
+        self._revision += 1
 
     def add_rigid_diaphragm(self, diaphragm: RigidDiaphragm) -> None:
         """Add rigid diaphragm tying slave nodes to a master node.
@@ -302,6 +533,7 @@ class FEMModel:
             if slave not in self.nodes:
                 raise ValueError(f"Slave node {slave} does not exist")
         self.diaphragms.append(diaphragm)
+        self._revision += 1
 
     @staticmethod
     def _get_uniform_load_components(uniform_load: UniformLoad,
@@ -372,7 +604,13 @@ class FEMModel:
                 "Install with: pip install openseespy>=3.5.0"
             )
 
-        if rebuild_structure or not self._ops_initialized:
+        rebuild = rebuild_structure or not self.has_live_ops_domain()
+        if not rebuild and self._dirty_sections:
+            rebuild = not self._push_section_updates(ops, ndm)
+
+        if rebuild:
+            self._ops_token = _claim_ops_domain()
+            self._dirty_sections.clear()
             ops.wipe()
             ops.model('basic', '-ndm', ndm, '-ndf', ndf)
 
@@ -602,7 +840,7 @@ class FEMModel:
         patterns.update({u.load_pattern for u in self.uniform_loads})
         patterns.update({s.load_pattern for s in self.surface_loads})
 
-        if not rebuild_structure:
+        if not rebuild:
             for pattern_id in sorted(patterns):
                 try:
                     ops.remove('loadPattern', pattern_id)
@@ -686,6 +924,38 @@ class FEMModel:
 
         self._is_built = True
         self._ops_initialized = True
+
+    def _push_section_updates(self, ops, ndm: int) -> bool:
+        """Push updated section parameters into the live OpenSees elements.
+
+        Returns:
+            False if an updated section type cannot be patched in place
+        """
+        tags_by_section: Dict[int, List[int]] = {}
+        for elem in self.elements.values():
+            if elem.section_tag in self._dirty_sections:
+                tags_by_section.setdefault(elem.section_tag, []).append(elem.tag)
+
+        for section_tag, element_tags in tags_by_section.items():
+            section = self.sections[section_tag]
+            sec_type = section['section_type']
+            if sec_type == 'ElasticBeamSection':
+                names = _BEAM_SECTION_PARAMETERS_3D if ndm == 3 else _BEAM_SECTION_PARAMETERS_2D
+            elif sec_type == 'ElasticMembranePlateSection':
+                names = _PLATE_SECTION_PARAMETERS
+            else:
+                _logger.info("Section %s (%s) cannot be patched; rebuilding", section_tag, sec_type)
+                return False
+            for name in names:
+                ops.setParameter('-val', float(section[name]), '-ele', *element_tags, name)
+
+        _logger.info(
+            "Patched %d section(s) on %d element(s) without rebuilding",
+            len(tags_by_section),
+            sum(len(tags) for tags in tags_by_section.values()),
+        )
+        self._dirty_sections.clear()
+        return True
     
     def get_node_coordinates(self) -> np.ndarray:
         """Get all node coordinates as numpy array.
@@ -717,6 +987,40 @@ class FEMModel:
         """
         return [node.tag for node in self.nodes.values() if node.is_fixed]
     
+    def fingerprint(self) -> str:
+        """Content hash of the model.
+        
+        Covers geometry, restraints, element connectivity, materials,
+        sections, diaphragms and loads, so two models that analyze the same
+        hash equal regardless of object identity. Used to key caches of
+        derived results such as mode shapes.
+        
+        Returns:
+            Hex digest (32 characters)
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        nodes = sorted(self.nodes.values(), key=lambda n: n.tag)
+        digest.update(np.array([n.tag for n in nodes], dtype=np.int64).tobytes())
+        digest.update(np.array([(n.x, n.y, n.z) for n in nodes], dtype=float).tobytes())
+        digest.update(np.array([n.restraints for n in nodes], dtype=np.int8).tobytes())
+        
+        def feed(value) -> None:
+            digest.update(repr(value).encode("utf-8"))
+        
+        for elem in sorted(self.elements.values(), key=lambda e: e.tag):
+            feed((elem.tag, elem.element_type.value, tuple(elem.node_tags),
+                  elem.material_tag, elem.section_tag, sorted(elem.geometry.items())))
+        for params in (self.materials, self.sections):
+            feed(sorted((tag, sorted(values.items())) for tag, values in params.items()))
+        feed([(d.master_node, tuple(d.slave_nodes), d.perp_dirn) for d in self.diaphragms])
+        # Load magnitudes as floats so [0, 0, -1e4] and [0.0, 0.0, -1e4] hash equal
+        feed([(load.node_tag, tuple(map(float, load.load_values)), load.load_pattern)
+              for load in self.loads])
+        feed([(load.element_tag, load.load_type, float(load.magnitude), load.load_pattern, load.visual_only)
+              for load in self.uniform_loads])
+        feed([(load.element_tag, float(load.pressure), load.load_pattern) for load in self.surface_loads])
+        return digest.hexdigest()
+    
     def get_summary(self) -> Dict:
         """Get model summary statistics.
         
@@ -735,127 +1039,37 @@ class FEMModel:
             'is_built': self._is_built,
         }
     
-    def validate_model(self) -> Tuple[bool, List[str]]:
-        """Validate model for common issues.
+    def _validation_key(self) -> Tuple[int, ...]:
+        # Sizes catch edits made straight on the dicts/lists
+        return (self._revision, len(self.nodes), len(self.elements), len(self.materials),
+                len(self.sections), len(self.diaphragms))
+    
+    def validation_report(self) -> "ValidationReport":
+        """Structured validation diagnostics, cached until the model changes.
         
         Returns:
-            Tuple of (is_valid, list_of_errors)
+            ValidationReport from ``src.fem.model_validation``
         """
-        errors = []
-        
-        # Check for nodes
-        if not self.nodes:
-            errors.append("Model has no nodes")
+        from src.fem.model_validation import validate_model_arrays
         
-        # Check for elements
-        if not self.elements:
-            errors.append("Model has no elements")
-        
-        # Check for boundary conditions
-        if not any(node.is_fixed or node.is_pinned for node in self.nodes.values()):
-            errors.append("Model has no fixed or pinned supports (unstable)")
-        
-        # Check material references
-        for elem in self.elements.values():
-            if elem.material_tag not in self.materials:
-                errors.append(
-                    f"Element {elem.tag} references non-existent material {elem.material_tag}"
-                )
-        
-        # Check section references for beam elements
-        for elem in self.elements.values():
-            if elem.element_type in [ElementType.BEAM_COLUMN, ElementType.ELASTIC_BEAM]:
-                if elem.section_tag is None:
-                    errors.append(f"Beam element {elem.tag} missing section_tag")
-                elif elem.section_tag not in self.sections:
-                    errors.append(
-                        f"Element {elem.tag} references non-existent section {elem.section_tag}"
-                    )
-
-        # Validate diaphragms
-        for diaphragm in self.diaphragms:
-            if diaphragm.master_node not in self.nodes:
-                errors.append(f"Diaphragm master node {diaphragm.master_node} missing")
-            for slave in diaphragm.slave_nodes:
-                if slave not in self.nodes:
-                    errors.append(f"Diaphragm slave node {slave} missing")
-                if slave == diaphragm.master_node:
-                    errors.append("Diaphragm slave cannot equal master node")
-        
-        # Gate I: Check for orphan nodes (nodes not connected to any element)
-        nodes_in_elements = set()
-        for elem in self.elements.values():
-            nodes_in_elements.update(elem.node_tags)
-        
-        # Also include diaphragm slave nodes as "connected" (they're constrained to master)
-        for diaphragm in self.diaphragms:
-            nodes_in_elements.update(diaphragm.slave_nodes)
-            nodes_in_elements.add(diaphragm.master_node)
-        
-        orphan_nodes = set(self.nodes.keys()) - nodes_in_elements
-        if orphan_nodes:
-            # Filter out fixed/pinned nodes (supports can be orphans - they provide reactions)
-            structural_orphans = [
-                tag for tag in orphan_nodes 
-                if not (self.nodes[tag].is_fixed or self.nodes[tag].is_pinned)
-            ]
-            if structural_orphans:
-                sample = structural_orphans[:5]
-                errors.append(
-                    f"Found {len(structural_orphans)} orphan node(s) not connected to elements: {sample}"
-                )
+        key = self._validation_key()
+        if self._validation is None or self._validation[0] != key:
+            self._validation = (key, validate_model_arrays(self))
+        return self._validation[1]
+    
+    def validate_model(self) -> Tuple[bool, List[str]]:
+        """Validate model for common issues.
         
-        # Gate I: Check for zero-length elements (coincident nodes)
-        zero_length_tolerance = 1e-6  # 1 micron
-        for elem in self.elements.values():
-            if len(elem.node_tags) >= 2:
-                # Check first two nodes for beam elements
-                n1 = self.nodes[elem.node_tags[0]]
-                n2 = self.nodes[elem.node_tags[1]]
-                
-                length = np.sqrt(
-                    (n2.x - n1.x)**2 + (n2.y - n1.y)**2 + (n2.z - n1.z)**2
-                )
-                
-                if length < zero_length_tolerance:
-                    errors.append(
-                        f"Element {elem.tag} has zero/near-zero length ({length:.2e} m) "
-                        f"between nodes {elem.node_tags[0]} and {elem.node_tags[1]}"
-                    )
+        Checks supports, material/section references, diaphragms, orphan
+        nodes, zero-length elements and shell mesh quality on packed
+        arrays. The result is cached against the model revision, so an
+        unchanged model is not re-validated.
         
-        # Mesh quality checks for shell elements (warn only)
-        max_aspect_ratio = 5.0
-        high_aspect_ratio_shells: List[Tuple[int, float]] = []
-        for elem in self.elements.values():
-            if elem.element_type not in (ElementType.SHELL_MITC4, ElementType.SHELL_DKGT):
-                continue
-
-            expected_nodes = 4 if elem.element_type == ElementType.SHELL_MITC4 else 3
-            if len(elem.node_tags) != expected_nodes:
-                errors.append(
-                    f"Shell element {elem.tag} has {len(elem.node_tags)} nodes "
-                    f"(expected {expected_nodes})"
-                )
-                continue
-
-            edge_lengths: List[float] = []
-            node_tags = elem.node_tags
-            for idx, node_tag in enumerate(node_tags):
-                next_tag = node_tags[(idx + 1) % len(node_tags)]
-                n1 = self.nodes[node_tag]
-                n2 = self.nodes[next_tag]
-                edge_lengths.append(
-                    float(np.sqrt((n2.x - n1.x)**2 + (n2.y - n1.y)**2 + (n2.z - n1.z)**2))
-                )
-
-            max_edge = max(edge_lengths)
-            min_edge = min(edge_lengths)
-
-            if min_edge > 0:
-                aspect_ratio = max_edge / min_edge
-                if aspect_ratio > max_aspect_ratio:
-                    high_aspect_ratio_shells.append((elem.tag, aspect_ratio))
-
+        Returns:
+            Tuple of (is_valid, list_of_errors)
+        """
+        report = self.validation_report()
+        high_aspect_ratio_shells = report.high_aspect_shells
         if high_aspect_ratio_shells:
             worst_tag, worst_ar = max(high_aspect_ratio_shells, key=lambda item: item[1])
             sample_items = high_aspect_ratio_shells[:5]
@@ -865,13 +1079,13 @@ class FEMModel:
             _logger.warning(
                 "Shell mesh aspect ratio warning: %d elements exceed max %.2f. Worst=%s(%.2f). Samples: %s",
                 len(high_aspect_ratio_shells),
-                max_aspect_ratio,
+                report.max_aspect_ratio,
                 worst_tag,
                 worst_ar,
                 sample_text,
             )
         
-        return (len(errors) == 0, errors)
+        return (report.is_valid, list(report.errors))
 
 
 def create_simple_frame_model(bay_width: float,
@@ -0,0 +1,207 @@
+"""
+Vectorized element force envelopes across load combinations.
+
+End forces of every combination are stacked into a
+(n_combinations, n_elements, 12) tensor and reduced with argmax/argmin over
+the combination axis, so the governing combination of each element and
+component is found without Python loops. ``ElementForceEnvelope`` objects
+are only built for elements that are actually looked up.
+"""
+
+from collections.abc import Mapping
+from typing import Any, Dict, Iterator, Optional, Sequence
+
+import numpy as np
+
+from src.fem.result_tables import FRAME_FORCE_KEYS, stack_node_tables
+from src.fem.results_processor import ElementForceEnvelope
+
+# Envelope components in FRAME_FORCE_KEYS column order (end i, then end j)
+ENVELOPE_COMPONENTS = ("N", "Vy", "Vz", "T", "My", "Mz")
+
+_N_COMPONENTS = len(ENVELOPE_COMPONENTS)
+
+
+class ForceEnvelope(Mapping):
+    """Lazy mapping of element tag to ``ElementForceEnvelope``.
+
+    For each element and component the envelope keeps:
+
+    - ``max_values``: largest end-force magnitude max(|F_i|, |F_j|)
+    - ``min_values``: smallest signed mid value (F_i + F_j) / 2
+
+    together with the index of the governing combination along the stacked
+    axis (``max_index`` / ``min_index``, -1 when nothing governs).
+
+    Attributes:
+        case_names: Combination names along the stacked axis
+        element_tags: Element tags, one per row
+        case_labels: Optional per-combination objects (e.g. LoadCombination)
+            stored as ``governing_*_case`` on materialized envelopes
+    """
+
+    def __init__(self,
+                 case_names: Sequence[str],
+                 element_tags: np.ndarray,
+                 max_values: np.ndarray,
+                 max_index: np.ndarray,
+                 min_values: np.ndarray,
+                 min_index: np.ndarray,
+                 case_labels: Optional[Sequence[Any]] = None,
+                 extra: Optional[Dict[int, ElementForceEnvelope]] = None):
+        self.case_names = list(case_names)
+        self.case_labels = list(case_labels) if case_labels is not None else None
+        self.element_tags = np.asarray(element_tags, dtype=np.int64)
+        self.max_values = max_values
+        self.max_index = max_index
+        self.min_values = min_values
+        self.min_index = min_index
+        self._row = {tag: row for row, tag in enumerate(self.element_tags.tolist())}
+        self._extra: Dict[int, ElementForceEnvelope] = dict(extra or {})
+        self._cache: Dict[int, ElementForceEnvelope] = {}
+
+    @classmethod
+    def from_end_forces(cls,
+                        case_names: Sequence[str],
+                        element_tags: np.ndarray,
+                        end_forces: np.ndarray,
+                        present: Optional[np.ndarray] = None,
+                        case_labels: Optional[Sequence[Any]] = None,
+                        extra: Optional[Dict[int, ElementForceEnvelope]] = None,
+                        ) -> "ForceEnvelope":
+        """Envelope a (n_cases, n_elements, 12) end-force tensor.
+
+        Args:
+            case_names: Combination names, one per leading index
+            element_tags: Element tags, one per row
+            end_forces: Local end forces ordered as ``FRAME_FORCE_KEYS``
+            present: Optional (n_cases, n_elements) mask of elements each
+                combination reports; absent entries never govern
+            case_labels: Optional per-combination objects, see class docs
+            extra: Envelopes of elements enveloped elsewhere (non-frame
+                layouts); frame results for the same tag are merged in
+        """
+        n_cases, n_elements = end_forces.shape[:2]
+        end_i = end_forces[:, :, :_N_COMPONENTS]
+        end_j = end_forces[:, :, _N_COMPONENTS:2 * _N_COMPONENTS]
+        max_abs = np.abs(end_i)
+        np.maximum(max_abs, np.abs(end_j), out=max_abs)
+        mid = end_i + end_j
+        mid *= 0.5
+        if present is not None and not present.all():
+            absent = ~present[:, :, None]
+            max_abs = np.where(absent, -np.inf, max_abs)
+            mid = np.where(absent, np.inf, mid)
+
+        if n_cases:
+            max_index = np.argmax(max_abs, axis=0)
+            min_index = np.argmin(mid, axis=0)
+            max_values = np.take_along_axis(max_abs, max_index[None], axis=0)[0]
+            min_values = np.take_along_axis(mid, min_index[None], axis=0)[0]
+        else:
+            max_index = np.zeros((n_elements, _N_COMPONENTS), dtype=np.int64)
+            min_index = np.zeros((n_elements, _N_COMPONENTS), dtype=np.int64)
+            max_values = np.zeros((n_elements, _N_COMPONENTS))
+            min_values = np.zeros((n_elements, _N_COMPONENTS))
+
+        # A magnitude of zero never governs (EnvelopeValue starts at 0.0)
+        no_max = ~(max_values > 0.0)
+        max_index = np.where(no_max, -1, max_index)
+        max_values = np.where(no_max, 0.0, max_values)
+        no_min = ~np.isfinite(min_values)
+        min_index = np.where(no_min, -1, min_index)
+        min_values = np.where(no_min, 0.0, min_values)
+
+        return cls(case_names, element_tags, max_values, max_index,
+                   min_values, min_index, case_labels=case_labels, extra=extra)
+
+    @classmethod
+    def from_results(cls,
+                     results: Mapping,
+                     extra: Optional[Dict[int, ElementForceEnvelope]] = None,
+                     ) -> "ForceEnvelope":
+        """Envelope the frame end forces of {combination name: AnalysisResult}.
+
+        Unsuccessful results are skipped. Non-frame force dicts are ignored;
+        see ``combination_processor.compute_envelope`` for the full envelope.
+        """
+        names = [name for name, result in results.items() if result.success]
+        tags, end_forces, present = stack_node_tables(
+            [results[name].element_forces.frames for name in names]
+        )
+        if end_forces.shape[2] != len(FRAME_FORCE_KEYS):
+            end_forces = np.zeros((len(names), tags.size, len(FRAME_FORCE_KEYS)))
+        return cls.from_end_forces(names, tags, end_forces, present, extra=extra)
+
+    def component_max_values(self, component: str) -> np.ndarray:
+        """Enveloped ``<component>_max`` magnitude per element, in iteration order.
+
+        Read from the reduced arrays; only elements that also have an
+        ``extra`` envelope are materialized.
+        """
+        col = ENVELOPE_COMPONENTS.index(component)
+        values = self.max_values[:, col].astype(float)
+        if not self._extra:
+            return values
+        merged = [getattr(self[tag], f"{component}_max").max_value for tag in self._extra]
+        rows = [self._row[tag] for tag in self._extra if tag in self._row]
+        values[rows] = [value for tag, value in zip(self._extra, merged) if tag in self._row]
+        extra_only = [value for tag, value in zip(self._extra, merged) if tag not in self._row]
+        return np.concatenate([values, np.asarray(extra_only, dtype=float)])
+
+    def governing_case(self, element_id: int, field_name: str) -> Optional[str]:
+        """Name of the combination governing e.g. ``"Mz_max"`` of an element."""
+        value = getattr(self[element_id], field_name)
+        if field_name.endswith("_max"):
+            return value.governing_max_case_name
+        return value.governing_min_case_name
+
+    def _materialize(self, element_id: int) -> ElementForceEnvelope:
+        row = self._row[element_id]
+        envelope = self._extra.get(element_id) or ElementForceEnvelope(element_id=element_id)
+        for col, component in enumerate(ENVELOPE_COMPONENTS):
+            max_case = int(self.max_index[row, col])
+            if max_case >= 0:
+                value = getattr(envelope, f"{component}_max")
+                if value.governing_max_case_name is None or self.max_values[row, col] > value.max_value:
+                    value.max_value = float(self.max_values[row, col])
+                    value.governing_max_case_name = self.case_names[max_case]
+                    value.governing_max_location = element_id
+                    if self.case_labels is not None:
+                        value.governing_max_case = self.case_labels[max_case]
+
+            min_case = int(self.min_index[row, col])
+            if min_case >= 0:
+                value = getattr(envelope, f"{component}_min")
+                if value.governing_min_case_name is None or self.min_values[row, col] < value.min_value:
+                    value.min_value = float(self.min_values[row, col])
+                    value.governing_min_case_name = self.case_names[min_case]
+                    value.governing_min_location = element_id
+                    if self.case_labels is not None:
+                        value.governing_min_case = self.case_labels[min_case]
+        return envelope
+
+    def __getitem__(self, element_id: int) -> ElementForceEnvelope:
+        envelope = self._cache.get(element_id)
+        if envelope is None:
+            if element_id in self._row:
+                envelope = self._materialize(element_id)
+            else:
+                envelope = self._extra[element_id]
+            self._cache[element_id] = envelope
+        return envelope
+
+    def __contains__(self, element_id: object) -> bool:
+        return element_id in self._row or element_id in self._extra
+
+    def __iter__(self) -> Iterator[int]:
+        yield from self._row
+        for element_id in self._extra:
+            if element_id not in self._row:
+                yield element_id
+
+    def __len__(self) -> int:
+        return len(self._row) + sum(1 for tag in self._extra if tag not in self._row)
+
+    def __repr__(self) -> str:
+        return f"ForceEnvelope(elements={len(self)}, combinations={len(self.case_names)})"
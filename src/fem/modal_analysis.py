@@ -0,0 +1,260 @@
+"""
+Modal analysis of FEMModel with lumped floor mass.
+
+Mass is derived from the gravity load patterns: self-weight and
+superimposed dead load in full plus a fraction of live load, converted
+with ``m = W / g`` at every loaded node. Only the horizontal translations
+carry mass, so slab vertical modes stay out of the lateral spectrum.
+Masses of diaphragm nodes are lumped onto the master through the rigid
+diaphragm constraint map (``M_red = T^T M T``), which gives each master
+its floor mass, the coupling to its offset from the centre of mass and the
+polar moment of inertia about the master.
+
+The lowest modes are extracted with ARPACK Lanczos in shift-invert mode
+about zero, reusing the sparse static factorization of the stiffness.
+Results are cached by ``FEMModel.fingerprint`` so reruns on an unchanged
+model return immediately.
+"""
+
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+from src.fem.fem_engine import FEMModel
+from src.fem.result_tables import NodeResultTable
+from src.fem.sparse_solver import DOFS_PER_NODE, SparseFEMSolver, sp, spla
+
+_logger = logging.getLogger(__name__)
+
+GRAVITY = 9.81  # m/s²
+
+# Default number of modes extracted
+DEFAULT_N_MODES = 6
+
+# Share of live load taken as seismic/dynamic mass
+DEFAULT_LIVE_LOAD_MASS_FRACTION = 0.3
+
+# Horizontal directions reported for participation, as full-DOF offsets
+MODAL_DIRECTIONS = {"X": 0, "Y": 1}
+
+# Modal results kept in the default cache
+DEFAULT_CACHE_ENTRIES = 8
+
+ModalCacheKey = Tuple[str, int, float]
+
+
+@dataclass
+class ModalResult:
+    """Periods, mode shapes and participation of the lowest modes.
+
+    Attributes:
+        periods: Natural periods (s), longest (fundamental) first
+        frequencies: Natural frequencies (Hz)
+        node_tags: Node tags in mode-shape row order
+        mode_shapes: Mass-normalized full-DOF shapes, (n_nodes * 6, n_modes)
+        participation_factors: {"X"/"Y": participation factor per mode}
+        effective_mass_ratios: {"X"/"Y": effective modal mass / total mass}
+        total_mass: {"X"/"Y": total mobile mass (kg)}
+        fingerprint: Model fingerprint the modes were computed for
+    """
+    periods: np.ndarray
+    frequencies: np.ndarray
+    node_tags: np.ndarray
+    mode_shapes: np.ndarray
+    participation_factors: Dict[str, np.ndarray] = field(default_factory=dict)
+    effective_mass_ratios: Dict[str, np.ndarray] = field(default_factory=dict)
+    total_mass: Dict[str, float] = field(default_factory=dict)
+    fingerprint: str = ""
+
+    @property
+    def n_modes(self) -> int:
+        return int(self.periods.size)
+
+    @property
+    def fundamental_period(self) -> float:
+        """Period of the first mode (s), 0.0 when no mode was found."""
+        return float(self.periods[0]) if self.periods.size else 0.0
+
+    def cumulative_mass_ratio(self, direction: str) -> np.ndarray:
+        """Running sum of effective mass ratios in ``direction``."""
+        return np.cumsum(self.effective_mass_ratios[direction])
+
+    def dominant_direction(self, mode: int) -> str:
+        """Direction with the largest effective mass in ``mode`` (0-based)."""
+        return max(MODAL_DIRECTIONS, key=lambda d: self.effective_mass_ratios[d][mode])
+
+    def mode_shape(self, mode: int) -> NodeResultTable:
+        """Shape of ``mode`` (0-based) as a node table, one row of 6 DOFs per node."""
+        shape = self.mode_shapes[:, mode].reshape(-1, DOFS_PER_NODE)
+        return NodeResultTable.from_arrays(self.node_tags, shape)
+
+
+def build_lumped_mass(model: FEMModel,
+                      solver: SparseFEMSolver,
+                      live_load_fraction: float = DEFAULT_LIVE_LOAD_MASS_FRACTION) -> np.ndarray:
+    """Full-DOF diagonal mass from the DL, SDL and LL load patterns.
+
+    Args:
+        model: FEMModel with gravity loads in the standard patterns
+        solver: Assembled solver of ``model``
+        live_load_fraction: Share of LL treated as mass
+
+    Returns:
+        Mass per full DOF (kg), non-zero on UX and UY only
+    """
+    loads = solver.case_loads(["DL", "SDL", "LL"])
+    factors = (1.0, 1.0, live_load_fraction)
+    weight = -sum(factor * case.nodal[2::DOFS_PER_NODE] for factor, case in zip(factors, loads))
+    node_mass = np.clip(weight, 0.0, None) / GRAVITY
+
+    mass = np.zeros(solver.system.n_dofs)
+    for offset in MODAL_DIRECTIONS.values():
+        mass[offset::DOFS_PER_NODE] = node_mass
+    return mass
+
+
+def run_modal_analysis(model: FEMModel,
+                       n_modes: int = DEFAULT_N_MODES,
+                       live_load_fraction: float = DEFAULT_LIVE_LOAD_MASS_FRACTION,
+                       solver: Optional[SparseFEMSolver] = None) -> ModalResult:
+    """Extract the lowest ``n_modes`` modes of a model.
+
+    Args:
+        model: FEMModel to analyze
+        n_modes: Number of modes (capped by the number of mass DOFs)
+        live_load_fraction: Share of LL treated as mass
+        solver: Optional factorized SparseFEMSolver of ``model`` to reuse
+
+    Returns:
+        ModalResult with modes in order of increasing frequency
+
+    Raises:
+        ImportError: If scipy is not installed
+        ValueError: If the model carries no gravity load to derive mass from
+    """
+    if sp is None:
+        raise ImportError("scipy is not installed. Install with: pip install scipy")
+    if solver is None:
+        solver = SparseFEMSolver(model)
+    if solver._solve is None:
+        solver.factorize()
+    system = solver.system
+    T = system.constraint_map
+
+    mass = build_lumped_mass(model, solver, live_load_fraction)
+    M_red = (T.T @ sp.diags(mass) @ T).tocsc()
+    n_mass_dofs = int(np.count_nonzero(M_red.diagonal() > 0.0))
+    if n_mass_dofs == 0:
+        raise ValueError("Model has no gravity load in the DL/SDL/LL patterns to derive mass from")
+    k = min(n_modes, n_mass_dofs - 1, system.n_free - 1)
+
+    n_free = system.n_free
+    stiffness_inverse = spla.LinearOperator(
+        (n_free, n_free), matvec=lambda x: solver._solve(np.asarray(x).ravel()), dtype=float,
+    )
+    eigenvalues, vectors = spla.eigsh(
+        system.reduced_stiffness, k=k, M=M_red, sigma=0.0, which="LM", OPinv=stiffness_inverse,
+    )
+    order = np.argsort(eigenvalues)
+    eigenvalues = np.clip(eigenvalues[order], 0.0, None)
+    vectors = vectors[:, order]
+    modal_mass = np.einsum('im,im->m', vectors, M_red @ vectors)
+    vectors /= np.sqrt(modal_mass)
+
+    omega = np.sqrt(eigenvalues)
+    with np.errstate(divide="ignore"):
+        periods = np.where(omega > 0.0, 2.0 * np.pi / omega, np.inf)
+    shapes = np.asarray(system.expand(vectors))
+
+    # Mass on restrained DOFs moves with the ground and does not participate
+    mobile = np.asarray(abs(T).sum(axis=1)).ravel() > 0.0
+    participation: Dict[str, np.ndarray] = {}
+    ratios: Dict[str, np.ndarray] = {}
+    totals: Dict[str, float] = {}
+    for direction, offset in MODAL_DIRECTIONS.items():
+        influence = np.zeros(system.n_dofs)
+        influence[offset::DOFS_PER_NODE] = 1.0
+        total = float((mass * mobile) @ influence)
+        gamma = shapes.T @ (mass * influence)
+        participation[direction] = gamma
+        ratios[direction] = gamma**2 / total if total > 0.0 else np.zeros_like(gamma)
+        totals[direction] = total
+
+    return ModalResult(
+        periods=periods,
+        frequencies=omega / (2.0 * np.pi),
+        node_tags=system.node_tags.copy(),
+        mode_shapes=shapes,
+        participation_factors=participation,
+        effective_mass_ratios=ratios,
+        total_mass=totals,
+    )
+
+
+class ModalResultCache:
+    """LRU cache of ``ModalResult`` keyed by model fingerprint.
+
+    Attributes:
+        max_entries: Number of modal results kept
+        hits: Lookups served from the cache
+        misses: Lookups that ran an eigen analysis
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_CACHE_ENTRIES):
+        if max_entries <= 0:
+            raise ValueError("max_entries must be positive")
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[ModalCacheKey, ModalResult]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self,
+            model: FEMModel,
+            n_modes: int = DEFAULT_N_MODES,
+            live_load_fraction: float = DEFAULT_LIVE_LOAD_MASS_FRACTION,
+            solver: Optional[SparseFEMSolver] = None) -> ModalResult:
+        """Return the modes of ``model``, computing them on a miss."""
+        fingerprint = model.fingerprint()
+        key = (fingerprint, int(n_modes), float(live_load_fraction))
+        with self._lock:
+            result = self._entries.get(key)
+            if result is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return result
+            self.misses += 1
+
+        _logger.debug("Modal cache miss for model %s", fingerprint)
+        result = run_modal_analysis(model, n_modes, live_load_fraction, solver)
+        result.fingerprint = fingerprint
+        with self._lock:
+            self._entries[key] = result
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return result
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_default_cache = ModalResultCache()
+
+
+def get_modal_result(model: FEMModel,
+                     n_modes: int = DEFAULT_N_MODES,
+                     live_load_fraction: float = DEFAULT_LIVE_LOAD_MASS_FRACTION,
+                     solver: Optional[SparseFEMSolver] = None) -> ModalResult:
+    """Modal result of ``model`` from the process-wide fingerprint cache.
+
+    ``solver`` is an optional SparseFEMSolver of ``model`` used on a miss.
+    """
+    return _default_cache.get(model, n_modes, live_load_fraction, solver)
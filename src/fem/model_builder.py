@@ -10,16 +10,19 @@ Floor-based node numbering scheme:
   - Ground level (0): nodes 1-999
   - Level N (N >= 1): nodes N*1000 to N*1000+999
   - Shell elements (walls): nodes 50000-59999
-  - Shell elements (slabs): nodes 60000-69999
+  - Shell elements (slabs): nodes 60000-69999 (above the floor-numbered
+    tags for buildings of 60 floors or more)
   
 Reference: https://opensees.berkeley.edu/wiki/index.php?title=Getting_Started_with_BuildingTcl
 """
 
 from dataclasses import dataclass
-from typing import Dict, List, Tuple, Optional, Set, TYPE_CHECKING
+from typing import Dict, List, Tuple, Optional, Sequence, Set, TYPE_CHECKING, Union
 import logging
 import math
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
 from src.core.constants import CONCRETE_DENSITY, MIN_BEAM_WIDTH, MIN_BEAM_DEPTH, MIN_COLUMN_SIZE
@@ -39,7 +42,7 @@ from src.fem.core_wall_geometry import (
     resolve_i_section_plan_dimensions,
 )
 from src.fem.coupling_beam import CouplingBeamGenerator
-from src.fem.fem_engine import FEMModel, RigidDiaphragm, Load, Node, Element, ElementType, UniformLoad
+from src.fem.fem_engine import FEMModel, FloorIndex, RigidDiaphragm, Load, Node, Element, ElementType, UniformLoad
 from src.fem.materials import ConcreteProperties, get_elastic_beam_section, get_elastic_membrane_plate_section, get_plane_stress_material, get_plate_fiber_section
 from src.fem.wall_element import WallPanel, WallMeshGenerator
 
@@ -57,19 +60,7 @@ def _group_nodes_by_elevation(model: FEMModel, tolerance: float = 1e-6) -> Dict[
     Returns:
         Mapping of floor elevation to list of node tags at that elevation
     """
-    floors: Dict[float, List[int]] = {}
-    for node in model.nodes.values():
-        elevation = node.z
-        matched_level = None
-        for level in floors:
-            if abs(level - elevation) <= tolerance:
-                matched_level = level
-                break
-        if matched_level is None:
-            floors[elevation] = [node.tag]
-        else:
-            floors[matched_level].append(node.tag)
-    return floors
+    return model.floor_index(tolerance).groups()
 
 
 def create_floor_rigid_diaphragms(model: FEMModel,
@@ -96,13 +87,11 @@ def create_floor_rigid_diaphragms(model: FEMModel,
         target_levels = list(floors.keys())
         level_nodes = floors
     else:
+        index = model.floor_index(tolerance)
         target_levels = floor_elevations
-        level_nodes: Dict[float, List[int]] = {}
-        for level in target_levels:
-            level_nodes[level] = [
-                node.tag for node in model.nodes.values()
-                if abs(node.z - level) <= tolerance
-            ]
+        level_nodes: Dict[float, List[int]] = {
+            level: index.nodes_at(level) for level in target_levels
+        }
 
     for level in target_levels:
         if abs(level - base_elevation) <= tolerance:
@@ -167,6 +156,10 @@ def apply_lateral_loads_to_diaphragms(model: FEMModel,
             z = model.nodes[diaphragm.master_node].z
             master_lookup[z] = diaphragm.master_node
 
+    master_levels = FloorIndex(tolerance)
+    for level in master_lookup:
+        master_levels.add(level)
+
     used_masters: Dict[float, int] = {}
     levels_to_apply = set(floor_shears.keys())
     if torsional_moments:
@@ -175,16 +168,10 @@ def apply_lateral_loads_to_diaphragms(model: FEMModel,
     for target_level in levels_to_apply:
         shear = floor_shears.get(target_level, 0.0)
         torque = torsional_moments.get(target_level, 0.0) if torsional_moments else 0.0
-        matched_level = None
-        matched_master = None
-        for level, master in master_lookup.items():
-            if abs(level - target_level) <= tolerance:
-                matched_level = level
-                matched_master = master
-                break
-
-        if matched_master is None or matched_level is None:
+        matched_level = master_levels.match(target_level)
+        if matched_level is None:
             raise ValueError(f"No diaphragm master found for elevation {target_level} m")
+        matched_master = master_lookup[matched_level]
 
         load_values = [0.0] * 6  # Fx, Fy, Fz, Mx, My, Mz
         if direction == "X":
@@ -228,11 +215,22 @@ class ModelBuilderOptions:
     omit_columns_near_core: bool = True
     column_omission_threshold: float = 0.5  # meters (400mm wall + 500mm column + 100mm clearance)
     suggested_omit_columns: Tuple[str, ...] = ()  # User-reviewable column IDs (frozen for immutability)
+    # Trim beams against the core and lay out slab panels once per plan, then
+    # reuse them on every floor; columns and walls are still built per storey.
+    # False repeats the trimming and slab layout storey by storey
+    share_plan_layouts: bool = True
 
 
 # Floor-based node numbering: Level N uses N*FLOOR_NODE_BASE as base tag
 # Ground level (0) uses tags 1-999, Level 1 uses 1001-1999, etc.
 FLOOR_NODE_BASE = 1000
+# Slab mesh nodes are numbered from here (raised for towers of 60+ floors)
+SLAB_NODE_BASE = 60000
+# NodeRegistry hash grid cell size as a multiple of the merge tolerance.
+# Cells are centred on multiples of the cell size, so the round-number
+# coordinates of a building grid sit mid-cell and rarely need a
+# neighbour-cell lookup.
+REGISTRY_CELL_TOLERANCE_RATIO = 100.0
 SHELL_TRI_TAG_OFFSET = 300000
 
 
@@ -328,19 +326,72 @@ class NodeRegistry:
       - Level N (N >= 1): nodes N*1000 to N*1000+999
     
     This makes node tags self-documenting: node 2005 is clearly on Level 2.
+    
+    Coincident points are found through a uniform spatial hash grid: a
+    point matches the nearest registered node within ``tolerance``, also
+    when the two straddle a cell boundary. ``get_or_create_many`` and
+    ``find_many`` take (N, 3) coordinate arrays for mesh generators.
     """
 
     def __init__(self, model: FEMModel, tolerance: float = 1e-6) -> None:
+        if tolerance <= 0.0:
+            raise ValueError(f"tolerance must be positive, got {tolerance}")
         self.model = model
         self.tolerance = tolerance
-        self._key_to_tag: Dict[Tuple[float, float, float], int] = {}
+        self._cell_size = tolerance * REGISTRY_CELL_TOLERANCE_RATIO
+        # Hash grid cell -> [(tag, x, y, z), ...]
+        self._cells: Dict[Tuple[int, int, int], List[Tuple[int, float, float, float]]] = {}
         # Track next available tag per floor level
         self._floor_counters: Dict[int, int] = {}
         # Track nodes per floor for diaphragm creation
         self.nodes_by_floor: Dict[int, List[int]] = {}
 
-    def _key(self, x: float, y: float, z: float) -> Tuple[float, float, float]:
-        return (round(x, 6), round(y, 6), round(z, 6))
+    def _cell_ranges(self, coords: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Lowest and highest cell index per axis within tolerance of each point."""
+        low = np.floor((coords - self.tolerance) / self._cell_size + 0.5).astype(np.int64)
+        high = np.floor((coords + self.tolerance) / self._cell_size + 0.5).astype(np.int64)
+        return low, high
+
+    def _find(self, x: float, y: float, z: float,
+              low: Sequence[int], high: Sequence[int]) -> Optional[int]:
+        if low == high:
+            bucket = self._cells.get(tuple(low))
+            if not bucket:
+                return None
+            candidates = bucket
+        else:
+            candidates = []
+            for cx in range(low[0], high[0] + 1):
+                for cy in range(low[1], high[1] + 1):
+                    for cz in range(low[2], high[2] + 1):
+                        candidates.extend(self._cells.get((cx, cy, cz), ()))
+
+        best_tag = None
+        best_dist = self.tolerance * self.tolerance
+        for tag, px, py, pz in candidates:
+            dist = (px - x) ** 2 + (py - y) ** 2 + (pz - z) ** 2
+            if dist <= best_dist:
+                best_tag, best_dist = tag, dist
+        return best_tag
+
+    def _insert(self, tag: int, x: float, y: float, z: float) -> None:
+        key = (
+            math.floor(x / self._cell_size + 0.5),
+            math.floor(y / self._cell_size + 0.5),
+            math.floor(z / self._cell_size + 0.5),
+        )
+        self._cells.setdefault(key, []).append((tag, x, y, z))
+
+    def _point_cell_range(self, x: float, y: float, z: float) -> Tuple[List[int], List[int]]:
+        """Scalar form of ``_cell_ranges`` for a single point."""
+        tol, size = self.tolerance, self._cell_size
+        low = [math.floor((v - tol) / size + 0.5) for v in (x, y, z)]
+        high = [math.floor((v + tol) / size + 0.5) for v in (x, y, z)]
+        return low, high
+
+    def _lookup(self, x: float, y: float, z: float) -> Optional[int]:
+        low, high = self._point_cell_range(x, y, z)
+        return self._find(x, y, z, low, high)
 
     def _get_next_tag_for_floor(self, floor_level: int) -> int:
         """Get next available node tag for given floor level."""
@@ -354,6 +405,38 @@ class NodeRegistry:
         self._floor_counters[floor_level] += 1
         return tag
 
+    def _resolve(self, x: float, y: float, z: float,
+                 low: Sequence[int], high: Sequence[int],
+                 restraints: Optional[Sequence[int]],
+                 floor_level: Optional[int]) -> int:
+        tag = self._find(x, y, z, low, high)
+        if tag is not None:
+            if restraints is not None and any(restraints):
+                node = self.model.nodes[tag]
+                node.restraints = [max(a, b) for a, b in zip(node.restraints, restraints)]
+                self.model.mark_modified()
+            return tag
+
+        # Generate floor-based tag if floor_level provided
+        if floor_level is not None:
+            tag = self._get_next_tag_for_floor(floor_level)
+        else:
+            # Legacy sequential numbering (for backward compatibility)
+            tag = self._get_next_tag_for_floor(0)
+        
+        node = Node(tag=tag, x=x, y=y, z=z,
+                    restraints=list(restraints) if restraints is not None else [0, 0, 0, 0, 0, 0])
+        self.model.add_node(node)
+        self._insert(tag, x, y, z)
+        
+        # Track node by floor level
+        if floor_level is not None:
+            if floor_level not in self.nodes_by_floor:
+                self.nodes_by_floor[floor_level] = []
+            self.nodes_by_floor[floor_level].append(tag)
+        
+        return tag
+
     def get_or_create(self,
                       x: float,
                       y: float,
@@ -373,37 +456,61 @@ class NodeRegistry:
         Returns:
             Node tag (existing or newly created)
         """
-        key = self._key(x, y, z)
-        if key in self._key_to_tag:
-            tag = self._key_to_tag[key]
-            if restraints:
-                node = self.model.nodes[tag]
-                node.restraints = [max(a, b) for a, b in zip(node.restraints, restraints)]
-            return tag
-
-        # Generate floor-based tag if floor_level provided
-        if floor_level is not None:
-            tag = self._get_next_tag_for_floor(floor_level)
-        else:
-            # Legacy sequential numbering (for backward compatibility)
-            tag = self._get_next_tag_for_floor(0)
+        low, high = self._point_cell_range(x, y, z)
+        return self._resolve(x, y, z, low, high, restraints or None, floor_level)
+
+    def get_or_create_many(self,
+                           coords: np.ndarray,
+                           restraints: Optional[np.ndarray] = None,
+                           floor_levels: Union[int, Sequence[int], np.ndarray, None] = None,
+                           ) -> np.ndarray:
+        """Batch form of ``get_or_create``.
         
-        node = Node(tag=tag, x=x, y=y, z=z,
-                    restraints=restraints or [0, 0, 0, 0, 0, 0])
-        self.model.add_node(node)
-        self._key_to_tag[key] = tag
+        Points are resolved in row order, so the tags and the nodes created
+        equal those of one ``get_or_create`` call per row, including
+        duplicates within the batch.
         
-        # Track node by floor level
-        if floor_level is not None:
-            if floor_level not in self.nodes_by_floor:
-                self.nodes_by_floor[floor_level] = []
-            self.nodes_by_floor[floor_level].append(tag)
+        Args:
+            coords: Array of shape (N, 3) with x, y, z (m)
+            restraints: Optional restraints for all rows (length 6) or per
+                        row (N, 6); all-zero rows add no restraint
+            floor_levels: Optional floor level for all rows or per row
         
-        return tag
+        Returns:
+            Node tags, int64 array of length N
+        """
+        points = np.asarray(coords, dtype=float).reshape(-1, 3)
+        count = points.shape[0]
+        low, high = self._cell_ranges(points)
+
+        if restraints is None:
+            row_restraints: List[Optional[List[int]]] = [None] * count
+        else:
+            restraint_array = np.broadcast_to(np.asarray(restraints, dtype=int), (count, 6))
+            row_restraints = restraint_array.tolist()
+        if floor_levels is None or np.ndim(floor_levels) == 0:
+            row_levels = [floor_levels] * count
+        else:
+            row_levels = np.asarray(floor_levels, dtype=np.int64).reshape(count).tolist()
+
+        tags = np.empty(count, dtype=np.int64)
+        for row, ((x, y, z), lo, hi) in enumerate(zip(points.tolist(), low.tolist(), high.tolist())):
+            tags[row] = self._resolve(x, y, z, lo, hi, row_restraints[row], row_levels[row])
+        return tags
 
     def get_existing(self, x: float, y: float, z: float) -> Optional[int]:
-        key = self._key(x, y, z)
-        return self._key_to_tag.get(key)
+        return self._lookup(x, y, z)
+
+    def find_many(self, coords: np.ndarray) -> np.ndarray:
+        """Tags of registered nodes at ``coords`` (N, 3); -1 where none exists."""
+        points = np.asarray(coords, dtype=float).reshape(-1, 3)
+        low, high = self._cell_ranges(points)
+        tags = np.full(points.shape[0], -1, dtype=np.int64)
+        for row, ((x, y, z), lo, hi) in enumerate(zip(points.tolist(), low.tolist(), high.tolist())):
+            tag = self._find(x, y, z, lo, hi)
+            if tag is not None:
+                tags[row] = tag
+        return tags
 
     def register_existing(
         self,
@@ -414,9 +521,8 @@ class NodeRegistry:
         z: float,
         floor_level: Optional[int] = None,
     ) -> None:
-        key = self._key(x, y, z)
-        if key not in self._key_to_tag:
-            self._key_to_tag[key] = node_tag
+        if self._lookup(x, y, z) is None:
+            self._insert(node_tag, x, y, z)
 
         if floor_level is not None:
             if floor_level not in self.nodes_by_floor:
@@ -424,6 +530,26 @@ class NodeRegistry:
             if node_tag not in self.nodes_by_floor[floor_level]:
                 self.nodes_by_floor[floor_level].append(node_tag)
 
+    def register_many(self,
+                      node_tags: Sequence[int],
+                      coords: np.ndarray,
+                      floor_level: Optional[int] = None) -> None:
+        """Register nodes added to the model outside the registry.
+        
+        Batch form of ``register_existing`` for nodes on one floor. Nodes
+        whose location is already registered are skipped.
+        """
+        points = np.asarray(coords, dtype=float).reshape(-1, 3)
+        low, high = self._cell_ranges(points)
+        added: List[int] = []
+        for tag, (x, y, z), lo, hi in zip(node_tags, points.tolist(), low.tolist(), high.tolist()):
+            if self._find(x, y, z, lo, hi) is None:
+                self._insert(int(tag), x, y, z)
+                added.append(int(tag))
+
+        if floor_level is not None and added:
+            self.nodes_by_floor.setdefault(floor_level, []).extend(added)
+
 
 def _get_core_wall_outline(geometry: CoreWallGeometry) -> List[Tuple[float, float]]:
     """Get core wall outline coordinates in mm based on configuration."""
@@ -1105,6 +1231,47 @@ def _compute_wtz_torsional_moments(
     return torsional_moments, basis
 
 
+def compute_wind_floor_loads(project: ProjectData) -> Tuple[Dict[str, Dict[float, float]], str]:
+    """Floor loads of the Wx, Wy and Wtz component cases.
+
+    Args:
+        project: Project with ``wind_result`` set
+
+    Returns:
+        ({"Wx"/"Wy": {elevation: shear (N)}, "Wtz": {elevation: Mz (N-m)}},
+        Wtz basis label)
+    """
+    geometry = project.geometry
+    floor_shears_x = _compute_floor_shears(
+        wind_result=project.wind_result,
+        direction="X",
+        story_height=geometry.story_height,
+        floors=geometry.floors,
+    )
+    floor_shears_y = _compute_floor_shears(
+        wind_result=project.wind_result,
+        direction="Y",
+        story_height=geometry.story_height,
+        floors=geometry.floors,
+    )
+
+    building_width = project.lateral.building_width
+    if building_width <= 0.0:
+        building_width = geometry.bay_x * geometry.num_bays_x
+
+    building_depth = project.lateral.building_depth
+    if building_depth <= 0.0:
+        building_depth = geometry.bay_y * geometry.num_bays_y
+
+    torsional_moments, basis = _compute_wtz_torsional_moments(
+        floor_shears_x=floor_shears_x,
+        floor_shears_y=floor_shears_y,
+        building_width=building_width,
+        building_depth=building_depth,
+    )
+    return {"Wx": floor_shears_x, "Wy": floor_shears_y, "Wtz": torsional_moments}, basis
+
+
 def _extract_wall_panels(
     core_geometry: CoreWallGeometry,
     offset_x: float,
@@ -1380,6 +1547,21 @@ def get_column_omission_suggestions(
 NUM_SUBDIVISIONS = 4
 
 
+def _interior_points(start: Sequence[float], end: Sequence[float], divisions: int) -> np.ndarray:
+    """Points dividing the line start -> end into equal parts, shape (divisions - 1, 3)."""
+    a = np.asarray(start, dtype=float)
+    b = np.asarray(end, dtype=float)
+    t = np.arange(1, divisions)[:, None] / divisions
+    return a + t * (b - a)
+
+# Section tags of sized members, shared by build_fem_model and
+# update_fem_model_sections
+PRIMARY_SECTION_TAG = 1
+SECONDARY_SECTION_TAG = 2
+COLUMN_SECTION_TAG = 3
+SLAB_SECTION_TAG = 5
+
+
 def _create_subdivided_beam(
     model: FEMModel,
     registry: "NodeRegistry",
@@ -1415,18 +1597,11 @@ def _create_subdivided_beam(
     end_x, end_y, end_z = end_node_obj.x, end_node_obj.y, end_node_obj.z
     
     # Create 3 intermediate nodes + reuse start/end (total 5 nodes)
-    node_tags = [start_node]
-    
-    for i in range(1, NUM_SUBDIVISIONS):
-        t = i / NUM_SUBDIVISIONS  # 1/4, 2/4, 3/4
-        inter_x = start_x + t * (end_x - start_x)
-        inter_y = start_y + t * (end_y - start_y)
-        inter_z = start_z + t * (end_z - start_z)
-        
-        inter_node = registry.get_or_create(inter_x, inter_y, inter_z, floor_level=floor_level)
-        node_tags.append(inter_node)
-    
-    node_tags.append(end_node)
+    inter_nodes = registry.get_or_create_many(
+        _interior_points((start_x, start_y, start_z), (end_x, end_y, end_z), NUM_SUBDIVISIONS),
+        floor_levels=floor_level,
+    )
+    node_tags = [start_node, *inter_nodes.tolist(), end_node]
     
     # Track parent beam ID for logical grouping
     parent_beam_id = element_tag
@@ -1463,6 +1638,119 @@ def _create_subdivided_beam(
     return element_tag, parent_beam_id
 
 
+def _slab_base_node_tag(floors: int) -> int:
+    """First slab node tag: 60000, or above the floor-numbered tags of tall buildings."""
+    return max(SLAB_NODE_BASE, (floors + 1) * FLOOR_NODE_BASE)
+
+
+def _plan_beam_segments(
+    lines: List[Tuple[Tuple[float, float], Tuple[float, float]]],
+    polygon: Optional[List[Tuple[float, float]]],
+    tolerance: float,
+) -> List[BeamSegment]:
+    """Trim plan beam lines (m) against the core polygon (mm).
+    
+    Segments no longer than ``tolerance`` are dropped. The result does not
+    depend on elevation, so one call serves every floor.
+    """
+    segments: List[BeamSegment] = []
+    for (x_start, y_start), (x_end, y_end) in lines:
+        for segment in trim_beam_segment_against_polygon(
+            start=(x_start * 1000.0, y_start * 1000.0),
+            end=(x_end * 1000.0, y_end * 1000.0),
+            polygon=polygon,
+        ):
+            if math.hypot(segment.end[0] - segment.start[0],
+                          segment.end[1] - segment.start[1]) <= tolerance * 1000:
+                continue
+            segments.append(segment)
+    return segments
+
+
+def _stamp_floor_beams(
+    model: FEMModel,
+    registry: "NodeRegistry",
+    segments: List[BeamSegment],
+    *,
+    z: float,
+    floor_level: int,
+    element_tag: int,
+    section_tag: int,
+    material_tag: int,
+    element_type: ElementType,
+    line_load: Optional[float],
+    load_pattern: int,
+) -> int:
+    """Create one floor of subdivided beams from plan segments.
+    
+    Nodes of all segments (start, end, then the interior points of each
+    segment) are resolved in one registry batch, which yields the same tags
+    as calling ``_create_subdivided_beam`` segment by segment.
+    
+    Args:
+        model: FEM model to add elements to
+        registry: Node registry for node creation/reuse
+        segments: Plan segments in mm (see ``_plan_beam_segments``)
+        z: Floor elevation (m)
+        floor_level: Floor level for node numbering
+        element_tag: First element tag
+        section_tag: Section property tag
+        material_tag: Material tag
+        element_type: ELASTIC_BEAM or SECONDARY_BEAM
+        line_load: Optional self-weight line load (N/m) on each sub-element
+        load_pattern: Load pattern of the self-weight load
+    
+    Returns:
+        Next free element tag
+    """
+    if not segments:
+        return element_tag
+
+    ends = np.array([(segment.start, segment.end) for segment in segments]) / 1000.0
+    ends = np.concatenate([ends, np.full(ends.shape[:2] + (1,), z)], axis=2)
+    t = (np.arange(1, NUM_SUBDIVISIONS) / NUM_SUBDIVISIONS)[None, :, None]
+    interior = ends[:, :1] + t * (ends[:, 1:] - ends[:, :1])
+    tags = registry.get_or_create_many(
+        np.concatenate([ends, interior], axis=1), floor_levels=floor_level
+    ).reshape(len(segments), NUM_SUBDIVISIONS + 1)
+    # start, interior points, end
+    chains = tags[:, [0, *range(2, NUM_SUBDIVISIONS + 1), 1]]
+
+    for chain, (start, end) in zip(chains.tolist(), ends[:, :, :2].tolist()):
+        dx = end[0] - start[0]
+        dy = end[1] - start[1]
+        length_xy = math.hypot(dx, dy)
+        if length_xy > 1e-10:
+            vecxz = (dy / length_xy, -dx / length_xy, 0.0)
+        else:
+            vecxz = (0.0, 0.0, 1.0)
+
+        parent_beam_id = element_tag
+        for i in range(NUM_SUBDIVISIONS):
+            model.add_element(Element(
+                tag=element_tag,
+                element_type=element_type,
+                node_tags=[chain[i], chain[i + 1]],
+                material_tag=material_tag,
+                section_tag=section_tag,
+                geometry={
+                    "vecxz": vecxz,
+                    "parent_beam_id": parent_beam_id,
+                    "sub_element_index": i,
+                },
+            ))
+            if line_load is not None:
+                model.add_uniform_load(UniformLoad(
+                    element_tag=element_tag,
+                    load_type="Gravity",
+                    magnitude=line_load,
+                    load_pattern=load_pattern,
+                ))
+            element_tag += 1
+
+    return element_tag
+
+
 def _resolve_coupling_endpoint_node(
     model: FEMModel,
     registry: NodeRegistry,
@@ -1568,9 +1856,9 @@ def build_fem_model(project: ProjectData,
         "epsU": -0.0035,
     })
 
-    primary_section_tag = 1
-    secondary_section_tag = 2
-    column_section_tag = 3
+    primary_section_tag = PRIMARY_SECTION_TAG
+    secondary_section_tag = SECONDARY_SECTION_TAG
+    column_section_tag = COLUMN_SECTION_TAG
     core_section_tag = 4
 
     primary_section = get_elastic_beam_section(
@@ -1648,22 +1936,15 @@ def build_fem_model(project: ProjectData,
 
                 start_node_obj = model.nodes[start_node]
                 end_node_obj = model.nodes[end_node]
-
-                start_x, start_y, start_z = start_node_obj.x, start_node_obj.y, start_node_obj.z
-                end_x, end_y, end_z = end_node_obj.x, end_node_obj.y, end_node_obj.z
-
-                node_tags = [start_node]
-                for i in range(1, NUM_SUBDIVISIONS):
-                    t = i / NUM_SUBDIVISIONS
-                    inter_x = start_x + t * (end_x - start_x)
-                    inter_y = start_y + t * (end_y - start_y)
-                    inter_z = start_z + t * (end_z - start_z)
-                    inter_node = registry.get_or_create(
-                        inter_x, inter_y, inter_z, floor_level=level
-                    )
-                    node_tags.append(inter_node)
-
-                node_tags.append(end_node)
+                inter_nodes = registry.get_or_create_many(
+                    _interior_points(
+                        (start_node_obj.x, start_node_obj.y, start_node_obj.z),
+                        (end_node_obj.x, end_node_obj.y, end_node_obj.z),
+                        NUM_SUBDIVISIONS,
+                    ),
+                    floor_levels=level,
+                )
+                node_tags = [start_node, *inter_nodes.tolist(), end_node]
 
                 parent_column_id = element_tag
                 for i in range(NUM_SUBDIVISIONS):
@@ -1782,295 +2063,84 @@ def build_fem_model(project: ProjectData,
             core_trim_polygon_global = _get_outer_trim_loop(core_outline_global)
         core_boundary_points.extend(core_outline_global)
 
+    # Beam plan layout: gridline beams and internal secondary beams are
+    # trimmed against the core once and reused on every floor
+    # (``share_plan_layouts``) instead of being re-trimmed per storey.
+    trim_polygon = core_trim_polygon_global if options.trim_beams_at_core else None
+
     # Beams along X direction (AT ALL GRIDLINES)
     # These are the gridline beams and should ALL be PRIMARY beams
-    # Internal subdivision beams are created separately below
-    for level in range(1, geometry.floors + 1):
-        z = level * geometry.story_height
-        for iy in range(geometry.num_bays_y + 1):  # All Y gridlines
-            y = iy * geometry.bay_y
-            # All gridline beams are PRIMARY beams
-            section_tag = primary_section_tag
-            section_dims = beam_sizes["primary"]
-
-            for ix in range(geometry.num_bays_x):
-                x_start = ix * geometry.bay_x
-                x_end = (ix + 1) * geometry.bay_x
-                segments = trim_beam_segment_against_polygon(
-                    start=(x_start * 1000.0, y * 1000.0),
-                    end=(x_end * 1000.0, y * 1000.0),
-                    polygon=core_trim_polygon_global if options.trim_beams_at_core else None,
-                )
-
-                for segment in segments:
-                    if math.hypot(segment.end[0] - segment.start[0],
-                                  segment.end[1] - segment.start[1]) <= options.tolerance * 1000:
-                        continue
-                    start_node = registry.get_or_create(
-                        segment.start[0] / 1000.0, segment.start[1] / 1000.0, z,
-                        floor_level=level
-                    )
-                    end_node = registry.get_or_create(
-                        segment.end[0] / 1000.0, segment.end[1] / 1000.0, z,
-                        floor_level=level
-                    )
-
-                    if segment.start_connection == BeamConnectionType.MOMENT:
-                        core_boundary_points.append(segment.start)
-                    if segment.end_connection == BeamConnectionType.MOMENT:
-                        core_boundary_points.append(segment.end)
-
-                    element_tag, parent_beam_id = _create_subdivided_beam(
-                        model=model,
-                        registry=registry,
-                        start_node=start_node,
-                        end_node=end_node,
-                        section_tag=section_tag,
-                        material_tag=beam_material_tag,
-                        floor_level=level,
-                        element_tag=element_tag,
-                        element_type=ElementType.ELASTIC_BEAM,
-                    )
-
-                    if options.apply_gravity_loads:
-                        width_m = section_dims[0] / 1000.0
-                        depth_m = section_dims[1] / 1000.0
-                        beam_self_weight = CONCRETE_DENSITY * width_m * depth_m
-                        w_total = beam_self_weight * 1000.0  # N/m
-                        for sub_idx in range(NUM_SUBDIVISIONS):
-                            model.add_uniform_load(
-                                UniformLoad(
-                                    element_tag=parent_beam_id + sub_idx,
-                                    load_type="Gravity",
-                                    magnitude=w_total,
-                                    load_pattern=options.dl_load_pattern,
-                                )
-                            )
-
+    x_lines = [
+        ((ix * geometry.bay_x, iy * geometry.bay_y), ((ix + 1) * geometry.bay_x, iy * geometry.bay_y))
+        for iy in range(geometry.num_bays_y + 1)
+        for ix in range(geometry.num_bays_x)
+    ]
     # Beams along Y direction (AT ALL GRIDLINES)
-    # These are the gridline beams and should ALL be PRIMARY beams
-    # Internal subdivision beams are created separately below
-    for level in range(1, geometry.floors + 1):
-        z = level * geometry.story_height
-        for ix in range(geometry.num_bays_x + 1):  # All X gridlines
-            x = ix * geometry.bay_x
-            # All gridline beams are PRIMARY beams
-            section_tag = primary_section_tag
-            section_dims = beam_sizes["primary"]
-
-            for iy in range(geometry.num_bays_y):
-                y_start = iy * geometry.bay_y
-                y_end = (iy + 1) * geometry.bay_y
-                segments = trim_beam_segment_against_polygon(
-                    start=(x * 1000.0, y_start * 1000.0),
-                    end=(x * 1000.0, y_end * 1000.0),
-                    polygon=core_trim_polygon_global if options.trim_beams_at_core else None,
-                )
-
-                for segment in segments:
-                    if math.hypot(segment.end[0] - segment.start[0],
-                                  segment.end[1] - segment.start[1]) <= options.tolerance * 1000:
-                        continue
-                    start_node = registry.get_or_create(
-                        segment.start[0] / 1000.0, segment.start[1] / 1000.0, z,
-                        floor_level=level
-                    )
-                    end_node = registry.get_or_create(
-                        segment.end[0] / 1000.0, segment.end[1] / 1000.0, z,
-                        floor_level=level
-                    )
-
-                    if segment.start_connection == BeamConnectionType.MOMENT:
-                        core_boundary_points.append(segment.start)
-                    if segment.end_connection == BeamConnectionType.MOMENT:
-                        core_boundary_points.append(segment.end)
-
-                    element_tag, parent_beam_id = _create_subdivided_beam(
-                        model=model,
-                        registry=registry,
-                        start_node=start_node,
-                        end_node=end_node,
-                        section_tag=section_tag,
-                        material_tag=beam_material_tag,
-                        floor_level=level,
-                        element_tag=element_tag,
-                        element_type=ElementType.ELASTIC_BEAM,
-                    )
-
-                    if options.apply_gravity_loads:
-                        width_m = section_dims[0] / 1000.0
-                        depth_m = section_dims[1] / 1000.0
-                        beam_self_weight = CONCRETE_DENSITY * width_m * depth_m
-                        w_total = beam_self_weight * 1000.0  # N/m
-                        for sub_idx in range(NUM_SUBDIVISIONS):
-                            model.add_uniform_load(
-                                UniformLoad(
-                                    element_tag=parent_beam_id + sub_idx,
-                                    load_type="Gravity",
-                                    magnitude=w_total,
-                                    load_pattern=options.dl_load_pattern,
-                                )
-                            )
+    y_lines = [
+        ((ix * geometry.bay_x, iy * geometry.bay_y), (ix * geometry.bay_x, (iy + 1) * geometry.bay_y))
+        for ix in range(geometry.num_bays_x + 1)
+        for iy in range(geometry.num_bays_y)
+    ]
+    beam_groups = [
+        (x_lines, primary_section_tag, beam_sizes["primary"], ElementType.ELASTIC_BEAM),
+        (y_lines, primary_section_tag, beam_sizes["primary"], ElementType.ELASTIC_BEAM),
+    ]
 
     # Internal secondary beam subdivision (NEW: Task 18.2)
     # Generate num_secondary_beams internal beams per bay, equally spaced
     # R1: Secondary beams are also trimmed at core wall boundaries
     if options.num_secondary_beams > 0:
-        for level in range(1, geometry.floors + 1):
-            z = level * geometry.story_height
-            floor_level = level
-            
-            # CORRECTED LOGIC: secondary_beam_direction controls subdivision direction
-            # If secondary_beam_direction="Y", create Y-direction beams
-            # If secondary_beam_direction="X", create X-direction beams
-            
-            if options.secondary_beam_direction == "Y":
-                # Secondary beams run along Y (internal to X bays)
-                for ix in range(geometry.num_bays_x):
-                    x_start_bay = ix * geometry.bay_x
-                    x_end_bay = (ix + 1) * geometry.bay_x
-                    
-                    # Create num_secondary_beams equally spaced within this X bay
-                    for i in range(1, options.num_secondary_beams + 1):
-                        x = x_start_bay + (i / (options.num_secondary_beams + 1)) * geometry.bay_x
-                        
-                        # Span from y=0 to y=total_y
-                        for iy in range(geometry.num_bays_y):
-                            y_start = iy * geometry.bay_y
-                            y_end = (iy + 1) * geometry.bay_y
-                            
-                            # R1: Apply beam trimming at core wall boundaries
-                            segments = trim_beam_segment_against_polygon(
-                                start=(x * 1000.0, y_start * 1000.0),
-                                end=(x * 1000.0, y_end * 1000.0),
-                                polygon=core_trim_polygon_global if options.trim_beams_at_core else None,
-                            )
-                            
-                            for segment in segments:
-                                # Skip very short segments (tolerance check)
-                                if math.hypot(segment.end[0] - segment.start[0],
-                                              segment.end[1] - segment.start[1]) <= options.tolerance * 1000:
-                                    continue
-                                
-                                # Create nodes from segment endpoints (converted back to meters)
-                                start_node = registry.get_or_create(
-                                    segment.start[0] / 1000.0, segment.start[1] / 1000.0, z,
-                                    floor_level=floor_level
-                                )
-                                end_node = registry.get_or_create(
-                                    segment.end[0] / 1000.0, segment.end[1] / 1000.0, z,
-                                    floor_level=floor_level
-                                )
-                                
-                                # Track core boundary points for moment connections
-                                if segment.start_connection == BeamConnectionType.MOMENT:
-                                    core_boundary_points.append(segment.start)
-                                if segment.end_connection == BeamConnectionType.MOMENT:
-                                    core_boundary_points.append(segment.end)
-                                
-                                # Create subdivided secondary beam (6 sub-elements)
-                                element_tag, _ = _create_subdivided_beam(
-                                    model=model,
-                                    registry=registry,
-                                    start_node=start_node,
-                                    end_node=end_node,
-                                    section_tag=secondary_section_tag,
-                                    material_tag=beam_material_tag,
-                                    floor_level=floor_level,
-                                    element_tag=element_tag,
-                                    element_type=ElementType.SECONDARY_BEAM,
-                                )
-
-                                # Apply gravity loads to all sub-elements
-                                if options.apply_gravity_loads:
-                                    width_m = beam_sizes["secondary"][0] / 1000.0
-                                    depth_m = beam_sizes["secondary"][1] / 1000.0
-                                    beam_self_weight = CONCRETE_DENSITY * width_m * depth_m
-                                    w_total = beam_self_weight * 1000.0  # N/m
-                                    for sub_idx in range(NUM_SUBDIVISIONS):
-                                        model.add_uniform_load(
-                                            UniformLoad(
-                                                element_tag=element_tag - NUM_SUBDIVISIONS + sub_idx,
-                                                load_type="Gravity",
-                                                magnitude=w_total,
-                                                load_pattern=options.dl_load_pattern,
-                                            )
-                                        )
-
-            else:  # secondary_beam_direction == "X"
-                # Secondary beams run along X (internal to Y bays)
-                for iy in range(geometry.num_bays_y):
-                    y_start_bay = iy * geometry.bay_y
-                    y_end_bay = (iy + 1) * geometry.bay_y
-                    
-                    # Create num_secondary_beams equally spaced within this Y bay
-                    for i in range(1, options.num_secondary_beams + 1):
-                        y = y_start_bay + (i / (options.num_secondary_beams + 1)) * geometry.bay_y
-                        
-                        # Span from x=0 to x=total_x
-                        for ix in range(geometry.num_bays_x):
-                            x_start = ix * geometry.bay_x
-                            x_end = (ix + 1) * geometry.bay_x
-                            
-                            # R1: Apply beam trimming at core wall boundaries
-                            segments = trim_beam_segment_against_polygon(
-                                start=(x_start * 1000.0, y * 1000.0),
-                                end=(x_end * 1000.0, y * 1000.0),
-                                polygon=core_trim_polygon_global if options.trim_beams_at_core else None,
-                            )
-                            
-                            for segment in segments:
-                                # Skip very short segments (tolerance check)
-                                if math.hypot(segment.end[0] - segment.start[0],
-                                              segment.end[1] - segment.start[1]) <= options.tolerance * 1000:
-                                    continue
-                                
-                                # Create nodes from segment endpoints (converted back to meters)
-                                start_node = registry.get_or_create(
-                                    segment.start[0] / 1000.0, segment.start[1] / 1000.0, z,
-                                    floor_level=floor_level
-                                )
-                                end_node = registry.get_or_create(
-                                    segment.end[0] / 1000.0, segment.end[1] / 1000.0, z,
-                                    floor_level=floor_level
-                                )
-                                
-                                # Track core boundary points for moment connections
-                                if segment.start_connection == BeamConnectionType.MOMENT:
-                                    core_boundary_points.append(segment.start)
-                                if segment.end_connection == BeamConnectionType.MOMENT:
-                                    core_boundary_points.append(segment.end)
-                                
-                                # Create subdivided secondary beam (6 sub-elements)
-                                element_tag, _ = _create_subdivided_beam(
-                                    model=model,
-                                    registry=registry,
-                                    start_node=start_node,
-                                    end_node=end_node,
-                                    section_tag=secondary_section_tag,
-                                    material_tag=beam_material_tag,
-                                    floor_level=floor_level,
-                                    element_tag=element_tag,
-                                    element_type=ElementType.SECONDARY_BEAM,
-                                )
-
-                                # Apply gravity loads to all sub-elements
-                                if options.apply_gravity_loads:
-                                    width_m = beam_sizes["secondary"][0] / 1000.0
-                                    depth_m = beam_sizes["secondary"][1] / 1000.0
-                                    beam_self_weight = CONCRETE_DENSITY * width_m * depth_m
-                                    w_total = beam_self_weight * 1000.0  # N/m
-                                    for sub_idx in range(NUM_SUBDIVISIONS):
-                                        model.add_uniform_load(
-                                            UniformLoad(
-                                                element_tag=element_tag - NUM_SUBDIVISIONS + sub_idx,
-                                                load_type="Gravity",
-                                                magnitude=w_total,
-                                                load_pattern=options.dl_load_pattern,
-                                            )
-                                        )
+        spacing = [i / (options.num_secondary_beams + 1) for i in range(1, options.num_secondary_beams + 1)]
+        if options.secondary_beam_direction == "Y":
+            # Secondary beams run along Y (internal to X bays)
+            secondary_lines = [
+                ((x, iy * geometry.bay_y), (x, (iy + 1) * geometry.bay_y))
+                for ix in range(geometry.num_bays_x)
+                for x in (ix * geometry.bay_x + t * geometry.bay_x for t in spacing)
+                for iy in range(geometry.num_bays_y)
+            ]
+        else:  # secondary_beam_direction == "X"
+            # Secondary beams run along X (internal to Y bays)
+            secondary_lines = [
+                ((ix * geometry.bay_x, y), ((ix + 1) * geometry.bay_x, y))
+                for iy in range(geometry.num_bays_y)
+                for y in (iy * geometry.bay_y + t * geometry.bay_y for t in spacing)
+                for ix in range(geometry.num_bays_x)
+            ]
+        beam_groups.append(
+            (secondary_lines, secondary_section_tag, beam_sizes["secondary"], ElementType.SECONDARY_BEAM)
+        )
 
+    for lines, section_tag, section_dims, element_type in beam_groups:
+        line_load = None
+        if options.apply_gravity_loads:
+            beam_self_weight = CONCRETE_DENSITY * (section_dims[0] / 1000.0) * (section_dims[1] / 1000.0)
+            line_load = beam_self_weight * 1000.0  # N/m
 
+        segments = _plan_beam_segments(lines, trim_polygon, options.tolerance)
+        for level in range(1, geometry.floors + 1):
+            if not options.share_plan_layouts and level > 1:
+                segments = _plan_beam_segments(lines, trim_polygon, options.tolerance)
+
+            for segment in segments:
+                if segment.start_connection == BeamConnectionType.MOMENT:
+                    core_boundary_points.append(segment.start)
+                if segment.end_connection == BeamConnectionType.MOMENT:
+                    core_boundary_points.append(segment.end)
+
+            element_tag = _stamp_floor_beams(
+                model,
+                registry,
+                segments,
+                z=level * geometry.story_height,
+                floor_level=level,
+                element_tag=element_tag,
+                section_tag=section_tag,
+                material_tag=beam_material_tag,
+                element_type=element_type,
+                line_load=line_load,
+                load_pattern=options.dl_load_pattern,
+            )
 
     # Core wall elements (ShellMITC4 mesh with PlateFiberSection)
     # MOVED BEFORE SLABS to allow slab mesh to snap to wall nodes
@@ -2226,17 +2296,11 @@ def build_fem_model(project: ProjectData,
                         )
                         
                         # Create 5 intermediate nodes at 1/6, 2/6, 3/6, 4/6, 5/6 positions
-                        node_tags = [start_node]
-                        for i in range(1, NUM_SUBDIVISIONS):
-                            t = i / NUM_SUBDIVISIONS
-                            inter_x = start_x + t * (end_x - start_x)
-                            inter_y = start_y + t * (end_y - start_y)
-                            inter_z = z  # Same elevation
-                            inter_node = registry.get_or_create(
-                                inter_x, inter_y, inter_z, floor_level=level
-                            )
-                            node_tags.append(inter_node)
-                        node_tags.append(end_node)
+                        inter_nodes = registry.get_or_create_many(
+                            _interior_points((start_x, start_y, z), (end_x, end_y, z), NUM_SUBDIVISIONS),
+                            floor_levels=level,
+                        )
+                        node_tags = [start_node, *inter_nodes.tolist(), end_node]
                         
                         # Track parent coupling beam ID for logical grouping
                         parent_coupling_beam_id = coupling_element_tag
@@ -2283,7 +2347,7 @@ def build_fem_model(project: ProjectData,
                 )
 
     # Slab elements (ShellMITC4 with ElasticMembranePlateSection)
-    slab_section_tag = 5
+    slab_section_tag = SLAB_SECTION_TAG
     slab_element_tags: List[int] = []  # Collect slab element tags for surface loads
     
     if options.include_slabs:
@@ -2297,14 +2361,10 @@ def build_fem_model(project: ProjectData,
         )
         model.add_section(slab_section_tag, slab_section)
         
-        # Build existing node lookup for beam/wall node sharing
-        existing_nodes: Dict[Tuple[float, float, float], int] = {}
-        for node in model.nodes.values():
-            existing_nodes[(round(node.x, 6), round(node.y, 6), round(node.z, 6))] = node.tag
-        
         slab_generator = SlabMeshGenerator(
-            base_node_tag=60000,
+            base_node_tag=_slab_base_node_tag(geometry.floors),
             base_element_tag=max(60000, max(model.elements.keys(), default=0) + 1),
+            reuse_layouts=options.share_plan_layouts,
         )
         
         slab_openings: List[SlabOpening] = []
@@ -2413,7 +2473,7 @@ def build_fem_model(project: ProjectData,
                             section_tag=slab_section_tag,
                             elements_along_x=elements_along_x,
                             elements_along_y=elements_along_y,
-                            existing_nodes=existing_nodes,
+                            registry=registry,
                             openings=slab_openings
                         )
                         
@@ -2421,19 +2481,19 @@ def build_fem_model(project: ProjectData,
                         for elem in mesh_result.elements:
                             used_slab_node_tags.update(elem.node_tags)
 
-                        for node_data in mesh_result.nodes:
-                            tag, x, y, z_coord, floor_lvl = node_data
-                            if tag not in used_slab_node_tags:
-                                continue
-
-                            node = Node(tag=tag, x=x, y=y, z=z_coord)
-                            model.add_node(node)
-                            existing_nodes[(round(x, 6), round(y, 6), round(z_coord, 6))] = tag
-
-                            # Track in registry for diaphragm
-                            if floor_lvl not in registry.nodes_by_floor:
-                                registry.nodes_by_floor[floor_lvl] = []
-                            registry.nodes_by_floor[floor_lvl].append(tag)
+                        new_slab_nodes = [
+                            node_data for node_data in mesh_result.nodes
+                            if node_data[0] in used_slab_node_tags
+                        ]
+                        for tag, x, y, z_coord, _ in new_slab_nodes:
+                            model.add_node(Node(tag=tag, x=x, y=y, z=z_coord))
+
+                        # Share with later panels and track for the diaphragm
+                        registry.register_many(
+                            [node_data[0] for node_data in new_slab_nodes],
+                            [node_data[1:4] for node_data in new_slab_nodes],
+                            floor_level=level,
+                        )
                         
                         # Add slab shell elements and collect tags
                         for elem in mesh_result.elements:
@@ -2490,26 +2550,9 @@ def build_fem_model(project: ProjectData,
                 UserWarning
             )
         else:
-            floor_shears_x = _compute_floor_shears(
-                wind_result=wind_result,
-                direction="X",
-                story_height=geometry.story_height,
-                floors=geometry.floors,
-            )
-            floor_shears_y = _compute_floor_shears(
-                wind_result=wind_result,
-                direction="Y",
-                story_height=geometry.story_height,
-                floors=geometry.floors,
-            )
-
-            building_width = project.lateral.building_width
-            if building_width <= 0.0:
-                building_width = geometry.bay_x * geometry.num_bays_x
-
-            building_depth = project.lateral.building_depth
-            if building_depth <= 0.0:
-                building_depth = geometry.bay_y * geometry.num_bays_y
+            wind_loads, basis = compute_wind_floor_loads(project)
+            floor_shears_x = wind_loads["Wx"]
+            floor_shears_y = wind_loads["Wy"]
 
             if floor_shears_x:
                 apply_lateral_loads_to_diaphragms(
@@ -2533,12 +2576,7 @@ def build_fem_model(project: ProjectData,
                 )
                 logger.info(f"Applied Wy loads to {len(floor_shears_y)} floors (pattern {options.wy_pattern})")
 
-            torsional_moments, basis = _compute_wtz_torsional_moments(
-                floor_shears_x=floor_shears_x,
-                floor_shears_y=floor_shears_y,
-                building_width=building_width,
-                building_depth=building_depth,
-            )
+            torsional_moments = wind_loads["Wtz"]
             if torsional_moments:
                 apply_lateral_loads_to_diaphragms(
                     model,
@@ -2564,6 +2602,168 @@ def build_fem_model(project: ProjectData,
     return model
 
 
+def update_fem_model_sections(model: FEMModel,
+                              project: ProjectData,
+                              options: Optional[ModelBuilderOptions] = None) -> bool:
+    """Patch member sizes and slab thickness into a model from build_fem_model.
+
+    Section properties of primary/secondary beams, columns and slabs are
+    replaced with ``FEMModel.update_section`` and the self-weight loads that
+    depend on them are rescaled. Nodes, elements, diaphragms and all other
+    loads are kept, so the caller must only use this when nothing but
+    member sizes (or slab thickness) changed.
+
+    Args:
+        model: Model previously built by ``build_fem_model``
+        project: Project with the new member sizes
+        options: Builder options used for the original build
+
+    Returns:
+        False if the model cannot be patched and must be rebuilt
+    """
+    options = options or ModelBuilderOptions()
+    beam_sizes = _extract_beam_sizes(project)
+    column_width, column_depth = _extract_column_dims(project)
+    beam_concrete = ConcreteProperties(fcu=project.materials.fcu_beam)
+    column_concrete = ConcreteProperties(fcu=project.materials.fcu_column)
+
+    frame_sections = {
+        PRIMARY_SECTION_TAG: get_elastic_beam_section(
+            beam_concrete,
+            width=beam_sizes["primary"][0],
+            height=beam_sizes["primary"][1],
+            section_tag=PRIMARY_SECTION_TAG,
+        ),
+        SECONDARY_SECTION_TAG: get_elastic_beam_section(
+            beam_concrete,
+            width=beam_sizes["secondary"][0],
+            height=beam_sizes["secondary"][1],
+            section_tag=SECONDARY_SECTION_TAG,
+        ),
+        COLUMN_SECTION_TAG: get_elastic_beam_section(
+            column_concrete,
+            width=column_width,
+            height=column_depth,
+            section_tag=COLUMN_SECTION_TAG,
+        ),
+    }
+    if any(tag not in model.sections for tag in frame_sections):
+        return False
+
+    has_slab = SLAB_SECTION_TAG in model.sections
+    if has_slab != options.include_slabs:
+        return False
+    slab_dl_pa = 0.0
+    if has_slab and options.apply_gravity_loads:
+        slab_dl_pa = _get_characteristic_loads(project, slab_thickness_m=options.slab_thickness)[0] * 1000.0
+        has_slab_dl = any(
+            load.load_pattern == options.dl_load_pattern for load in model.surface_loads
+        )
+        if (slab_dl_pa > 0) != has_slab_dl:
+            return False
+
+    column_ratio = (
+        frame_sections[COLUMN_SECTION_TAG]["A"] / model.sections[COLUMN_SECTION_TAG]["A"]
+    )
+    for tag, section in frame_sections.items():
+        model.update_section(tag, section)
+    if has_slab:
+        model.update_section(
+            SLAB_SECTION_TAG,
+            get_elastic_membrane_plate_section(
+                beam_concrete,
+                thickness=options.slab_thickness,
+                section_tag=SLAB_SECTION_TAG,
+            ),
+        )
+
+    if options.apply_gravity_loads:
+        # Beam self-weight is the only DL line load on primary/secondary beams
+        beam_weight = {
+            tag: CONCRETE_DENSITY * frame_sections[tag]["A"] * 1000.0  # N/m
+            for tag in (PRIMARY_SECTION_TAG, SECONDARY_SECTION_TAG)
+        }
+        for uniform_load in model.uniform_loads:
+            elem = model.elements.get(uniform_load.element_tag)
+            if uniform_load.load_pattern == options.dl_load_pattern and elem is not None:
+                if elem.section_tag in beam_weight:
+                    uniform_load.magnitude = beam_weight[elem.section_tag]
+
+        # Column self-weight is lumped as DL point loads at column nodes
+        column_nodes = {
+            node_tag
+            for elem in model.elements.values()
+            if elem.section_tag == COLUMN_SECTION_TAG
+            for node_tag in elem.node_tags
+        }
+        for load in model.loads:
+            if load.load_pattern == options.dl_load_pattern and load.node_tag in column_nodes:
+                load.load_values[2] *= column_ratio
+
+        for surface_load in model.surface_loads:
+            if surface_load.load_pattern == options.dl_load_pattern:
+                surface_load.pressure = slab_dl_pa
+
+    logger.info(
+        "Updated FEM sections in place: primary=%s secondary=%s column=%sx%s slab=%.3fm",
+        beam_sizes["primary"], beam_sizes["secondary"], column_width, column_depth,
+        options.slab_thickness,
+    )
+    return True
+
+
+
+def update_fem_model_loads(model: FEMModel,
+                           project: ProjectData,
+                           options: Optional[ModelBuilderOptions] = None) -> bool:
+    """Patch SDL, LL and wind load magnitudes into a model from build_fem_model.
+
+    Slab SDL/LL pressures and the Wx/Wy/Wtz floor loads on diaphragm
+    masters are overwritten with the values of ``project``. Nothing else is
+    touched, so the caller must only use this when nothing but load
+    magnitudes changed.
+
+    Args:
+        model: Model previously built by ``build_fem_model``
+        project: Project with the new load inputs
+        options: Builder options used for the original build
+
+    Returns:
+        False if the loaded elements or floors differ and the model must
+        be rebuilt
+    """
+    options = options or ModelBuilderOptions()
+    if options.apply_gravity_loads and SLAB_SECTION_TAG in model.sections:
+        _, sdl, ll = _get_characteristic_loads(project, slab_thickness_m=options.slab_thickness)
+        for pattern, pressure_kpa in ((options.sdl_load_pattern, sdl), (options.ll_load_pattern, ll)):
+            surface_loads = [load for load in model.surface_loads if load.load_pattern == pattern]
+            if (pressure_kpa > 0) != bool(surface_loads):
+                return False
+            for surface_load in surface_loads:
+                surface_load.pressure = pressure_kpa * 1000.0
+
+    if options.apply_wind_loads and project.wind_result is not None:
+        wind_loads, _ = compute_wind_floor_loads(project)
+        components = (
+            ("Wx", options.wx_pattern, 0),
+            ("Wy", options.wy_pattern, 1),
+            ("Wtz", options.wtz_pattern, 5),
+        )
+        for case, pattern, dof in components:
+            targets = {round(z, 6): value for z, value in wind_loads[case].items()}
+            applied = {
+                round(model.nodes[load.node_tag].z, 6): load
+                for load in model.loads if load.load_pattern == pattern
+            }
+            if applied.keys() != targets.keys():
+                return False
+            for level, load in applied.items():
+                load.load_values[dof] = targets[level]
+
+    logger.info("Updated FEM load magnitudes in place")
+    return True
+
+
 __all__ = [
     "create_floor_rigid_diaphragms",
     "apply_lateral_loads_to_diaphragms",
@@ -2571,6 +2771,9 @@ __all__ = [
     "BeamSegment",
     "trim_beam_segment_against_polygon",
     "build_fem_model",
+    "update_fem_model_sections",
+    "update_fem_model_loads",
+    "compute_wind_floor_loads",
     "FLOOR_NODE_BASE",
     "NodeRegistry",
 ]
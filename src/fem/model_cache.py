@@ -0,0 +1,266 @@
+"""
+Content-addressed cache of built FEM models.
+
+Models are keyed by ``canonical_key``, a deterministic hash of the full
+builder inputs: dataclasses, enums, mappings and sequences are normalized
+into a canonical JSON form (sorted mapping keys, ``-0.0`` folded into
+``0.0``, NumPy scalars unwrapped) before hashing, so two equal inputs always
+produce the same key regardless of field or insertion order.
+
+``ModelCache`` keeps built models as ``model_snapshot`` byte strings in
+least-recently-used order under a memory budget and is safe to share
+between threads, so one instance can serve every session of a server
+process. Each lookup restores a private ``FEMModel`` from the snapshot;
+the cached bytes are never mutated. Snapshots pushed out of memory can
+spill to disk as ``.npz`` files and are reloaded from there on the next
+lookup instead of rebuilding the model.
+"""
+
+import dataclasses
+import enum
+import hashlib
+import json
+import logging
+import math
+import os
+import shutil
+import threading
+import zipfile
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, List, Optional, Tuple, Union
+
+import numpy as np
+
+from src.fem.fem_engine import FEMModel
+from src.fem.model_snapshot import snapshot_bytes, snapshot_from_bytes
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+DEFAULT_MAX_SPILL_BYTES = 2 << 30  # 2 GiB
+
+_SPILL_SUFFIX = ".npz"
+_VARIANT_SUFFIX = ".variant"
+
+
+def _canonical(value: Any) -> Any:
+    """JSON-serializable, order-independent form of ``value``."""
+    if value is None or isinstance(value, (bool, str)):
+        return value
+    if isinstance(value, enum.Enum):
+        return {"__enum__": type(value).__qualname__, "value": _canonical(value.value)}
+    if isinstance(value, (int, np.integer)):
+        return int(value)
+    if isinstance(value, (float, np.floating)):
+        value = float(value)
+        if not math.isfinite(value):
+            return {"__float__": repr(value)}
+        return value + 0.0  # fold -0.0 into 0.0
+    if isinstance(value, np.bool_):
+        return bool(value)
+    if isinstance(value, np.ndarray):
+        return {"__array__": str(value.dtype), "shape": list(value.shape),
+                "values": _canonical(value.tolist())}
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return {
+            "__type__": type(value).__qualname__,
+            "fields": {f.name: _canonical(getattr(value, f.name)) for f in dataclasses.fields(value)},
+        }
+    if isinstance(value, dict):
+        items = [[_canonical(k), _canonical(v)] for k, v in value.items()]
+        return {"__dict__": sorted(items, key=_sort_key)}
+    if isinstance(value, (set, frozenset)):
+        return {"__set__": sorted((_canonical(item) for item in value), key=_sort_key)}
+    if isinstance(value, (list, tuple)):
+        return [_canonical(item) for item in value]
+    if isinstance(value, Path):
+        return {"__path__": value.as_posix()}
+    if hasattr(value, "__dict__"):
+        return {"__type__": type(value).__qualname__, "fields": _canonical(vars(value))}
+    return {"__repr__": repr(value)}
+
+
+def _sort_key(item: Any) -> str:
+    return json.dumps(item, sort_keys=True, separators=(",", ":"))
+
+
+def canonical_key(*parts: Any) -> str:
+    """Deterministic hex digest of ``parts``.
+
+    Equal inputs give equal keys across processes and runs; any change to
+    a field value, including ones nested in dataclasses or dicts, gives a
+    different key.
+    """
+    payload = json.dumps([_canonical(part) for part in parts], sort_keys=True,
+                         separators=(",", ":"), allow_nan=False)
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=20).hexdigest()
+
+
+class ModelCache:
+    """Thread-safe LRU cache of built models under a memory budget.
+
+    Models are held as ``snapshot_bytes`` and every lookup rebuilds a new
+    ``FEMModel`` from them, so callers own the model they receive and may
+    patch or analyze it without affecting other sessions. Each entry may
+    carry a caller-defined ``variant`` string recording inputs that are not
+    part of ``key`` (e.g. member sizes a caller patches after lookup).
+
+    Args:
+        max_bytes: Memory budget for the cached snapshots
+        spill_dir: Directory for snapshots evicted from memory (None: discard)
+        max_spill_bytes: Disk budget for spilled snapshots
+
+    Attributes:
+        hits: Lookups served from memory or disk
+        misses: Lookups that found nothing
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES,
+                 spill_dir: Optional[Union[str, Path]] = None,
+                 max_spill_bytes: int = DEFAULT_MAX_SPILL_BYTES):
+        if max_bytes <= 0:
+            raise ValueError("max_bytes must be positive")
+        self.max_bytes = max_bytes
+        self.spill_dir = Path(spill_dir) if spill_dir is not None else None
+        self.max_spill_bytes = max_spill_bytes
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, Tuple[bytes, str]]" = OrderedDict()
+        self._current_bytes = 0
+        self._lock = threading.RLock()
+
+    @property
+    def current_bytes(self) -> int:
+        return self._current_bytes
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            return key in self._entries or self._spill_path(key) is not None
+
+    def get(self, key: str) -> Optional[FEMModel]:
+        """New model for ``key``, reloading a spilled snapshot; None on a miss."""
+        found = self.lookup(key)
+        return found[0] if found is not None else None
+
+    def lookup(self, key: str) -> Optional[Tuple[FEMModel, str]]:
+        """(new model, variant) for ``key``; None on a miss."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            else:
+                entry = self._load_spilled(key)
+                if entry is None:
+                    self.misses += 1
+                    return None
+                self._insert(key, entry)
+            self.hits += 1
+        data, variant = entry
+        return snapshot_from_bytes(data).to_model(), variant
+
+    def put(self, key: str, model: FEMModel, variant: str = "") -> None:
+        """Store a snapshot of ``model`` under ``key`` as the most recent entry."""
+        entry = (snapshot_bytes(model), variant)
+        with self._lock:
+            self._insert(key, entry)
+
+    def discard(self, key: str) -> None:
+        """Drop ``key`` from memory and disk."""
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self._current_bytes -= len(entry[0])
+            if self.spill_dir is not None:
+                self._unlink_spilled(self.spill_dir / f"{key}{_SPILL_SUFFIX}")
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._current_bytes = 0
+            if self.spill_dir is not None:
+                shutil.rmtree(self.spill_dir, ignore_errors=True)
+
+    def _insert(self, key: str, entry: Tuple[bytes, str]) -> None:
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._current_bytes -= len(previous[0])
+        self._entries[key] = entry
+        self._current_bytes += len(entry[0])
+        # Always keep the newest entry, even when it alone exceeds the budget
+        while self._current_bytes > self.max_bytes and len(self._entries) > 1:
+            old_key, old_entry = self._entries.popitem(last=False)
+            self._current_bytes -= len(old_entry[0])
+            self._spill(old_key, old_entry)
+
+    def _spill_path(self, key: str) -> Optional[Path]:
+        if self.spill_dir is None:
+            return None
+        path = self.spill_dir / f"{key}{_SPILL_SUFFIX}"
+        return path if path.is_file() else None
+
+    def _spill(self, key: str, entry: Tuple[bytes, str]) -> None:
+        if self.spill_dir is None:
+            return
+        target = self.spill_dir / f"{key}{_SPILL_SUFFIX}"
+        scratch = self.spill_dir / f".{key}.{os.getpid()}.tmp"
+        try:
+            self.spill_dir.mkdir(parents=True, exist_ok=True)
+            # The variant goes first; the snapshot file marks a complete entry
+            target.with_suffix(_VARIANT_SUFFIX).write_text(entry[1], encoding="utf-8")
+            scratch.write_bytes(entry[0])
+            os.replace(scratch, target)
+        except OSError as e:
+            logger.warning("Could not spill model to %s: %s", self.spill_dir, e)
+            scratch.unlink(missing_ok=True)
+            return
+        self._evict_spilled()
+
+    def _load_spilled(self, key: str) -> Optional[Tuple[bytes, str]]:
+        path = self._spill_path(key)
+        if path is None:
+            return None
+        try:
+            data = path.read_bytes()
+            variant = path.with_suffix(_VARIANT_SUFFIX).read_text(encoding="utf-8")
+            snapshot_from_bytes(data)
+        except (OSError, ValueError, KeyError, zipfile.BadZipFile) as e:
+            logger.warning("Discarding unreadable spilled model %s: %s", key, e)
+            self._unlink_spilled(path)
+            return None
+        os.utime(path)
+        return data, variant
+
+    @staticmethod
+    def _unlink_spilled(path: Path) -> None:
+        path.unlink(missing_ok=True)
+        path.with_suffix(_VARIANT_SUFFIX).unlink(missing_ok=True)
+
+    def _spilled_entries(self) -> List[Tuple[Path, float, int]]:
+        """(path, last use time, bytes) of spilled snapshots, least recently used first."""
+        if self.spill_dir is None or not self.spill_dir.is_dir():
+            return []
+        found = []
+        for path in self.spill_dir.glob(f"*{_SPILL_SUFFIX}"):
+            stat = path.stat()
+            found.append((path, stat.st_mtime, stat.st_size))
+        return sorted(found, key=lambda entry: entry[1])
+
+    def _evict_spilled(self) -> None:
+        entries = self._spilled_entries()
+        total = sum(size for _, _, size in entries)
+        for path, _, size in entries[:-1]:
+            if total <= self.max_spill_bytes:
+                break
+            self._unlink_spilled(path)
+            total -= size
+
+
+__all__ = [
+    "DEFAULT_MAX_BYTES",
+    "ModelCache",
+    "canonical_key",
+]
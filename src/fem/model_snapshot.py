@@ -0,0 +1,367 @@
+"""
+Versioned columnar snapshots of a FEMModel.
+
+A snapshot stores the model as flat NumPy arrays (node coordinates and
+restraints, element types, connectivity, material/section tags, loads and
+diaphragms) plus a small JSON metadata table for materials, sections and
+anything that is not naturally columnar. Element ``geometry`` dicts are
+split into one column per key, so the common numeric entries (``vecxz``,
+parent ids) never go through per-element serialization.
+
+Snapshots are written either as a directory of ``.npy`` files with a
+``meta.json`` (opened memory-mapped, each array on first access) or as a
+single ``.npz`` byte string for shipping to worker processes. Both load
+into a ``ModelSnapshot``, which exposes the arrays directly for diffing
+and rebuilds the ``FEMModel`` only when ``to_model()`` is called.
+"""
+
+import io
+import json
+import os
+import shutil
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Mapping, Tuple, Union
+
+import numpy as np
+
+from src.fem.fem_engine import (
+    Element,
+    ElementType,
+    FEMModel,
+    Load,
+    Node,
+    RigidDiaphragm,
+    SurfaceLoad,
+    UniformLoad,
+)
+
+# Bump when the array layout or meta schema changes
+SNAPSHOT_VERSION = 1
+
+_META_FILE = "meta.json"
+_META_ARRAY = "__meta__"
+_ELEMENT_TYPES = list(ElementType)
+
+
+def _offsets(sizes: List[int]) -> np.ndarray:
+    return np.concatenate([[0], np.cumsum(sizes, dtype=np.int64)]).astype(np.int64)
+
+
+def _encode(value: Any) -> Any:
+    """JSON-safe form of a parameter value; tuples survive the round trip."""
+    if isinstance(value, tuple):
+        return {"__tuple__": [_encode(item) for item in value]}
+    if isinstance(value, list):
+        return [_encode(item) for item in value]
+    if isinstance(value, dict):
+        return {"__dict__": [[_encode(k), _encode(v)] for k, v in value.items()]}
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+def _decode(value: Any) -> Any:
+    if isinstance(value, list):
+        return [_decode(item) for item in value]
+    if isinstance(value, dict):
+        if "__tuple__" in value:
+            return tuple(_decode(item) for item in value["__tuple__"])
+        return {_decode(k): _decode(v) for k, v in value["__dict__"]}
+    return value
+
+
+def _column_kind(values: List[Any]) -> Tuple[str, int]:
+    """Storage kind and width of one geometry key across elements."""
+    types = {type(value) for value in values}
+    if types == {bool}:
+        return "bool", 1
+    if types == {int}:
+        return "int", 1
+    if types == {float}:
+        return "float", 1
+    if types == {tuple}:
+        widths = {len(value) for value in values}
+        if len(widths) == 1 and all(type(item) is float for value in values for item in value):
+            return "tuple", widths.pop()
+    return "json", 0
+
+
+_COLUMN_DTYPES = {"bool": bool, "int": np.int64, "float": np.float64, "tuple": np.float64}
+
+
+def _pack(model: FEMModel) -> Tuple[Dict[str, np.ndarray], Dict[str, Any]]:
+    """Split ``model`` into named arrays and a JSON metadata table."""
+    nodes = list(model.nodes.values())
+    elements = list(model.elements.values())
+    arrays: Dict[str, np.ndarray] = {
+        "node_tags": np.array([node.tag for node in nodes], dtype=np.int64),
+        "node_coords": np.array([(node.x, node.y, node.z) for node in nodes],
+                                dtype=np.float64).reshape(len(nodes), 3),
+        "node_restraints": np.array([node.restraints for node in nodes],
+                                    dtype=np.int8).reshape(len(nodes), 6),
+    }
+
+    type_codes = {member: code for code, member in enumerate(_ELEMENT_TYPES)}
+    arrays["element_tags"] = np.array([elem.tag for elem in elements], dtype=np.int64)
+    arrays["element_types"] = np.array([type_codes[elem.element_type] for elem in elements],
+                                       dtype=np.int16)
+    arrays["element_offsets"] = _offsets([len(elem.node_tags) for elem in elements])
+    arrays["element_nodes"] = np.array([tag for elem in elements for tag in elem.node_tags],
+                                       dtype=np.int64)
+    arrays["element_materials"] = np.array([elem.material_tag for elem in elements], dtype=np.int64)
+    arrays["element_has_section"] = np.array([elem.section_tag is not None for elem in elements],
+                                             dtype=bool)
+    arrays["element_sections"] = np.array(
+        [elem.section_tag if elem.section_tag is not None else 0 for elem in elements],
+        dtype=np.int64,
+    )
+
+    # One column per geometry key, with a presence mask
+    by_key: Dict[str, Dict[int, Any]] = {}
+    for row, elem in enumerate(elements):
+        for key, value in elem.geometry.items():
+            by_key.setdefault(key, {})[row] = value
+    geometry_meta = []
+    for index, (key, entries) in enumerate(by_key.items()):
+        kind, width = _column_kind(list(entries.values()))
+        column = {"key": key, "kind": kind}
+        if kind == "json":
+            column["values"] = [[row, _encode(value)] for row, value in entries.items()]
+        else:
+            present = np.zeros(len(elements), dtype=bool)
+            present[list(entries)] = True
+            shape = (len(entries), width) if kind == "tuple" else (len(entries),)
+            arrays[f"geometry_{index}_present"] = present
+            arrays[f"geometry_{index}_values"] = np.array(
+                list(entries.values()), dtype=_COLUMN_DTYPES[kind]
+            ).reshape(shape)
+        geometry_meta.append(column)
+
+    arrays["load_nodes"] = np.array([load.node_tag for load in model.loads], dtype=np.int64)
+    arrays["load_values"] = np.array([load.load_values for load in model.loads],
+                                     dtype=np.float64).reshape(len(model.loads), 6)
+    arrays["load_patterns"] = np.array([load.load_pattern for load in model.loads], dtype=np.int64)
+
+    uniform_types = sorted({load.load_type for load in model.uniform_loads})
+    uniform_codes = {name: code for code, name in enumerate(uniform_types)}
+    arrays["uniform_elements"] = np.array([load.element_tag for load in model.uniform_loads],
+                                          dtype=np.int64)
+    arrays["uniform_types"] = np.array([uniform_codes[load.load_type] for load in model.uniform_loads],
+                                       dtype=np.int16)
+    arrays["uniform_magnitudes"] = np.array([load.magnitude for load in model.uniform_loads],
+                                            dtype=np.float64)
+    arrays["uniform_patterns"] = np.array([load.load_pattern for load in model.uniform_loads],
+                                          dtype=np.int64)
+    arrays["uniform_visual_only"] = np.array([load.visual_only for load in model.uniform_loads],
+                                             dtype=bool)
+
+    arrays["surface_elements"] = np.array([load.element_tag for load in model.surface_loads],
+                                          dtype=np.int64)
+    arrays["surface_pressures"] = np.array([load.pressure for load in model.surface_loads],
+                                           dtype=np.float64)
+    arrays["surface_patterns"] = np.array([load.load_pattern for load in model.surface_loads],
+                                          dtype=np.int64)
+
+    arrays["diaphragm_masters"] = np.array([d.master_node for d in model.diaphragms], dtype=np.int64)
+    arrays["diaphragm_perp_dirns"] = np.array([d.perp_dirn for d in model.diaphragms], dtype=np.int64)
+    arrays["diaphragm_offsets"] = _offsets([len(d.slave_nodes) for d in model.diaphragms])
+    arrays["diaphragm_slaves"] = np.array([tag for d in model.diaphragms for tag in d.slave_nodes],
+                                          dtype=np.int64)
+
+    meta = {
+        "version": SNAPSHOT_VERSION,
+        "fingerprint": model.fingerprint(),
+        "n_nodes": len(nodes),
+        "n_elements": len(elements),
+        "element_types": [member.value for member in _ELEMENT_TYPES],
+        "uniform_load_types": uniform_types,
+        "geometry": geometry_meta,
+        "materials": [[tag, _encode(params)] for tag, params in model.materials.items()],
+        "sections": [[tag, _encode(params)] for tag, params in model.sections.items()],
+        "omitted_columns": _encode(model.omitted_columns),
+    }
+    return arrays, meta
+
+
+class ModelSnapshot:
+    """Loaded snapshot: lazily opened arrays plus the metadata table.
+
+    Args:
+        meta: Snapshot metadata (``meta.json`` contents)
+        opener: Callable returning the array stored under a name
+
+    Raises:
+        ValueError: If the snapshot was written by another format version
+    """
+
+    def __init__(self, meta: Dict[str, Any], opener: Callable[[str], np.ndarray]):
+        if meta.get("version") != SNAPSHOT_VERSION:
+            raise ValueError(f"snapshot version {meta.get('version')} != {SNAPSHOT_VERSION}")
+        self.meta = meta
+        self._opener = opener
+        self._arrays: Dict[str, np.ndarray] = {}
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        """Array ``name``, opened on first access."""
+        array = self._arrays.get(name)
+        if array is None:
+            array = self._arrays[name] = self._opener(name)
+        return array
+
+    @property
+    def fingerprint(self) -> str:
+        """``FEMModel.fingerprint()`` of the model at save time."""
+        return self.meta["fingerprint"]
+
+    @property
+    def n_nodes(self) -> int:
+        return self.meta["n_nodes"]
+
+    @property
+    def n_elements(self) -> int:
+        return self.meta["n_elements"]
+
+    def element_connectivity(self, row: int) -> np.ndarray:
+        """Node tags of the element in ``row`` (snapshot order)."""
+        offsets = self["element_offsets"]
+        return self["element_nodes"][offsets[row]:offsets[row + 1]]
+
+    def _geometry(self) -> List[Dict[str, Any]]:
+        geometry: List[Dict[str, Any]] = [{} for _ in range(self.n_elements)]
+        for index, column in enumerate(self.meta["geometry"]):
+            key, kind = column["key"], column["kind"]
+            if kind == "json":
+                for row, value in column["values"]:
+                    geometry[row][key] = _decode(value)
+                continue
+            rows = np.flatnonzero(self[f"geometry_{index}_present"]).tolist()
+            values = self[f"geometry_{index}_values"].tolist()
+            if kind == "tuple":
+                values = [tuple(value) for value in values]
+            for row, value in zip(rows, values):
+                geometry[row][key] = value
+        return geometry
+
+    def to_model(self) -> FEMModel:
+        """Rebuild the FEMModel held by this snapshot."""
+        model = FEMModel()
+        for tag, params in self.meta["materials"]:
+            model.add_material(tag, _decode(params))
+        for tag, params in self.meta["sections"]:
+            model.add_section(tag, _decode(params))
+
+        for tag, coords, restraints in zip(self["node_tags"].tolist(),
+                                           self["node_coords"].tolist(),
+                                           self["node_restraints"].tolist()):
+            model.add_node(Node(tag=tag, x=coords[0], y=coords[1], z=coords[2],
+                                restraints=restraints))
+
+        element_types = [ElementType(value) for value in self.meta["element_types"]]
+        offsets = self["element_offsets"].tolist()
+        connectivity = self["element_nodes"].tolist()
+        sections = self["element_sections"].tolist()
+        for row, (tag, type_code, material, has_section, geometry) in enumerate(zip(
+                self["element_tags"].tolist(), self["element_types"].tolist(),
+                self["element_materials"].tolist(), self["element_has_section"].tolist(),
+                self._geometry())):
+            model.add_element(Element(
+                tag=tag,
+                element_type=element_types[type_code],
+                node_tags=connectivity[offsets[row]:offsets[row + 1]],
+                material_tag=material,
+                section_tag=sections[row] if has_section else None,
+                geometry=geometry,
+            ))
+
+        for node_tag, values, pattern in zip(self["load_nodes"].tolist(),
+                                             self["load_values"].tolist(),
+                                             self["load_patterns"].tolist()):
+            model.add_load(Load(node_tag=node_tag, load_values=values, load_pattern=pattern))
+        uniform_types = self.meta["uniform_load_types"]
+        for elem_tag, type_code, magnitude, pattern, visual_only in zip(
+                self["uniform_elements"].tolist(), self["uniform_types"].tolist(),
+                self["uniform_magnitudes"].tolist(), self["uniform_patterns"].tolist(),
+                self["uniform_visual_only"].tolist()):
+            model.add_uniform_load(UniformLoad(
+                element_tag=elem_tag, load_type=uniform_types[type_code], magnitude=magnitude,
+                load_pattern=pattern, visual_only=visual_only,
+            ))
+        for elem_tag, pressure, pattern in zip(self["surface_elements"].tolist(),
+                                               self["surface_pressures"].tolist(),
+                                               self["surface_patterns"].tolist()):
+            model.add_surface_load(SurfaceLoad(element_tag=elem_tag, pressure=pressure,
+                                               load_pattern=pattern))
+
+        slave_offsets = self["diaphragm_offsets"].tolist()
+        slaves = self["diaphragm_slaves"].tolist()
+        for row, (master, perp_dirn) in enumerate(zip(self["diaphragm_masters"].tolist(),
+                                                      self["diaphragm_perp_dirns"].tolist())):
+            model.add_rigid_diaphragm(RigidDiaphragm(
+                master_node=master,
+                slave_nodes=slaves[slave_offsets[row]:slave_offsets[row + 1]],
+                perp_dirn=perp_dirn,
+            ))
+
+        model.omitted_columns = _decode(self.meta["omitted_columns"])
+        return model
+
+
+def save_snapshot(model: FEMModel, path: Union[str, Path]) -> Path:
+    """Write ``model`` as a snapshot directory at ``path`` (replacing it).
+
+    Returns:
+        The snapshot directory
+    """
+    target = Path(path)
+    arrays, meta = _pack(model)
+    scratch = target.parent / f".{target.name}.{os.getpid()}.tmp"
+    shutil.rmtree(scratch, ignore_errors=True)
+    scratch.mkdir(parents=True)
+    try:
+        for name, values in arrays.items():
+            np.save(scratch / f"{name}.npy", values, allow_pickle=False)
+        with open(scratch / _META_FILE, "w", encoding="utf-8") as handle:
+            json.dump(meta, handle)
+        shutil.rmtree(target, ignore_errors=True)
+        os.replace(scratch, target)
+    finally:
+        shutil.rmtree(scratch, ignore_errors=True)
+    return target
+
+
+def load_snapshot(path: Union[str, Path]) -> ModelSnapshot:
+    """Open a snapshot directory; arrays are memory-mapped on first access."""
+    directory = Path(path)
+    with open(directory / _META_FILE, encoding="utf-8") as handle:
+        meta = json.load(handle)
+
+    def opener(name: str) -> np.ndarray:
+        return np.load(directory / f"{name}.npy", mmap_mode="r", allow_pickle=False)
+
+    return ModelSnapshot(meta, opener)
+
+
+def snapshot_bytes(model: FEMModel) -> bytes:
+    """Serialize ``model`` as a single ``.npz`` byte string."""
+    arrays, meta = _pack(model)
+    arrays[_META_ARRAY] = np.frombuffer(json.dumps(meta).encode("utf-8"), dtype=np.uint8)
+    buffer = io.BytesIO()
+    np.savez(buffer, **arrays)
+    return buffer.getvalue()
+
+
+def snapshot_from_bytes(data: bytes) -> ModelSnapshot:
+    """Open a snapshot produced by ``snapshot_bytes``; arrays decode on first access."""
+    archive: Mapping[str, np.ndarray] = np.load(io.BytesIO(data), allow_pickle=False)
+    meta = json.loads(archive[_META_ARRAY].tobytes().decode("utf-8"))
+    return ModelSnapshot(meta, archive.__getitem__)
+
+
+__all__ = [
+    "ModelSnapshot",
+    "SNAPSHOT_VERSION",
+    "load_snapshot",
+    "save_snapshot",
+    "snapshot_bytes",
+    "snapshot_from_bytes",
+]
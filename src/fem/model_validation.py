@@ -0,0 +1,243 @@
+"""
+Array-based validation of FEMModel topology and mesh quality.
+
+Node coordinates and element connectivity are packed into flat NumPy arrays
+in a single pass over the model, after which orphan detection, zero-length
+checks and shell aspect ratios run as bulk array operations. ``FEMModel``
+caches the resulting ``ValidationReport`` against its revision counter, so
+repeated analyses of an unchanged model skip validation entirely.
+"""
+
+import itertools
+import operator
+from dataclasses import dataclass
+from typing import List, Tuple
+
+import numpy as np
+
+from src.fem.fem_engine import ElementType, FEMModel
+
+ZERO_LENGTH_TOLERANCE = 1e-6  # 1 micron
+MAX_SHELL_ASPECT_RATIO = 5.0
+
+_SHELL_NODE_COUNTS = {ElementType.SHELL_MITC4: 4, ElementType.SHELL_DKGT: 3}
+_SECTIONED_TYPES = (ElementType.BEAM_COLUMN, ElementType.ELASTIC_BEAM)
+
+_NODE_COORDS = operator.attrgetter("x", "y", "z")
+_NODE_RESTRAINTS = operator.attrgetter("restraints")
+_ELEMENT_TYPE = operator.attrgetter("element_type")
+_ELEMENT_NODES = operator.attrgetter("node_tags")
+_ELEMENT_MATERIAL = operator.attrgetter("material_tag")
+_ELEMENT_SECTION = operator.attrgetter("section_tag")
+
+
+@dataclass(frozen=True)
+class ValidationReport:
+    """Structured outcome of a model validation pass.
+
+    Attributes:
+        errors: Error messages in the order ``validate_model`` reports them
+        orphan_nodes: Unsupported node tags not referenced by any element
+            or diaphragm (int64 array, model order)
+        zero_length_elements: Tags of elements whose first two nodes
+            coincide (int64 array)
+        shell_tags: Tags of shells with the expected node count (int64 array)
+        shell_aspect_ratios: Longest over shortest edge for each entry of
+            ``shell_tags``; NaN where an edge has zero length
+        max_aspect_ratio: Threshold used for the mesh quality warning
+    """
+    errors: Tuple[str, ...]
+    orphan_nodes: np.ndarray
+    zero_length_elements: np.ndarray
+    shell_tags: np.ndarray
+    shell_aspect_ratios: np.ndarray
+    max_aspect_ratio: float = MAX_SHELL_ASPECT_RATIO
+
+    @property
+    def is_valid(self) -> bool:
+        return not self.errors
+
+    @property
+    def high_aspect_shells(self) -> List[Tuple[int, float]]:
+        """(tag, aspect ratio) of shells above ``max_aspect_ratio``, in model order."""
+        with np.errstate(invalid="ignore"):
+            mask = self.shell_aspect_ratios > self.max_aspect_ratio
+        return list(zip(self.shell_tags[mask].tolist(), self.shell_aspect_ratios[mask].tolist()))
+
+
+def _rows_for_tags(sorted_tags: np.ndarray, order: np.ndarray,
+                   tags: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Map node tags to node rows; returns (rows, found)."""
+    if len(sorted_tags) == 0:
+        return np.zeros(len(tags), dtype=np.int64), np.zeros(len(tags), dtype=bool)
+    pos = np.minimum(np.searchsorted(sorted_tags, tags), len(sorted_tags) - 1)
+    return order[pos], sorted_tags[pos] == tags
+
+
+def _edge_lengths(coords: np.ndarray, rows: np.ndarray) -> np.ndarray:
+    """Lengths of the closed polygon edges for each row of node indices."""
+    start = coords[rows]
+    delta = coords[np.roll(rows, -1, axis=1)] - start
+    return np.sqrt(delta[..., 0]**2 + delta[..., 1]**2 + delta[..., 2]**2)
+
+
+def validate_model_arrays(model: FEMModel,
+                          zero_length_tolerance: float = ZERO_LENGTH_TOLERANCE,
+                          max_aspect_ratio: float = MAX_SHELL_ASPECT_RATIO) -> ValidationReport:
+    """Validate ``model`` using packed coordinate and connectivity arrays.
+
+    Args:
+        model: FEMModel to check
+        zero_length_tolerance: Element length (m) below which nodes coincide
+        max_aspect_ratio: Shell edge ratio above which a mesh warning is due
+
+    Returns:
+        ValidationReport with errors and per-entity diagnostics
+    """
+    errors: List[str] = []
+    nodes = list(model.nodes.values())
+    elements = list(model.elements.values())
+
+    if not nodes:
+        errors.append("Model has no nodes")
+    if not elements:
+        errors.append("Model has no elements")
+
+    n_nodes = len(nodes)
+    node_tags = np.fromiter(model.nodes.keys(), dtype=np.int64, count=n_nodes)
+    coords = np.fromiter(itertools.chain.from_iterable(map(_NODE_COORDS, nodes)),
+                         dtype=float, count=3 * n_nodes).reshape(n_nodes, 3)
+    restraints = np.fromiter(itertools.chain.from_iterable(map(_NODE_RESTRAINTS, nodes)),
+                             dtype=np.int8, count=6 * n_nodes).reshape(n_nodes, 6)
+    # Node.is_fixed / Node.is_pinned on the whole restraint table
+    translations_fixed = (restraints[:, :3] == 1).all(axis=1)
+    supported = translations_fixed & (
+        (restraints[:, 3:] == 1).all(axis=1) | (restraints[:, 3:] == 0).all(axis=1)
+    )
+    if not supported.any():
+        errors.append("Model has no fixed or pinned supports (unstable)")
+
+    # Pack element attributes and flattened connectivity
+    n_elems = len(elements)
+    elem_tags = np.fromiter(model.elements.keys(), dtype=np.int64, count=n_elems)
+    elem_types = np.fromiter(map(_ELEMENT_TYPE, elements), dtype=object, count=n_elems)
+    connectivity = list(map(_ELEMENT_NODES, elements))
+    counts = np.fromiter(map(len, connectivity), dtype=np.int64, count=n_elems)
+    offsets = np.concatenate(([0], np.cumsum(counts)[:-1])).astype(np.int64)
+    flat_tags = np.fromiter(itertools.chain.from_iterable(connectivity),
+                            dtype=np.int64, count=int(counts.sum()))
+
+    material_known = np.fromiter(map(model.materials.__contains__, map(_ELEMENT_MATERIAL, elements)),
+                                 dtype=bool, count=n_elems)
+    for index in np.flatnonzero(~material_known).tolist():
+        elem = elements[index]
+        errors.append(f"Element {elem.tag} references non-existent material {elem.material_tag}")
+
+    sectioned = np.zeros(n_elems, dtype=bool)
+    for element_type in _SECTIONED_TYPES:
+        sectioned |= elem_types == element_type
+    section_tags = np.fromiter(map(_ELEMENT_SECTION, elements), dtype=object, count=n_elems)
+    section_known = np.fromiter(map(model.sections.__contains__, section_tags[sectioned]),
+                                dtype=bool, count=int(sectioned.sum()))
+    for index in np.flatnonzero(sectioned)[~section_known].tolist():
+        elem = elements[index]
+        if elem.section_tag is None:
+            errors.append(f"Beam element {elem.tag} missing section_tag")
+        elif elem.section_tag not in model.sections:
+            errors.append(f"Element {elem.tag} references non-existent section {elem.section_tag}")
+
+    node_set = model.nodes
+    for diaphragm in model.diaphragms:
+        if diaphragm.master_node not in node_set:
+            errors.append(f"Diaphragm master node {diaphragm.master_node} missing")
+        for slave in diaphragm.slave_nodes:
+            if slave not in node_set:
+                errors.append(f"Diaphragm slave node {slave} missing")
+            if slave == diaphragm.master_node:
+                errors.append("Diaphragm slave cannot equal master node")
+
+    order = np.argsort(node_tags, kind="stable")
+    sorted_tags = node_tags[order]
+    rows, found = _rows_for_tags(sorted_tags, order, flat_tags)
+
+    # Orphans: neither in an element nor tied by a diaphragm, and unsupported
+    diaphragm_tags = np.fromiter(
+        itertools.chain.from_iterable(
+            itertools.chain(d.slave_nodes, (d.master_node,)) for d in model.diaphragms
+        ),
+        dtype=np.int64,
+    )
+    d_rows, d_found = _rows_for_tags(sorted_tags, order, diaphragm_tags)
+    connected = np.zeros(n_nodes, dtype=bool)
+    connected[rows[found]] = True
+    connected[d_rows[d_found]] = True
+    orphan_nodes = node_tags[~connected & ~supported]
+    if len(orphan_nodes):
+        errors.append(
+            f"Found {len(orphan_nodes)} orphan node(s) not connected to elements: "
+            f"{orphan_nodes[:5].tolist()}"
+        )
+
+    # Elements pointing at nodes removed from the dict cannot be measured
+    complete = np.ones(n_elems, dtype=bool)
+    if not found.all():
+        owner = np.repeat(np.arange(n_elems), counts)
+        for index, tag in zip(owner[~found].tolist(), flat_tags[~found].tolist()):
+            if complete[index]:
+                errors.append(f"Element {elements[index].tag} references missing node {tag}")
+            complete[index] = False
+
+    # Zero-length check on the first two nodes of every element
+    first = rows[offsets[complete]]
+    second = rows[offsets[complete] + 1]
+    delta = coords[second] - coords[first]
+    lengths = np.sqrt(delta[:, 0]**2 + delta[:, 1]**2 + delta[:, 2]**2)
+    short = np.flatnonzero(lengths < zero_length_tolerance)
+    measured = np.flatnonzero(complete)
+    for index, length in zip(measured[short].tolist(), lengths[short].tolist()):
+        node_i, node_j = elements[index].node_tags[:2]
+        errors.append(
+            f"Element {elements[index].tag} has zero/near-zero length ({length:.2e} m) "
+            f"between nodes {node_i} and {node_j}"
+        )
+    zero_length_elements = elem_tags[measured[short]]
+
+    # Shell node counts and edge aspect ratios
+    expected = np.zeros(n_elems, dtype=np.int64)
+    for element_type, n_corners in _SHELL_NODE_COUNTS.items():
+        expected[elem_types == element_type] = n_corners
+    is_shell = expected > 0
+    for index in np.flatnonzero(is_shell & (counts != expected)).tolist():
+        errors.append(
+            f"Shell element {elements[index].tag} has {counts[index]} nodes "
+            f"(expected {expected[index]})"
+        )
+    well_formed = is_shell & (counts == expected) & complete
+    ratios = np.full(n_elems, np.nan)
+    for n_corners in set(_SHELL_NODE_COUNTS.values()):
+        selected = np.flatnonzero(well_formed & (counts == n_corners))
+        if not len(selected):
+            continue
+        corner_rows = rows[offsets[selected][:, None] + np.arange(n_corners)]
+        edges = _edge_lengths(coords, corner_rows)
+        longest = edges.max(axis=1)
+        shortest = edges.min(axis=1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ratios[selected] = np.where(shortest > 0, longest / shortest, np.nan)
+
+    return ValidationReport(
+        errors=tuple(errors),
+        orphan_nodes=orphan_nodes,
+        zero_length_elements=zero_length_elements,
+        shell_tags=elem_tags[well_formed],
+        shell_aspect_ratios=ratios[well_formed],
+        max_aspect_ratio=max_aspect_ratio,
+    )
+
+
+__all__ = [
+    "MAX_SHELL_ASPECT_RATIO",
+    "ValidationReport",
+    "ZERO_LENGTH_TOLERANCE",
+    "validate_model_arrays",
+]
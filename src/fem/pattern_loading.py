@@ -0,0 +1,308 @@
+"""
+Pattern live load analysis per HK Code 2013 Cl 2.3.2.1.
+
+Spans are the column bays along each plan direction. Every live load entry
+(slab surface loads, beam uniform loads and nodal loads in the LL pattern)
+is assigned to the bay holding its centroid, and one load vector is built
+per bay with the same conversion as ``build_pattern_loads``. The patterns of
+``PatternLoadingGenerator`` are sums of bay vectors, so building them is a
+single (n_dofs, n_bays) @ (n_bays, n_patterns) product, and all patterns
+are solved as one multi-column RHS against one factorization.
+
+The patterns are enveloped into ``LL_MAX`` and ``LL_MIN``, the signed
+maximum and minimum of each node and element component. A single signed
+envelope would be unconservative wherever the governing pattern opposes
+the larger-magnitude one (e.g. a pattern hogging against dead load), so
+``combine_with_live_load_bounds`` combines every combination that carries
+``LL`` once with each bound. Combinations are linear in ``LL``, so the
+envelope over the two is the worst pattern per component. ``LL`` itself
+stays the full live loading.
+"""
+
+import copy
+import dataclasses
+import logging
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+from src.fem.combination_processor import combine_results_batch
+from src.fem.fem_engine import FEMModel
+from src.fem.load_combinations import (
+    LoadCombinationDefinition,
+    LoadComponentType,
+    PatternLoadCase,
+    PatternLoadingGenerator,
+)
+from src.fem.result_tables import ElementForceTable, NodeResultTable, stack_node_tables
+from src.fem.solver import AnalysisResult, LOAD_CASE_PATTERN_MAP
+from src.fem.sparse_solver import (
+    FRAME_ELEMENT_TYPES,
+    PatternLoads,
+    SparseFEMSolver,
+    build_pattern_loads,
+)
+from src.fem.wind_case_synthesizer import SynthesizedWindCases
+
+logger = logging.getLogger(__name__)
+
+LIVE_LOAD_CASE = "LL"
+PATTERN_CASE_PREFIX = "LL_"
+LIVE_LOAD_MAX_CASE = "LL_MAX"
+LIVE_LOAD_MIN_CASE = "LL_MIN"
+LIVE_LOAD_BOUND_CASES = (LIVE_LOAD_MAX_CASE, LIVE_LOAD_MIN_CASE)
+PLAN_DIRECTIONS = ("X", "Y")
+
+# Plan coordinates closer than this are the same grid line (m)
+GRID_TOLERANCE = 1e-3
+
+
+def is_pattern_case(name: str) -> bool:
+    """Whether ``name`` is a pattern live load case such as "LL_X2"."""
+    return name.startswith(PATTERN_CASE_PREFIX)
+
+
+def column_grid_lines(model: FEMModel) -> Dict[str, np.ndarray]:
+    """Sorted X and Y grid lines through the model's vertical frame members."""
+    lines: Dict[str, List[float]] = {direction: [] for direction in PLAN_DIRECTIONS}
+    for elem in model.elements.values():
+        if elem.element_type not in FRAME_ELEMENT_TYPES:
+            continue
+        start, end = (model.nodes[tag] for tag in elem.node_tags[:2])
+        if abs(start.x - end.x) < GRID_TOLERANCE and abs(start.y - end.y) < GRID_TOLERANCE:
+            lines["X"].append(start.x)
+            lines["Y"].append(start.y)
+    return {direction: _unique_lines(values) for direction, values in lines.items()}
+
+
+def generate_live_load_patterns(
+    grid_lines: Mapping[str, np.ndarray],
+    mode: str = "all",
+) -> Dict[str, Tuple[str, PatternLoadCase]]:
+    """Pattern cases along each plan direction.
+
+    The full-loading pattern is shared by both directions and named
+    "LL_FULL"; the others are "LL_X1", "LL_Y1", ... in generator order.
+
+    Returns:
+        Dict of {case name: (direction, PatternLoadCase)}
+    """
+    cases: Dict[str, Tuple[str, PatternLoadCase]] = {}
+    for direction in PLAN_DIRECTIONS:
+        n_spans = max(len(grid_lines[direction]) - 1, 1)
+        patterns = PatternLoadingGenerator.generate_patterns(n_spans, mode)
+        full, others = patterns[0], patterns[1:]
+        cases.setdefault(f"{PATTERN_CASE_PREFIX}FULL", (direction, full))
+        for index, pattern in enumerate(others, start=1):
+            cases[f"{PATTERN_CASE_PREFIX}{direction}{index}"] = (direction, pattern)
+    return cases
+
+
+def build_live_load_patterns(
+    model: FEMModel,
+    solver: SparseFEMSolver,
+    mode: str = "all",
+    grid_lines: Optional[Mapping[str, np.ndarray]] = None,
+) -> Dict[str, PatternLoads]:
+    """Load vectors of every live load pattern.
+
+    Args:
+        model: FEMModel with live loads in the LL load pattern
+        solver: Assembled solver of ``model``
+        mode: PatternLoadingGenerator mode ("all", "checkerboard", "shear", "full")
+        grid_lines: {"X"/"Y": sorted grid coordinates}; defaults to the
+            column grid of the model
+
+    Returns:
+        Dict of {pattern case name: PatternLoads}
+    """
+    if solver.system is None:
+        solver.assemble()
+    grid_lines = grid_lines or column_grid_lines(model)
+    cases = generate_live_load_patterns(grid_lines, mode)
+
+    loads: Dict[str, PatternLoads] = {}
+    for direction in PLAN_DIRECTIONS:
+        names = [name for name, (d, _) in cases.items() if d == direction]
+        if not names:
+            continue
+        bays = _bay_loads(model, solver, direction, grid_lines[direction])
+        n_bays = len(bays)
+        weights = np.zeros((n_bays, len(names)))
+        for column, name in enumerate(names):
+            pattern = cases[name][1]
+            spans = [span for span in pattern.loaded_spans if span < n_bays]
+            weights[spans, column] = pattern.factor
+
+        nodal = np.column_stack([bay.nodal for bay in bays]) @ weights
+        for column, name in enumerate(names):
+            fixed_end: Dict[int, np.ndarray] = {}
+            for bay, weight in zip(bays, weights[:, column]):
+                if weight == 0.0:
+                    continue
+                for tag, forces in bay.frame_fixed_end.items():
+                    fixed_end[tag] = fixed_end.get(tag, 0.0) + weight * forces
+            loads[name] = PatternLoads(nodal=nodal[:, column], frame_fixed_end=fixed_end)
+    return loads
+
+
+def analyze_pattern_live_loads(
+    model: FEMModel,
+    mode: str = "all",
+    solver: Optional[SparseFEMSolver] = None,
+    include_element_forces: bool = True,
+) -> Dict[str, AnalysisResult]:
+    """Solve all live load patterns as one batch and envelope them.
+
+    Returns:
+        Dict with one result per pattern case plus the "LL_MAX" and
+        "LL_MIN" envelopes
+    """
+    solver = solver or SparseFEMSolver(model)
+    loads = build_live_load_patterns(model, solver, mode)
+    results = solver.analyze_loads(loads, include_element_forces)
+    results.update(envelope_pattern_results(list(results.values())))
+    logger.info("Solved %d live load patterns against one factorization", len(loads))
+    return results
+
+
+def with_pattern_live_load_cases(
+    model: FEMModel,
+    results: Mapping[str, AnalysisResult],
+    mode: str = "all",
+) -> Dict[str, AnalysisResult]:
+    """Return ``results`` with the pattern cases and their envelopes added.
+
+    "LL" keeps the full live loading; see ``combine_with_live_load_bounds``
+    for combinations over the "LL_MAX"/"LL_MIN" envelopes. If the pattern
+    analysis fails, returns a copy of ``results`` unchanged.
+    """
+    merged = dict(results)
+    pattern_results = analyze_pattern_live_loads(model, mode)
+    envelope = pattern_results[LIVE_LOAD_MAX_CASE]
+    if not envelope.success:
+        logger.warning("Pattern live load skipped: %s", envelope.message)
+        return merged
+    merged.update(pattern_results)
+    return merged
+
+
+def envelope_pattern_results(results: Sequence[AnalysisResult]) -> Dict[str, AnalysisResult]:
+    """Signed maximum and minimum per component over ``results``.
+
+    Returns:
+        Dict with the "LL_MAX" and "LL_MIN" envelopes
+    """
+    solved = [result for result in results if result.success]
+    if not solved:
+        failed = AnalysisResult(success=False, message=f"{LIVE_LOAD_CASE}: no live load pattern solved")
+        return {case: failed for case in LIVE_LOAD_BOUND_CASES}
+
+    envelopes: Dict[str, AnalysisResult] = {}
+    for case, pick in ((LIVE_LOAD_MAX_CASE, np.max), (LIVE_LOAD_MIN_CASE, np.min)):
+        other: Dict[int, Dict[str, float]] = {}
+        for result in solved:
+            for tag, forces in result.element_forces.other.items():
+                target = other.setdefault(tag, {})
+                for key, value in forces.items():
+                    target[key] = pick((value, target.get(key, value)))
+
+        envelopes[case] = AnalysisResult(
+            success=True,
+            message=f"{case}: envelope of {len(solved)} live load patterns",
+            converged=all(result.converged for result in solved),
+            node_displacements=_envelope_tables([r.node_displacements for r in solved], pick),
+            node_reactions=_envelope_tables([r.node_reactions for r in solved], pick),
+            element_forces=ElementForceTable.from_parts(
+                _envelope_tables([r.element_forces.frames for r in solved], pick), other,
+            ),
+        )
+    return envelopes
+
+
+def combine_with_live_load_bounds(
+    results: Mapping[str, AnalysisResult],
+    combinations: Sequence[LoadCombinationDefinition],
+) -> Dict[str, AnalysisResult]:
+    """``combine_results_batch`` that covers every live load pattern.
+
+    Without "LL_MAX"/"LL_MIN" in ``results`` this is ``combine_results_batch``.
+    Otherwise each combination with an LL factor is combined with "LL"
+    taken as either bound, under the names "<combination> [LL_MAX]" and
+    "<combination> [LL_MIN]", so an envelope over the combined results
+    holds the worst pattern together with the other loads.
+    """
+    if not all(case in results for case in LIVE_LOAD_BOUND_CASES):
+        return combine_results_batch(results, combinations)
+
+    with_live = [comb for comb in combinations if comb.get_factor(LoadComponentType.LL) != 0.0]
+    plain = combine_results_batch(results, [comb for comb in combinations if comb not in with_live])
+    bounded = {
+        bound: combine_results_batch(_with_case(results, LIVE_LOAD_CASE, results[bound]), with_live)
+        for bound in LIVE_LOAD_BOUND_CASES
+    }
+
+    merged: Dict[str, AnalysisResult] = {}
+    for comb in combinations:
+        if comb.name in plain:
+            merged[comb.name] = plain[comb.name]
+        for bound in LIVE_LOAD_BOUND_CASES:
+            if comb.name in bounded[bound]:
+                merged[f"{comb.name} [{bound}]"] = bounded[bound][comb.name]
+    return merged
+
+
+def _with_case(results: Mapping[str, AnalysisResult],
+               name: str,
+               result: AnalysisResult) -> Mapping[str, AnalysisResult]:
+    """``results`` with ``name`` replaced, keeping synthesized wind cases lazy."""
+    if isinstance(results, SynthesizedWindCases):
+        return SynthesizedWindCases(
+            results.components, base_results={**results.base_results, name: result},
+        )
+    return {**results, name: result}
+
+
+def _envelope_tables(tables: Sequence[NodeResultTable], pick=np.max) -> NodeResultTable:
+    tags, values, _ = stack_node_tables(tables)
+    return NodeResultTable.from_arrays(tags, pick(values, axis=0))
+
+
+def _unique_lines(values: Sequence[float]) -> np.ndarray:
+    values = np.sort(np.asarray(values, dtype=float))
+    if not values.size:
+        return values
+    keep = np.concatenate([[True], np.diff(values) > GRID_TOLERANCE])
+    return values[keep]
+
+
+def _bay_loads(model: FEMModel,
+               solver: SparseFEMSolver,
+               direction: str,
+               lines: np.ndarray) -> List[PatternLoads]:
+    """Live load vectors of each bay between consecutive grid ``lines``."""
+    axis = direction.lower()
+    n_bays = max(len(lines) - 1, 1)
+    ll_pattern = LOAD_CASE_PATTERN_MAP[LIVE_LOAD_CASE]
+
+    def bay_of(node_tags: Sequence[int]) -> int:
+        centroid = np.mean([getattr(model.nodes[tag], axis) for tag in node_tags])
+        return int(np.clip(np.searchsorted(lines, centroid) - 1, 0, n_bays - 1))
+
+    # Relabel each live load with its bay and reuse the standard conversion
+    relabeled = copy.copy(model)
+    relabeled.loads = [
+        dataclasses.replace(load, load_pattern=bay_of([load.node_tag]))
+        for load in model.loads if load.load_pattern == ll_pattern
+    ]
+    relabeled.uniform_loads = [
+        dataclasses.replace(load, load_pattern=bay_of(model.elements[load.element_tag].node_tags))
+        for load in model.uniform_loads if load.load_pattern == ll_pattern
+    ]
+    relabeled.surface_loads = [
+        dataclasses.replace(load, load_pattern=bay_of(model.elements[load.element_tag].node_tags))
+        for load in model.surface_loads if load.load_pattern == ll_pattern
+    ]
+    by_bay = build_pattern_loads(relabeled, solver.system)
+    n_dofs = solver.system.n_dofs
+    return [by_bay.get(bay) or PatternLoads(nodal=np.zeros(n_dofs)) for bay in range(n_bays)]
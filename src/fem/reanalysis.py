@@ -0,0 +1,338 @@
+"""
+Low-rank reanalysis of section changes against a factorized base stiffness.
+
+Sizing loops change the sections of a few element groups at a time. The
+stiffness change of a frame element is a 12x12 matrix of rank <= 6, so a
+perturbed design differs from the factorized base by ``K1 = K0 + P L P^T``
+with a small rank ``r``. ``LowRankReanalysis`` solves such designs with the
+Sherman-Morrison-Woodbury identity::
+
+    K1^-1 F = X0 - Z (L^-1 + V^T Z)^-1 V^T X0,   V = T^T P,  Z = K0^-1 V
+
+which costs ``r`` back-substitutions plus an ``r x r`` dense solve instead
+of a re-assembly and refactorization. Past ``rank_threshold`` the stiffness
+is re-assembled and refactorized, and the requested design becomes the new
+base so that subsequent small perturbations are low-rank again.
+
+Loads are held at their base values; self-weight changes are not tracked.
+"""
+
+import logging
+from dataclasses import dataclass, replace
+from typing import Dict, Iterable, List, Mapping, NamedTuple, Optional, Sequence
+
+import numpy as np
+
+from src.fem.fem_engine import FEMModel
+from src.fem.solver import AnalysisResult
+from src.fem.sparse_solver import (
+    ElementBlock,
+    SparseFEMSolver,
+    _assemble_blocks,
+    _congruent,
+    _frame_local_stiffness,
+    sp,
+)
+
+_logger = logging.getLogger(__name__)
+
+# Section keys of a frame element, in _frame_local_stiffness argument order
+FRAME_SECTION_KEYS = ("E", "A", "G", "J", "Iy", "Iz")
+
+# Largest update rank solved with Woodbury before refactorizing. Z is a
+# dense n_dofs x rank block (rank back-substitutions), so beyond about a
+# hundred columns a sparse refactorization is cheaper.
+DEFAULT_RANK_THRESHOLD = 96
+
+# Eigenvalues of an element stiffness change below this fraction of the
+# largest one are treated as zero (rigid-body modes)
+_RANK_TOLERANCE = 1e-10
+
+
+@dataclass
+class ReanalysisStats:
+    """Counters for a ``LowRankReanalysis``.
+
+    Attributes:
+        low_rank_solves: Designs solved with a nonzero-rank Woodbury update
+        refactorizations: Designs that re-assembled and refactorized
+        last_rank: Update rank of the most recent design
+    """
+    low_rank_solves: int = 0
+    refactorizations: int = 0
+    last_rank: int = 0
+
+
+class _LowRankUpdate(NamedTuple):
+    """Woodbury terms of one design, ``K1 = K0 + P diag(eigenvalues) P^T``."""
+    P: "sp.csr_matrix"
+    eigenvalues: np.ndarray
+    rows: np.ndarray
+    local: np.ndarray
+    V: np.ndarray
+    Z: np.ndarray
+    capacitance: np.ndarray
+
+    def apply(self, base: np.ndarray) -> np.ndarray:
+        """Correct reduced base solutions ``K0^-1 b`` to ``K1^-1 b``."""
+        return base - self.Z @ np.linalg.solve(self.capacitance, self.V.T @ base)
+
+
+class LowRankReanalysis:
+    """Solve section changes of frame element groups without refactorizing.
+
+    Args:
+        model: FEMModel to analyze (frames and shells, see sparse_solver)
+        groups: Element groups that may change, {group name: element tags}.
+            Only frame elements can be grouped.
+        load_cases: Load case names solved for every design
+        default_pattern: Pattern for names missing from LOAD_CASE_PATTERN_MAP
+        rank_threshold: Largest update rank solved with Woodbury
+        method: Factorization method, see SparseFEMSolver
+
+    Example:
+        >>> reanalysis = LowRankReanalysis(model, {"columns": column_tags}, ["Wx"])
+        >>> u = reanalysis.solve({"columns": {**column_section, "Iz": 2 * Iz}})
+    """
+
+    def __init__(self,
+                 model: FEMModel,
+                 groups: Mapping[str, Iterable[int]],
+                 load_cases: Sequence[str] = ("DL",),
+                 default_pattern: int = 1,
+                 rank_threshold: int = DEFAULT_RANK_THRESHOLD,
+                 method: str = "auto"):
+        if sp is None:
+            raise ImportError("scipy is not installed. Install with: pip install scipy")
+        self.model = model
+        self.load_cases = list(load_cases)
+        self.rank_threshold = rank_threshold
+        self.stats = ReanalysisStats()
+
+        self.solver = SparseFEMSolver(model, method=method)
+        self.solver.factorize()
+        system = self.solver.system
+
+        self._frame_position = next(
+            (i for i, block in enumerate(system.blocks) if block.kind == "frame"), None
+        )
+        frame_rows: Dict[int, int] = {}
+        if self._frame_position is not None:
+            frame_rows = {int(tag): row for row, tag in enumerate(self._frames.tags)}
+
+        self.groups: Dict[str, np.ndarray] = {}
+        self._group_slices: Dict[str, slice] = {}
+        rows: List[np.ndarray] = []
+        offset = 0
+        for name, tags in groups.items():
+            tags = list(tags)
+            missing = [tag for tag in tags if tag not in frame_rows]
+            if missing:
+                raise ValueError(f"Group '{name}' has non-frame or unknown elements: {missing[:5]}")
+            group_rows = np.array([frame_rows[tag] for tag in tags], dtype=np.int64)
+            self.groups[name] = np.asarray(tags, dtype=np.int64)
+            self._group_slices[name] = slice(offset, offset + group_rows.size)
+            rows.append(group_rows)
+            offset += group_rows.size
+        self._rows = np.concatenate(rows) if rows else np.zeros(0, dtype=np.int64)
+
+        self._original_props = np.array([
+            [model.sections[model.elements[int(tag)].section_tag][key] for key in FRAME_SECTION_KEYS]
+            for tag in (self._frames.tags[self._rows] if self._rows.size else [])
+        ], dtype=float).reshape(-1, len(FRAME_SECTION_KEYS))
+        self._base_props = self._original_props.copy()
+        self._last_update_key: Optional[bytes] = None
+        self._last_update: Optional[_LowRankUpdate] = None
+
+        self._case_loads = self.solver.case_loads(self.load_cases, default_pattern)
+        self._loads = np.zeros((system.n_dofs, len(self._case_loads)))
+        for column, loads in enumerate(self._case_loads):
+            self._loads[:, column] = loads.nodal
+        self._reduced_loads = np.asarray(system.reduce(self._loads))
+        self._base_solution = self.solver._solve(self._reduced_loads)
+
+    @property
+    def _frames(self) -> ElementBlock:
+        return self.solver.system.blocks[self._frame_position]
+
+    def group_lengths(self, name: str) -> np.ndarray:
+        """Lengths of the elements of a group (m)."""
+        return self._frames.lengths[self._rows[self._group_slices[name]]]
+
+    def target_props(self, design: Mapping[str, Mapping[str, float]]) -> np.ndarray:
+        """Section parameters of every grouped element for a design.
+
+        Returns:
+            Array (n_grouped_elements, len(FRAME_SECTION_KEYS)), rows in
+            group order (see ``group_rows``)
+        """
+        return self._target_props(design)
+
+    def group_rows(self, name: str) -> np.ndarray:
+        """Frame block rows of the elements of a group."""
+        return self._rows[self._group_slices[name]]
+
+    def group_slice(self, name: str) -> slice:
+        """Rows of a group in ``target_props``."""
+        return self._group_slices[name]
+
+    def _target_props(self, design: Mapping[str, Mapping[str, float]]) -> np.ndarray:
+        target = self._original_props.copy()
+        for name, section in design.items():
+            if name not in self._group_slices:
+                raise KeyError(f"Unknown element group '{name}'")
+            target[self._group_slices[name]] = [section[key] for key in FRAME_SECTION_KEYS]
+        return target
+
+    def solve(self, design: Mapping[str, Mapping[str, float]]) -> np.ndarray:
+        """Full-DOF displacements of every load case for a design.
+
+        Args:
+            design: Section parameters (``FRAME_SECTION_KEYS``) per changed
+                group; groups not listed keep the model's original section
+
+        Returns:
+            Displacements, shape (n_dofs, n_load_cases)
+        """
+        return self._solve_design(design)[0]
+
+    def solve_rhs(self,
+                  design: Mapping[str, Mapping[str, float]],
+                  rhs: np.ndarray) -> np.ndarray:
+        """Solve ``K(design) x = rhs`` for full-DOF right-hand sides.
+
+        Uses the same factorization and low-rank update as ``solve``, so
+        adjoint problems of a design cost one back-substitution each.
+
+        Args:
+            design: Section parameters per changed group, see ``solve``
+            rhs: Full-DOF right-hand sides, shape (n_dofs,) or (n_dofs, k)
+
+        Returns:
+            Full-DOF solutions with the shape of ``rhs``
+        """
+        system = self.solver.system
+        update = self._update(design)
+        X = self.solver._solve(np.asarray(system.reduce(rhs)))
+        if update is not None:
+            X = update.apply(X)
+        return np.asarray(system.expand(X))
+
+    def analyze(self,
+                design: Mapping[str, Mapping[str, float]],
+                include_element_forces: bool = True) -> Dict[str, AnalysisResult]:
+        """Solve a design and build ``AnalysisResult`` objects per load case."""
+        U, correction = self._solve_design(design)
+        system = self.solver.system
+        R = np.asarray(system.stiffness @ U) - self._loads
+        if correction is not None:
+            R += correction.P @ (correction.eigenvalues[:, None] * np.asarray(correction.P.T @ U))
+            frames = self._frames
+            patched_local = frames.local_stiffness.copy()
+            patched_local[correction.rows] = correction.local
+            blocks = list(system.blocks)
+            blocks[self._frame_position] = replace(frames, local_stiffness=patched_local)
+            system = replace(system, blocks=blocks)
+
+        results: Dict[str, AnalysisResult] = {}
+        for column, lc in enumerate(self.load_cases):
+            result = self.solver._build_result(
+                U[:, column], R[:, column], self._case_loads[column],
+                include_element_forces, system=system,
+            )
+            result.message = f"{lc}: {result.message} (low-rank reanalysis)"
+            results[lc] = result
+        return results
+
+    def _solve_design(self, design: Mapping[str, Mapping[str, float]]):
+        update = self._update(design)
+        if update is None:
+            X = self._base_solution
+        else:
+            X = update.apply(self._base_solution)
+            self.stats.low_rank_solves += 1
+        return np.asarray(self.solver.system.expand(X)), update
+
+    def _update(self, design: Mapping[str, Mapping[str, float]]) -> Optional[_LowRankUpdate]:
+        """Low-rank update of ``design`` against the base, or None if none is needed.
+
+        Refactorizes (and rebases) when the rank exceeds ``rank_threshold``.
+        The update of the most recent design is memoized.
+        """
+        target = self._target_props(design)
+        key = target.tobytes()
+        if key == self._last_update_key:
+            return self._last_update
+
+        update = None
+        changed = np.flatnonzero(np.any(target != self._base_props, axis=1))
+        if not changed.size:
+            self.stats.last_rank = 0
+        else:
+            update = self._build_update(target, changed)
+            if update is None:
+                # Rebased: the design is now the base, reported as rank 0 next time
+                self.stats.refactorizations += 1
+                return None
+        self._last_update_key = key
+        self._last_update = update
+        return update
+
+    def _build_update(self, target: np.ndarray, changed: np.ndarray) -> Optional[_LowRankUpdate]:
+        system = self.solver.system
+        frames = self._frames
+        rows = self._rows[changed]
+        local = _frame_local_stiffness(frames.lengths[rows], *target[changed].T)
+        transform = frames.transform[rows]
+        delta = _congruent(transform, local - frames.local_stiffness[rows])
+        eigenvalues, vectors = np.linalg.eigh(delta)
+        scale = np.abs(eigenvalues).max(axis=1, keepdims=True)
+        keep = np.abs(eigenvalues) > _RANK_TOLERANCE * np.maximum(scale, 1e-300)
+        rank = int(keep.sum())
+        self.stats.last_rank = rank
+
+        if rank > self.rank_threshold:
+            _logger.info("Update rank %d exceeds %d; refactorizing", rank, self.rank_threshold)
+            self._rebase(target, changed, rows, local)
+            return None
+
+        # P: full-DOF columns of the kept eigenvectors, K1 = K0 + P diag(lam) P^T
+        element, mode = np.nonzero(keep)
+        dofs = frames.dofs[rows][element]
+        P = sp.csr_matrix(
+            (vectors[element, :, mode].ravel(),
+             (dofs.ravel(), np.repeat(np.arange(rank), dofs.shape[1]))),
+            shape=(system.n_dofs, rank),
+        )
+        lam = eigenvalues[element, mode]
+        V = np.asarray((system.constraint_map.T @ P).todense())
+        Z = self.solver._solve(V)
+        capacitance = np.diag(1.0 / lam) + V.T @ Z
+        return _LowRankUpdate(P, lam, rows, local, V, Z, capacitance)
+
+    def _rebase(self, target: np.ndarray, changed: np.ndarray,
+                rows: np.ndarray, local: np.ndarray) -> None:
+        """Adopt ``target`` as the base design and refactorize."""
+        system = self.solver.system
+        frames = self._frames
+        local_stiffness = frames.local_stiffness.copy()
+        local_stiffness[rows] = local
+        stiffness = frames.stiffness.copy()
+        stiffness[rows] = _congruent(frames.transform[rows], local)
+        blocks = list(system.blocks)
+        blocks[self._frame_position] = replace(
+            frames, local_stiffness=local_stiffness, stiffness=stiffness,
+        )
+        K = _assemble_blocks(blocks, system.n_dofs)
+        T = system.constraint_map
+        self.solver.system = replace(
+            system,
+            stiffness=K,
+            reduced_stiffness=(T.T @ K @ T).tocsc(),
+            blocks=blocks,
+        )
+        self.solver._solve = None
+        self.solver.factorize()
+        self._last_update_key = None
+        self._base_props = target.copy()
+        self._base_solution = self.solver._solve(self._reduced_loads)
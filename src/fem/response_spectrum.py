@@ -0,0 +1,264 @@
+"""
+Response spectrum load cases from cached modal results.
+
+Each mode's peak response to a spectral acceleration ``Sa(T)`` in direction
+``d`` is the static response to ``u_n = Gamma_nd * Sa(T_n) / omega_n^2 * phi_n``.
+Modal peaks of every node and element component are stacked into
+``(n_values, n_modes)`` arrays and combined in one pass::
+
+    r = sqrt(sum_ij rho_ij r_i r_j) = sqrt(rowsum((R @ rho) * R))
+
+which is O(n_values * n_modes^2) in BLAS and keeps memory at
+O(n_values * n_modes). ``rho`` is the Der Kiureghian CQC correlation for
+equal modal damping, or the identity for SRSS.
+
+The directional cases ``EX`` and ``EY`` are unsigned envelopes.
+``with_orthogonal_seismic_cases`` adds the Eurocode 8 orthogonal
+combinations ``E1 = EX + 0.3 EY`` and ``E2 = 0.3 EX + EY`` (EN 1998-1
+Cl 4.3.3.5.1), which the seismic load combinations reference; their
+reversal cases supply the sign.
+"""
+
+import logging
+from dataclasses import dataclass
+from typing import Callable, Dict, Mapping, Optional
+
+import numpy as np
+
+from src.fem.fem_engine import FEMModel
+from src.fem.modal_analysis import (
+    DEFAULT_LIVE_LOAD_MASS_FRACTION,
+    GRAVITY,
+    ModalResult,
+    build_lumped_mass,
+    get_modal_result,
+)
+from src.fem.result_tables import (
+    ElementForceTable,
+    NodeResultTable,
+    superpose_element_tables,
+    superpose_node_tables,
+)
+from src.fem.solver import AnalysisResult
+from src.fem.sparse_solver import DOFS_PER_NODE, SparseFEMSolver, SparseStiffnessSystem
+
+logger = logging.getLogger(__name__)
+
+# Directional response spectrum cases and their excitation direction
+SEISMIC_DIRECTION_CASES: Dict[str, str] = {"EX": "X", "EY": "Y"}
+
+# Orthogonal combinations referenced by get_uls_seismic_combinations
+ORTHOGONAL_SEISMIC_CASES: Dict[str, Dict[str, float]] = {
+    "E1": {"EX": 1.0, "EY": 0.3},
+    "E2": {"EX": 0.3, "EY": 1.0},
+}
+
+# Modes used for response spectrum cases by default
+DEFAULT_RSA_MODES = 12
+
+# Viscous damping ratio of every mode
+DEFAULT_DAMPING_RATIO = 0.05
+
+MODAL_COMBINATION_METHODS = ("CQC", "SRSS")
+
+
+@dataclass(frozen=True)
+class DesignSpectrum:
+    """Eurocode 8 horizontal design spectrum (EN 1998-1 Cl 3.2.2.5).
+
+    Defaults describe a Type 1 spectrum on ground type C with low
+    ductility; set ``ag`` and the corner periods per project.
+
+    Attributes:
+        ag: Design ground acceleration on type A ground (m/s²)
+        soil_factor: Soil factor S
+        TB: Lower corner period of the constant-acceleration branch (s)
+        TC: Upper corner period of the constant-acceleration branch (s)
+        TD: Start of the constant-displacement branch (s)
+        behaviour_factor: Behaviour factor q
+        lower_bound: Lower bound factor beta on ag
+    """
+    ag: float = 0.1 * GRAVITY
+    soil_factor: float = 1.15
+    TB: float = 0.2
+    TC: float = 0.6
+    TD: float = 2.0
+    behaviour_factor: float = 1.5
+    lower_bound: float = 0.2
+
+    def __call__(self, periods: np.ndarray) -> np.ndarray:
+        """Design spectral acceleration Sd(T) (m/s²) for an array of periods."""
+        T = np.asarray(periods, dtype=float)
+        ag_s = self.ag * self.soil_factor
+        plateau = ag_s * 2.5 / self.behaviour_factor
+        floor = self.lower_bound * self.ag
+        with np.errstate(divide="ignore", invalid="ignore"):
+            rising = ag_s * (2.0 / 3.0 + T / self.TB * (2.5 / self.behaviour_factor - 2.0 / 3.0))
+            velocity = np.maximum(plateau * self.TC / T, floor)
+            displacement = np.maximum(plateau * self.TC * self.TD / T**2, floor)
+        return np.select(
+            [T <= self.TB, T <= self.TC, T <= self.TD],
+            [rising, np.full_like(T, plateau), velocity],
+            displacement,
+        )
+
+
+def modal_correlation(omega: np.ndarray,
+                      damping: float = DEFAULT_DAMPING_RATIO,
+                      method: str = "CQC") -> np.ndarray:
+    """Modal correlation matrix rho (n_modes, n_modes).
+
+    Args:
+        omega: Circular frequencies (rad/s)
+        damping: Modal damping ratio (equal for all modes)
+        method: "CQC" (Der Kiureghian) or "SRSS" (identity)
+    """
+    if method not in MODAL_COMBINATION_METHODS:
+        raise ValueError(f"method must be one of {MODAL_COMBINATION_METHODS}")
+    omega = np.asarray(omega, dtype=float)
+    if method == "SRSS":
+        return np.eye(omega.size)
+    r = omega[None, :] / omega[:, None]
+    zeta2 = damping * damping
+    return 8.0 * zeta2 * (1.0 + r) * r**1.5 / ((1.0 - r * r) ** 2 + 4.0 * zeta2 * r * (1.0 + r) ** 2)
+
+
+def combine_modal_responses(modal: np.ndarray, correlation: np.ndarray) -> np.ndarray:
+    """Combine modal peaks ``(..., n_modes)`` into unsigned totals ``(...)``."""
+    flat = modal.reshape(-1, modal.shape[-1])
+    squared = np.einsum('nm,nm->n', flat @ correlation, flat)
+    return np.sqrt(np.maximum(squared, 0.0)).reshape(modal.shape[:-1])
+
+
+def run_response_spectrum(model: FEMModel,
+                          spectrum: Optional[Callable[[np.ndarray], np.ndarray]] = None,
+                          n_modes: int = DEFAULT_RSA_MODES,
+                          damping: float = DEFAULT_DAMPING_RATIO,
+                          method: str = "CQC",
+                          live_load_fraction: float = DEFAULT_LIVE_LOAD_MASS_FRACTION,
+                          modal: Optional[ModalResult] = None,
+                          include_element_forces: bool = True,
+                          solver: Optional[SparseFEMSolver] = None) -> Dict[str, AnalysisResult]:
+    """Build the directional response spectrum cases of a model.
+
+    Args:
+        model: FEMModel with gravity loads for the mass source
+        spectrum: Callable mapping periods (s) to Sa (m/s²); defaults to
+            ``DesignSpectrum()``
+        n_modes: Modes to combine
+        damping: Modal damping ratio for CQC
+        method: "CQC" or "SRSS"
+        live_load_fraction: Share of LL in the mass source
+        modal: Modal result to combine; fetched from the fingerprint cache
+            (``get_modal_result``) when omitted
+        include_element_forces: Combine element end forces as well
+        solver: Optional SparseFEMSolver of ``model`` to reuse for the
+            mass source and, when ``modal`` is omitted, the eigen solve
+
+    Returns:
+        Dict with "EX" and "EY" AnalysisResults of unsigned peak responses
+    """
+    spectrum = spectrum or DesignSpectrum()
+    solver = solver or SparseFEMSolver(model)
+    if modal is None:
+        modal = get_modal_result(model, n_modes, live_load_fraction, solver)
+
+    system = solver.system if solver.system is not None else solver.assemble()
+    mass = build_lumped_mass(model, solver, live_load_fraction)
+
+    omega = 2.0 * np.pi * modal.frequencies
+    valid = omega > 0.0
+    omega = omega[valid]
+    shapes = modal.mode_shapes[:, valid]
+    spectral = np.asarray(spectrum(modal.periods[valid]), dtype=float)
+    correlation = modal_correlation(omega, damping, method)
+
+    results: Dict[str, AnalysisResult] = {}
+    for case, direction in SEISMIC_DIRECTION_CASES.items():
+        gamma = modal.participation_factors[direction][valid]
+        displacements = shapes * (gamma * spectral / omega**2)
+        ratio = float(modal.effective_mass_ratios[direction][valid].sum())
+        result = _combine_case(
+            system, displacements, mass, omega, correlation, include_element_forces,
+        )
+        result.message = (
+            f"{case}: response spectrum {method} of {omega.size} modes "
+            f"({ratio:.0%} mass in {direction})"
+        )
+        results[case] = result
+    return results
+
+
+def with_orthogonal_seismic_cases(results: Mapping[str, AnalysisResult]) -> Dict[str, AnalysisResult]:
+    """Return ``results`` extended with E1/E2 built from EX and EY.
+
+    Combines the unsigned directional envelopes with the 100/30 rule. If
+    either directional case is missing or unsuccessful, returns a copy of
+    ``results`` unchanged.
+    """
+    merged = dict(results)
+    components = [merged.get(case) for case in SEISMIC_DIRECTION_CASES]
+    if any(result is None or not result.success for result in components):
+        logger.warning("E1/E2 synthesis skipped: EX/EY response spectrum cases unavailable")
+        return merged
+    for case, weights in ORTHOGONAL_SEISMIC_CASES.items():
+        weighted = [(weights[key], merged[key]) for key in SEISMIC_DIRECTION_CASES]
+        merged[case] = AnalysisResult(
+            success=True,
+            message=f"{case}: " + " + ".join(f"{w:.1f} {key}" for key, w in weights.items()),
+            node_displacements=superpose_node_tables(
+                (w, result.node_displacements) for w, result in weighted
+            ),
+            node_reactions=superpose_node_tables(
+                (w, result.node_reactions) for w, result in weighted
+            ),
+            element_forces=superpose_element_tables(
+                (w, result.element_forces) for w, result in weighted
+            ),
+        )
+    return merged
+
+
+def _combine_case(system: SparseStiffnessSystem,
+                  displacements: np.ndarray,
+                  mass: np.ndarray,
+                  omega: np.ndarray,
+                  correlation: np.ndarray,
+                  include_element_forces: bool) -> AnalysisResult:
+    """Combine the modal responses ``displacements`` (n_dofs, n_modes)."""
+    result = AnalysisResult(success=True, message="")
+    node_disp = combine_modal_responses(displacements, correlation).reshape(-1, DOFS_PER_NODE)
+    result.node_displacements = NodeResultTable.from_arrays(system.node_tags, node_disp)
+
+    # Reactions balance the equivalent inertia loads M u omega^2 of each mode
+    modal_reactions = np.asarray(system.stiffness @ displacements)
+    modal_reactions -= mass[:, None] * displacements * omega**2
+    modal_reactions[~system.reaction_dofs] = 0.0
+    reactions = combine_modal_responses(modal_reactions, correlation).reshape(-1, DOFS_PER_NODE)
+    rows = np.flatnonzero(np.any(reactions > 1e-10, axis=1))
+    result.node_reactions = NodeResultTable.from_arrays(system.node_tags[rows], reactions[rows])
+
+    if not include_element_forces:
+        return result
+    frame_tags = []
+    frame_forces = []
+    other: Dict[int, Dict[str, float]] = {}
+    for block in system.blocks:
+        u_e = displacements[block.dofs]
+        if block.kind == "frame":
+            u_local = np.einsum('nij,njm->nim', block.transform, u_e)
+            modal_forces = np.einsum('nij,njm->nim', block.local_stiffness, u_local)
+            frame_tags.append(block.tags)
+            frame_forces.append(combine_modal_responses(modal_forces, correlation))
+        else:
+            modal_forces = np.einsum('nij,njm->nim', block.stiffness, u_e)
+            forces = combine_modal_responses(modal_forces, correlation)
+            for tag, values in zip(block.tags.tolist(), forces.tolist()):
+                other[tag] = {f'force_{i}': f for i, f in enumerate(values)}
+    if frame_tags:
+        result.element_forces = ElementForceTable.from_frame_arrays(
+            np.concatenate(frame_tags), np.vstack(frame_forces), other,
+        )
+    else:
+        result.element_forces = ElementForceTable(other)
+    return result
@@ -0,0 +1,268 @@
+"""
+Persistent content-addressed store of analysis results.
+
+Solved load cases are written to disk under a hash of the model
+fingerprint and the analysis request, so a browser refresh, a server
+restart or a repeated regression run gets the results back without
+solving. ``analyze_model(..., store=ResultStore())`` checks the store
+before validating or solving.
+
+Each entry is a directory of ``.npy`` arrays, one concatenation per
+result field over all load cases plus row offsets, and a ``meta.json``
+with the per-case status. Arrays are opened memory-mapped copy-on-write,
+so a hit reads only the pages that are used and callers may still modify
+the tables in place. Entries are evicted least recently used once the
+store exceeds ``max_bytes``.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from src.fem.result_tables import FRAME_FORCE_KEYS, ElementForceTable, NodeResultTable
+from src.fem.solver import AnalysisResult
+from src.fem.solver_autotune import default_cache_dir
+
+_logger = logging.getLogger(__name__)
+
+# Bump when the entry layout or the meaning of stored results changes
+STORE_VERSION = 1
+
+DEFAULT_MAX_BYTES = 1 << 30  # 1 GiB
+
+_META_FILE = "meta.json"
+_NODE_FIELDS = ("node_displacements", "node_reactions")
+
+
+def _write_array(directory: Path, name: str, values: np.ndarray) -> None:
+    np.save(directory / f"{name}.npy", values, allow_pickle=False)
+
+
+def _read_array(directory: Path, name: str) -> np.ndarray:
+    return np.load(directory / f"{name}.npy", mmap_mode="c", allow_pickle=False)
+
+
+def _offsets(sizes: Iterable[int]) -> np.ndarray:
+    return np.concatenate([[0], np.cumsum(list(sizes), dtype=np.int64)]).astype(np.int64)
+
+
+class ResultStore:
+    """On-disk LRU store of ``analyze_model`` results.
+
+    Args:
+        root: Store directory (default: ``results`` in ``default_cache_dir()``)
+        max_bytes: Size cap of all entries; least recently used entries are
+            evicted after a write exceeds it
+    """
+
+    def __init__(self, root: Optional[Path] = None, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.root = Path(root) if root is not None else default_cache_dir() / "results"
+        self.max_bytes = max_bytes
+
+    @staticmethod
+    def key(model,
+            load_cases: Sequence[str],
+            include_element_forces: bool = True,
+            element_tags: Optional[Iterable[int]] = None,
+            load_pattern: int = 1,
+            backend: str = "auto",
+            sparse_method: str = "auto",
+            autotune: bool = False) -> str:
+        """Content hash of a model and analysis request.
+
+        The solver options are part of the request because stored results
+        carry their solver metadata (message, iteration count and
+        ``solver_configuration``), which differs between them.
+
+        Args:
+            model: FEMModel (hashed through ``FEMModel.fingerprint``)
+            load_cases: Load case names in request order
+            include_element_forces: Whether element forces are part of the results
+            element_tags: Optional element force subset
+            load_pattern: Pattern used for load cases without a fixed pattern
+            backend: Requested ``analyze_model`` backend
+            sparse_method: Requested scipy solver method
+            autotune: Whether an autotuned OpenSees configuration was requested
+
+        Returns:
+            Hex digest (32 characters)
+        """
+        request = {
+            "version": STORE_VERSION,
+            "model": model.fingerprint(),
+            "load_cases": list(load_cases),
+            "element_forces": bool(include_element_forces),
+            "element_tags": None if element_tags is None else sorted(int(t) for t in element_tags),
+            "load_pattern": int(load_pattern),
+            "backend": backend,
+            "sparse_method": sparse_method,
+            "autotune": bool(autotune),
+        }
+        payload = json.dumps(request, sort_keys=True).encode()
+        return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, AnalysisResult]]:
+        """Stored results for ``key``, or None. Marks the entry as used."""
+        directory = self.root / key
+        try:
+            with open(directory / _META_FILE, encoding="utf-8") as handle:
+                meta = json.load(handle)
+            results = self._read(directory, meta)
+        except (OSError, ValueError, KeyError) as e:
+            if directory.exists():
+                _logger.warning("Discarding unreadable result store entry %s: %s", key, e)
+                shutil.rmtree(directory, ignore_errors=True)
+            return None
+        os.utime(directory / _META_FILE)
+        return results
+
+    def put(self, key: str, results: Dict[str, AnalysisResult]) -> bool:
+        """Store ``results`` under ``key`` and evict past ``max_bytes``.
+
+        Returns:
+            True if the entry was written
+        """
+        scratch = self.root / f".{key}.{os.getpid()}.tmp"
+        try:
+            shutil.rmtree(scratch, ignore_errors=True)
+            scratch.mkdir(parents=True)
+            meta = self._write(scratch, results)
+            with open(scratch / _META_FILE, "w", encoding="utf-8") as handle:
+                json.dump(meta, handle)
+            target = self.root / key
+            if target.exists():
+                shutil.rmtree(scratch, ignore_errors=True)
+            else:
+                os.replace(scratch, target)
+        except (OSError, ValueError) as e:
+            _logger.warning("Could not store results in %s: %s", self.root, e)
+            shutil.rmtree(scratch, ignore_errors=True)
+            return False
+        self.evict()
+        return True
+
+    def entries(self) -> List[Tuple[str, float, int]]:
+        """(key, last use time, bytes) of each entry, least recently used first."""
+        found = []
+        if not self.root.is_dir():
+            return found
+        for directory in self.root.iterdir():
+            meta_path = directory / _META_FILE
+            if directory.name.startswith(".") or not meta_path.is_file():
+                continue
+            size = sum(path.stat().st_size for path in directory.iterdir())
+            found.append((directory.name, meta_path.stat().st_mtime, size))
+        return sorted(found, key=lambda entry: entry[1])
+
+    def total_bytes(self) -> int:
+        return sum(size for _, _, size in self.entries())
+
+    def evict(self) -> List[str]:
+        """Remove least recently used entries until the store fits ``max_bytes``."""
+        entries = self.entries()
+        total = sum(size for _, _, size in entries)
+        evicted = []
+        for key, _, size in entries:
+            if total <= self.max_bytes:
+                break
+            shutil.rmtree(self.root / key, ignore_errors=True)
+            total -= size
+            evicted.append(key)
+        if evicted:
+            _logger.info("Evicted %d result store entries", len(evicted))
+        return evicted
+
+    def clear(self) -> None:
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def _write(self, directory: Path, results: Dict[str, AnalysisResult]) -> Dict:
+        cases = list(results.values())
+        tables = {name: [getattr(r, name) for r in cases] for name in _NODE_FIELDS}
+        tables["frames"] = [r.element_forces.frames for r in cases]
+        for name, per_case in tables.items():
+            width = max((table.width for table in per_case if len(table)), default=0)
+            _write_array(directory, f"{name}_offsets", _offsets(len(t) for t in per_case))
+            _write_array(directory, f"{name}_tags", np.concatenate(
+                [t.tags for t in per_case] + [np.zeros(0, dtype=np.int64)]
+            ))
+            _write_array(directory, f"{name}_values", np.concatenate(
+                [t.array.reshape(-1, width) if len(t) else np.zeros((0, width)) for t in per_case]
+                + [np.zeros((0, width))]
+            ))
+
+        # Non-frame force dicts as (element tag, key id, value) triples
+        keys: Dict[str, int] = {}
+        triples = [
+            [(tag, keys.setdefault(k, len(keys)), v) for tag, forces in r.element_forces.other.items()
+             for k, v in forces.items()]
+            for r in cases
+        ]
+        flat = [item for per_case in triples for item in per_case]
+        _write_array(directory, "other_offsets", _offsets(len(t) for t in triples))
+        _write_array(directory, "other_tags", np.array([t for t, _, _ in flat], dtype=np.int64))
+        _write_array(directory, "other_keys", np.array([k for _, k, _ in flat], dtype=np.int32))
+        _write_array(directory, "other_values", np.array([v for _, _, v in flat], dtype=np.float64))
+
+        return {
+            "version": STORE_VERSION,
+            "created": time.time(),
+            "other_keys": list(keys),
+            "cases": [
+                {
+                    "name": name,
+                    "success": result.success,
+                    "message": result.message,
+                    "converged": result.converged,
+                    "iterations": result.iterations,
+                    "solver_configuration": result.solver_configuration,
+                }
+                for name, result in results.items()
+            ],
+        }
+
+    def _read(self, directory: Path, meta: Dict) -> Dict[str, AnalysisResult]:
+        if meta.get("version") != STORE_VERSION:
+            raise ValueError(f"store version {meta.get('version')} != {STORE_VERSION}")
+        tables: Dict[str, List[NodeResultTable]] = {}
+        for name in _NODE_FIELDS + ("frames",):
+            offsets = _read_array(directory, f"{name}_offsets")
+            tags = _read_array(directory, f"{name}_tags")
+            values = _read_array(directory, f"{name}_values")
+            tables[name] = [
+                NodeResultTable.from_arrays(tags[start:stop], values[start:stop])
+                if stop > start else NodeResultTable(width=values.shape[1] or None)
+                for start, stop in zip(offsets[:-1], offsets[1:])
+            ]
+
+        key_names = meta["other_keys"]
+        offsets = _read_array(directory, "other_offsets")
+        other_tags = _read_array(directory, "other_tags").tolist()
+        other_keys = _read_array(directory, "other_keys").tolist()
+        other_values = _read_array(directory, "other_values").tolist()
+
+        results: Dict[str, AnalysisResult] = {}
+        for index, case in enumerate(meta["cases"]):
+            other: Dict[int, Dict[str, float]] = {}
+            for row in range(int(offsets[index]), int(offsets[index + 1])):
+                other.setdefault(other_tags[row], {})[key_names[other_keys[row]]] = other_values[row]
+            frames = tables["frames"][index]
+            if not len(frames):
+                frames = NodeResultTable(width=len(FRAME_FORCE_KEYS))
+            results[case["name"]] = AnalysisResult(
+                success=case["success"],
+                message=case["message"],
+                converged=case["converged"],
+                iterations=case["iterations"],
+                node_displacements=tables["node_displacements"][index],
+                node_reactions=tables["node_reactions"][index],
+                element_forces=ElementForceTable.from_parts(frames, other),
+                solver_configuration=case["solver_configuration"],
+            )
+        return results
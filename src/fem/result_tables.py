@@ -0,0 +1,441 @@
+"""
+Columnar storage for FEM analysis results.
+
+Node and element results are held as contiguous float64 arrays with a
+tag-to-row index instead of one Python list/dict per entity. The tables
+implement the ``MutableMapping`` protocol so existing dict-style access
+(``result.node_displacements[tag]``, ``.items()``, ``.get()``) keeps
+working, while combination, enveloping and UI code can operate on the
+arrays directly.
+"""
+
+from collections.abc import Mapping, MutableMapping
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+FRAME_FORCE_KEYS = (
+    'N_i', 'Vy_i', 'Vz_i', 'T_i', 'My_i', 'Mz_i',
+    'N_j', 'Vy_j', 'Vz_j', 'T_j', 'My_j', 'Mz_j',
+)
+
+_FRAME_FORCE_KEY_SET = frozenset(FRAME_FORCE_KEYS)
+
+# Row width assumed for empty node tables (ux, uy, uz, rx, ry, rz)
+DEFAULT_NODE_WIDTH = 6
+
+# Rough per-entry footprint of a {key: float} force dict (slot + boxed float)
+_FORCE_DICT_ENTRY_BYTES = 80
+
+
+class NodeResultTable(MutableMapping):
+    """Per-node result vectors stored as an ``(n_nodes, width)`` array.
+
+    Rows are addressed by node tag through ``index``. Items inserted one at a
+    time are buffered and consolidated into the array on the next bulk
+    access, so incremental construction stays linear.
+
+    Attributes:
+        tags: Node tags in row order (int64 array)
+        array: Result values, one row per tag (float64 array)
+        index: Mapping of node tag to row number
+    """
+
+    __slots__ = ("_tags", "_array", "_index", "_pending", "_width")
+
+    def __init__(self,
+                 data: Optional[Mapping] = None,
+                 width: Optional[int] = None):
+        self._width = width
+        self._tags = np.zeros(0, dtype=np.int64)
+        self._array = np.zeros((0, width or 0), dtype=np.float64)
+        self._index: Dict[int, int] = {}
+        self._pending: Dict[int, np.ndarray] = {}
+        if data:
+            if isinstance(data, NodeResultTable):
+                self._set_arrays(data.tags.copy(), data.array.copy())
+            else:
+                for tag, values in data.items():
+                    self[tag] = values
+
+    @classmethod
+    def from_arrays(cls, tags: Sequence[int], values: np.ndarray) -> "NodeResultTable":
+        """Build a table from a tag vector and a matching 2D value array.
+
+        Args:
+            tags: Node tags, one per row (must be unique)
+            values: Array of shape (len(tags), width)
+
+        Returns:
+            Table that references ``values`` without copying when it is
+            already a C-contiguous float64 array.
+        """
+        tags_arr = np.asarray(tags, dtype=np.int64).reshape(-1)
+        values_arr = np.ascontiguousarray(values, dtype=np.float64)
+        if values_arr.ndim != 2 or values_arr.shape[0] != tags_arr.size:
+            raise ValueError(
+                f"Expected values of shape ({tags_arr.size}, width), got {values_arr.shape}"
+            )
+        table = cls(width=values_arr.shape[1])
+        table._set_arrays(tags_arr, values_arr)
+        if len(table._index) != tags_arr.size:
+            raise ValueError("Node tags must be unique")
+        return table
+
+    def _set_arrays(self, tags: np.ndarray, values: np.ndarray) -> None:
+        self._tags = tags
+        self._array = values
+        self._width = values.shape[1]
+        self._index = {tag: row for row, tag in enumerate(tags.tolist())}
+        self._pending = {}
+
+    def _flush(self) -> None:
+        if not self._pending:
+            return
+        new_tags = np.fromiter(self._pending.keys(), dtype=np.int64, count=len(self._pending))
+        new_rows = np.vstack(list(self._pending.values()))
+        start = self._tags.size
+        self._tags = np.concatenate([self._tags, new_tags])
+        self._array = np.vstack([self._array.reshape(-1, self.width), new_rows])
+        for offset, tag in enumerate(self._pending):
+            self._index[tag] = start + offset
+        self._pending = {}
+
+    @property
+    def width(self) -> int:
+        """Number of components per row."""
+        return self._width if self._width is not None else DEFAULT_NODE_WIDTH
+
+    @property
+    def tags(self) -> np.ndarray:
+        self._flush()
+        return self._tags
+
+    @property
+    def array(self) -> np.ndarray:
+        self._flush()
+        if self._array.shape[1] != self.width:
+            self._array = self._array.reshape(-1, self.width)
+        return self._array
+
+    @property
+    def index(self) -> Dict[int, int]:
+        self._flush()
+        return self._index
+
+    def rows_for(self, tags: Iterable[int], fill: float = 0.0) -> np.ndarray:
+        """Gather rows for ``tags`` into a new array.
+
+        Args:
+            tags: Node tags to look up
+            fill: Value used for tags that are not in the table
+
+        Returns:
+            Array of shape (len(tags), width)
+        """
+        index = self.index
+        rows = np.array([index.get(tag, -1) for tag in tags], dtype=np.int64)
+        out = np.full((rows.size, self.width), fill, dtype=np.float64)
+        found = rows >= 0
+        out[found] = self.array[rows[found]]
+        return out
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the tag and value arrays."""
+        return int(self.tags.nbytes + self.array.nbytes)
+
+    def copy(self) -> "NodeResultTable":
+        return NodeResultTable(self, width=self._width)
+
+    def __getitem__(self, tag: int) -> List[float]:
+        row = self._index.get(tag)
+        if row is not None:
+            return self._array[row].tolist()
+        pending = self._pending.get(tag)
+        if pending is not None:
+            return pending.tolist()
+        raise KeyError(tag)
+
+    def __setitem__(self, tag: int, values: Sequence[float]) -> None:
+        row_values = np.asarray(values, dtype=np.float64).reshape(-1)
+        if self._width is None and not self._index and not self._pending:
+            self._width = row_values.size
+            self._array = self._array.reshape(0, self._width)
+        if row_values.size != self.width:
+            raise ValueError(
+                f"Node {tag} has {row_values.size} components, table width is {self.width}"
+            )
+        row = self._index.get(tag)
+        if row is not None:
+            self._array[row] = row_values
+        else:
+            self._pending[tag] = row_values
+
+    def __delitem__(self, tag: int) -> None:
+        self._flush()
+        row = self._index[tag]
+        keep = np.ones(self._tags.size, dtype=bool)
+        keep[row] = False
+        self._set_arrays(self._tags[keep], self._array[keep])
+
+    def __contains__(self, tag: object) -> bool:
+        return tag in self._index or tag in self._pending
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self.tags.tolist())
+
+    def __len__(self) -> int:
+        return len(self._index) + len(self._pending)
+
+    def items(self) -> List[Tuple[int, List[float]]]:  # type: ignore[override]
+        return list(zip(self.tags.tolist(), self.array.tolist()))
+
+    def values(self) -> List[List[float]]:  # type: ignore[override]
+        return self.array.tolist()
+
+    def __repr__(self) -> str:
+        return f"NodeResultTable(n={len(self)}, width={self.width})"
+
+
+def _is_frame_forces(forces: Mapping) -> bool:
+    return len(forces) == len(FRAME_FORCE_KEYS) and _FRAME_FORCE_KEY_SET.issuperset(forces)
+
+
+class ElementForceTable(MutableMapping):
+    """Element end forces with 3D frame elements stored column-wise.
+
+    Force dicts with exactly the 12 ``FRAME_FORCE_KEYS`` are packed into an
+    ``(n_frames, 12)`` array (local end forces i then j). Any other layout
+    (2D frames, shell ``force_k`` vectors) is kept in the ``other`` dict.
+    """
+
+    __slots__ = ("_frames", "_other")
+
+    def __init__(self, data: Optional[Mapping] = None):
+        self._frames = NodeResultTable(width=len(FRAME_FORCE_KEYS))
+        self._other: Dict[int, Dict[str, float]] = {}
+        if data:
+            if isinstance(data, ElementForceTable):
+                self._frames = data._frames.copy()
+                self._other = {tag: dict(forces) for tag, forces in data._other.items()}
+            else:
+                for tag, forces in data.items():
+                    self[tag] = forces
+
+    @classmethod
+    def from_frame_arrays(cls,
+                          tags: Sequence[int],
+                          values: np.ndarray,
+                          other: Optional[Mapping[int, Dict[str, float]]] = None,
+                          ) -> "ElementForceTable":
+        """Build a table from frame end-force arrays.
+
+        Args:
+            tags: Frame element tags, one per row
+            values: Array of shape (len(tags), 12) ordered as ``FRAME_FORCE_KEYS``
+            other: Optional non-frame force dicts keyed by element tag
+        """
+        table = cls()
+        table._frames = NodeResultTable.from_arrays(tags, values)
+        if table._frames.width != len(FRAME_FORCE_KEYS):
+            raise ValueError(f"Frame force rows must have {len(FRAME_FORCE_KEYS)} components")
+        if other:
+            table._other = {tag: dict(forces) for tag, forces in other.items()}
+        return table
+
+    @property
+    def frames(self) -> NodeResultTable:
+        """Frame end forces as a tag-indexed table of width 12."""
+        return self._frames
+
+    @property
+    def frame_tags(self) -> np.ndarray:
+        return self._frames.tags
+
+    @property
+    def frame_array(self) -> np.ndarray:
+        return self._frames.array
+
+    @property
+    def frame_index(self) -> Dict[int, int]:
+        return self._frames.index
+
+    @property
+    def other(self) -> Dict[int, Dict[str, float]]:
+        """Force dicts of elements that are not 3D frames."""
+        return self._other
+
+    @classmethod
+    def from_parts(cls,
+                   frames: NodeResultTable,
+                   other: Dict[int, Dict[str, float]]) -> "ElementForceTable":
+        """Assemble a table from a frame table and non-frame force dicts.
+
+        An element present in both (reported as a frame in one load case
+        and with a different layout in another) falls back to the key-wise
+        union in ``other``.
+        """
+        for tag in [tag for tag in other if tag in frames]:
+            for key, value in zip(FRAME_FORCE_KEYS, frames[tag]):
+                other[tag][key] = other[tag].get(key, 0.0) + value
+            del frames[tag]
+
+        table = cls()
+        if len(frames):
+            table._frames = frames
+        table._other = other
+        return table
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory footprint: frame arrays plus force dicts."""
+        entries = sum(len(forces) for forces in self._other.values())
+        return self._frames.nbytes + entries * _FORCE_DICT_ENTRY_BYTES
+
+    def copy(self) -> "ElementForceTable":
+        return ElementForceTable(self)
+
+    def __getitem__(self, tag: int) -> Dict[str, float]:
+        if tag in self._frames:
+            return dict(zip(FRAME_FORCE_KEYS, self._frames[tag]))
+        return self._other[tag]
+
+    def __setitem__(self, tag: int, forces: Mapping[str, float]) -> None:
+        if _is_frame_forces(forces):
+            self._other.pop(tag, None)
+            self._frames[tag] = [forces[key] for key in FRAME_FORCE_KEYS]
+        else:
+            if tag in self._frames:
+                del self._frames[tag]
+            self._other[tag] = dict(forces)
+
+    def __delitem__(self, tag: int) -> None:
+        if tag in self._frames:
+            del self._frames[tag]
+        else:
+            del self._other[tag]
+
+    def __contains__(self, tag: object) -> bool:
+        return tag in self._frames or tag in self._other
+
+    def __iter__(self) -> Iterator[int]:
+        yield from self._frames
+        yield from self._other
+
+    def __len__(self) -> int:
+        return len(self._frames) + len(self._other)
+
+    def items(self) -> List[Tuple[int, Dict[str, float]]]:  # type: ignore[override]
+        frame_items = [
+            (tag, dict(zip(FRAME_FORCE_KEYS, row)))
+            for tag, row in self._frames.items()
+        ]
+        return frame_items + list(self._other.items())
+
+    def values(self) -> List[Dict[str, float]]:  # type: ignore[override]
+        return [forces for _, forces in self.items()]
+
+    def __repr__(self) -> str:
+        return f"ElementForceTable(frames={len(self._frames)}, other={len(self._other)})"
+
+
+def superpose_node_tables(
+    weighted_tables: Iterable[Tuple[float, Mapping]],
+) -> NodeResultTable:
+    """Linear combination ``sum(factor * table)`` over the union of node tags.
+
+    Rows missing from a table contribute zero; narrower tables fill the
+    leading components only. Zero factors are skipped.
+    """
+    tables = [
+        (factor, table if isinstance(table, NodeResultTable) else NodeResultTable(table))
+        for factor, table in weighted_tables
+        if factor != 0.0 and len(table)
+    ]
+    if not tables:
+        return NodeResultTable()
+
+    union = np.unique(np.concatenate([table.tags for _, table in tables]))
+    width = max(table.width for _, table in tables)
+    combined = np.zeros((union.size, width), dtype=np.float64)
+    for factor, table in tables:
+        rows = np.searchsorted(union, table.tags)
+        combined[rows, :table.width] += factor * table.array
+    return NodeResultTable.from_arrays(union, combined)
+
+
+def superpose_element_tables(
+    weighted_tables: Iterable[Tuple[float, Mapping]],
+) -> ElementForceTable:
+    """Linear combination of element force tables.
+
+    Frame rows are combined as arrays; other force dicts are summed key by
+    key over the union of keys.
+    """
+    tables = [
+        (factor, table if isinstance(table, ElementForceTable) else ElementForceTable(table))
+        for factor, table in weighted_tables
+        if factor != 0.0 and len(table)
+    ]
+    frames = superpose_node_tables((factor, table.frames) for factor, table in tables)
+    other = superpose_force_dicts((factor, table.other) for factor, table in tables)
+    return ElementForceTable.from_parts(frames, other)
+
+
+def superpose_force_dicts(
+    weighted_forces: Iterable[Tuple[float, Mapping[int, Mapping[str, float]]]],
+) -> Dict[int, Dict[str, float]]:
+    """Key-wise linear combination of {element_tag: force_dict} maps."""
+    combined: Dict[int, Dict[str, float]] = {}
+    for factor, forces_by_tag in weighted_forces:
+        if factor == 0.0:
+            continue
+        for tag, forces in forces_by_tag.items():
+            target = combined.setdefault(tag, {})
+            for key, value in forces.items():
+                target[key] = target.get(key, 0.0) + factor * value
+    return combined
+
+
+def stack_node_tables(
+    tables: Sequence[NodeResultTable],
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Align several tables on the union of their tags.
+
+    Args:
+        tables: One table per load case
+
+    Returns:
+        Tuple of (tags, values, present) where ``values`` has shape
+        (n_tables, n_tags, width), missing rows are zero, and ``present``
+        is a boolean (n_tables, n_tags) mask of the rows each table holds.
+    """
+    filled = [table for table in tables if len(table)]
+    if not filled:
+        width = max((table.width for table in tables), default=DEFAULT_NODE_WIDTH)
+        return (
+            np.zeros(0, dtype=np.int64),
+            np.zeros((len(tables), 0, width), dtype=np.float64),
+            np.zeros((len(tables), 0), dtype=bool),
+        )
+
+    width = max(table.width for table in filled)
+    reference = filled[0].tags
+    if all(np.array_equal(table.tags, reference) for table in tables):
+        # Common case: every load case reports the same entities in order
+        values = np.zeros((len(tables), reference.size, width), dtype=np.float64)
+        for case, table in enumerate(tables):
+            values[case, :, :table.width] = table.array
+        return reference, values, np.ones((len(tables), reference.size), dtype=bool)
+
+    union = np.unique(np.concatenate([table.tags for table in filled]))
+    values = np.zeros((len(tables), union.size, width), dtype=np.float64)
+    present = np.zeros((len(tables), union.size), dtype=bool)
+    for case, table in enumerate(tables):
+        if not len(table):
+            continue
+        rows = np.searchsorted(union, table.tags)
+        values[case, rows, :table.width] = table.array
+        present[case, rows] = True
+    return union, values, present
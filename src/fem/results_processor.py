@@ -7,13 +7,22 @@ design optimization.
 """
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Mapping, Optional, Tuple
 from enum import Enum
+
+import numpy as np
 from src.core.data_models import (
     LoadCombination, LoadCaseResult, EnvelopeValue, EnvelopedResult
 )
+from src.fem.fem_engine import FloorIndex
+from src.fem.result_tables import FRAME_FORCE_KEYS, ElementForceTable
 from src.fem.solver import AnalysisResult
 
+# Columns of 2D frame end forces in the FRAME_FORCE_KEYS layout
+_FRAME_2D_COLUMNS = {'N_i': 0, 'V_i': 1, 'M_i': 5, 'N_j': 6, 'V_j': 7, 'M_j': 11}
+# Envelope component ranked by each get_critical_elements criterion
+_CRITERION_COMPONENTS = {"moment": "Mz", "shear": "Vy", "axial": "N"}
+
 
 class ForceType(str, Enum):
     """Force type enumeration for section force extraction."""
@@ -139,7 +148,8 @@ class ResultsProcessor:
     
     def __init__(self):
         """Initialize results processor."""
-        self.element_force_envelopes: Dict[int, ElementForceEnvelope] = {}
+        # A lazy ForceEnvelope after processing; envelopes materialize on lookup
+        self.element_force_envelopes: Mapping[int, ElementForceEnvelope] = {}
         self.displacement_envelopes: Dict[int, DisplacementEnvelope] = {}
         self.reaction_envelopes: Dict[int, ReactionEnvelope] = {}
     
@@ -153,106 +163,63 @@ class ResultsProcessor:
             load_case_results: List of analysis results for each load combination
         """
         # Clear existing envelopes
-        self.element_force_envelopes.clear()
+        self.element_force_envelopes = {}
         self.displacement_envelopes.clear()
         self.reaction_envelopes.clear()
         
+        self._build_element_force_envelopes(load_case_results)
+
         # Process each load case
         for result in load_case_results:
-            self._update_element_force_envelope(result)
             self._update_displacement_envelope(result)
             self._update_reaction_envelope(result)
     
-    def _update_element_force_envelope(self, result: LoadCaseResult) -> None:
-        """Update element force envelopes with new load case results.
+    def _build_element_force_envelopes(self, load_case_results: List[LoadCaseResult]) -> None:
+        """Envelope element forces of all load case results in one pass.
+
+        Forces are gathered into a (n_cases, n_elements, 12) tensor in
+        ``FRAME_FORCE_KEYS`` order and reduced with ``ForceEnvelope``.
+        2D results map V->Vy and M->Mz.
         
         Args:
-            result: Load case result to process
+            load_case_results: Load case results to envelope
         """
-        for elem_id, forces in result.element_forces.items():
-            # Get or create envelope for this element
-            if elem_id not in self.element_force_envelopes:
-                self.element_force_envelopes[elem_id] = ElementForceEnvelope(elem_id)
-            
-            envelope = self.element_force_envelopes[elem_id]
-            
-            # Extract forces (handle both 2D and 3D elements)
-            # For 3D beam elements
-            if 'N_i' in forces:
-                n_val = max(abs(forces.get('N_i', 0.0)), abs(forces.get('N_j', 0.0)))
-                vy_val = max(abs(forces.get('Vy_i', 0.0)), abs(forces.get('Vy_j', 0.0)))
-                vz_val = max(abs(forces.get('Vz_i', 0.0)), abs(forces.get('Vz_j', 0.0)))
-                mz_val = max(abs(forces.get('Mz_i', 0.0)), abs(forces.get('Mz_j', 0.0)))
-                my_val = max(abs(forces.get('My_i', 0.0)), abs(forces.get('My_j', 0.0)))
-                n_signed = (forces.get('N_i', 0.0) + forces.get('N_j', 0.0)) / 2
-                vy_signed = (forces.get('Vy_i', 0.0) + forces.get('Vy_j', 0.0)) / 2
-                vz_signed = (forces.get('Vz_i', 0.0) + forces.get('Vz_j', 0.0)) / 2
-                mz_signed = (forces.get('Mz_i', 0.0) + forces.get('Mz_j', 0.0)) / 2
-                my_signed = (forces.get('My_i', 0.0) + forces.get('My_j', 0.0)) / 2
-            # For 2D beam elements
-            elif 'V_i' in forces:
-                n_val = max(abs(forces.get('N_i', 0.0)), abs(forces.get('N_j', 0.0)))
-                vy_val = max(abs(forces.get('V_i', 0.0)), abs(forces.get('V_j', 0.0)))
-                vz_val = 0.0
-                mz_val = max(abs(forces.get('M_i', 0.0)), abs(forces.get('M_j', 0.0)))
-                my_val = 0.0
-                n_signed = (forces.get('N_i', 0.0) + forces.get('N_j', 0.0)) / 2
-                vy_signed = (forces.get('V_i', 0.0) + forces.get('V_j', 0.0)) / 2
-                vz_signed = 0.0
-                mz_signed = (forces.get('M_i', 0.0) + forces.get('M_j', 0.0)) / 2
-                my_signed = 0.0
-            else:
-                continue  # Skip if force format not recognized
-            
-            # Update axial force envelope
-            if n_val > envelope.N_max.max_value:
-                envelope.N_max.max_value = n_val
-                envelope.N_max.governing_max_case = result.combination
-                envelope.N_max.governing_max_location = elem_id
-            if n_signed < envelope.N_min.min_value or envelope.N_min.min_value == 0.0:
-                envelope.N_min.min_value = n_signed
-                envelope.N_min.governing_min_case = result.combination
-                envelope.N_min.governing_min_location = elem_id
-            
-            # Update major-axis shear envelope
-            if vy_val > envelope.Vy_max.max_value:
-                envelope.Vy_max.max_value = vy_val
-                envelope.Vy_max.governing_max_case = result.combination
-                envelope.Vy_max.governing_max_location = elem_id
-            if vy_signed < envelope.Vy_min.min_value or envelope.Vy_min.min_value == 0.0:
-                envelope.Vy_min.min_value = vy_signed
-                envelope.Vy_min.governing_min_case = result.combination
-                envelope.Vy_min.governing_min_location = elem_id
-
-            # Update minor-axis shear envelope
-            if vz_val > envelope.Vz_max.max_value:
-                envelope.Vz_max.max_value = vz_val
-                envelope.Vz_max.governing_max_case = result.combination
-                envelope.Vz_max.governing_max_location = elem_id
-            if vz_signed < envelope.Vz_min.min_value or envelope.Vz_min.min_value == 0.0:
-                envelope.Vz_min.min_value = vz_signed
-                envelope.Vz_min.governing_min_case = result.combination
-                envelope.Vz_min.governing_min_location = elem_id
-
-            # Update major-axis moment envelope
-            if mz_val > envelope.Mz_max.max_value:
-                envelope.Mz_max.max_value = mz_val
-                envelope.Mz_max.governing_max_case = result.combination
-                envelope.Mz_max.governing_max_location = elem_id
-            if mz_signed < envelope.Mz_min.min_value or envelope.Mz_min.min_value == 0.0:
-                envelope.Mz_min.min_value = mz_signed
-                envelope.Mz_min.governing_min_case = result.combination
-                envelope.Mz_min.governing_min_location = elem_id
-
-            # Update minor-axis moment envelope
-            if my_val > envelope.My_max.max_value:
-                envelope.My_max.max_value = my_val
-                envelope.My_max.governing_max_case = result.combination
-                envelope.My_max.governing_max_location = elem_id
-            if my_signed < envelope.My_min.min_value or envelope.My_min.min_value == 0.0:
-                envelope.My_min.min_value = my_signed
-                envelope.My_min.governing_min_case = result.combination
-                envelope.My_min.governing_min_location = elem_id
+        from src.fem.force_envelope import ForceEnvelope
+
+        rows: Dict[int, int] = {}
+        entries: List[Tuple[int, int, List[float]]] = []
+        for case_idx, result in enumerate(load_case_results):
+            for elem_id, forces in result.element_forces.items():
+                # For 3D beam elements
+                if 'N_i' in forces:
+                    values = [forces.get(key, 0.0) for key in FRAME_FORCE_KEYS]
+                # For 2D beam elements
+                elif 'V_i' in forces:
+                    values = [0.0] * len(FRAME_FORCE_KEYS)
+                    for key, col in _FRAME_2D_COLUMNS.items():
+                        values[col] = forces.get(key, 0.0)
+                else:
+                    continue  # Skip if force format not recognized
+                row = rows.setdefault(elem_id, len(rows))
+                entries.append((case_idx, row, values))
+
+        if not entries:
+            return
+
+        end_forces = np.zeros((len(load_case_results), len(rows), len(FRAME_FORCE_KEYS)))
+        present = np.zeros((len(load_case_results), len(rows)), dtype=bool)
+        case_index, row_index, values = zip(*entries)
+        end_forces[case_index, row_index] = values
+        present[case_index, row_index] = True
+
+        envelope = ForceEnvelope.from_end_forces(
+            case_names=[result.case_name for result in load_case_results],
+            element_tags=np.fromiter(rows, dtype=np.int64, count=len(rows)),
+            end_forces=end_forces,
+            present=present,
+            case_labels=[result.combination for result in load_case_results],
+        )
+        self.element_force_envelopes = envelope
     
     def _update_displacement_envelope(self, result: LoadCaseResult) -> None:
         """Update displacement envelopes with new load case results.
@@ -364,15 +331,13 @@ class ResultsProcessor:
             node_elevations: Dictionary mapping node ID to elevation (m)
             story_height: Typical story height (m)
         """
-        # Group nodes by floor level
-        floors: Dict[float, List[int]] = {}
+        # Group nodes by floor level (exact elevation match)
+        index = FloorIndex(tolerance=0.0)
         for node_id, elevation in node_elevations.items():
-            if elevation not in floors:
-                floors[elevation] = []
-            floors[elevation].append(node_id)
-        
-        # Sort floor elevations
-        sorted_elevations = sorted(floors.keys())
+            index.add(elevation, node_id)
+        floors = index.groups()
+        sorted_elevations = index.sorted_levels()
+        envelopes = self.displacement_envelopes
         
         # Calculate drift for each floor
         for i in range(len(sorted_elevations) - 1):
@@ -383,39 +348,32 @@ class ResultsProcessor:
             if height == 0:
                 continue
             
-            # Get nodes at each level
-            lower_nodes = floors[lower_elevation]
-            upper_nodes = floors[upper_elevation]
+            lower = [envelopes[tag] for tag in floors[lower_elevation] if tag in envelopes]
+            if not lower:
+                continue
+            # Every lower node is compared against every upper node and the
+            # largest difference wins, so only the lower-floor extremes matter
+            lower_x = np.array([env.ux_max.max_value for env in lower], dtype=float)
+            lower_y = np.array([env.uy_max.max_value for env in lower], dtype=float)
+            x_lo, x_hi = lower_x.min(), lower_x.max()
+            y_lo, y_hi = lower_y.min(), lower_y.max()
             
-            # Calculate drift for each node pair
-            for upper_node in upper_nodes:
-                if upper_node not in self.displacement_envelopes:
+            for upper_node in floors[upper_elevation]:
+                envelope = envelopes.get(upper_node)
+                if envelope is None:
                     continue
                 
-                upper_disp_x = self.displacement_envelopes[upper_node].ux_max.max_value
-                upper_disp_y = self.displacement_envelopes[upper_node].uy_max.max_value
+                upper_disp_x = envelope.ux_max.max_value
+                upper_disp_y = envelope.uy_max.max_value
+                drift_x = max(upper_disp_x - x_lo, x_hi - upper_disp_x)
+                drift_y = max(upper_disp_y - y_lo, y_hi - upper_disp_y)
+                drift_ratio = float(max(drift_x, drift_y)) / height
                 
-                # Find corresponding lower node (simplified - same X-Y position)
-                # In practice, should match by coordinates
-                for lower_node in lower_nodes:
-                    if lower_node not in self.displacement_envelopes:
-                        continue
-                    
-                    lower_disp_x = self.displacement_envelopes[lower_node].ux_max.max_value
-                    lower_disp_y = self.displacement_envelopes[lower_node].uy_max.max_value
-                    
-                    # Calculate inter-story drift
-                    drift_x = abs(upper_disp_x - lower_disp_x)
-                    drift_y = abs(upper_disp_y - lower_disp_y)
-                    drift = max(drift_x, drift_y)
-                    drift_ratio = drift / height
-                    
-                    # Update drift envelope
-                    if drift_ratio > self.displacement_envelopes[upper_node].drift_max.max_value:
-                        self.displacement_envelopes[upper_node].drift_max.max_value = drift_ratio
-                        # Copy governing case from displacement
-                        self.displacement_envelopes[upper_node].drift_max.governing_max_case = \
-                            self.displacement_envelopes[upper_node].ux_max.governing_max_case
+                # Update drift envelope
+                if drift_ratio > envelope.drift_max.max_value:
+                    envelope.drift_max.max_value = drift_ratio
+                    # Copy governing case from displacement
+                    envelope.drift_max.governing_max_case = envelope.ux_max.governing_max_case
     
     def get_critical_elements(
         self,
@@ -431,27 +389,31 @@ class ResultsProcessor:
         Returns:
             List of tuples (element_id, max_value, governing_case)
         """
+        component = _CRITERION_COMPONENTS.get(criterion)
+        if component is None:
+            return []
+
+        envelopes = self.element_force_envelopes
+        tags = list(envelopes)
+        values = self._component_max_values(component)
+        # Stable descending order, as list.sort(reverse=True)
         critical = []
-        
-        for elem_id, envelope in self.element_force_envelopes.items():
-            if criterion == "moment":
-                value = envelope.Mz_max.max_value
-                case = envelope.Mz_max.governing_max_case
-            elif criterion == "shear":
-                value = envelope.Vy_max.max_value
-                case = envelope.Vy_max.governing_max_case
-            elif criterion == "axial":
-                value = envelope.N_max.max_value
-                case = envelope.N_max.governing_max_case
-            else:
-                continue
-            
-            critical.append((elem_id, value, case))
-        
-        # Sort by value (descending)
-        critical.sort(key=lambda x: x[1], reverse=True)
-        
-        return critical[:n_elements]
+        for index in np.argsort(-values, kind="stable")[:n_elements].tolist():
+            envelope_value = getattr(envelopes[tags[index]], f"{component}_max")
+            critical.append((tags[index], envelope_value.max_value, envelope_value.governing_max_case))
+        return critical
+
+    def _component_max_values(self, component: str) -> np.ndarray:
+        """Enveloped ``<component>_max`` magnitude per element, in iteration order."""
+        from src.fem.force_envelope import ForceEnvelope
+
+        envelopes = self.element_force_envelopes
+        if isinstance(envelopes, ForceEnvelope):
+            return envelopes.component_max_values(component)
+        return np.fromiter(
+            (getattr(env, f"{component}_max").max_value for env in envelopes.values()),
+            dtype=float, count=len(envelopes),
+        )
     
     def export_envelope_summary(self) -> str:
         """Export envelope summary for reporting.
@@ -469,11 +431,11 @@ class ResultsProcessor:
         lines.append(f"  Total elements enveloped: {len(self.element_force_envelopes)}")
         
         if self.element_force_envelopes:
-            max_Mz = max(env.Mz_max.max_value for env in self.element_force_envelopes.values())
-            max_My = max(env.My_max.max_value for env in self.element_force_envelopes.values())
-            max_Vy = max(env.Vy_max.max_value for env in self.element_force_envelopes.values())
-            max_Vz = max(env.Vz_max.max_value for env in self.element_force_envelopes.values())
-            max_N = max(env.N_max.max_value for env in self.element_force_envelopes.values())
+            max_Mz = self._component_max_values("Mz").max()
+            max_My = self._component_max_values("My").max()
+            max_Vy = self._component_max_values("Vy").max()
+            max_Vz = self._component_max_values("Vz").max()
+            max_N = self._component_max_values("N").max()
             
             lines.append(f"  Maximum Mz (major): {max_Mz/1e6:.2f} kN-m")
             lines.append(f"  Maximum My (minor): {max_My/1e6:.2f} kN-m")
@@ -610,7 +572,34 @@ class ResultsProcessor:
                 max_value=0.0
             )
         
-        for elem_tag, force_dict in result.element_forces.items():
+        element_forces = result.element_forces
+        if not isinstance(element_forces, ElementForceTable):
+            element_forces = ElementForceTable(element_forces)
+
+        # 3D frame rows: read both end columns straight from the array
+        frame_array = element_forces.frame_array
+        if frame_array.size:
+            col_i = FRAME_FORCE_KEYS.index(key_i_3d)
+            col_j = FRAME_FORCE_KEYS.index(key_j_3d)
+            end_forces = (frame_array[:, [col_i, col_j]] / 1000.0).tolist()
+            for elem_tag, (force_i, force_j) in zip(
+                element_forces.frame_tags.tolist(), end_forces
+            ):
+                elem_info = model.elements.get(elem_tag)
+                if elem_info is None or len(elem_info.node_tags) != 2:
+                    continue
+
+                elements_dict[elem_tag] = ElementForce(
+                    element_id=elem_tag,
+                    node_i=elem_info.node_tags[0],
+                    node_j=elem_info.node_tags[1],
+                    force_i=force_i,
+                    force_j=force_j
+                )
+                min_val = min(min_val, force_i, force_j)
+                max_val = max(max_val, force_i, force_j)
+
+        for elem_tag, force_dict in element_forces.other.items():
             if elem_tag not in model.elements:
                 continue
 
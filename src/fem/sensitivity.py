@@ -0,0 +1,397 @@
+"""
+Adjoint design sensitivities of frame responses to section sizes.
+
+For a response ``r = a^T u`` of the linear solution ``K u = F`` (loads held
+fixed), the derivative with respect to a section size ``p`` is::
+
+    dr/dp = dr/dp|_u - lambda^T (dK/dp) u,    K lambda = a
+
+so each response costs one adjoint back-substitution regardless of how
+many design variables there are. The frame stiffness is linear in
+``E A``, ``G J``, ``E Iy`` and ``E Iz``, so ``dK/dp`` is assembled from unit
+element matrices and the chain rule through the rectangular section
+formulas of ``materials.get_elastic_beam_section``.
+
+Design variables are named ``"<group>_width"`` and ``"<group>_depth"`` (mm),
+matching ``src.ai.optimizer.create_frame_sizing_optimizer``. Solves go
+through a ``LowRankReanalysis``, so sensitivities of a perturbed design
+reuse the base factorization.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from src.core.constants import COVER_MM, K_PRIME
+from src.fem.fem_engine import FEMModel
+from src.fem.reanalysis import FRAME_SECTION_KEYS, LowRankReanalysis
+from src.fem.result_tables import FRAME_FORCE_KEYS
+from src.fem.sparse_solver import _frame_local_stiffness
+
+# Section sizes per group: (width, depth) in mm
+GroupSizes = Mapping[str, Tuple[float, float]]
+
+# Size-dependent section parameters, in FRAME_SECTION_KEYS
+_SIZED_KEYS = ("A", "J", "Iy", "Iz")
+_SIZED_COLUMNS = [FRAME_SECTION_KEYS.index(key) for key in _SIZED_KEYS]
+_E_COLUMN = FRAME_SECTION_KEYS.index("E")
+_G_COLUMN = FRAME_SECTION_KEYS.index("G")
+
+_DOFS_PER_NODE = 6
+
+
+@dataclass(frozen=True)
+class DisplacementResponse:
+    """Weighted sum of nodal displacements, ``sum(w * u[node, dof])``.
+
+    Attributes:
+        name: Response label
+        weights: (node tag, dof index 0-5, weight) terms
+    """
+    name: str
+    weights: Tuple[Tuple[int, int, float], ...]
+
+
+@dataclass(frozen=True)
+class ElementForceResponse:
+    """One local end force of a frame element.
+
+    Attributes:
+        name: Response label
+        element_tag: Frame element tag
+        component: Force key from ``FRAME_FORCE_KEYS`` (e.g. ``"Mz_i"``)
+    """
+    name: str
+    element_tag: int
+    component: str
+
+
+Response = Union[DisplacementResponse, ElementForceResponse]
+
+
+@dataclass
+class SensitivityResult:
+    """Response values and design derivatives per load case.
+
+    Attributes:
+        name: Response label
+        values: Response value per load case, shape (n_cases,)
+        gradient: {variable name: d value / d variable (per mm)}, each of
+            shape (n_cases,)
+        load_cases: Load case names along the case axis
+    """
+    name: str
+    values: np.ndarray
+    gradient: Dict[str, np.ndarray]
+    load_cases: List[str]
+
+    @property
+    def governing_case(self) -> int:
+        """Index of the load case with the largest absolute value."""
+        return int(np.argmax(np.abs(self.values)))
+
+    def governing_gradient(self) -> Dict[str, float]:
+        """Derivatives of |value| in the governing load case."""
+        case = self.governing_case
+        sign = 1.0 if self.values[case] >= 0.0 else -1.0
+        return {name: sign * float(grad[case]) for name, grad in self.gradient.items()}
+
+
+def displacement_response(node_tag: int, dof: int) -> DisplacementResponse:
+    """Displacement of one node DOF (0-2 translations, 3-5 rotations)."""
+    return DisplacementResponse(f"u{dof}_{node_tag}", ((node_tag, dof, 1.0),))
+
+
+def drift_response(model: FEMModel, top_node: int, bottom_node: int, dof: int = 0) -> DisplacementResponse:
+    """Drift ratio ``(u_top - u_bottom) / h`` between two nodes."""
+    height = model.nodes[top_node].z - model.nodes[bottom_node].z
+    if height <= 0.0:
+        raise ValueError(f"Node {top_node} is not above node {bottom_node}")
+    return DisplacementResponse(
+        f"drift{dof}_{top_node}_{bottom_node}",
+        ((top_node, dof, 1.0 / height), (bottom_node, dof, -1.0 / height)),
+    )
+
+
+def column_drift_responses(model: FEMModel,
+                           element_tags: Sequence[int],
+                           dof: int = 0) -> List[DisplacementResponse]:
+    """Drift ratio responses over the vertical elements among ``element_tags``."""
+    responses = []
+    for tag in element_tags:
+        i, j = model.elements[tag].node_tags[:2]
+        if model.nodes[i].z > model.nodes[j].z:
+            i, j = j, i
+        if model.nodes[j].z - model.nodes[i].z > 1e-6:
+            responses.append(drift_response(model, j, i, dof))
+    return responses
+
+
+def element_moment_responses(element_tags: Sequence[int], axis: str = "Mz") -> List[ElementForceResponse]:
+    """End-moment responses (both ends) about ``axis`` ("My" or "Mz")."""
+    return [
+        ElementForceResponse(f"{axis}_{end}_{tag}", tag, f"{axis}_{end}")
+        for tag in element_tags
+        for end in ("i", "j")
+    ]
+
+
+def rectangular_section_derivatives(width: float, depth: float) -> Dict[str, np.ndarray]:
+    """Size-dependent properties of a rectangular section and their derivatives.
+
+    Mirrors ``get_elastic_beam_section`` (width perpendicular to the Mz
+    bending plane, depth in it).
+
+    Args:
+        width: Section width (mm)
+        depth: Section depth (mm)
+
+    Returns:
+        {"value", "d_width", "d_depth"}: arrays ordered as A, J, Iy, Iz in
+        m-based units; derivatives are per mm
+    """
+    b, h = width / 1000.0, depth / 1000.0
+    A, dA = b * h, (h, b)
+    Iz, dIz = b * h**3 / 12, (h**3 / 12, b * h**2 / 4)
+    Iy, dIy = h * b**3 / 12, (b**2 * h / 4, b**3 / 12)
+
+    short, long_ = min(b, h), max(b, h)
+    ratio = long_ / short
+    if ratio >= 10:
+        k, dk = 1 / 3, (0.0, 0.0)
+    elif ratio >= 5:
+        k, dk = 0.291, (0.0, 0.0)
+    elif ratio >= 3:
+        k, dk = 0.263, (0.0, 0.0)
+    else:
+        k = 0.141 * (1 - 0.42 * short / long_)
+        dk = (-0.141 * 0.42 / long_, 0.141 * 0.42 * short / long_**2)
+    J = k * short * long_**3
+    dJ_short = dk[0] * short * long_**3 + k * long_**3
+    dJ_long = dk[1] * short * long_**3 + 3 * k * short * long_**2
+    dJ = (dJ_long, dJ_short) if b >= h else (dJ_short, dJ_long)
+
+    derivatives = np.array([dA, dJ, dIy, dIz]) / 1000.0
+    return {
+        "value": np.array([A, J, Iy, Iz]),
+        "d_width": derivatives[:, 0],
+        "d_depth": derivatives[:, 1],
+    }
+
+
+class SectionSensitivity:
+    """Adjoint sensitivities of frame responses to group section sizes.
+
+    Args:
+        reanalysis: LowRankReanalysis over the groups to size
+        sizes: Current (width, depth) in mm per group; groups not listed
+            keep the model's original section
+
+    Example:
+        >>> sensitivity = SectionSensitivity(reanalysis, {"columns": (500, 500)})
+        >>> drift = sensitivity.gradients(column_drift_responses(model, tags))
+    """
+
+    def __init__(self, reanalysis: LowRankReanalysis, sizes: GroupSizes):
+        self.reanalysis = reanalysis
+        self.load_cases = list(reanalysis.load_cases)
+        frames = reanalysis._frames
+        self._row_of = {int(tag): row for row, tag in enumerate(frames.tags)}
+        # Frame row -> (group, position in the group); first group wins
+        self._group_position: Dict[int, Tuple[str, int]] = {}
+        for name in reanalysis.groups:
+            for position, row in enumerate(reanalysis.group_rows(name).tolist()):
+                self._group_position.setdefault(row, (name, position))
+        # E and G per group, from the model's section of the first element
+        original = reanalysis._original_props
+        self._moduli = {
+            name: (original[reanalysis.group_slice(name)][0, _E_COLUMN],
+                   original[reanalysis.group_slice(name)][0, _G_COLUMN])
+            for name in reanalysis.groups
+        }
+        self._displacements: Optional[np.ndarray] = None
+        self._target: Optional[np.ndarray] = None
+        self.set_sizes(sizes)
+
+    @property
+    def variables(self) -> List[str]:
+        """Design variable names, width and depth of each sized group."""
+        return [f"{name}_{size}" for name in self.sizes for size in ("width", "depth")]
+
+    def set_sizes(self, sizes: GroupSizes) -> None:
+        unknown = set(sizes) - set(self.reanalysis.groups)
+        if unknown:
+            raise KeyError(f"Unknown element groups: {sorted(unknown)}")
+        self.sizes = {name: (float(w), float(d)) for name, (w, d) in sizes.items()}
+        self._sections = {name: rectangular_section_derivatives(w, d) for name, (w, d) in self.sizes.items()}
+        self._displacements = None
+        self._target = None
+
+    def design(self) -> Dict[str, Dict[str, float]]:
+        """Section parameters per sized group, as passed to the reanalysis."""
+        design = {}
+        for name, section in self._sections.items():
+            E, G = self._moduli[name]
+            design[name] = dict(zip(_SIZED_KEYS, section["value"].tolist()), E=E, G=G)
+        return design
+
+    def _target_props(self) -> np.ndarray:
+        """Grouped element properties of the current sizes (memoized per sizes)."""
+        if self._target is None:
+            self._target = self.reanalysis.target_props(self.design())
+        return self._target
+
+    def displacements(self) -> np.ndarray:
+        """Full-DOF displacements of the current sizes, (n_dofs, n_cases)."""
+        if self._displacements is None:
+            self._displacements = self.reanalysis.solve(self.design())
+        return self._displacements
+
+    def values(self, responses: Sequence[Response]) -> np.ndarray:
+        """Response values without sensitivities, shape (n_responses, n_cases)."""
+        U = self.displacements()
+        if not responses:
+            return np.zeros((0, U.shape[1]))
+        A, explicit_rows = self._adjoint_loads(responses)
+        values = A.T @ U
+        for index, (row, column, _) in explicit_rows.items():
+            values[index] += self._fixed_end(row, column)
+        return values
+
+    def governing(self, responses: Sequence[Response]) -> Tuple[Response, int, float]:
+        """Response, load case index and value with the largest magnitude."""
+        values = self.values(responses)
+        index, case = np.unravel_index(np.argmax(np.abs(values)), values.shape)
+        return responses[index], int(case), float(values[index, case])
+
+    def gradients(self, responses: Sequence[Response]) -> List[SensitivityResult]:
+        """Values and size derivatives of ``responses`` with one adjoint solve each.
+
+        All adjoint right-hand sides are solved in one batched call.
+        """
+        if not responses:
+            return []
+        reanalysis = self.reanalysis
+        frames = reanalysis._frames
+        U = self.displacements()
+        A, explicit_rows = self._adjoint_loads(responses)
+        adjoint = reanalysis.solve_rhs(self.design(), A)
+        values = A.T @ U
+
+        gradients = [{name: np.zeros(len(self.load_cases)) for name in self.variables}
+                     for _ in responses]
+        target = self._target_props()
+        for name, section in self._sections.items():
+            rows = reanalysis.group_rows(name)
+            props = target[reanalysis.group_slice(name)]
+            unit = self._unit_stiffness(rows, props)
+            transform = frames.transform[rows]
+            dofs = frames.dofs[rows]
+            u_local = np.einsum('nij,njc->nic', transform, U[dofs])
+            lam_local = np.einsum('nij,njr->nir', transform, adjoint[dofs])
+            # d r / d prop summed over the group's elements, (n_props, n_resp, n_cases)
+            implicit = -np.einsum('nir,nqij,njc->qrc', lam_local, unit, u_local)
+            for size in ("width", "depth"):
+                d_props = section[f"d_{size}"]
+                total = np.einsum('q,qrc->rc', d_props, implicit)
+                for index in range(len(responses)):
+                    gradients[index][f"{name}_{size}"] += total[index]
+
+            group_rows = {int(row): position for position, row in enumerate(rows)}
+            for index, (row, column, _) in explicit_rows.items():
+                position = group_rows.get(row)
+                if position is None:
+                    continue
+                # End forces depend on the element's own stiffness directly
+                direct = np.einsum('qj,jc->qc', unit[position][:, column, :], u_local[position])
+                for size in ("width", "depth"):
+                    gradients[index][f"{name}_{size}"] += section[f"d_{size}"] @ direct
+
+        results = []
+        for index, response in enumerate(responses):
+            value = values[index]
+            if index in explicit_rows:
+                row, column, _ = explicit_rows[index]
+                value = value + self._fixed_end(row, column)
+            results.append(SensitivityResult(response.name, value, gradients[index], self.load_cases))
+        return results
+
+    def flexural_utilization(self, group: str, fcu: float, axis: str = "Mz") -> SensitivityResult:
+        """Utilization ``|M| / (K' fcu b d^2)`` of a group's governing end moment.
+
+        The governing element end and load case are picked from the current
+        solution; ``d = depth - COVER_MM`` as in the design check summary.
+        Moments are in N·m, so ``M`` is scaled by 1e3 to N·mm.
+        """
+        tags = self.reanalysis.groups[group].tolist()
+        response, _, _ = self.governing(element_moment_responses(tags, axis))
+        moment = self.gradients([response])[0]
+        width, depth = self.sizes[group]
+        d = depth - COVER_MM
+        capacity = K_PRIME * fcu * width * d**2
+        magnitude = np.abs(moment.values) * 1e3
+        sign = np.where(moment.values >= 0.0, 1.0, -1.0)
+        gradient = {
+            name: sign * grad * 1e3 / capacity for name, grad in moment.gradient.items()
+        }
+        utilization = magnitude / capacity
+        gradient[f"{group}_width"] = gradient[f"{group}_width"] - utilization / width
+        gradient[f"{group}_depth"] = gradient[f"{group}_depth"] - 2.0 * utilization / d
+        return SensitivityResult(f"utilization_{group}", utilization, gradient, self.load_cases)
+
+    def _unit_stiffness(self, rows: np.ndarray, props: np.ndarray) -> np.ndarray:
+        """d k_local / d prop for A, J, Iy, Iz, shape (n, 4, 12, 12)."""
+        lengths = self.reanalysis._frames.lengths[rows]
+        E, G = props[:, _E_COLUMN], props[:, _G_COLUMN]
+        zero, one = np.zeros_like(lengths), np.ones_like(lengths)
+        unit = [
+            _frame_local_stiffness(lengths, E, one, G, zero, zero, zero),
+            _frame_local_stiffness(lengths, E, zero, G, one, zero, zero),
+            _frame_local_stiffness(lengths, E, zero, G, zero, one, zero),
+            _frame_local_stiffness(lengths, E, zero, G, zero, zero, one),
+        ]
+        return np.stack(unit, axis=1)
+
+    def _element_local_stiffness(self, row: int, target: np.ndarray) -> np.ndarray:
+        reanalysis = self.reanalysis
+        group = self._group_position.get(row)
+        if group is None:
+            return reanalysis._frames.local_stiffness[row]
+        name, position = group
+        props = target[reanalysis.group_slice(name)][position]
+        lengths = reanalysis._frames.lengths[[row]]
+        return _frame_local_stiffness(lengths, *(np.array([value]) for value in props))[0]
+
+    def _adjoint_loads(self, responses: Sequence[Response]):
+        """Adjoint right-hand sides (n_dofs, n_responses) and force-response rows."""
+        reanalysis = self.reanalysis
+        system = reanalysis.solver.system
+        frames = reanalysis._frames
+        A = np.zeros((system.n_dofs, len(responses)))
+        explicit_rows: Dict[int, Tuple[int, int, int]] = {}
+        target = None
+        for index, response in enumerate(responses):
+            if isinstance(response, DisplacementResponse):
+                for node, dof, weight in response.weights:
+                    A[system.node_index[node] * _DOFS_PER_NODE + dof, index] += weight
+                continue
+            row = self._row_of.get(int(response.element_tag))
+            if row is None:
+                raise ValueError(f"Element {response.element_tag} is not a frame element")
+            column = FRAME_FORCE_KEYS.index(response.component)
+            if target is None:
+                target = self._target_props()
+            local = self._element_local_stiffness(row, target)
+            A[frames.dofs[row], index] += frames.transform[row].T @ local[column]
+            explicit_rows[index] = (row, column, int(response.element_tag))
+        return A, explicit_rows
+
+    def _fixed_end(self, row: int, column: int) -> np.ndarray:
+        tag = int(self.reanalysis._frames.tags[row])
+        values = np.zeros(len(self.load_cases))
+        for case, loads in enumerate(self.reanalysis._case_loads):
+            fixed_end = loads.frame_fixed_end.get(tag)
+            if fixed_end is not None:
+                values[case] = fixed_end[column]
+        return values
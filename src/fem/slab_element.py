@@ -11,9 +11,11 @@ References:
 """
 
 from dataclasses import dataclass, field
-from typing import List, Tuple, Dict, Optional
+from typing import Any, List, Tuple, Dict, Optional
 import logging
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
 
@@ -158,6 +160,22 @@ class SlabMeshResult:
     boundary_nodes: Dict[str, List[int]] = field(default_factory=dict)
 
 
+@dataclass(frozen=True)
+class SlabPanelLayout:
+    """Plan layout of a slab panel mesh, shared by floors with the same plan.
+    
+    Attributes:
+        xy: (N, 2) grid node coordinates, row by row from the bottom-left
+        quads: (E, 4) element connectivity as indices into ``xy``
+        skipped_for_openings: Number of grid cells removed by openings
+        aspect_ratio: Element aspect ratio (long side / short side)
+    """
+    xy: np.ndarray
+    quads: np.ndarray
+    skipped_for_openings: int
+    aspect_ratio: float
+
+
 class SlabMeshGenerator:
     """Generate quad mesh for slab panels.
     
@@ -167,16 +185,21 @@ class SlabMeshGenerator:
     
     def __init__(self, 
                  base_node_tag: int = 50000,
-                 base_element_tag: int = 50000):
+                 base_element_tag: int = 50000,
+                 reuse_layouts: bool = True):
         """Initialize mesh generator.
         
         Args:
             base_node_tag: Starting node tag for slab nodes
             base_element_tag: Starting element tag for slab elements
+            reuse_layouts: Cache panel layouts so repeated floors only
+                           renumber the mesh instead of regenerating it
         """
         self._node_tag = base_node_tag
         self._element_tag = base_element_tag
         self._high_aspect_ratio_panels: List[Tuple[str, float]] = []
+        self.reuse_layouts = reuse_layouts
+        self._layouts: Dict[Tuple, SlabPanelLayout] = {}
     
     def _get_next_node_tag(self) -> int:
         tag = self._node_tag
@@ -219,6 +242,7 @@ class SlabMeshGenerator:
         beam_subdivision_count: int = 6,
         existing_nodes: Optional[Dict[Tuple[float, float, float], int]] = None,
         openings: Optional[List['SlabOpening']] = None,
+        registry: Optional[Any] = None,
     ) -> SlabMeshResult:
         """Generate mesh for a slab panel.
         
@@ -236,6 +260,10 @@ class SlabMeshGenerator:
             existing_nodes: Optional dict mapping (x,y,z) coords to existing node tags
                            for sharing nodes with beams
             openings: Optional list of SlabOpening to exclude from mesh
+            registry: Optional NodeRegistry used instead of existing_nodes to
+                      find shared nodes, in one batch lookup per panel.
+                      New nodes are not registered; callers register the
+                      nodes they add with registry.register_many().
         
         Returns:
             SlabMeshResult with nodes, elements, and boundary nodes
@@ -245,115 +273,58 @@ class SlabMeshGenerator:
         if elements_along_y is None:
             elements_along_y = beam_subdivision_count
         
-        nodes: List[Tuple[int, float, float, float, int]] = []
-        elements: List[SlabQuad] = []
-        boundary_nodes: Dict[str, List[int]] = {
-            'left': [],
-            'right': [],
-            'bottom': [],
-            'top': [],
-        }
-        
-        existing_nodes = existing_nodes or {}
-        openings = openings or []
-        
+        layout = self.panel_layout(slab, elements_along_x, elements_along_y, openings or [])
         num_nodes_x = elements_along_x + 1
         num_nodes_y = elements_along_y + 1
-        
-        dx = slab.width_x / elements_along_x
-        dy = slab.width_y / elements_along_y
-        
-        x0, y0 = slab.origin
         z = slab.elevation
         
-        # Generate nodes in grid pattern
-        # node_grid[iy][ix] = node_tag
-        node_grid: List[List[int]] = []
+        # Look up nodes shared with beams/walls, then number the rest in
+        # grid order (row by row from the bottom-left corner)
+        if registry is not None:
+            coords = np.column_stack([layout.xy, np.full(len(layout.xy), z)])
+            grid_tags = registry.find_many(coords).tolist()
+        else:
+            existing_nodes = existing_nodes or {}
+            grid_tags = [
+                existing_nodes.get((round(x, 6), round(y, 6), round(z, 6)), -1)
+                for x, y in layout.xy.tolist()
+            ]
         
-        for iy in range(num_nodes_y):
-            row: List[int] = []
-            y = y0 + iy * dy
-            
-            for ix in range(num_nodes_x):
-                x = x0 + ix * dx
-                
-                # Check if node already exists (shared with beam)
-                coord_key = (round(x, 6), round(y, 6), round(z, 6))
-                if coord_key in existing_nodes:
-                    tag = existing_nodes[coord_key]
-                else:
-                    tag = self._get_next_node_tag()
-                    nodes.append((tag, x, y, z, floor_level))
-                
-                row.append(tag)
-                
-                # Track boundary nodes for beam connectivity
-                if ix == 0:
-                    boundary_nodes['left'].append(tag)
-                if ix == num_nodes_x - 1:
-                    boundary_nodes['right'].append(tag)
-                if iy == 0:
-                    boundary_nodes['bottom'].append(tag)
-                if iy == num_nodes_y - 1:
-                    boundary_nodes['top'].append(tag)
-            
-            node_grid.append(row)
+        nodes: List[Tuple[int, float, float, float, int]] = []
+        for index, (x, y) in enumerate(layout.xy.tolist()):
+            if grid_tags[index] < 0:
+                grid_tags[index] = self._get_next_node_tag()
+                nodes.append((grid_tags[index], x, y, z, floor_level))
         
-        # Generate quad elements (CCW ordering when viewed from +Z)
-        skipped_for_openings = 0
-        for iy in range(num_nodes_y - 1):
-            for ix in range(num_nodes_x - 1):
-                # Calculate element center point for opening check
-                elem_x_min = x0 + ix * dx
-                elem_x_max = x0 + (ix + 1) * dx
-                elem_y_min = y0 + iy * dy
-                elem_y_max = y0 + (iy + 1) * dy
-                elem_center_x = (elem_x_min + elem_x_max) / 2
-                elem_center_y = (elem_y_min + elem_y_max) / 2
-                
-                # Skip element if it overlaps with any opening
-                skip_element = False
-                for opening in openings:
-                    if opening.polygon_vertices is not None:
-                        if _point_in_polygon((elem_center_x, elem_center_y), opening.polygon_vertices):
-                            skip_element = True
-                            skipped_for_openings += 1
-                            break
-                    else:
-                        ox_min, oy_min, ox_max, oy_max = opening.bounds
-                        if (ox_min <= elem_center_x <= ox_max and
-                            oy_min <= elem_center_y <= oy_max):
-                            skip_element = True
-                            skipped_for_openings += 1
-                            break
-                
-                if skip_element:
-                    continue
-                
-                # Counter-clockwise ordering when viewed from above
-                n1 = node_grid[iy][ix]          # Bottom-left
-                n2 = node_grid[iy][ix + 1]      # Bottom-right
-                n3 = node_grid[iy + 1][ix + 1]  # Top-right
-                n4 = node_grid[iy + 1][ix]      # Top-left
-                
-                elem = SlabQuad(
-                    tag=self._get_next_element_tag(),
-                    node_tags=(n1, n2, n3, n4),
-                    section_tag=section_tag,
-                    slab_id=slab.slab_id,
-                    floor_level=floor_level,
-                )
-                elements.append(elem)
+        # Track boundary nodes for beam connectivity
+        grid = np.array(grid_tags, dtype=np.int64).reshape(num_nodes_y, num_nodes_x)
+        boundary_nodes: Dict[str, List[int]] = {
+            'left': grid[:, 0].tolist(),
+            'right': grid[:, -1].tolist(),
+            'bottom': grid[0, :].tolist(),
+            'top': grid[-1, :].tolist(),
+        }
+        
+        # Quads keep counter-clockwise ordering when viewed from above
+        elements = [
+            SlabQuad(
+                tag=self._get_next_element_tag(),
+                node_tags=tuple(quad),
+                section_tag=section_tag,
+                slab_id=slab.slab_id,
+                floor_level=floor_level,
+            )
+            for quad in grid.reshape(-1)[layout.quads].tolist()
+        ]
         
         # Check mesh quality (aspect ratio)
-        aspect_ratio = max(dx, dy) / min(dx, dy) if min(dx, dy) > 0 else float('inf')
-        if aspect_ratio > 5:
-            self._high_aspect_ratio_panels.append((slab.slab_id, aspect_ratio))
+        if layout.aspect_ratio > 5:
+            self._high_aspect_ratio_panels.append((slab.slab_id, layout.aspect_ratio))
         
         logger.info(
             f"Generated slab mesh '{slab.slab_id}': "
             f"{len(nodes)} new nodes, {len(elements)} elements, "
-            f"aspect ratio {aspect_ratio:.2f}"
+            f"aspect ratio {layout.aspect_ratio:.2f}"
         )
         
         return SlabMeshResult(
@@ -362,6 +333,95 @@ class SlabMeshGenerator:
             boundary_nodes=boundary_nodes,
         )
 
+    def panel_layout(self,
+                     slab: SlabPanel,
+                     elements_along_x: int,
+                     elements_along_y: int,
+                     openings: List['SlabOpening']) -> SlabPanelLayout:
+        """Plan layout of a slab panel mesh, independent of elevation.
+        
+        With ``reuse_layouts`` the layout is computed once per panel
+        footprint, division counts and openings, and then shared by every
+        floor with the same plan.
+        """
+        key = (
+            slab.origin, slab.width_x, slab.width_y, elements_along_x, elements_along_y,
+            tuple(
+                (opening.bounds, tuple(opening.polygon_vertices or ()))
+                for opening in openings
+            ),
+        )
+        layout = self._layouts.get(key) if self.reuse_layouts else None
+        if layout is None:
+            layout = _build_panel_layout(slab, elements_along_x, elements_along_y, openings)
+            if self.reuse_layouts:
+                self._layouts[key] = layout
+        return layout
+
+
+def _points_in_polygon(x: np.ndarray, y: np.ndarray, polygon: List[Tuple[float, float]]) -> np.ndarray:
+    """Vectorized form of ``_point_in_polygon`` over point arrays."""
+    inside = np.zeros(x.shape, dtype=bool)
+    j = len(polygon) - 1
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for i in range(len(polygon)):
+            xi, yi = polygon[i]
+            xj, yj = polygon[j]
+            crosses = (yi > y) != (yj > y)
+            inside ^= crosses & (x < (xj - xi) * (y - yi) / (yj - yi) + xi)
+            j = i
+    return inside
+
+
+def _build_panel_layout(slab: SlabPanel,
+                        elements_along_x: int,
+                        elements_along_y: int,
+                        openings: List['SlabOpening']) -> SlabPanelLayout:
+    num_nodes_x = elements_along_x + 1
+    num_nodes_y = elements_along_y + 1
+    dx = slab.width_x / elements_along_x
+    dy = slab.width_y / elements_along_y
+    x0, y0 = slab.origin
+    
+    grid_x = x0 + np.arange(num_nodes_x) * dx
+    grid_y = y0 + np.arange(num_nodes_y) * dy
+    xy = np.column_stack([np.tile(grid_x, num_nodes_y), np.repeat(grid_y, num_nodes_x)])
+    
+    # Element centres, row-major from the bottom-left element
+    center_x = np.tile((grid_x[:-1] + grid_x[1:]) / 2, elements_along_y)
+    center_y = np.repeat((grid_y[:-1] + grid_y[1:]) / 2, elements_along_x)
+    
+    # Skip elements whose centre lies in any opening
+    skipped = np.zeros(center_x.shape, dtype=bool)
+    for opening in openings:
+        if opening.polygon_vertices is not None:
+            skipped |= _points_in_polygon(center_x, center_y, opening.polygon_vertices)
+        else:
+            ox_min, oy_min, ox_max, oy_max = opening.bounds
+            skipped |= (
+                (ox_min <= center_x) & (center_x <= ox_max)
+                & (oy_min <= center_y) & (center_y <= oy_max)
+            )
+    
+    # n1..n4: bottom-left, bottom-right, top-right, top-left
+    bottom_left = (
+        np.arange(elements_along_y)[:, None] * num_nodes_x + np.arange(elements_along_x)[None, :]
+    ).reshape(-1)
+    quads = np.column_stack([
+        bottom_left,
+        bottom_left + 1,
+        bottom_left + num_nodes_x + 1,
+        bottom_left + num_nodes_x,
+    ])[~skipped]
+    
+    aspect_ratio = max(dx, dy) / min(dx, dy) if min(dx, dy) > 0 else float('inf')
+    return SlabPanelLayout(
+        xy=xy,
+        quads=quads,
+        skipped_for_openings=int(skipped.sum()),
+        aspect_ratio=aspect_ratio,
+    )
+
 
 def create_slab_panels_from_bays(
     num_bays_x: int,
@@ -415,6 +475,7 @@ __all__ = [
     "SlabOpening",
     "SlabQuad",
     "SlabMeshResult",
+    "SlabPanelLayout",
     "SlabMeshGenerator",
     "create_slab_panels_from_bays",
 ]
@@ -6,12 +6,25 @@ structural finite element models.
 """
 
 import logging
+import multiprocessing
+import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple
 import numpy as np
 
+from src.fem.result_tables import FRAME_FORCE_KEYS, ElementForceTable, NodeResultTable
+
+if TYPE_CHECKING:
+    from src.fem.result_store import ResultStore
+    from src.fem.solver_autotune import AutotuneReport, SolverConfiguration
+
 _logger = logging.getLogger(__name__)
 
+# End-force keys of 2D frame elements (eleForce of length 6)
+_FRAME_2D_FORCE_KEYS = ('N_i', 'V_i', 'M_i', 'N_j', 'V_j', 'M_j')
+
 
 @dataclass
 class AnalysisResult:
@@ -25,14 +38,30 @@ class AnalysisResult:
         node_displacements: Node displacements {node_tag: [ux, uy, uz, rx, ry, rz]}
         node_reactions: Reaction forces {node_tag: [Fx, Fy, Fz, Mx, My, Mz]}
         element_forces: Element forces {element_tag: force_dict}
+        solver_configuration: Autotuned OpenSees configuration and candidate
+            timings (s) when solved with ``analyze_model(autotune=True)``
+
+    The three result maps are columnar tables (``NodeResultTable`` /
+    ``ElementForceTable``) that behave like the dicts above; plain dicts
+    assigned to them are converted on assignment.
     """
     success: bool
     message: str
     converged: bool = True
     iterations: int = 0
-    node_displacements: Dict[int, List[float]] = field(default_factory=dict)
-    node_reactions: Dict[int, List[float]] = field(default_factory=dict)
-    element_forces: Dict[int, Dict[str, float]] = field(default_factory=dict)
+    node_displacements: NodeResultTable = field(default_factory=NodeResultTable)
+    node_reactions: NodeResultTable = field(default_factory=NodeResultTable)
+    element_forces: ElementForceTable = field(default_factory=ElementForceTable)
+    solver_configuration: Dict[str, object] = field(default_factory=dict)
+
+    def __setattr__(self, name, value):
+        if name in ("node_displacements", "node_reactions"):
+            if not isinstance(value, NodeResultTable):
+                value = NodeResultTable(value)
+        elif name == "element_forces":
+            if not isinstance(value, ElementForceTable):
+                value = ElementForceTable(value)
+        super().__setattr__(name, value)
     
     def get_max_displacement(self, dof: int = 2) -> Tuple[int, float]:
         """Get maximum displacement and node tag.
@@ -46,14 +75,11 @@ class AnalysisResult:
         if not self.node_displacements:
             return (0, 0.0)
         
-        max_disp = 0.0
-        max_node = 0
-        for node_tag, disps in self.node_displacements.items():
-            if abs(disps[dof]) > abs(max_disp):
-                max_disp = disps[dof]
-                max_node = node_tag
-        
-        return (max_node, max_disp)
+        column = self.node_displacements.array[:, dof]
+        row = int(np.argmax(np.abs(column)))
+        if column[row] == 0.0:
+            return (0, 0.0)
+        return (int(self.node_displacements.tags[row]), float(column[row]))
     
     def get_total_reaction(self, dof: int = 2) -> float:
         """Get total reaction force/moment.
@@ -67,8 +93,7 @@ class AnalysisResult:
         if not self.node_reactions:
             return 0.0
         
-        total = sum(reactions[dof] for reactions in self.node_reactions.values())
-        return total
+        return float(self.node_reactions.array[:, dof].sum())
 
 
 class FEMSolver:
@@ -85,7 +110,9 @@ class FEMSolver:
             import openseespy.opensees as ops
             self.ops = ops
             self._ops_available = True
-        except ImportError:
+        except (ImportError, OSError, RuntimeError):
+            # openseespy raises RuntimeError/OSError when its binary cannot
+            # be loaded on the current platform
             self.ops = None
     
     def check_availability(self) -> bool:
@@ -100,7 +127,9 @@ class FEMSolver:
                                    load_pattern: int = 1,
                                    max_iterations: int = 100,
                                    tolerance: float = 1e-6,
-                                   include_element_forces: bool = True) -> AnalysisResult:
+                                   include_element_forces: bool = True,
+                                   element_tags: Optional[Iterable[int]] = None,
+                                   configuration: Optional["SolverConfiguration"] = None) -> AnalysisResult:
         """Run linear static analysis.
         
         This performs a linear static analysis on the current OpenSeesPy model.
@@ -110,6 +139,9 @@ class FEMSolver:
             load_pattern: Load pattern identifier to analyze
             max_iterations: Maximum iterations for nonlinear solver (if needed)
             tolerance: Convergence tolerance
+            include_element_forces: Whether to extract element end forces
+            element_tags: Optional subset of elements to extract forces for
+            configuration: Optional OpenSees configuration replacing the defaults
         
         Returns:
             AnalysisResult with displacements, reactions, and element forces
@@ -122,19 +154,76 @@ class FEMSolver:
                 "OpenSeesPy is not available. Install with: pip install openseespy"
             )
         
-        ops = self.ops
-        
-        # Create analysis
-        # For linear static analysis, we use:
-        # - constraints: Plain (or Transformation for MPCs)
-        # - numberer: RCM (Reverse Cuthill-McKee for bandwidth optimization)
-        # - system: BandGeneral (for general systems) or ProfileSPD (for symmetric)
-        # - test: NormDispIncr (convergence test)
-        # - algorithm: Linear (for linear analysis)
-        # - integrator: LoadControl (static load)
-        # - analysis: Static
-        
         try:
+            self.configure_linear_static_analysis(
+                max_iterations=max_iterations,
+                tolerance=tolerance,
+                configuration=configuration,
+            )
+        except Exception as e:
+            return AnalysisResult(
+                success=False,
+                converged=False,
+                message=f"Analysis error: {str(e)}"
+            )
+
+        return self.solve_configured_analysis(
+            include_element_forces=include_element_forces,
+            element_tags=element_tags,
+        )
+
+    def configure_linear_static_analysis(self,
+                                         max_iterations: int = 100,
+                                         tolerance: float = 1e-6,
+                                         factor_once: bool = False,
+                                         configuration: Optional["SolverConfiguration"] = None,
+                                         strict: bool = False) -> None:
+        """Define the OpenSeesPy analysis objects for a linear static solve.
+
+        For linear static analysis, we use:
+        - constraints: Transformation (for rigid diaphragm MPCs)
+        - numberer: RCM (Reverse Cuthill-McKee for bandwidth optimization)
+        - system: UmfPack, falling back to SparseGeneral then BandGeneral
+        - test: NormDispIncr (convergence test)
+        - algorithm: Linear, optionally with ``-factorOnce``
+        - integrator: LoadControl (static load)
+        - analysis: Static
+
+        Args:
+            max_iterations: Maximum iterations for the convergence test
+            tolerance: Convergence tolerance
+            factor_once: If True, the stiffness matrix is assembled and
+                factorized on the first ``analyze`` call only. Subsequent
+                solves reuse the factorization, so only valid while the
+                structure (stiffness) is unchanged.
+            configuration: Optional constraint handler, numberer and system
+                to use instead of the defaults (see
+                ``src.fem.solver_autotune``)
+            strict: Raise if ``configuration`` cannot be applied instead of
+                falling back to the defaults
+
+        Raises:
+            RuntimeError: If OpenSeesPy is not available
+        """
+        if not self._ops_available:
+            raise RuntimeError(
+                "OpenSeesPy is not available. Install with: pip install openseespy"
+            )
+
+        ops = self.ops
+        applied = False
+        if configuration is not None:
+            try:
+                configuration.apply(ops)
+                applied = True
+            except Exception as e:
+                if strict:
+                    raise
+                _logger.warning(
+                    "Solver configuration %s unavailable (%s) - using defaults",
+                    configuration.label, e,
+                )
+        if not applied:
             ops.constraints('Transformation')
             ops.numberer('RCM')
             system_candidates = ('UmfPack', 'SparseGeneral', 'BandGeneral')
@@ -144,17 +233,38 @@ class FEMSolver:
                     break
                 except Exception:
                     continue
-            ops.test('NormDispIncr', tolerance, max_iterations)
+        ops.test('NormDispIncr', tolerance, max_iterations)
+        if factor_once:
+            ops.algorithm('Linear', '-factorOnce')
+        else:
             ops.algorithm('Linear')
-            ops.integrator('LoadControl', 1.0)  # Apply full load in one step
-            ops.analysis('Static')
-            
-            # Analyze
-            result_code = ops.analyze(1)  # 1 step
-            
+        ops.integrator('LoadControl', 1.0)  # Apply full load in one step
+        ops.analysis('Static')
+
+    def solve_configured_analysis(self,
+                                  include_element_forces: bool = True,
+                                  element_tags: Optional[Iterable[int]] = None) -> AnalysisResult:
+        """Run one load step on the already configured analysis and extract results.
+
+        Args:
+            include_element_forces: Whether to extract element end forces
+            element_tags: Optional subset of elements to extract forces for
+
+        Returns:
+            AnalysisResult with displacements, reactions, and element forces
+        """
+        if not self._ops_available:
+            raise RuntimeError("OpenSeesPy is not available")
+
+        try:
+            result_code = self.ops.analyze(1)  # 1 step
+
             if result_code == 0:
                 # Analysis successful - extract results
-                results = self.extract_results(include_element_forces=include_element_forces)
+                results = self.extract_results(
+                    include_element_forces=include_element_forces,
+                    element_tags=element_tags,
+                )
                 results.success = True
                 results.converged = True
                 results.message = "Analysis completed successfully"
@@ -166,17 +276,30 @@ class FEMSolver:
                     converged=False,
                     message=f"Analysis failed with code {result_code}"
                 )
-        
+
         except Exception as e:
             return AnalysisResult(
                 success=False,
                 converged=False,
                 message=f"Analysis error: {str(e)}"
             )
-    
-    def extract_results(self, include_element_forces: bool = True) -> AnalysisResult:
+
+    def extract_results(self,
+                        include_element_forces: bool = True,
+                        element_tags: Optional[Iterable[int]] = None) -> AnalysisResult:
         """Extract analysis results from OpenSeesPy model.
-        
+
+        Results are gathered in bulk into preallocated arrays. Reactions are
+        only queried at fixed or MPC-constrained nodes when the OpenSees
+        build exposes those queries, and each element class is probed once
+        to decide whether its local end forces (``localForce``) or global
+        ``eleForce`` vector is read, so frames and shells cost one call each.
+
+        Args:
+            include_element_forces: Whether to extract element end forces
+            element_tags: Optional subset of elements to extract forces for;
+                other elements are skipped entirely
+
         Returns:
             AnalysisResult with current state of model
         """
@@ -187,84 +310,132 @@ class FEMSolver:
         
         result = AnalysisResult(success=True, message="Results extracted")
         
-        # Get all node tags
-        node_tags = ops.getNodeTags()
-        
-        # Extract displacements for all nodes
-        for node_tag in node_tags:
-            disp = ops.nodeDisp(node_tag)
-            result.node_displacements[node_tag] = list(disp)
-        
-        # Extract reactions for fixed nodes
+        node_tags = np.asarray(ops.getNodeTags(), dtype=np.int64)
+        if node_tags.size:
+            result.node_displacements = NodeResultTable.from_arrays(
+                node_tags, self._gather_rows(ops.nodeDisp, node_tags),
+            )
+
         ops.reactions()
-        for node_tag in node_tags:
-            reaction = ops.nodeReaction(node_tag)
-            # Only store if non-zero (i.e., node has restraints)
-            if any(abs(r) > 1e-10 for r in reaction):
-                result.node_reactions[node_tag] = list(reaction)
+        reaction_tags = self._reaction_candidate_tags(node_tags)
+        if reaction_tags.size:
+            reactions = self._gather_rows(ops.nodeReaction, reaction_tags)
+            # Only keep nodes that actually carry a reaction
+            keep = np.any(np.abs(reactions) > 1e-10, axis=1)
+            result.node_reactions = NodeResultTable.from_arrays(
+                reaction_tags[keep], reactions[keep],
+            )
         
         if include_element_forces:
-            elem_tags = ops.getEleTags()
-            _logger.info(f"Extracting forces for {len(elem_tags)} elements")
-            extracted_count = 0
-            zero_force_count = 0
+            result.element_forces = self._extract_element_forces(element_tags)
+        
+        return result
 
-            for elem_tag in elem_tags:
-                try:
-                    forces = ops.eleForce(elem_tag)
+    @staticmethod
+    def _gather_rows(query, tags: np.ndarray) -> np.ndarray:
+        """Call ``query(tag)`` for every tag into one preallocated array."""
+        first = query(int(tags[0]))
+        buffer = np.empty((tags.size, len(first)), dtype=np.float64)
+        buffer[0] = first
+        for row, tag in enumerate(tags[1:].tolist(), start=1):
+            buffer[row] = query(tag)
+        return buffer
+
+    def _reaction_candidate_tags(self, node_tags: np.ndarray) -> np.ndarray:
+        """Nodes that can carry a reaction: fixed, constrained or retained."""
+        ops = self.ops
+        try:
+            candidates = set(ops.getFixedNodes())
+            candidates.update(ops.getConstrainedNodes())
+            candidates.update(ops.getRetainedNodes())
+        except (AttributeError, RuntimeError):
+            # Older builds lack the constraint queries - scan every node
+            return node_tags
+        return node_tags[np.isin(node_tags, np.fromiter(candidates, dtype=np.int64))]
+
+    def _extract_element_forces(self,
+                                element_tags: Optional[Iterable[int]] = None
+                                ) -> ElementForceTable:
+        """Read element end forces, one OpenSees call per element.
 
-                    if extracted_count < 5:
-                        _logger.debug(f"Element {elem_tag}: forces={forces[:6] if len(forces) >= 6 else forces}")
+        Elements are grouped by OpenSees class. The first element of a class
+        decides whether the class reports 12-component local frame forces;
+        the rest of the class then uses that query directly.
+        """
+        ops = self.ops
+        all_tags = list(ops.getEleTags())
+        try:
+            class_tags = list(ops.getEleClassTags())
+        except (AttributeError, RuntimeError):
+            class_tags = []
+        if len(class_tags) != len(all_tags):
+            # Unknown classes: probe every element on its own
+            class_tags = list(range(len(all_tags)))
 
-                    if all(abs(f) < 1e-10 for f in forces):
-                        zero_force_count += 1
+        if element_tags is not None:
+            wanted = set(element_tags)
+            pairs = [(tag, cls) for tag, cls in zip(all_tags, class_tags) if tag in wanted]
+        else:
+            pairs = list(zip(all_tags, class_tags))
+
+        frame_tags = np.empty(len(pairs), dtype=np.int64)
+        frame_buffer = np.empty((len(pairs), len(FRAME_FORCE_KEYS)), dtype=np.float64)
+        n_frames = 0
+        other: Dict[int, Dict[str, float]] = {}
+        class_reads_local: Dict[int, bool] = {}
+        failed = 0
 
+        for elem_tag, class_tag in pairs:
+            try:
+                reads_local = class_reads_local.get(class_tag)
+                forces = None
+                if reads_local is None:
+                    forces = ops.eleForce(elem_tag)
+                    reads_local = False
                     if len(forces) == 12:
                         try:
                             local_forces = ops.eleResponse(elem_tag, 'localForce')
-                            if local_forces and len(local_forces) == 12:
-                                forces = local_forces
                         except Exception:
-                            pass
-
-                        result.element_forces[elem_tag] = {
-                            'N_i': forces[0],
-                            'Vy_i': forces[1],
-                            'Vz_i': forces[2],
-                            'T_i': forces[3],
-                            'My_i': forces[4],
-                            'Mz_i': forces[5],
-                            'N_j': forces[6],
-                            'Vy_j': forces[7],
-                            'Vz_j': forces[8],
-                            'T_j': forces[9],
-                            'My_j': forces[10],
-                            'Mz_j': forces[11],
-                        }
-                        extracted_count += 1
-                    elif len(forces) == 6:
-                        result.element_forces[elem_tag] = {
-                            'N_i': forces[0],
-                            'V_i': forces[1],
-                            'M_i': forces[2],
-                            'N_j': forces[3],
-                            'V_j': forces[4],
-                            'M_j': forces[5],
-                        }
-                        extracted_count += 1
-                    else:
-                        result.element_forces[elem_tag] = {
-                            f'force_{i}': f for i, f in enumerate(forces)
-                        }
-                        extracted_count += 1
-                except Exception as e:
-                    _logger.debug(f"Could not extract forces for element {elem_tag}: {e}")
-
-            _logger.info(f"Extracted forces for {len(result.element_forces)} elements out of {len(elem_tags)} total")
-            if zero_force_count > 0:
-                _logger.warning(f"WARNING: {zero_force_count} elements have all-zero forces - check load application")
-        
-        return result
+                            local_forces = None
+                        if local_forces is not None and len(local_forces) == 12:
+                            forces = local_forces
+                            reads_local = True
+                    class_reads_local[class_tag] = reads_local
+                elif reads_local:
+                    forces = ops.eleResponse(elem_tag, 'localForce')
+                    if forces is None or len(forces) != 12:
+                        forces = ops.eleForce(elem_tag)
+                else:
+                    forces = ops.eleForce(elem_tag)
+
+                if len(forces) == 12:
+                    frame_tags[n_frames] = elem_tag
+                    frame_buffer[n_frames] = forces
+                    n_frames += 1
+                elif len(forces) == 6:
+                    other[elem_tag] = dict(zip(_FRAME_2D_FORCE_KEYS, forces))
+                else:
+                    other[elem_tag] = {f'force_{i}': f for i, f in enumerate(forces)}
+            except Exception:
+                failed += 1
+
+        frame_buffer = frame_buffer[:n_frames]
+        element_forces = ElementForceTable.from_frame_arrays(
+            frame_tags[:n_frames], frame_buffer, other,
+        )
+
+        _logger.info(
+            "Extracted forces for %d elements out of %d total",
+            len(element_forces), len(all_tags),
+        )
+        if failed:
+            _logger.debug("Could not extract forces for %d elements", failed)
+        zero_frames = int(np.count_nonzero(~np.any(np.abs(frame_buffer) >= 1e-10, axis=1)))
+        if zero_frames:
+            _logger.warning(
+                f"WARNING: {zero_frames} elements have all-zero forces - check load application"
+            )
+        return element_forces
     
     def get_element_stress(self, element_tag: int) -> Optional[Dict[str, float]]:
         """Get element stresses (if available).
@@ -288,6 +459,10 @@ class FEMSolver:
     def get_natural_frequencies(self, n_modes: int = 5) -> Optional[np.ndarray]:
         """Get natural frequencies via eigenvalue analysis.
         
+        Requires nodal mass in the OpenSees domain, which build_fem_model
+        does not assign; see src.fem.modal_analysis for the modal pipeline
+        with lumped floor mass.
+        
         Args:
             n_modes: Number of modes to extract
         
@@ -339,6 +514,15 @@ def analyze_model(
     load_pattern: int = 1,
     load_cases: Optional[List[str]] = None,
     include_element_forces: bool = True,
+    factorize_once: bool = True,
+    backend: str = "auto",
+    parallel: bool = False,
+    max_workers: Optional[int] = None,
+    element_types: Optional[Iterable] = None,
+    reuse_structure: bool = False,
+    sparse_method: str = "auto",
+    autotune: bool = False,
+    store: Optional["ResultStore"] = None,
 ) -> Dict[str, AnalysisResult]:
     """Build and analyze a FEMModel for multiple load cases.
     
@@ -349,6 +533,44 @@ def analyze_model(
                    If None or ["combined"], returns single result with "combined" key.
                    Supported: ["DL", "SDL", "LL", "Wx", "Wy", "Wtz"] plus
                    sign aliases ["Wx+", "Wx-", "Wy+", "Wy-", "Wtz+", "Wtz-"].
+        include_element_forces: Whether to extract element end forces
+        factorize_once: If True, assemble and factorize the stiffness matrix
+                   once and back-substitute every load case against it.
+                   If False, each case is re-assembled and re-factorized.
+        backend: "opensees", "scipy" or "auto". "scipy" assembles and solves
+                   the model with the native sparse solver (see
+                   src.fem.sparse_solver). "auto" uses OpenSeesPy and falls
+                   back to scipy when OpenSeesPy cannot be loaded.
+        parallel: If True, ship the pickled model to a process pool and
+                   solve groups of load cases concurrently. Each worker owns
+                   its own OpenSees domain. Results are merged back in
+                   ``load_cases`` order. ``backend`` and ``sparse_method``
+                   are forwarded, so workers solve with the same method.
+        max_workers: Process count for ``parallel`` (default: CPU count)
+        element_types: Optional ElementType filter for element force
+                   extraction, e.g. frame types only to skip shell output.
+                   Elements of other types get no entry in element_forces.
+        reuse_structure: If True and the OpenSees domain still holds this
+                   model, keep its nodes, elements and diaphragms and only
+                   push section changes made with ``FEMModel.update_section``
+                   before re-solving. Ignored by the scipy and parallel paths.
+        sparse_method: Solver method of the scipy backend (see
+                   ``SparseFEMSolver``). "pcg"/"minres" solve iteratively
+                   with an AMG or per-floor block-Jacobi preconditioner,
+                   for meshes whose direct factors exceed memory, and are
+                   used by the "auto" backend too. The iteration count is
+                   reported in ``AnalysisResult.iterations``.
+        autotune: If True, solve with the fastest OpenSees constraint
+                   handler, numberer and system for the model's size class.
+                   The first model of a size class benchmarks the candidates
+                   within the tuner's time budget and persists the choice
+                   (see ``src.fem.solver_autotune``).
+                   The choice and timings are reported in
+                   ``AnalysisResult.solver_configuration``.
+        store: Optional on-disk ResultStore. Results of the same model
+                   content and request are returned from it without
+                   validating or solving; fully successful solves are
+                   written to it.
     
     Returns:
         Dict of {load_case_name: AnalysisResult}
@@ -358,10 +580,38 @@ def analyze_model(
     
     if not isinstance(model, FEMModel):
         raise TypeError("model must be a FEMModel instance")
+    if backend not in ("auto", "opensees", "scipy"):
+        raise ValueError("backend must be 'auto', 'opensees' or 'scipy'")
     
     # Default to combined analysis for backward compatibility
     if load_cases is None:
         load_cases = ["combined"]
+
+    element_tags = None
+    if element_types is not None:
+        wanted_types = set(element_types)
+        element_tags = {
+            tag for tag, elem in model.elements.items()
+            if elem.element_type in wanted_types
+        }
+
+    if store is not None:
+        store_key = store.key(
+            model, load_cases, include_element_forces, element_tags, load_pattern,
+            backend, sparse_method, autotune,
+        )
+        cached = store.get(store_key)
+        if cached is not None:
+            _logger.info("Loaded %d load cases from result store", len(cached))
+            return cached
+        results = analyze_model(
+            model, load_pattern, load_cases, include_element_forces, factorize_once,
+            backend, parallel, max_workers, element_types, reuse_structure,
+            sparse_method, autotune,
+        )
+        if all(result.success for result in results.values()):
+            store.put(store_key, results)
+        return results
     
     # Validate model
     is_valid, errors = model.validate_model()
@@ -372,9 +622,47 @@ def analyze_model(
             message=f"Model validation failed: {'; '.join(errors)}"
         )
         return {lc: error_result for lc in load_cases}
-    
+
+    # OpenSees only offers direct system solvers; iterative modes run on scipy
+    use_sparse = backend == "scipy" or (backend == "auto" and sparse_method in ("pcg", "minres"))
+
+    solver = None
+    tuning = None
+    if autotune and not use_sparse:
+        solver = FEMSolver()
+        if solver.check_availability():
+            # Tune before dispatching so parallel workers find the stored choice
+            tuning = _autotuned_configuration(model, solver)
+
+    workers = min(max_workers or os.cpu_count() or 1, len(load_cases))
+    if parallel and workers > 1 and "combined" not in load_cases:
+        return _run_load_cases_parallel(
+            model,
+            load_cases,
+            load_pattern,
+            include_element_forces=include_element_forces,
+            factorize_once=factorize_once,
+            backend=backend,
+            max_workers=workers,
+            element_types=element_types,
+            autotune=tuning is not None,
+            sparse_method=sparse_method,
+        )
+
+    if use_sparse:
+        return _run_load_cases_sparse(
+            model, load_cases, load_pattern, include_element_forces, element_tags,
+            sparse_method,
+        )
+
     # Check solver availability
-    solver = FEMSolver()
+    solver = solver or FEMSolver()
+    if not solver.check_availability() and backend == "auto":
+        _logger.warning("OpenSeesPy not available - falling back to scipy sparse solver")
+        return _run_load_cases_sparse(
+            model, load_cases, load_pattern, include_element_forces, element_tags,
+            sparse_method,
+        )
     if not solver.check_availability():
         error_result = AnalysisResult(
             success=False,
@@ -383,23 +671,50 @@ def analyze_model(
         )
         return {lc: error_result for lc in load_cases}
     
-    results: Dict[str, AnalysisResult] = {}
-    
-    for index, lc in enumerate(load_cases):
-        # Run analysis for each load case
-        result = _run_single_load_case(
+    configuration = tuning.configuration if tuning is not None else None
+    if factorize_once and len(load_cases) > 1 and "combined" not in load_cases:
+        results = _run_load_cases_factorized(
             model,
             solver,
-            lc,
+            load_cases,
             load_pattern,
             include_element_forces=include_element_forces,
-            rebuild_structure=(index == 0),
+            element_tags=element_tags,
+            reuse_structure=reuse_structure,
+            configuration=configuration,
         )
-        results[lc] = result
-    
+    else:
+        results = {}
+        for index, lc in enumerate(load_cases):
+            # Run analysis for each load case
+            results[lc] = _run_single_load_case(
+                model,
+                solver,
+                lc,
+                load_pattern,
+                include_element_forces=include_element_forces,
+                element_tags=element_tags,
+                rebuild_structure=(index == 0 and not reuse_structure),
+                configuration=configuration,
+            )
+
+    if tuning is not None:
+        for result in results.values():
+            result.solver_configuration = tuning.as_summary()
     return results
 
 
+def _autotuned_configuration(model, solver: FEMSolver) -> Optional["AutotuneReport"]:
+    """Stored or freshly benchmarked configuration; None if tuning fails."""
+    from src.fem.solver_autotune import SolverAutotuner
+
+    try:
+        return SolverAutotuner().configuration_for(model, solver)
+    except Exception as e:
+        _logger.warning("Solver autotuning failed - using default configuration: %s", e)
+        return None
+
+
 # Load case to load pattern ID mapping
 LOAD_CASE_PATTERN_MAP: Dict[str, int] = {
     "DL": 1,      # Dead Load
@@ -418,13 +733,171 @@ LOAD_CASE_PATTERN_MAP: Dict[str, int] = {
 }
 
 
+# Model unpickled once per worker process by _init_parallel_worker
+_WORKER_MODEL = None
+
+
+def _init_parallel_worker(model_payload: bytes) -> None:
+    """Process pool initializer: unpickle the shared FEMModel once."""
+    global _WORKER_MODEL
+    _WORKER_MODEL = pickle.loads(model_payload)
+
+
+def _solve_load_case_group(
+    load_cases: List[str],
+    default_pattern: int,
+    include_element_forces: bool,
+    factorize_once: bool,
+    backend: str,
+    element_types: Optional[List] = None,
+    autotune: bool = False,
+    sparse_method: str = "auto",
+) -> Dict[str, AnalysisResult]:
+    """Worker task: solve a group of load cases serially in this process."""
+    return analyze_model(
+        _WORKER_MODEL,
+        load_pattern=default_pattern,
+        load_cases=load_cases,
+        include_element_forces=include_element_forces,
+        factorize_once=factorize_once,
+        backend=backend,
+        element_types=element_types,
+        sparse_method=sparse_method,
+        autotune=autotune,
+    )
+
+
+def _split_load_case_groups(load_cases: List[str], n_groups: int) -> List[List[str]]:
+    """Split load cases into ``n_groups`` contiguous, near-equal groups.
+
+    Contiguous groups keep the factorize-once benefit inside each worker.
+    """
+    n_groups = max(1, min(n_groups, len(load_cases)))
+    size, extra = divmod(len(load_cases), n_groups)
+    groups = []
+    start = 0
+    for index in range(n_groups):
+        stop = start + size + (1 if index < extra else 0)
+        groups.append(list(load_cases[start:stop]))
+        start = stop
+    return groups
+
+
+def _run_load_cases_parallel(
+    model,
+    load_cases: List[str],
+    default_pattern: int = 1,
+    include_element_forces: bool = True,
+    factorize_once: bool = True,
+    backend: str = "auto",
+    max_workers: int = 2,
+    element_types: Optional[Iterable] = None,
+    autotune: bool = False,
+    sparse_method: str = "auto",
+) -> Dict[str, AnalysisResult]:
+    """Solve groups of load cases concurrently in a process pool.
+
+    OpenSees keeps one global domain per interpreter, so concurrency needs
+    processes. The model is pickled once and unpickled once per worker by
+    the pool initializer; workers use the "spawn" start method so they do
+    not inherit the parent's OpenSees domain or UI threads.
+
+    A failure of a whole group (e.g. a crashed worker) is captured as a
+    failed AnalysisResult for each case in that group.
+
+    Returns:
+        Dict of {load_case_name: AnalysisResult} in ``load_cases`` order
+    """
+    groups = _split_load_case_groups(load_cases, max_workers)
+    merged: Dict[str, AnalysisResult] = {}
+
+    try:
+        payload = pickle.dumps(model, protocol=pickle.HIGHEST_PROTOCOL)
+        executor = ProcessPoolExecutor(
+            max_workers=len(groups),
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_parallel_worker,
+            initargs=(payload,),
+        )
+    except Exception as e:
+        _logger.error("Could not start parallel analysis: %s", e, exc_info=True)
+        return {
+            lc: AnalysisResult(
+                success=False,
+                converged=False,
+                message=f"{lc}: Analysis error - {str(e)}"
+            )
+            for lc in load_cases
+        }
+
+    with executor:
+        futures = [
+            executor.submit(
+                _solve_load_case_group,
+                group,
+                default_pattern,
+                include_element_forces,
+                factorize_once,
+                backend,
+                None if element_types is None else list(element_types),
+                autotune,
+                sparse_method,
+            )
+            for group in groups
+        ]
+        for group, future in zip(groups, futures):
+            try:
+                merged.update(future.result())
+            except Exception as e:
+                _logger.error("Load case group %s failed: %s", group, e, exc_info=True)
+                for lc in group:
+                    merged[lc] = AnalysisResult(
+                        success=False,
+                        converged=False,
+                        message=f"{lc}: Analysis error - {str(e)}"
+                    )
+
+    return {lc: merged[lc] for lc in load_cases}
+
+
+def _run_load_cases_sparse(
+    model,
+    load_cases: List[str],
+    default_pattern: int = 1,
+    include_element_forces: bool = True,
+    element_tags: Optional[Iterable[int]] = None,
+    method: str = "auto",
+) -> Dict[str, AnalysisResult]:
+    """Run load cases with the native scipy sparse backend."""
+    from src.fem.sparse_solver import SparseFEMSolver, analyze_model_sparse
+
+    if not SparseFEMSolver.check_availability():
+        error_result = AnalysisResult(
+            success=False,
+            converged=False,
+            message="Neither OpenSeesPy nor scipy is available. Install with: pip install openseespy scipy"
+        )
+        return {lc: error_result for lc in load_cases}
+
+    return analyze_model_sparse(
+        model,
+        load_cases,
+        load_pattern=default_pattern,
+        include_element_forces=include_element_forces,
+        method=method,
+        element_tags=element_tags,
+    )
+
+
 def _run_single_load_case(
     model,
     solver: FEMSolver,
     load_case: str,
     default_pattern: int = 1,
     include_element_forces: bool = True,
+    element_tags: Optional[Iterable[int]] = None,
     rebuild_structure: bool = True,
+    configuration: Optional["SolverConfiguration"] = None,
 ) -> AnalysisResult:
     """Run analysis for a single load case.
     
@@ -455,6 +928,8 @@ def _run_single_load_case(
         result = solver.run_linear_static_analysis(
             load_pattern=1,
             include_element_forces=include_element_forces,
+            element_tags=element_tags,
+            configuration=configuration,
         )
         result.message = f"{load_case}: {result.message}"
         return result
@@ -468,6 +943,82 @@ def _run_single_load_case(
         )
 
 
+def _run_load_cases_factorized(
+    model,
+    solver: FEMSolver,
+    load_cases: List[str],
+    default_pattern: int = 1,
+    include_element_forces: bool = True,
+    element_tags: Optional[Iterable[int]] = None,
+    reuse_structure: bool = False,
+    configuration: Optional["SolverConfiguration"] = None,
+) -> Dict[str, AnalysisResult]:
+    """Run several load cases against a single stiffness factorization.
+
+    The structure is built once and the analysis is configured with
+    ``Linear -factorOnce``. Each subsequent case only swaps the active load
+    pattern and back-substitutes against the stored factorization. Because
+    the Linear algorithm solves for the full unbalance ``P - K u``, the
+    displacements left over from the previous case do not need resetting.
+
+    If a case fails, the next case rebuilds the structure and re-factorizes
+    so a single bad case cannot poison the remaining results.
+
+    Args:
+        model: FEMModel instance
+        solver: FEMSolver instance
+        load_cases: Load case names (e.g., ["DL", "SDL", "LL"])
+        default_pattern: Pattern used for names missing from LOAD_CASE_PATTERN_MAP
+        reuse_structure: Patch the live domain for the first case instead of
+            rebuilding it (see ``analyze_model``)
+        configuration: Optional OpenSees configuration replacing the defaults
+
+    Returns:
+        Dict of {load_case_name: AnalysisResult} in ``load_cases`` order
+    """
+    results: Dict[str, AnalysisResult] = {}
+    factorized = False
+    rebuild = not reuse_structure
+
+    for lc in load_cases:
+        pattern_id = LOAD_CASE_PATTERN_MAP.get(lc, default_pattern)
+        try:
+            if factorized:
+                model.build_openseespy_model(
+                    active_pattern=pattern_id,
+                    rebuild_structure=False,
+                )
+                solver.ops.setTime(0.0)
+            else:
+                model.build_openseespy_model(
+                    active_pattern=pattern_id,
+                    rebuild_structure=rebuild,
+                )
+                rebuild = True
+                solver.reset_analysis_state()
+                solver.configure_linear_static_analysis(
+                    factor_once=True, configuration=configuration,
+                )
+
+            result = solver.solve_configured_analysis(
+                include_element_forces=include_element_forces,
+                element_tags=element_tags,
+            )
+        except Exception as e:
+            _logger.error("Load case '%s' failed: %s", lc, e, exc_info=True)
+            result = AnalysisResult(
+                success=False,
+                converged=False,
+                message=f"Analysis error - {str(e)}"
+            )
+
+        factorized = result.success
+        result.message = f"{lc}: {result.message}"
+        results[lc] = result
+
+    return results
+
+
 def print_analysis_summary(result: AnalysisResult) -> None:
     """Print formatted analysis summary.
     
@@ -480,6 +1031,12 @@ def print_analysis_summary(result: AnalysisResult) -> None:
     print(f"Status: {'SUCCESS' if result.success else 'FAILED'}")
     print(f"Message: {result.message}")
     print(f"Converged: {result.converged}")
+    if result.solver_configuration:
+        config = result.solver_configuration
+        print(f"Solver: {config['constraints']} / {config['numberer']} / {config['system']}"
+              f" (autotuned for {config['size_class']})")
+        for label, seconds in sorted(config.get("timings", {}).items(), key=lambda item: item[1]):
+            print(f"  {label}: {seconds*1000:.1f} ms")
     
     if result.success:
         print(f"\nNodes analyzed: {len(result.node_displacements)}")
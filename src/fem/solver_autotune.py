@@ -0,0 +1,352 @@
+"""
+Autotuning of the OpenSees analysis configuration.
+
+``FEMSolver`` defaults to Transformation constraints, the RCM numberer and
+the first available of UmfPack, SparseGeneral and BandGeneral. Which
+combination is fastest depends on the model: band solvers suit tall narrow
+frames, sparse LU suits shell meshes, and penalty constraints avoid the
+transformation of every diaphragm DOF.
+
+``SolverAutotuner`` times each compatible candidate on the actual model the
+first time a model size class is seen. A candidate counts only if its
+displacements match the reference configuration. Candidates much slower
+than the best so far are dropped after one solve, and benchmarking stops
+once a time budget is spent. The fastest equivalent choice is stored in a
+JSON file, so later runs of models in the same size class reuse it without
+benchmarking. ``tune_in_background`` benchmarks in a separate process so an
+interactive caller can solve with the defaults meanwhile.
+"""
+
+import json
+import logging
+import math
+import multiprocessing
+import os
+import pickle
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from src.fem.fem_engine import ElementType, FEMModel
+
+_logger = logging.getLogger(__name__)
+
+# OpenSees arguments of each constraint handler
+CONSTRAINT_HANDLERS: Dict[str, Tuple] = {
+    "Transformation": ("Transformation",),
+    "Penalty": ("Penalty", 1.0e14, 1.0e14),
+    "Lagrange": ("Lagrange",),
+}
+NUMBERERS = ("RCM", "AMD", "Plain")
+SYSTEMS = ("UmfPack", "SparseGeneral", "BandGeneral", "ProfileSPD")
+
+# Systems that need a positive definite matrix (not Lagrange multipliers)
+_SPD_SYSTEMS = ("ProfileSPD",)
+
+# Systems whose storage grows with the bandwidth, which only a bandwidth
+# reducing numberer keeps small
+_BANDWIDTH_SYSTEMS = ("BandGeneral", "ProfileSPD")
+
+# Max displacement difference relative to the reference, accepted as
+# equivalent. Penalty constraints of 1e14 differ by about 1e-6.
+EQUIVALENCE_RTOL = 1e-5
+
+# Wall-clock budget of one tuning run (s); later candidates are skipped
+DEFAULT_TIME_BUDGET = 30.0
+
+# A candidate whose first solve is this many times slower than the best so
+# far is dropped without repeats
+DEFAULT_PRUNE_FACTOR = 3.0
+
+CACHE_DIR_ENV = "PRELIMSTRUCT_CACHE_DIR"
+TUNING_FILENAME = "solver_tuning.json"
+
+_SHELL_TYPES = (ElementType.SHELL, ElementType.SHELL_MITC4, ElementType.SHELL_DKGT)
+
+
+def default_cache_dir() -> Path:
+    """Directory for persisted solver data (``$PRELIMSTRUCT_CACHE_DIR``)."""
+    return Path(os.environ.get(CACHE_DIR_ENV) or Path.home() / ".cache" / "prelimstruct")
+
+
+@dataclass(frozen=True)
+class SolverConfiguration:
+    """OpenSees constraint handler, DOF numberer and system of equations."""
+    constraints: str = "Transformation"
+    numberer: str = "RCM"
+    system: str = "UmfPack"
+
+    @property
+    def label(self) -> str:
+        return f"{self.constraints}/{self.numberer}/{self.system}"
+
+    def apply(self, ops) -> None:
+        """Define the three analysis objects in the current OpenSees domain."""
+        ops.constraints(*CONSTRAINT_HANDLERS[self.constraints])
+        ops.numberer(self.numberer)
+        ops.system(self.system)
+
+    def to_dict(self) -> Dict[str, str]:
+        return {"constraints": self.constraints, "numberer": self.numberer, "system": self.system}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, str]) -> "SolverConfiguration":
+        return cls(data["constraints"], data["numberer"], data["system"])
+
+
+@dataclass
+class AutotuneReport:
+    """Outcome of tuning, or of looking up a stored choice.
+
+    Attributes:
+        size_class: Model size class the choice is stored under
+        configuration: Fastest equivalent configuration
+        timings: Solve time (s) of each equivalent candidate by label
+        rejected: Reason each other candidate was dropped, by label
+        tuned: True if benchmarked in this run, False if loaded from disk
+    """
+    size_class: str
+    configuration: SolverConfiguration
+    timings: Dict[str, float] = field(default_factory=dict)
+    rejected: Dict[str, str] = field(default_factory=dict)
+    tuned: bool = False
+
+    def as_summary(self) -> Dict[str, object]:
+        """Plain dict for ``AnalysisResult.solver_configuration``."""
+        return {
+            **self.configuration.to_dict(),
+            "size_class": self.size_class,
+            "autotuned": True,
+            "timings": dict(self.timings),
+        }
+
+
+def model_size_class(model: FEMModel) -> str:
+    """Size class of a model: node count rounded up to a power of two,
+    plus whether it has shells and rigid diaphragms."""
+    n_nodes = max(len(model.nodes), 1)
+    bucket = 2 ** math.ceil(math.log2(n_nodes))
+    has_shells = any(elem.element_type in _SHELL_TYPES for elem in model.elements.values())
+    return f"n{bucket}-{'shell' if has_shells else 'frame'}{'-rd' if model.diaphragms else ''}"
+
+
+def candidate_configurations(model: FEMModel) -> List[SolverConfiguration]:
+    """Configurations worth benchmarking for ``model``, default first."""
+    candidates = []
+    for constraints in CONSTRAINT_HANDLERS:
+        # OpenSees aborts the process for Lagrange multipliers on rigidDiaphragm MPCs
+        if constraints == "Lagrange" and model.diaphragms:
+            continue
+        for numberer in NUMBERERS:
+            for system in SYSTEMS:
+                if constraints == "Lagrange" and system in _SPD_SYSTEMS:
+                    continue
+                if numberer == "Plain" and system in _BANDWIDTH_SYSTEMS:
+                    continue
+                candidates.append(SolverConfiguration(constraints, numberer, system))
+    return candidates
+
+
+class SolverAutotuner:
+    """Benchmark and persist the fastest OpenSees configuration per size class.
+
+    Args:
+        path: JSON file of stored choices (default: ``solver_tuning.json`` in
+            ``default_cache_dir()``)
+        candidates: Configurations to try (default: ``candidate_configurations``)
+        load_pattern: Load pattern solved while benchmarking
+        repeats: Timed solves per candidate; the fastest counts
+        rtol: Displacement tolerance for equivalence with the reference
+        time_budget: Seconds after which remaining candidates are skipped
+        prune_factor: Drop a candidate after one solve if it is this many
+            times slower than the fastest so far
+    """
+
+    def __init__(self,
+                 path: Optional[Path] = None,
+                 candidates: Optional[Iterable[SolverConfiguration]] = None,
+                 load_pattern: int = 1,
+                 repeats: int = 2,
+                 rtol: float = EQUIVALENCE_RTOL,
+                 time_budget: float = DEFAULT_TIME_BUDGET,
+                 prune_factor: float = DEFAULT_PRUNE_FACTOR):
+        self.path = Path(path) if path is not None else default_cache_dir() / TUNING_FILENAME
+        self.candidates = None if candidates is None else list(candidates)
+        self.load_pattern = load_pattern
+        self.repeats = max(1, repeats)
+        self.rtol = rtol
+        self.time_budget = time_budget
+        self.prune_factor = prune_factor
+
+    def lookup(self, model: FEMModel) -> Optional[AutotuneReport]:
+        """Stored choice for the size class of ``model``, if any."""
+        size_class = model_size_class(model)
+        entry = self._load().get(size_class)
+        if entry is None:
+            return None
+        try:
+            configuration = SolverConfiguration.from_dict(entry)
+        except KeyError:
+            return None
+        return AutotuneReport(
+            size_class=size_class,
+            configuration=configuration,
+            timings=dict(entry.get("timings", {})),
+        )
+
+    def configuration_for(self, model: FEMModel, solver=None) -> AutotuneReport:
+        """Stored choice for ``model``, benchmarking it on first use."""
+        return self.lookup(model) or self.tune(model, solver)
+
+    def tune(self, model: FEMModel, solver=None) -> AutotuneReport:
+        """Benchmark the candidates on ``model`` and store the fastest.
+
+        The first candidate that solves is the reference; candidates that
+        fail or whose displacements differ from it by more than ``rtol``
+        (relative to the largest reference displacement) are rejected, as
+        are candidates over ``prune_factor`` times slower than the fastest
+        so far and those left when ``time_budget`` runs out.
+
+        Args:
+            model: FEMModel to benchmark
+            solver: Optional FEMSolver to reuse
+
+        Returns:
+            AutotuneReport of this run
+
+        Raises:
+            RuntimeError: If OpenSeesPy is unavailable or no candidate solves
+        """
+        from src.fem.solver import FEMSolver
+
+        solver = solver or FEMSolver()
+        if not solver.check_availability():
+            raise RuntimeError("OpenSeesPy is not available. Install with: pip install openseespy")
+
+        size_class = model_size_class(model)
+        candidates = self.candidates or candidate_configurations(model)
+        node_tags = list(model.nodes)
+        model.build_openseespy_model(active_pattern=self.load_pattern)
+
+        timings: Dict[str, float] = {}
+        rejected: Dict[str, str] = {}
+        reference: Optional[np.ndarray] = None
+        started = time.perf_counter()
+        for candidate in candidates:
+            if timings and time.perf_counter() - started > self.time_budget:
+                rejected[candidate.label] = f"time budget of {self.time_budget:g} s exhausted"
+                continue
+            limit = self.prune_factor * min(timings.values()) if timings else math.inf
+            try:
+                elapsed, displacements = self._time_candidate(solver, candidate, node_tags, limit)
+            except Exception as e:
+                rejected[candidate.label] = str(e).strip() or e.__class__.__name__
+                continue
+            if reference is None:
+                reference = displacements
+            scale = max(float(np.abs(reference).max()), np.finfo(float).tiny)
+            difference = float(np.abs(displacements - reference).max()) / scale
+            if difference > self.rtol:
+                rejected[candidate.label] = f"displacements differ by {difference:.1e}"
+                continue
+            timings[candidate.label] = elapsed
+        solver.reset_analysis_state()
+
+        if not timings:
+            raise RuntimeError(f"No solver configuration could solve the model: {rejected}")
+        fastest = min(timings, key=timings.get)
+        configuration = next(c for c in candidates if c.label == fastest)
+        report = AutotuneReport(size_class, configuration, timings, rejected, tuned=True)
+        self._store(report)
+        _logger.info(
+            "Autotuned %s: %s (%.1f ms, %d candidates, %d rejected)",
+            size_class, fastest, timings[fastest] * 1000.0, len(candidates), len(rejected),
+        )
+        return report
+
+    def tune_in_background(self, model: FEMModel) -> bool:
+        """Start tuning ``model``'s size class in a separate process.
+
+        OpenSees keeps one domain per interpreter, so the benchmark runs in
+        a spawned process and leaves this one free to solve. The choice is
+        stored as by ``tune``; at most one run per size class and path is
+        started by this process.
+
+        Returns:
+            True if a tuning process was started
+        """
+        key = (str(self.path), model_size_class(model))
+        with _background_lock:
+            if key in _background_runs and _background_runs[key].is_alive():
+                return False
+            try:
+                process = multiprocessing.get_context("spawn").Process(
+                    target=_tune_in_subprocess,
+                    args=(pickle.dumps(model, protocol=pickle.HIGHEST_PROTOCOL), self),
+                    name=f"solver-autotune-{key[1]}",
+                    daemon=True,
+                )
+                process.start()
+            except Exception as e:
+                _logger.warning("Could not start background solver tuning: %s", e)
+                return False
+            _background_runs[key] = process
+        return True
+
+    def _time_candidate(self, solver, candidate: SolverConfiguration,
+                        node_tags: List[int], limit: float = math.inf) -> Tuple[float, np.ndarray]:
+        best = math.inf
+        for _ in range(self.repeats):
+            solver.reset_analysis_state()
+            solver.configure_linear_static_analysis(configuration=candidate, strict=True)
+            start = time.perf_counter()
+            code = solver.ops.analyze(1)
+            best = min(best, time.perf_counter() - start)
+            if code != 0:
+                raise RuntimeError(f"analyze returned {code}")
+            if best > limit:
+                raise RuntimeError(f"slower than {limit:.3g} s")
+        result = solver.extract_results(include_element_forces=False)
+        return best, result.node_displacements.rows_for(node_tags)
+
+    def _load(self) -> Dict[str, Dict]:
+        try:
+            with open(self.path, encoding="utf-8") as handle:
+                data = json.load(handle)
+        except (OSError, ValueError):
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def _store(self, report: AutotuneReport) -> None:
+        data = self._load()
+        data[report.size_class] = {
+            **report.configuration.to_dict(),
+            "timings": report.timings,
+            "tuned_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        }
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            scratch = self.path.with_suffix(f".{os.getpid()}.tmp")
+            with open(scratch, "w", encoding="utf-8") as handle:
+                json.dump(data, handle, indent=2, sort_keys=True)
+            os.replace(scratch, self.path)
+        except OSError as e:
+            _logger.warning("Could not store solver tuning in %s: %s", self.path, e)
+
+
+# Background tuning processes started by this interpreter, by (path, size class)
+_background_runs: Dict[Tuple[str, str], multiprocessing.process.BaseProcess] = {}
+_background_lock = threading.Lock()
+
+
+def _tune_in_subprocess(model_payload: bytes, tuner: SolverAutotuner) -> None:
+    """Entry point of ``SolverAutotuner.tune_in_background`` processes."""
+    try:
+        tuner.tune(pickle.loads(model_payload))
+    except Exception as e:
+        _logger.warning("Background solver tuning failed: %s", e)
@@ -0,0 +1,1168 @@
+"""
+Native sparse linear static solver for FEMModel.
+
+This module assembles the global stiffness matrix of a FEMModel directly
+with ``scipy.sparse`` and solves it with a sparse direct factorization.
+It mirrors the OpenSeesPy model produced by ``FEMModel.build_openseespy_model``:
+
+- ``elasticBeamColumn`` frames with ``Linear`` transformation (vecxz)
+- ``ShellMITC4`` quads (membrane + drilling, MITC4 plate)
+- ``ShellDKGT`` triangles (Allman drilling membrane, DKT plate)
+- Rigid diaphragms (perp_dirn=3) as a multi-point constraint transformation
+- Nodal fixities by eliminating restrained DOFs
+
+All requested load cases are solved against one factorization as a
+multi-column right-hand side and returned as ``AnalysisResult`` objects,
+so the backend can stand in for OpenSeesPy when it fails to load.
+
+Note:
+    Frames and ShellMITC4 quads match OpenSees to round-off. Triangles use
+    an Allman membrane, which approximates the DKGT membrane closely but
+    not exactly (displacements typically agree within 1e-4).
+"""
+
+import logging
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+from src.fem.fem_engine import ElementType, FEMModel
+from src.fem.result_tables import ElementForceTable, NodeResultTable
+from src.fem.solver import LOAD_CASE_PATTERN_MAP, AnalysisResult
+
+try:
+    import scipy.sparse as sp
+    import scipy.sparse.linalg as spla
+except ImportError:  # pragma: no cover - depends on environment
+    sp = None
+    spla = None
+
+try:
+    from sksparse.cholmod import cholesky as _cholmod_cholesky
+except ImportError:
+    _cholmod_cholesky = None
+
+_logger = logging.getLogger(__name__)
+
+DOFS_PER_NODE = 6
+
+SOLVER_METHODS = ("auto", "cholesky", "lu", "pcg", "minres")
+ITERATIVE_SOLVER_METHODS = ("pcg", "minres")
+
+# Element types built as elasticBeamColumn by build_openseespy_model
+FRAME_ELEMENT_TYPES = (
+    ElementType.ELASTIC_BEAM,
+    ElementType.SECONDARY_BEAM,
+    ElementType.BEAM_COLUMN,
+    ElementType.SHELL,
+    ElementType.COUPLING_BEAM,
+)
+
+# Transverse shear correction factor used by OpenSees plate sections
+SHEAR_CORRECTION = 5.0 / 6.0
+
+# Drilling penalty of triangles relative to G*h. Allman rotations already
+# carry in-plane stiffness; the penalty only suppresses the spurious
+# equal-rotation mode, and small values reproduce ShellDKGT.
+TRI_DRILLING_PENALTY = 1e-5
+
+# SuperLU settings for the symmetric reduced stiffness: a symmetric
+# minimum-degree ordering of A^T + A applied to rows and columns, keeping
+# diagonal pivots unless they fall below 1% of the column maximum. On a
+# 17,100-DOF tower this factorizes in 0.06 s with 0.9M fill, against
+# 4.1 s / 17M for COLAMD and 10 s / 25M for MMD_AT_PLUS_A alone, whose
+# column ordering SuperLU's partial pivoting otherwise discards.
+_LU_DIAG_PIVOT_THRESH = 0.01
+
+
+@dataclass
+class ElementBlock:
+    """Vectorized stiffness data for a group of same-type elements.
+
+    Attributes:
+        kind: "frame", "quad" or "tri"
+        tags: Element tags, shape (n,)
+        dofs: Global DOF indices per element, shape (n, ndof_e)
+        stiffness: Global element stiffness matrices, shape (n, ndof_e, ndof_e)
+        local_stiffness: Frame local stiffness (n, 12, 12); None for shells
+        transform: Frame global-to-local transformation (n, 12, 12); None for shells
+        lengths: Frame lengths (n,); None for shells
+    """
+    kind: str
+    tags: np.ndarray
+    dofs: np.ndarray
+    stiffness: np.ndarray
+    local_stiffness: Optional[np.ndarray] = None
+    transform: Optional[np.ndarray] = None
+    lengths: Optional[np.ndarray] = None
+
+
+@dataclass
+class SparseStiffnessSystem:
+    """Assembled global stiffness system of a FEMModel.
+
+    Attributes:
+        node_tags: Node tags in DOF order, shape (n_nodes,)
+        node_index: Mapping {node_tag: row in node_tags}
+        stiffness: Full global stiffness (6 * n_nodes square, CSR)
+        constraint_map: Map from reduced to full DOFs, ``u_full = T @ u_red``
+        reduced_stiffness: ``T.T @ K @ T`` restricted to active DOFs (CSC)
+        blocks: Element stiffness blocks used for assembly and force recovery
+        reaction_dofs: Boolean mask of full DOFs that report reactions
+            (fixities and both ends of rigid diaphragm constraints)
+        dropped_map: Columns of the constraint map removed because they carry
+            no stiffness; loads projecting onto them cannot be equilibrated
+    """
+    node_tags: np.ndarray
+    node_index: Dict[int, int]
+    stiffness: "sp.csr_matrix"
+    constraint_map: "sp.csr_matrix"
+    reduced_stiffness: "sp.csc_matrix"
+    blocks: List[ElementBlock] = field(default_factory=list)
+    reaction_dofs: Optional[np.ndarray] = None
+    dropped_map: Optional["sp.csr_matrix"] = None
+
+    @property
+    def n_dofs(self) -> int:
+        """Number of DOFs in the full (unconstrained) system."""
+        return self.stiffness.shape[0]
+
+    @property
+    def n_free(self) -> int:
+        """Number of independent DOFs solved for."""
+        return self.reduced_stiffness.shape[0]
+
+    def expand(self, reduced: np.ndarray) -> np.ndarray:
+        """Expand reduced DOF vectors (n_free,) or (n_free, m) to full DOFs."""
+        return self.constraint_map @ reduced
+
+    def reduce(self, full: np.ndarray) -> np.ndarray:
+        """Project full DOF load vectors onto the reduced DOFs."""
+        return self.constraint_map.T @ full
+
+
+# ---------------------------------------------------------------------------
+# Element stiffness
+# ---------------------------------------------------------------------------
+
+def _frame_local_stiffness(length: np.ndarray,
+                           E: np.ndarray,
+                           A: np.ndarray,
+                           G: np.ndarray,
+                           J: np.ndarray,
+                           Iy: np.ndarray,
+                           Iz: np.ndarray) -> np.ndarray:
+    """Euler-Bernoulli 3D frame stiffness in local coordinates, (n, 12, 12)."""
+    n = length.shape[0]
+    L = length
+    k = np.zeros((n, 12, 12))
+
+    ea = E * A / L
+    gj = G * J / L
+    k[:, 0, 0] = k[:, 6, 6] = ea
+    k[:, 0, 6] = k[:, 6, 0] = -ea
+    k[:, 3, 3] = k[:, 9, 9] = gj
+    k[:, 3, 9] = k[:, 9, 3] = -gj
+
+    # Bending in the local x-y plane (Iz): v and rz
+    z12, z6, z4, z2 = (12 * E * Iz / L**3, 6 * E * Iz / L**2,
+                       4 * E * Iz / L, 2 * E * Iz / L)
+    bz = np.stack([
+        np.stack([z12, z6, -z12, z6], axis=-1),
+        np.stack([z6, z4, -z6, z2], axis=-1),
+        np.stack([-z12, -z6, z12, -z6], axis=-1),
+        np.stack([z6, z2, -z6, z4], axis=-1),
+    ], axis=1)
+    iz = np.array([1, 5, 7, 11])
+    k[:, iz[:, None], iz[None, :]] = bz
+
+    # Bending in the local x-z plane (Iy): w and ry
+    y12, y6, y4, y2 = (12 * E * Iy / L**3, 6 * E * Iy / L**2,
+                       4 * E * Iy / L, 2 * E * Iy / L)
+    by = np.stack([
+        np.stack([y12, -y6, -y12, -y6], axis=-1),
+        np.stack([-y6, y4, y6, y2], axis=-1),
+        np.stack([-y12, y6, y12, y6], axis=-1),
+        np.stack([-y6, y2, y6, y4], axis=-1),
+    ], axis=1)
+    iy = np.array([2, 4, 8, 10])
+    k[:, iy[:, None], iy[None, :]] = by
+    return k
+
+
+def _congruent(transform: np.ndarray, local: np.ndarray) -> np.ndarray:
+    """Batched ``T^T K T`` of (n, m, m) stacks, as matmuls rather than einsum."""
+    return transform.transpose(0, 2, 1) @ local @ transform
+
+
+def _block_diagonal(rotation: np.ndarray, n_blocks: int) -> np.ndarray:
+    """Stack (n, 3, 3) rotations into (n, 3*n_blocks, 3*n_blocks) transforms."""
+    n = rotation.shape[0]
+    size = 3 * n_blocks
+    transform = np.zeros((n, size, size))
+    for b in range(n_blocks):
+        transform[:, 3 * b:3 * b + 3, 3 * b:3 * b + 3] = rotation
+    return transform
+
+
+def _frame_rotation(xi: np.ndarray, xj: np.ndarray,
+                    vecxz: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Local axes of OpenSees ``Linear`` transformation, rows = (x, y, z)."""
+    dx = xj - xi
+    length = np.linalg.norm(dx, axis=1)
+    if np.any(length <= 0.0):
+        raise ValueError("Frame element has zero length")
+    ex = dx / length[:, None]
+    ey = np.cross(vecxz, ex)
+    ey_norm = np.linalg.norm(ey, axis=1)
+    if np.any(ey_norm < 1e-12):
+        raise ValueError("Frame vecxz is parallel to the element axis")
+    ey /= ey_norm[:, None]
+    ez = np.cross(ex, ey)
+    return np.stack([ex, ey, ez], axis=1), length
+
+
+def _shell_constitutive(E: np.ndarray, nu: np.ndarray,
+                        h: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Membrane, bending, shear and drilling rigidities for elastic shells."""
+    base = np.zeros((E.shape[0], 3, 3))
+    base[:, 0, 0] = base[:, 1, 1] = 1.0
+    base[:, 0, 1] = base[:, 1, 0] = nu
+    base[:, 2, 2] = 0.5 * (1.0 - nu)
+    scale = E / (1.0 - nu**2)
+    membrane = base * (scale * h)[:, None, None]
+    bending = base * (scale * h**3 / 12.0)[:, None, None]
+    G = E / (2.0 * (1.0 + nu))
+    shear = SHEAR_CORRECTION * G * h
+    drilling = G * h
+    return membrane, bending, shear, drilling
+
+
+def _shell_basis(coords: np.ndarray) -> np.ndarray:
+    """Element basis (n, 3, 3), rows = (e1, e2, e3), following OpenSees shells."""
+    if coords.shape[1] == 4:
+        v1 = 0.5 * (coords[:, 1] + coords[:, 2] - coords[:, 0] - coords[:, 3])
+        v2 = 0.5 * (coords[:, 2] + coords[:, 3] - coords[:, 0] - coords[:, 1])
+    else:
+        v1 = coords[:, 1] - coords[:, 0]
+        v2 = coords[:, 2] - coords[:, 0]
+    e1 = v1 / np.linalg.norm(v1, axis=1)[:, None]
+    v2 = v2 - np.sum(v2 * e1, axis=1)[:, None] * e1
+    e2 = v2 / np.linalg.norm(v2, axis=1)[:, None]
+    e3 = np.cross(e1, e2)
+    return np.stack([e1, e2, e3], axis=1)
+
+
+def _shell_point_matrices(N: np.ndarray, dNx: np.ndarray,
+                          dNy: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Membrane, drilling and bending B matrices at one integration point.
+
+    Args:
+        N: Shape functions, (n_nodes,)
+        dNx, dNy: Cartesian derivatives, (n, n_nodes)
+
+    Returns:
+        (B_membrane (n,3,6k), B_drill (n,6k), B_bending (n,3,6k))
+    """
+    n, nn = dNx.shape
+    bm = np.zeros((n, 3, 6 * nn))
+    bd = np.zeros((n, 6 * nn))
+    bb = np.zeros((n, 3, 6 * nn))
+    for a in range(nn):
+        u, v, rx, ry, rz = 6 * a, 6 * a + 1, 6 * a + 3, 6 * a + 4, 6 * a + 5
+        bm[:, 0, u] = dNx[:, a]
+        bm[:, 1, v] = dNy[:, a]
+        bm[:, 2, u] = dNy[:, a]
+        bm[:, 2, v] = dNx[:, a]
+        # Hughes-Brezzi drilling strain: 0.5 * (dv/dx - du/dy) - rz
+        bd[:, u] = -0.5 * dNy[:, a]
+        bd[:, v] = 0.5 * dNx[:, a]
+        bd[:, rz] = -N[a]
+        # Mindlin plate with u = z * ry, v = -z * rx
+        bb[:, 0, ry] = dNx[:, a]
+        bb[:, 1, rx] = -dNy[:, a]
+        bb[:, 2, ry] = dNy[:, a]
+        bb[:, 2, rx] = -dNx[:, a]
+    return bm, bd, bb
+
+
+def _covariant_shear(N: np.ndarray, dNr: np.ndarray, dNs: np.ndarray,
+                     x: np.ndarray, y: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Covariant transverse shear strain rows (e_r, e_s) at one point, each (n, 6k)."""
+    n, nn = x.shape
+    x_r, y_r = x @ dNr, y @ dNr
+    x_s, y_s = x @ dNs, y @ dNs
+    e_r = np.zeros((n, 6 * nn))
+    e_s = np.zeros((n, 6 * nn))
+    for a in range(nn):
+        w, rx, ry = 6 * a + 2, 6 * a + 3, 6 * a + 4
+        e_r[:, w] = dNr[a]
+        e_r[:, ry] = N[a] * x_r
+        e_r[:, rx] = -N[a] * y_r
+        e_s[:, w] = dNs[a]
+        e_s[:, ry] = N[a] * x_s
+        e_s[:, rx] = -N[a] * y_s
+    return e_r, e_s
+
+
+def _quad_functions(r: float, s: float) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    ra = np.array([-1.0, 1.0, 1.0, -1.0])
+    sa = np.array([-1.0, -1.0, 1.0, 1.0])
+    N = 0.25 * (1 + r * ra) * (1 + s * sa)
+    dNr = 0.25 * ra * (1 + s * sa)
+    dNs = 0.25 * sa * (1 + r * ra)
+    return N, dNr, dNs
+
+
+def _tri_functions(r: float, s: float) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    N = np.array([1.0 - r - s, r, s])
+    dNr = np.array([-1.0, 1.0, 0.0])
+    dNs = np.array([-1.0, 0.0, 1.0])
+    return N, dNr, dNs
+
+
+def _jacobian(dNr: np.ndarray, dNs: np.ndarray,
+              x: np.ndarray, y: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Jacobian inverse (n, 2, 2) and determinant (n,) at one point."""
+    jac = np.empty((x.shape[0], 2, 2))
+    jac[:, 0, 0] = x @ dNr
+    jac[:, 0, 1] = y @ dNr
+    jac[:, 1, 0] = x @ dNs
+    jac[:, 1, 1] = y @ dNs
+    det = jac[:, 0, 0] * jac[:, 1, 1] - jac[:, 0, 1] * jac[:, 1, 0]
+    if np.any(det <= 0.0):
+        raise ValueError("Shell element has zero or negative area")
+    inv = np.empty_like(jac)
+    inv[:, 0, 0] = jac[:, 1, 1] / det
+    inv[:, 0, 1] = -jac[:, 0, 1] / det
+    inv[:, 1, 0] = -jac[:, 1, 0] / det
+    inv[:, 1, 1] = jac[:, 0, 0] / det
+    return inv, det
+
+
+def _dkt_bending(x: np.ndarray, y: np.ndarray, r: float, s: float) -> np.ndarray:
+    """Discrete Kirchhoff triangle curvature matrix (Batoz et al., 1980).
+
+    Returns:
+        B matrix (n, 3, 18) acting on element-local DOFs, with the same
+        curvature convention as ``_shell_point_matrices``.
+    """
+    x23, x31, x12 = x[:, 1] - x[:, 2], x[:, 2] - x[:, 0], x[:, 0] - x[:, 1]
+    y23, y31, y12 = y[:, 1] - y[:, 2], y[:, 2] - y[:, 0], y[:, 0] - y[:, 1]
+
+    def side(xij: np.ndarray, yij: np.ndarray) -> Tuple[np.ndarray, ...]:
+        l2 = xij**2 + yij**2
+        return -6 * xij / l2, 3 * xij * yij / l2, -6 * yij / l2, 3 * yij**2 / l2
+
+    P4, q4, t4, r4 = side(x23, y23)
+    P5, q5, t5, r5 = side(x31, y31)
+    P6, q6, t6, r6 = side(x12, y12)
+    a, b = 1 - 2 * r, 1 - 2 * s
+
+    hx_r = np.stack([P6 * a + (P5 - P6) * s, q6 * a - (q5 + q6) * s,
+                     -4 + 6 * (r + s) + r6 * a - s * (r5 + r6),
+                     -P6 * a + s * (P4 + P6), q6 * a - s * (q6 - q4),
+                     -2 + 6 * r + r6 * a + s * (r4 - r6),
+                     -s * (P5 + P4), s * (q4 - q5), -s * (r5 - r4)], axis=1)
+    hy_r = np.stack([t6 * a + s * (t5 - t6), 1 + r6 * a - s * (r5 + r6),
+                     -q6 * a + s * (q5 + q6),
+                     -t6 * a + s * (t4 + t6), -1 + r6 * a + s * (r4 - r6),
+                     -q6 * a - s * (q4 - q6),
+                     -s * (t4 + t5), s * (r4 - r5), -s * (q4 - q5)], axis=1)
+    hx_s = np.stack([-P5 * b - r * (P6 - P5), q5 * b - r * (q5 + q6),
+                     -4 + 6 * (r + s) + r5 * b - r * (r5 + r6),
+                     r * (P4 + P6), r * (q4 - q6), -r * (r6 - r4),
+                     P5 * b - r * (P4 + P5), q5 * b + r * (q4 - q5),
+                     -2 + 6 * s + r5 * b + r * (r4 - r5)], axis=1)
+    hy_s = np.stack([-t5 * b - r * (t6 - t5), 1 + r5 * b - r * (r5 + r6),
+                     -q5 * b + r * (q5 + q6),
+                     r * (t4 + t6), r * (r4 - r6), -r * (q4 - q6),
+                     t5 * b - r * (t4 + t5), -1 + r5 * b + r * (r4 - r5),
+                     -q5 * b - r * (q4 - q5)], axis=1)
+
+    area2 = (x31 * y12 - x12 * y31)[:, None]
+    # Batoz rotations (w, w_y, -w_x) are the local (w, rx, ry) shell DOFs
+    b9 = np.stack([
+        (y31[:, None] * hx_r + y12[:, None] * hx_s) / area2,
+        (-x31[:, None] * hy_r - x12[:, None] * hy_s) / area2,
+        (-x31[:, None] * hx_r - x12[:, None] * hx_s
+         + y31[:, None] * hy_r + y12[:, None] * hy_s) / area2,
+    ], axis=1)
+    bb = np.zeros((x.shape[0], 3, 18))
+    plate_dofs = (np.arange(3)[:, None] * 6 + np.array([2, 3, 4])).ravel()
+    bb[:, :, plate_dofs] = b9
+    return bb
+
+
+def _allman_membrane(x: np.ndarray, y: np.ndarray, r: float, s: float,
+                     inv: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Allman membrane with drilling rotations for 3-node shells.
+
+    The quadratic (LST) field is driven by corner translations and drilling
+    rotations: each mid-side displacement is the edge average plus
+    ``l/8 * (w_j - w_i)`` along the outward edge normal.
+
+    Returns:
+        (B_membrane (n, 3, 18), B_drill (n, 18)) at the point (r, s)
+    """
+    n = x.shape[0]
+    L = np.array([1.0 - r - s, r, s])
+    dL = np.array([[-1.0, -1.0], [1.0, 0.0], [0.0, 1.0]])  # dL_i/d(r, s)
+    edges = ((0, 1), (1, 2), (2, 0))
+
+    # LST shape function derivatives in (r, s): corners then mid-sides
+    d_nat = np.zeros((6, 2))
+    for i in range(3):
+        d_nat[i] = (4.0 * L[i] - 1.0) * dL[i]
+    for m, (i, j) in enumerate(edges):
+        d_nat[3 + m] = 4.0 * (L[i] * dL[j] + L[j] * dL[i])
+    dN = np.einsum('nij,aj->nia', inv, d_nat)  # (n, 2, 6): d/dx, d/dy
+
+    # Map LST DOFs (u, v) x 6 onto corner DOFs (u, v, rz) x 3
+    G = np.zeros((n, 12, 9))
+    for i in range(3):
+        G[:, 2 * i, 3 * i] = 1.0
+        G[:, 2 * i + 1, 3 * i + 1] = 1.0
+    for m, (i, j) in enumerate(edges):
+        dx, dy = x[:, j] - x[:, i], y[:, j] - y[:, i]
+        # Outward normal times length for counter-clockwise nodes: (dy, -dx)
+        for a, b in ((i, -1.0), (j, 1.0)):
+            G[:, 2 * (3 + m), 3 * a] = 0.5
+            G[:, 2 * (3 + m) + 1, 3 * a + 1] = 0.5
+            G[:, 2 * (3 + m), 3 * a + 2] = b * dy / 8.0
+            G[:, 2 * (3 + m) + 1, 3 * a + 2] = -b * dx / 8.0
+
+    b_lst = np.zeros((n, 3, 12))
+    b_lst[:, 0, 0::2] = dN[:, 0]
+    b_lst[:, 1, 1::2] = dN[:, 1]
+    b_lst[:, 2, 0::2] = dN[:, 1]
+    b_lst[:, 2, 1::2] = dN[:, 0]
+    d_lst = np.zeros((n, 12))
+    d_lst[:, 0::2] = -0.5 * dN[:, 1]
+    d_lst[:, 1::2] = 0.5 * dN[:, 0]
+
+    b9 = np.einsum('nij,njk->nik', b_lst, G)
+    d9 = np.einsum('nj,njk->nk', d_lst, G)
+    d9[:, 2::3] -= L  # drilling strain: skew(grad u) - rz
+
+    membrane_dofs = (np.arange(3)[:, None] * 6 + np.array([0, 1, 5])).ravel()
+    bm = np.zeros((n, 3, 18))
+    bd = np.zeros((n, 18))
+    bm[:, :, membrane_dofs] = b9
+    bd[:, membrane_dofs] = d9
+    return bm, bd
+
+
+def _shell_local_stiffness(x: np.ndarray, y: np.ndarray, E: np.ndarray,
+                           nu: np.ndarray, h: np.ndarray) -> np.ndarray:
+    """Flat shell stiffness in element coordinates, (n, 6k, 6k).
+
+    Quads use 2x2 Gauss integration with MITC4 tying of the transverse
+    shear and a Hughes-Brezzi drilling term. Triangles use a 3-point rule
+    with an Allman drilling membrane and DKT (Kirchhoff) bending.
+    """
+    n, nn = x.shape
+    Dm, Db, ks, ktt = _shell_constitutive(E, nu, h)
+    k = np.zeros((n, 6 * nn, 6 * nn))
+
+    if nn == 4:
+        g = 1.0 / np.sqrt(3.0)
+        points = [(-g, -g, 1.0), (g, -g, 1.0), (g, g, 1.0), (-g, g, 1.0)]
+        functions = _quad_functions
+        # MITC4 tying points: e_r at (0, -1) and (0, 1), e_s at (-1, 0) and (1, 0)
+        e_r_a, _ = _covariant_shear(*_quad_functions(0.0, -1.0), x, y)
+        e_r_c, _ = _covariant_shear(*_quad_functions(0.0, 1.0), x, y)
+        _, e_s_d = _covariant_shear(*_quad_functions(-1.0, 0.0), x, y)
+        _, e_s_b = _covariant_shear(*_quad_functions(1.0, 0.0), x, y)
+
+        def assumed_shear(r: float, s: float) -> Tuple[np.ndarray, np.ndarray]:
+            e_r = 0.5 * (1 - s) * e_r_a + 0.5 * (1 + s) * e_r_c
+            e_s = 0.5 * (1 - r) * e_s_d + 0.5 * (1 + r) * e_s_b
+            return e_r, e_s
+    elif nn == 3:
+        sixth = 1.0 / 6.0
+        points = [(sixth, sixth, sixth), (4 * sixth, sixth, sixth), (sixth, 4 * sixth, sixth)]
+        functions = _tri_functions
+        assumed_shear = None
+    else:
+        raise ValueError(f"Shell elements require 3 or 4 nodes, got {nn}")
+
+    for r, s, weight in points:
+        N, dNr, dNs = functions(r, s)
+        inv, det = _jacobian(dNr, dNs, x, y)
+        dNx = inv[:, 0, 0, None] * dNr + inv[:, 0, 1, None] * dNs
+        dNy = inv[:, 1, 0, None] * dNr + inv[:, 1, 1, None] * dNs
+        bm, bd, bb = _shell_point_matrices(N, dNx, dNy)
+        drilling = ktt
+        if nn == 3:
+            bm, bd = _allman_membrane(x, y, r, s, inv)
+            drilling = TRI_DRILLING_PENALTY * ktt
+
+        dv = weight * det
+        k += _congruent(bm, Dm) * dv[:, None, None]
+        k += np.einsum('ni,nk->nik', bd, bd) * (drilling * dv)[:, None, None]
+        if assumed_shear is None:
+            # Kirchhoff triangle: DKT curvatures, no transverse shear
+            bb = _dkt_bending(x, y, r, s)
+        else:
+            e_r, e_s = assumed_shear(r, s)
+            bs = np.einsum('nij,njk->nik', inv, np.stack([e_r, e_s], axis=1))
+            k += np.einsum('nji,njk->nik', bs, bs) * (ks * dv)[:, None, None]
+        k += _congruent(bb, Db) * dv[:, None, None]
+    return k
+
+
+# ---------------------------------------------------------------------------
+# Assembly
+# ---------------------------------------------------------------------------
+
+def _node_dofs(node_index: Dict[int, int], node_tags: Sequence[Sequence[int]]) -> np.ndarray:
+    rows = np.array([[node_index[t] for t in tags] for tags in node_tags], dtype=np.int64)
+    return (rows[:, :, None] * DOFS_PER_NODE + np.arange(DOFS_PER_NODE)).reshape(len(rows), -1)
+
+
+def _frame_block(model: FEMModel, elements: list, node_index: Dict[int, int],
+                 coords: np.ndarray) -> ElementBlock:
+    props = np.empty((len(elements), 6))
+    vecxz = np.empty((len(elements), 3))
+    for row, elem in enumerate(elements):
+        if elem.section_tag is None:
+            raise ValueError(f"Element {elem.tag} missing section_tag")
+        if elem.section_tag not in model.sections:
+            raise ValueError(
+                f"Element {elem.tag} references unknown section {elem.section_tag}"
+            )
+        section = model.sections[elem.section_tag]
+        props[row] = (section['E'], section['A'], section['G'],
+                      section['J'], section['Iy'], section['Iz'])
+        vecxz[row] = elem.geometry.get('vecxz', (0.0, 0.0, 1.0))
+
+    ends = np.array([[node_index[t] for t in elem.node_tags[:2]] for elem in elements])
+    rotation, length = _frame_rotation(coords[ends[:, 0]], coords[ends[:, 1]], vecxz)
+    local = _frame_local_stiffness(length, *props.T)
+    transform = _block_diagonal(rotation, 4)
+    stiffness = _congruent(transform, local)
+    return ElementBlock(
+        kind="frame",
+        tags=np.array([elem.tag for elem in elements], dtype=np.int64),
+        dofs=_node_dofs(node_index, [elem.node_tags[:2] for elem in elements]),
+        stiffness=stiffness,
+        local_stiffness=local,
+        transform=transform,
+        lengths=length,
+    )
+
+
+def _shell_properties(model: FEMModel, elem) -> Tuple[float, float, float]:
+    if elem.section_tag is None:
+        raise ValueError(f"Element {elem.tag} missing section_tag")
+    section = model.sections.get(elem.section_tag)
+    if section is None:
+        raise ValueError(f"Element {elem.tag} references unknown section {elem.section_tag}")
+    if section['section_type'] == 'ElasticMembranePlateSection':
+        return section['E'], section['nu'], section['h']
+    if section['section_type'] == 'PlateFiber':
+        material = model.materials.get(section['matTag'])
+        if material is None:
+            raise ValueError(
+                f"Section {elem.section_tag} references unknown material {section['matTag']}"
+            )
+        return material['E'], material['nu'], section['h']
+    raise ValueError(
+        f"Section type {section['section_type']} not supported for shell element {elem.tag}"
+    )
+
+
+def _shell_block(model: FEMModel, elements: list, node_index: Dict[int, int],
+                 coords: np.ndarray, kind: str) -> ElementBlock:
+    props = np.array([_shell_properties(model, elem) for elem in elements], dtype=float)
+    conn = np.array([[node_index[t] for t in elem.node_tags] for elem in elements])
+    xyz = coords[conn]
+    basis = _shell_basis(xyz)
+    rel = xyz - xyz.mean(axis=1, keepdims=True)
+    x = np.einsum('nak,nk->na', rel, basis[:, 0])
+    y = np.einsum('nak,nk->na', rel, basis[:, 1])
+    local = _shell_local_stiffness(x, y, *props.T)
+    transform = _block_diagonal(basis, 2 * conn.shape[1])
+    stiffness = _congruent(transform, local)
+    return ElementBlock(
+        kind=kind,
+        tags=np.array([elem.tag for elem in elements], dtype=np.int64),
+        dofs=_node_dofs(node_index, [elem.node_tags for elem in elements]),
+        stiffness=stiffness,
+    )
+
+
+def _assemble_blocks(blocks: List[ElementBlock], n_dofs: int) -> "sp.csr_matrix":
+    rows, cols, data = [], [], []
+    for block in blocks:
+        size = block.dofs.shape[1]
+        rows.append(np.repeat(block.dofs, size, axis=1).ravel())
+        cols.append(np.tile(block.dofs, (1, size)).ravel())
+        data.append(block.stiffness.ravel())
+    if not rows:
+        return sp.csr_matrix((n_dofs, n_dofs))
+    return sp.coo_matrix(
+        (np.concatenate(data), (np.concatenate(rows), np.concatenate(cols))),
+        shape=(n_dofs, n_dofs),
+    ).tocsr()
+
+
+def _constraint_map(model: FEMModel, node_index: Dict[int, int],
+                    coords: np.ndarray) -> Tuple["sp.csr_matrix", np.ndarray]:
+    """Build ``u_full = T @ u_red`` for fixities and rigid diaphragms.
+
+    Returns:
+        (T, reaction_dofs) where ``reaction_dofs`` flags fixed DOFs and the
+        master/slave DOFs of diaphragm constraints, which is where OpenSees
+        reports non-zero reactions.
+    """
+    n_dofs = len(node_index) * DOFS_PER_NODE
+    fixed = np.zeros(n_dofs, dtype=bool)
+    for tag, node in model.nodes.items():
+        base = node_index[tag] * DOFS_PER_NODE
+        fixed[base:base + DOFS_PER_NODE] = np.asarray(node.restraints, dtype=bool)
+
+    slave_rows: Dict[int, List[Tuple[int, float]]] = {}
+    is_master = np.zeros(n_dofs, dtype=bool)
+    for diaphragm in model.diaphragms:
+        if diaphragm.perp_dirn != 3:
+            raise ValueError("Rigid diaphragms are only supported with perp_dirn=3")
+        m = node_index[diaphragm.master_node]
+        xm, ym = coords[m, 0], coords[m, 1]
+        mb = m * DOFS_PER_NODE
+        is_master[[mb + 0, mb + 1, mb + 5]] = True
+        for slave in diaphragm.slave_nodes:
+            s = node_index[slave]
+            sb = s * DOFS_PER_NODE
+            dx, dy = coords[s, 0] - xm, coords[s, 1] - ym
+            slave_rows[sb + 0] = [(mb + 0, 1.0), (mb + 5, -dy)]
+            slave_rows[sb + 1] = [(mb + 1, 1.0), (mb + 5, dx)]
+            slave_rows[sb + 5] = [(mb + 5, 1.0)]
+
+    is_slave = np.zeros(n_dofs, dtype=bool)
+    if slave_rows:
+        is_slave[np.fromiter(slave_rows.keys(), dtype=np.int64)] = True
+    independent = ~is_slave & ~fixed
+    column = np.full(n_dofs, -1, dtype=np.int64)
+    column[independent] = np.arange(int(independent.sum()))
+
+    rows = list(np.flatnonzero(independent))
+    cols = list(column[independent])
+    vals = [1.0] * len(rows)
+    for slave_dof, terms in slave_rows.items():
+        for master_dof, coeff in terms:
+            if column[master_dof] >= 0 and coeff != 0.0:
+                rows.append(slave_dof)
+                cols.append(column[master_dof])
+                vals.append(coeff)
+
+    T = sp.csr_matrix(
+        (vals, (rows, cols)),
+        shape=(n_dofs, int(independent.sum())),
+    )
+    return T, fixed | is_slave | is_master
+
+
+def assemble_stiffness_system(model: FEMModel) -> SparseStiffnessSystem:
+    """Assemble the sparse global stiffness system of a FEMModel.
+
+    Args:
+        model: FEMModel instance
+
+    Returns:
+        SparseStiffnessSystem with full and reduced stiffness matrices
+
+    Raises:
+        ImportError: If scipy is not installed
+        ValueError: If the model uses unsupported elements or sections
+    """
+    if sp is None:
+        raise ImportError("scipy is not installed. Install with: pip install scipy")
+
+    node_tags = np.array(list(model.nodes.keys()), dtype=np.int64)
+    node_index = {int(tag): i for i, tag in enumerate(node_tags)}
+    coords = np.array([[n.x, n.y, n.z] for n in model.nodes.values()], dtype=float)
+    coords = coords.reshape(-1, 3)
+
+    frames, quads, tris = [], [], []
+    for elem in model.elements.values():
+        if elem.element_type in FRAME_ELEMENT_TYPES:
+            frames.append(elem)
+        elif elem.element_type == ElementType.SHELL_MITC4:
+            if len(elem.node_tags) != 4:
+                raise ValueError(
+                    f"ShellMITC4 element {elem.tag} requires exactly 4 nodes, "
+                    f"got {len(elem.node_tags)}"
+                )
+            quads.append(elem)
+        elif elem.element_type == ElementType.SHELL_DKGT:
+            if len(elem.node_tags) != 3:
+                raise ValueError(
+                    f"ShellDKGT element {elem.tag} requires exactly 3 nodes, "
+                    f"got {len(elem.node_tags)}"
+                )
+            tris.append(elem)
+        else:
+            raise ValueError(
+                f"Element type {elem.element_type.value} not supported in sparse solver"
+            )
+
+    blocks: List[ElementBlock] = []
+    if frames:
+        blocks.append(_frame_block(model, frames, node_index, coords))
+    if quads:
+        blocks.append(_shell_block(model, quads, node_index, coords, "quad"))
+    if tris:
+        blocks.append(_shell_block(model, tris, node_index, coords, "tri"))
+
+    n_dofs = len(node_tags) * DOFS_PER_NODE
+    K = _assemble_blocks(blocks, n_dofs)
+    T, reaction_dofs = _constraint_map(model, node_index, coords)
+
+    # DOFs without stiffness (e.g. an unconnected rotation) are dropped so the
+    # factorization stays regular; loads on them are reported at solve time.
+    K_red = (T.T @ K @ T).tocsc()
+    active = np.abs(K_red.diagonal()) > 0.0
+    dropped_map = None
+    if not np.all(active):
+        _logger.debug("Dropping %d DOFs without stiffness", int((~active).sum()))
+        dropped_map = T[:, ~active].tocsr()
+        T = T[:, active].tocsr()
+        K_red = K_red[active][:, active].tocsc()
+
+    return SparseStiffnessSystem(
+        node_tags=node_tags,
+        node_index=node_index,
+        stiffness=K,
+        constraint_map=T,
+        reduced_stiffness=K_red,
+        blocks=blocks,
+        reaction_dofs=reaction_dofs,
+        dropped_map=dropped_map,
+    )
+
+
+# ---------------------------------------------------------------------------
+# Loads
+# ---------------------------------------------------------------------------
+
+@dataclass
+class PatternLoads:
+    """Load vectors of one load pattern.
+
+    Attributes:
+        nodal: Full-DOF equivalent nodal load vector, shape (n_dofs,)
+        frame_fixed_end: Frame fixed-end forces in local coordinates,
+            {element_tag: (12,) array}, added back during force recovery
+    """
+    nodal: np.ndarray
+    frame_fixed_end: Dict[int, np.ndarray] = field(default_factory=dict)
+
+
+def _frame_fixed_end_forces(wy: float, wz: float, length: float) -> np.ndarray:
+    """Local fixed-end forces of ElasticBeam3d under beamUniform (wy, wz)."""
+    vy = 0.5 * wy * length
+    vz = 0.5 * wz * length
+    my = wz * length**2 / 12.0
+    mz = wy * length**2 / 12.0
+    return np.array([0.0, -vy, -vz, 0.0, my, -mz,
+                     0.0, -vy, -vz, 0.0, -my, mz])
+
+
+def build_pattern_loads(model: FEMModel,
+                        system: SparseStiffnessSystem) -> Dict[int, PatternLoads]:
+    """Build load vectors for every load pattern in the model.
+
+    Nodal, beam uniform and surface loads are converted exactly as
+    ``FEMModel.build_openseespy_model`` applies them to OpenSeesPy.
+
+    Returns:
+        Dict of {pattern_id: PatternLoads}
+    """
+    n_dofs = system.n_dofs
+    node_index = system.node_index
+    patterns: Dict[int, PatternLoads] = {}
+
+    def pattern(pattern_id: int) -> PatternLoads:
+        if pattern_id not in patterns:
+            patterns[pattern_id] = PatternLoads(nodal=np.zeros(n_dofs))
+        return patterns[pattern_id]
+
+    for load in model.loads:
+        base = node_index[load.node_tag] * DOFS_PER_NODE
+        pattern(load.load_pattern).nodal[base:base + DOFS_PER_NODE] += load.load_values[:DOFS_PER_NODE]
+
+    frame_rows = {}
+    for block in system.blocks:
+        if block.kind == "frame":
+            for row, tag in enumerate(block.tags):
+                frame_rows[int(tag)] = (block, row)
+
+    for uniform_load in model.uniform_loads:
+        target = pattern(uniform_load.load_pattern)
+        if uniform_load.visual_only:
+            continue
+        if uniform_load.element_tag not in frame_rows:
+            raise ValueError(
+                f"Uniform load on element {uniform_load.element_tag} requires a frame element"
+            )
+        block, row = frame_rows[uniform_load.element_tag]
+        wy, wz = FEMModel._get_uniform_load_components(uniform_load, 3)
+        fixed_end = _frame_fixed_end_forces(wy, wz, block.lengths[row])
+        tag = uniform_load.element_tag
+        target.frame_fixed_end[tag] = target.frame_fixed_end.get(tag, 0.0) + fixed_end
+        target.nodal[block.dofs[row]] -= block.transform[row].T @ fixed_end
+
+    for surface_load in model.surface_loads:
+        shell_elem = model.elements.get(surface_load.element_tag)
+        if shell_elem is None:
+            raise ValueError(
+                f"SurfaceLoad references non-existent element {surface_load.element_tag}"
+            )
+        if shell_elem.element_type not in (ElementType.SHELL_MITC4, ElementType.SHELL_DKGT):
+            raise ValueError(
+                f"SurfaceLoad can only be applied to shell elements, "
+                f"got {shell_elem.element_type}"
+            )
+        shell_nodes = [model.nodes[tag] for tag in shell_elem.node_tags]
+        area = FEMModel._compute_planar_polygon_area(shell_nodes)
+        force_per_node = -surface_load.pressure * area / float(len(shell_nodes))
+        target = pattern(surface_load.load_pattern)
+        for node_tag in shell_elem.node_tags:
+            target.nodal[node_index[node_tag] * DOFS_PER_NODE + 2] += force_per_node
+
+    return patterns
+
+
+def _combine_patterns(patterns: Dict[int, PatternLoads],
+                      pattern_ids: Sequence[int],
+                      n_dofs: int) -> PatternLoads:
+    combined = PatternLoads(nodal=np.zeros(n_dofs))
+    for pattern_id in pattern_ids:
+        loads = patterns.get(pattern_id)
+        if loads is None:
+            continue
+        combined.nodal += loads.nodal
+        for tag, fixed_end in loads.frame_fixed_end.items():
+            combined.frame_fixed_end[tag] = combined.frame_fixed_end.get(tag, 0.0) + fixed_end
+    return combined
+
+
+# ---------------------------------------------------------------------------
+# Solver
+# ---------------------------------------------------------------------------
+
+class SparseFEMSolver:
+    """SciPy sparse direct solver for linear static analysis of a FEMModel.
+
+    The stiffness matrix is assembled and factorized once; every load case
+    is then a back-substitution, solved together as a multi-column RHS.
+    The "pcg" and "minres" methods replace the factorization with a
+    preconditioned iterative solve (see ``src.fem.iterative_solver``) for
+    meshes whose factors do not fit in memory.
+
+    Args:
+        model: FEMModel instance
+        method: "auto" (Cholesky via scikit-sparse if installed, else LU),
+            "cholesky", "lu", "pcg" or "minres"
+        preconditioner: Iterative methods only - "auto", "amg" or
+            "block_jacobi" (one block per floor)
+        rtol: Iterative methods only - relative residual tolerance
+        maxiter: Iterative methods only - iterations per load case before
+            falling back to the direct solve
+        warm_start: Iterative methods only - start from the previous solution
+    """
+
+    def __init__(self, model: FEMModel, method: str = "auto",
+                 preconditioner: str = "auto",
+                 rtol: Optional[float] = None,
+                 maxiter: Optional[int] = None,
+                 warm_start: bool = True):
+        if method not in SOLVER_METHODS:
+            raise ValueError(f"method must be one of {SOLVER_METHODS}")
+        self.model = model
+        self.method = method
+        self.preconditioner = preconditioner
+        self.rtol = rtol
+        self.maxiter = maxiter
+        self.warm_start = warm_start
+        self.system: Optional[SparseStiffnessSystem] = None
+        self.factorization_method: Optional[str] = None
+        self._solve = None
+        self._pattern_loads: Optional[Dict[int, PatternLoads]] = None
+
+    @staticmethod
+    def check_availability() -> bool:
+        """Check if scipy.sparse is available."""
+        return sp is not None
+
+    @property
+    def is_iterative(self) -> bool:
+        return self.method in ITERATIVE_SOLVER_METHODS
+
+    def assemble(self) -> SparseStiffnessSystem:
+        """Assemble the stiffness system and pattern load vectors."""
+        self.system = assemble_stiffness_system(self.model)
+        self._pattern_loads = build_pattern_loads(self.model, self.system)
+        self._solve = None
+        return self.system
+
+    def factorize(self) -> None:
+        """Factorize the reduced stiffness matrix (assembling if needed).
+
+        Iterative methods build the preconditioner instead.
+        """
+        if self.system is None:
+            self.assemble()
+        if self.is_iterative:
+            self._setup_iterative()
+            return
+        self._solve, self.factorization_method = self._factorize_direct()
+
+    def _factorize_direct(self):
+        K = self.system.reduced_stiffness
+        if self.method != "lu" and _cholmod_cholesky is not None:
+            return _cholmod_cholesky(K), "Cholesky"
+        if self.method == "cholesky":
+            _logger.info("scikit-sparse not installed; using sparse LU instead of Cholesky")
+        lu = spla.splu(K, permc_spec="MMD_AT_PLUS_A", diag_pivot_thresh=_LU_DIAG_PIVOT_THRESH,
+                       options={"SymmetricMode": True})
+        return lu.solve, "LU"
+
+    def _setup_iterative(self) -> None:
+        from src.fem import iterative_solver as its
+
+        K = self.system.reduced_stiffness
+        kind = self.preconditioner
+        if kind not in its.PRECONDITIONERS:
+            raise ValueError(f"preconditioner must be one of {its.PRECONDITIONERS}")
+        if kind == "auto":
+            kind = "amg" if its.pyamg is not None else "block_jacobi"
+        if kind == "amg":
+            preconditioner = its.amg_preconditioner(K)
+        else:
+            node_z = np.array([self.model.nodes[int(tag)].z for tag in self.system.node_tags])
+            preconditioner = its.block_jacobi_preconditioner(
+                K, its.floor_blocks(self.system, node_z),
+            )
+        self._solve = its.IterativeSolve(
+            K,
+            preconditioner,
+            method=self.method,
+            rtol=self.rtol or its.DEFAULT_RTOL,
+            maxiter=self.maxiter or its.DEFAULT_MAXITER,
+            warm_start=self.warm_start,
+            direct=lambda: self._factorize_direct()[0],
+        )
+        self.factorization_method = f"{self.method.upper()} + {kind.replace('_', '-')}"
+
+    def solve(self, rhs: np.ndarray) -> np.ndarray:
+        """Solve ``K u = f`` for full-DOF load vectors.
+
+        Args:
+            rhs: Full-DOF loads, shape (n_dofs,) or (n_dofs, m)
+
+        Returns:
+            Full-DOF displacements with the same shape as ``rhs``
+        """
+        if self._solve is None:
+            self.factorize()
+        reduced = np.asarray(self.system.reduce(rhs))
+        return np.asarray(self.system.expand(self._solve(reduced)))
+
+    def case_loads(self,
+                   load_cases: Sequence[str],
+                   default_pattern: int = 1) -> List[PatternLoads]:
+        """Combined pattern loads of each load case, in ``load_cases`` order."""
+        if self._pattern_loads is None:
+            self.assemble()
+        all_patterns = sorted(self._pattern_loads)
+        case_loads = []
+        for lc in load_cases:
+            if lc == "combined":
+                pattern_ids = all_patterns
+            else:
+                pattern_ids = [LOAD_CASE_PATTERN_MAP.get(lc, default_pattern)]
+            case_loads.append(
+                _combine_patterns(self._pattern_loads, pattern_ids, self.system.n_dofs)
+            )
+        return case_loads
+
+    def analyze_load_cases(self,
+                           load_cases: Sequence[str],
+                           default_pattern: int = 1,
+                           include_element_forces: bool = True,
+                           element_tags: Optional[Iterable[int]] = None,
+                           ) -> Dict[str, AnalysisResult]:
+        """Solve several load cases against one factorization.
+
+        Args:
+            load_cases: Load case names (see LOAD_CASE_PATTERN_MAP);
+                "combined" applies every load pattern at once
+            default_pattern: Pattern used for names missing from the map
+            include_element_forces: Whether to recover element end forces
+            element_tags: Optional subset of elements to recover forces for
+
+        Returns:
+            Dict of {load_case_name: AnalysisResult} in ``load_cases`` order
+        """
+        if self._solve is None:
+            self.factorize()
+        case_loads = self.case_loads(load_cases, default_pattern)
+        return self.analyze_loads(
+            dict(zip(load_cases, case_loads)), include_element_forces, element_tags,
+        )
+
+    def analyze_loads(self,
+                      case_loads: Mapping[str, PatternLoads],
+                      include_element_forces: bool = True,
+                      element_tags: Optional[Iterable[int]] = None,
+                      ) -> Dict[str, AnalysisResult]:
+        """Solve prebuilt load vectors as one multi-column RHS.
+
+        Args:
+            case_loads: {case name: PatternLoads}, e.g. span-by-span live
+                load patterns built outside LOAD_CASE_PATTERN_MAP
+            include_element_forces: Whether to recover element end forces
+            element_tags: Optional subset of elements to recover forces for
+
+        Returns:
+            Dict of {case name: AnalysisResult} in ``case_loads`` order
+        """
+        if self._solve is None:
+            self.factorize()
+        system = self.system
+        load_cases = list(case_loads)
+        case_loads = list(case_loads.values())
+        F = np.zeros((system.n_dofs, len(case_loads)))
+        for column, loads in enumerate(case_loads):
+            F[:, column] = loads.nodal
+        U = self.solve(F)
+        R = np.asarray(system.stiffness @ U) - F
+
+        # Equilibrium check in the reduced space, including any load that
+        # lands on DOFs dropped for lacking stiffness.
+        residual = np.abs(np.asarray(system.reduce(R))).max(axis=0, initial=0.0)
+        scale = np.abs(np.asarray(system.reduce(F))).max(axis=0, initial=1.0)
+        if system.dropped_map is not None:
+            unsupported = np.abs(np.asarray(system.dropped_map.T @ F)).max(axis=0, initial=0.0)
+            residual = np.maximum(residual, unsupported)
+
+        wanted = None
+        if element_tags is not None:
+            wanted = np.fromiter(element_tags, dtype=np.int64)
+
+        results: Dict[str, AnalysisResult] = {}
+        for column, lc in enumerate(load_cases):
+            if not np.isfinite(residual[column]) or residual[column] > 1e-6 * scale[column]:
+                results[lc] = AnalysisResult(
+                    success=False,
+                    converged=False,
+                    message=(
+                        f"{lc}: Analysis failed - load applied to DOFs without "
+                        "stiffness or singular stiffness matrix"
+                    ),
+                )
+                continue
+            results[lc] = self._build_result(
+                U[:, column], R[:, column], case_loads[column], include_element_forces, wanted,
+            )
+            results[lc].message = f"{lc}: {results[lc].message}"
+            if self.is_iterative:
+                stats = self._solve.stats
+                results[lc].iterations = stats.iterations[column]
+                if not stats.converged[column]:
+                    results[lc].message += (
+                        f" - no convergence in {stats.iterations[column]} iterations, "
+                        "solved by direct fallback"
+                    )
+        return results
+
+    def _build_result(self, u: np.ndarray, reactions: np.ndarray,
+                      loads: PatternLoads, include_element_forces: bool,
+                      wanted: Optional[np.ndarray] = None,
+                      system: Optional[SparseStiffnessSystem] = None) -> AnalysisResult:
+        system = system or self.system
+        result = AnalysisResult(
+            success=True,
+            message=f"Analysis completed successfully (scipy sparse {self.factorization_method})",
+        )
+        disp = u.reshape(-1, DOFS_PER_NODE)
+        result.node_displacements = NodeResultTable.from_arrays(system.node_tags, disp)
+
+        # Reactions exist only where a DOF is fixed or MPC-constrained;
+        # elsewhere K u - f is zero up to round-off.
+        reactions = np.where(system.reaction_dofs, reactions, 0.0).reshape(-1, DOFS_PER_NODE)
+        rows = np.flatnonzero(np.any(np.abs(reactions) > 1e-10, axis=1))
+        result.node_reactions = NodeResultTable.from_arrays(system.node_tags[rows], reactions[rows])
+
+        if include_element_forces:
+            frame_tags = []
+            frame_forces = []
+            other = {}
+            for block in system.blocks:
+                rows = slice(None) if wanted is None else np.isin(block.tags, wanted)
+                tags = block.tags[rows]
+                if not tags.size:
+                    continue
+                u_e = u[block.dofs[rows]]
+                if block.kind == "frame":
+                    u_local = np.einsum('nij,nj->ni', block.transform[rows], u_e)
+                    forces = np.einsum('nij,nj->ni', block.local_stiffness[rows], u_local)
+                    for row, tag in enumerate(tags.tolist()):
+                        fixed_end = loads.frame_fixed_end.get(tag)
+                        if fixed_end is not None:
+                            forces[row] += fixed_end
+                    frame_tags.append(tags)
+                    frame_forces.append(forces)
+                else:
+                    forces = np.einsum('nij,nj->ni', block.stiffness[rows], u_e)
+                    for tag, values in zip(tags.tolist(), forces.tolist()):
+                        other[tag] = {f'force_{i}': f for i, f in enumerate(values)}
+            if frame_tags:
+                result.element_forces = ElementForceTable.from_frame_arrays(
+                    np.concatenate(frame_tags), np.vstack(frame_forces), other,
+                )
+            else:
+                result.element_forces = ElementForceTable(other)
+        return result
+
+
+def analyze_model_sparse(model: FEMModel,
+                         load_cases: Sequence[str],
+                         load_pattern: int = 1,
+                         include_element_forces: bool = True,
+                         method: str = "auto",
+                         element_tags: Optional[Iterable[int]] = None,
+                         ) -> Dict[str, AnalysisResult]:
+    """Analyze load cases of a FEMModel with the SciPy sparse backend.
+
+    Args:
+        model: FEMModel instance (already validated)
+        load_cases: Load case names, or ["combined"]
+        load_pattern: Pattern for names missing from LOAD_CASE_PATTERN_MAP
+        include_element_forces: Whether to recover element end forces
+        method: Factorization method, see SparseFEMSolver
+        element_tags: Optional subset of elements to recover forces for
+
+    Returns:
+        Dict of {load_case_name: AnalysisResult}
+    """
+    try:
+        solver = SparseFEMSolver(model, method=method)
+        return solver.analyze_load_cases(
+            load_cases,
+            default_pattern=load_pattern,
+            include_element_forces=include_element_forces,
+            element_tags=element_tags,
+        )
+    except Exception as e:
+        _logger.error("Sparse analysis failed: %s", e, exc_info=True)
+        error_result = AnalysisResult(
+            success=False,
+            converged=False,
+            message=f"Analysis error - {str(e)}",
+        )
+        return {lc: error_result for lc in load_cases}
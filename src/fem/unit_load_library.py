@@ -0,0 +1,221 @@
+"""
+Unit-load result library for instant load magnitude edits.
+
+The analysis is linear, so every gravity and wind case of a model is a
+weighted sum of a few unit cases that depend only on topology and
+stiffness:
+
+- ``SLAB@z``: 1 kPa on every slab shell of the floor at elevation z
+- ``FX@z`` / ``FY@z``: 1 kN on the diaphragm master at z
+- ``MZ@z``: 1 kN·m torsion on the diaphragm master at z
+- ``DL``: the model's own self-weight case
+
+They are solved once as a multi-column RHS. ``load_case_results`` then
+rebuilds SDL, LL and the wind component cases for the load inputs of any
+project with one tensor product, so edits to ``LoadInput.dead_load``, the
+live load class or the wind parameters need no rebuild or re-solve.
+"""
+
+import copy
+import logging
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence
+
+import numpy as np
+
+from src.core.data_models import ProjectData
+from src.fem.fem_engine import FEMModel, SurfaceLoad
+from src.fem.model_builder import _get_characteristic_loads, compute_wind_floor_loads
+from src.fem.result_tables import (
+    ElementForceTable,
+    NodeResultTable,
+    stack_node_tables,
+)
+from src.fem.solver import AnalysisResult
+from src.fem.sparse_solver import DOFS_PER_NODE, PatternLoads, SparseFEMSolver, build_pattern_loads
+
+logger = logging.getLogger(__name__)
+
+UNIT_PRESSURE = 1000.0  # 1 kPa in Pa
+UNIT_FORCE = 1000.0     # 1 kN in N, 1 kN·m in N·m
+
+# Load cases rebuilt from the unit cases
+LIBRARY_LOAD_CASES = ("DL", "SDL", "LL", "Wx", "Wy", "Wtz")
+
+# Unit lateral cases: (prefix, full-DOF offset, wind component case)
+_LATERAL_UNITS = (("FX", 0, "Wx"), ("FY", 1, "Wy"), ("MZ", 5, "Wtz"))
+
+
+def _level(z: float) -> float:
+    return round(float(z), 6)
+
+
+def _other_table(other: Mapping[int, Mapping[str, float]]) -> NodeResultTable:
+    """Shell ``force_i`` dicts as a zero-padded table."""
+    if not other:
+        return NodeResultTable()
+    width = max(len(forces) for forces in other.values())
+    values = np.zeros((len(other), width))
+    for row, forces in enumerate(other.values()):
+        values[row, :len(forces)] = [forces[f"force_{i}"] for i in range(len(forces))]
+    return NodeResultTable.from_arrays(list(other), values)
+
+
+class UnitLoadLibrary:
+    """Unit-case results of one model topology and stiffness.
+
+    Args:
+        model: FEMModel from ``build_fem_model``
+        solver: Optional SparseFEMSolver of ``model`` to reuse
+        include_element_forces: Keep element end forces of the unit cases
+        element_types: Optional ElementType filter for the kept element
+            forces, e.g. frame types only to skip shell force vectors
+
+    Attributes:
+        unit_cases: Unit case names in stack order
+        slab_levels: Floor elevations carrying slab unit cases
+        master_levels: {elevation: diaphragm master node tag}
+
+    Raises:
+        ValueError: If a unit case cannot be solved
+    """
+
+    def __init__(self,
+                 model: FEMModel,
+                 solver: Optional[SparseFEMSolver] = None,
+                 include_element_forces: bool = True,
+                 element_types: Optional[Iterable] = None):
+        self.fingerprint = model.fingerprint()
+        solver = solver or SparseFEMSolver(model)
+        if solver.system is None:
+            solver.assemble()
+
+        unit_loads = {"DL": solver.case_loads(["DL"])[0]}
+        unit_loads.update(self._slab_unit_loads(model, solver))
+        unit_loads.update(self._lateral_unit_loads(model, solver))
+        element_tags = None
+        if element_types is not None:
+            wanted_types = set(element_types)
+            element_tags = [
+                tag for tag, elem in model.elements.items() if elem.element_type in wanted_types
+            ]
+        results = solver.analyze_loads(unit_loads, include_element_forces, element_tags)
+        failed = [name for name, result in results.items() if not result.success]
+        if failed:
+            raise ValueError(f"Unit load cases could not be solved: {', '.join(failed)}")
+
+        self.unit_cases: List[str] = list(results)
+        self._column = {name: column for column, name in enumerate(self.unit_cases)}
+        ordered = list(results.values())
+        self._stacks = {
+            "node_displacements": stack_node_tables([r.node_displacements for r in ordered]),
+            "node_reactions": stack_node_tables([r.node_reactions for r in ordered]),
+            "frames": stack_node_tables([r.element_forces.frames for r in ordered]),
+            "other": stack_node_tables([_other_table(r.element_forces.other) for r in ordered]),
+        }
+        # Shell force vectors are stacked zero-padded; keep each element's width
+        self._other_width = {
+            tag: len(forces) for r in ordered for tag, forces in r.element_forces.other.items()
+        }
+        logger.info("Solved %d unit load cases for model %s", len(ordered), self.fingerprint)
+
+    def case_weights(self, project: ProjectData) -> Dict[str, Dict[str, float]]:
+        """Unit-case weights of each library load case for ``project``'s loads."""
+        _, sdl, ll = _get_characteristic_loads(project)
+        weights: Dict[str, Dict[str, float]] = {
+            "DL": {"DL": 1.0},
+            "SDL": {f"SLAB@{z:g}": sdl for z in self.slab_levels},
+            "LL": {f"SLAB@{z:g}": ll for z in self.slab_levels},
+        }
+        wind_loads = (
+            compute_wind_floor_loads(project)[0] if project.wind_result is not None else {}
+        )
+        for prefix, _, case in _LATERAL_UNITS:
+            weights[case] = {
+                f"{prefix}@{_level(z):g}": value / UNIT_FORCE
+                for z, value in wind_loads.get(case, {}).items()
+                if _level(z) in self.master_levels
+            }
+        return weights
+
+    def load_case_results(self,
+                          project: ProjectData,
+                          load_cases: Sequence[str] = LIBRARY_LOAD_CASES,
+                          ) -> Dict[str, AnalysisResult]:
+        """Load case results for ``project``'s load magnitudes."""
+        weights = self.case_weights(project)
+        return self.combine({case: weights[case] for case in load_cases})
+
+    def combine(self, cases: Mapping[str, Mapping[str, float]]) -> Dict[str, AnalysisResult]:
+        """Evaluate weighted sums of unit cases in one tensor product.
+
+        Args:
+            cases: {result name: {unit case: weight}}
+
+        Returns:
+            Dict of {result name: AnalysisResult}
+        """
+        names = list(cases)
+        factors = np.zeros((len(names), len(self.unit_cases)))
+        for row, name in enumerate(names):
+            for unit, weight in cases[name].items():
+                factors[row, self._column[unit]] += weight
+
+        combined = {
+            field: np.einsum("kc,cnm->knm", factors, values)
+            for field, (_, values, _) in self._stacks.items()
+        }
+        results: Dict[str, AnalysisResult] = {}
+        for row, name in enumerate(names):
+            active = factors[row] != 0.0
+            tables: Dict[str, NodeResultTable] = {}
+            for field, (tags, _, present) in self._stacks.items():
+                rows = present[active].any(axis=0)
+                tables[field] = NodeResultTable.from_arrays(tags[rows], combined[field][row][rows])
+            other = {
+                tag: {f"force_{i}": f for i, f in enumerate(values[:self._other_width[tag]])}
+                for tag, values in zip(tables["other"].tags.tolist(), tables["other"].array.tolist())
+            }
+            results[name] = AnalysisResult(
+                success=True,
+                message=f"{name}: combined from {int(active.sum())} unit load cases",
+                node_displacements=tables["node_displacements"],
+                node_reactions=tables["node_reactions"],
+                element_forces=ElementForceTable.from_parts(tables["frames"], other),
+            )
+        return results
+
+    def _slab_unit_loads(self, model: FEMModel,
+                         solver: SparseFEMSolver) -> Dict[str, PatternLoads]:
+        slab_tags = sorted({load.element_tag for load in model.surface_loads})
+        floor_of = {
+            tag: _level(np.mean([model.nodes[node].z for node in model.elements[tag].node_tags]))
+            for tag in slab_tags
+        }
+        self.slab_levels = sorted(set(floor_of.values()))
+        pattern_of = {z: index for index, z in enumerate(self.slab_levels)}
+
+        # One load pattern per floor, converted by the standard pattern builder
+        unit_model = copy.copy(model)
+        unit_model.loads = []
+        unit_model.uniform_loads = []
+        unit_model.surface_loads = [
+            SurfaceLoad(element_tag=tag, pressure=UNIT_PRESSURE, load_pattern=pattern_of[floor_of[tag]])
+            for tag in slab_tags
+        ]
+        by_floor = build_pattern_loads(unit_model, solver.system)
+        return {f"SLAB@{z:g}": by_floor[pattern_of[z]] for z in self.slab_levels}
+
+    def _lateral_unit_loads(self, model: FEMModel,
+                            solver: SparseFEMSolver) -> Dict[str, PatternLoads]:
+        system = solver.system
+        self.master_levels: Dict[float, int] = {
+            _level(model.nodes[diaphragm.master_node].z): diaphragm.master_node
+            for diaphragm in model.diaphragms
+        }
+        loads: Dict[str, PatternLoads] = {}
+        for prefix, offset, _ in _LATERAL_UNITS:
+            for z, master in sorted(self.master_levels.items()):
+                nodal = np.zeros(system.n_dofs)
+                nodal[system.node_index[master] * DOFS_PER_NODE + offset] = UNIT_FORCE
+                loads[f"{prefix}@{z:g}"] = PatternLoads(nodal=nodal)
+        return loads
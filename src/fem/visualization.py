@@ -69,6 +69,7 @@ PlotlyFigure = Any
 from src.fem.fem_engine import (
     FEMModel,
     ElementType,
+    FloorIndex,
     Node,
     Element,
     Load,
@@ -765,11 +766,7 @@ def _get_floor_elevations(model: ModelLike, tolerance: float = 0.01) -> List[flo
     Returns:
         Sorted list of unique z-elevations
     """
-    elevations: List[float] = []
-
-    def _add_level(z_value: float) -> None:
-        if not any(abs(z_value - e) < tolerance for e in elevations):
-            elevations.append(z_value)
+    index = FloorIndex(tolerance)
 
     # Prefer slab (horizontal) shell element elevations.
     # Wall shells span between floors (different z-values across nodes) and
@@ -781,9 +778,9 @@ def _get_floor_elevations(model: ModelLike, tolerance: float = 0.01) -> List[flo
                 z_spread = max(node_zs) - min(node_zs)
                 if z_spread > tolerance:
                     continue  # vertical (wall) shell — skip
-                _add_level(sum(node_zs) / len(node_zs))
+                index.add(sum(node_zs) / len(node_zs))
 
-    if not elevations:
+    if not index.levels:
         for elem in model.elements.values():
             if len(elem.node_tags) != 2:
                 continue
@@ -792,13 +789,13 @@ def _get_floor_elevations(model: ModelLike, tolerance: float = 0.01) -> List[flo
             if not n_i or not n_j:
                 continue
             if abs(n_i.z - n_j.z) <= tolerance:
-                _add_level(n_i.z)
+                index.add(n_i.z)
 
-    if not elevations:
+    if not index.levels:
         for node in model.nodes.values():
-            _add_level(node.z)
+            index.add(node.z)
 
-    return sorted(elevations)
+    return index.sorted_levels()
 
 
 def _draw_local_axes(fig: Any, model: "ModelLike", arrow_frac: float = 0.10) -> None:
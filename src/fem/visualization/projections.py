@@ -10,7 +10,7 @@ This module handles coordinate transformations for different view types:
 from typing import Dict, List, Optional, Tuple
 import numpy as np
 
-from src.fem.fem_engine import Node, Element
+from src.fem.fem_engine import Element, FloorIndex, Node
 
 
 # Type aliases for coordinate tuples
@@ -33,12 +33,7 @@ def get_floor_elevations(
     Returns:
         Sorted list of unique z-elevations
     """
-    elevations: List[float] = []
-    for node in nodes.values():
-        z = node.z
-        if not any(abs(z - e) < tolerance for e in elevations):
-            elevations.append(z)
-    return sorted(elevations)
+    return FloorIndex.from_nodes(nodes.values(), tolerance).sorted_levels()
 
 
 def filter_nodes_at_elevation(
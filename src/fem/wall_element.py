@@ -18,6 +18,8 @@ from typing import Any, List, Tuple, Dict, Optional
 import math
 import logging
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
 
@@ -174,6 +176,27 @@ class WallMeshGenerator:
         # node_grid[iz][ix] = node_tag
         node_grid: List[List[int]] = []
         
+        registry_tags = None
+        if registry is not None:
+            # Deduplicated path: registry handles node creation (one batch
+            # per panel, row by row) and adds to OpenSeesPy model internally
+            ix_grid = np.tile(np.arange(num_nodes_x), num_nodes_z)
+            z_grid = np.repeat(np.arange(num_nodes_z) * dz, num_nodes_x)
+            coords = np.column_stack([
+                wall.base_point[0] + ix_grid * dx,
+                wall.base_point[1] + ix_grid * dy,
+                z_grid,
+            ])
+            restraints = np.zeros((coords.shape[0], 6), dtype=int)
+            restraints[z_grid == 0.0] = 1
+            floor_levels = (
+                (z_grid / story_height).astype(int) if story_height > 0
+                else np.zeros(coords.shape[0], dtype=int)
+            )
+            registry_tags = registry.get_or_create_many(
+                coords, restraints=restraints, floor_levels=floor_levels,
+            ).reshape(num_nodes_z, num_nodes_x).tolist()
+        
         for iz in range(num_nodes_z):
             row: List[int] = []
             z = iz * dz
@@ -183,15 +206,8 @@ class WallMeshGenerator:
                 x = wall.base_point[0] + ix * dx
                 y = wall.base_point[1] + ix * dy
                 
-                if registry is not None:
-                    # Deduplicated path: registry handles node creation
-                    # and adds to OpenSeesPy model internally
-                    restraints = [1, 1, 1, 1, 1, 1] if z == 0.0 else None
-                    tag = registry.get_or_create(
-                        x, y, z,
-                        restraints=restraints,
-                        floor_level=floor_level,
-                    )
+                if registry_tags is not None:
+                    tag = registry_tags[iz][ix]
                 else:
                     # Legacy path: sequential tag assignment
                     tag = self._get_next_node_tag()
@@ -7,8 +7,17 @@ matching the project reference `windloadcombo.csv` and Phase 11 Section 5.5.
 from __future__ import annotations
 
 import logging
-from typing import Dict, Iterable, List, Mapping, Tuple
+from collections.abc import Mapping as MappingABC
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional, Tuple
 
+import numpy as np
+
+from src.fem.result_tables import (
+    ElementForceTable,
+    NodeResultTable,
+    superpose_element_tables,
+    superpose_node_tables,
+)
 from src.fem.solver import AnalysisResult
 
 logger = logging.getLogger(__name__)
@@ -44,49 +53,114 @@ WIND_CASE_COEFFICIENTS: Dict[str, Tuple[float, float, float]] = {
     "W24": (-0.55, -0.55, -1.00),
 }
 
+WIND_CASE_NAMES: Tuple[str, ...] = tuple(WIND_CASE_COEFFICIENTS)
+
+# (24, 3) coefficient matrix; rows follow WIND_CASE_NAMES, columns COMPONENT_CASE_KEYS
+WIND_COEFFICIENT_MATRIX = np.array(
+    [WIND_CASE_COEFFICIENTS[name] for name in WIND_CASE_NAMES], dtype=np.float64
+)
+
+
+class SynthesizedWindCases(MappingABC):
+    """Read-only results map with W1-W24 kept as a coefficient view.
+
+    Only the Wx/Wy/Wtz component results and ``WIND_COEFFICIENT_MATRIX`` are
+    stored. A W-case is superposed when it is first looked up and cached
+    afterwards. Combination code can skip materialization entirely through
+    ``component_weights``.
+
+    Args:
+        component_results: Map containing successful Wx, Wy and Wtz results
+        base_results: Optional results to expose alongside W1-W24 (e.g. the
+            full solved load-case dict); synthesized cases take precedence
+    """
+
+    def __init__(self,
+                 component_results: Mapping[str, AnalysisResult],
+                 base_results: Optional[Mapping[str, AnalysisResult]] = None):
+        _validate_component_results(component_results)
+        self.components: Dict[str, AnalysisResult] = {
+            key: component_results[key] for key in COMPONENT_CASE_KEYS
+        }
+        self.base_results: Dict[str, AnalysisResult] = dict(base_results or {})
+        self._materialized: Dict[str, AnalysisResult] = {}
+
+    def component_weights(self, case_name: str) -> Optional[Dict[str, float]]:
+        """Component coefficients of a synthesized case, None for other keys."""
+        coefficients = WIND_CASE_COEFFICIENTS.get(case_name)
+        if coefficients is None:
+            return None
+        return dict(zip(COMPONENT_CASE_KEYS, coefficients))
+
+    def is_materialized(self, case_name: str) -> bool:
+        return case_name in self._materialized
+
+    def __getitem__(self, case_name: str) -> AnalysisResult:
+        coefficients = WIND_CASE_COEFFICIENTS.get(case_name)
+        if coefficients is None:
+            return self.base_results[case_name]
+        result = self._materialized.get(case_name)
+        if result is None:
+            result = _synthesize_single_case(
+                case_name=case_name,
+                coefficients=coefficients,
+                wx_result=self.components["Wx"],
+                wy_result=self.components["Wy"],
+                wtz_result=self.components["Wtz"],
+            )
+            self._materialized[case_name] = result
+        return result
+
+    def __contains__(self, case_name: object) -> bool:
+        return case_name in WIND_CASE_COEFFICIENTS or case_name in self.base_results
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self.base_results
+        for case_name in WIND_CASE_NAMES:
+            if case_name not in self.base_results:
+                yield case_name
+
+    def __len__(self) -> int:
+        return len(self.base_results) + sum(
+            1 for case_name in WIND_CASE_NAMES if case_name not in self.base_results
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"SynthesizedWindCases(base={len(self.base_results)}, "
+            f"materialized={len(self._materialized)}/{len(WIND_CASE_NAMES)})"
+        )
+
 
 def synthesize_w1_w24_cases(
     component_results: Mapping[str, AnalysisResult],
-) -> Dict[str, AnalysisResult]:
+) -> SynthesizedWindCases:
     """Build canonical W1-W24 analysis results from component wind cases.
 
     The synthesis equation is:
       W_i = c_wx * Wx + c_wy * Wy + c_wtz * Wtz
-    with coefficients from ``WIND_CASE_COEFFICIENTS``.
+    with coefficients from ``WIND_CASE_COEFFICIENTS``. Cases are synthesized
+    lazily on lookup, see ``SynthesizedWindCases``.
 
     Raises:
         ValueError: If any required component case is missing or unsuccessful.
     """
-    _validate_component_results(component_results)
-
-    wx_result = component_results["Wx"]
-    wy_result = component_results["Wy"]
-    wtz_result = component_results["Wtz"]
-
-    synthesized: Dict[str, AnalysisResult] = {}
-    for case_name, coefficients in WIND_CASE_COEFFICIENTS.items():
-        synthesized[case_name] = _synthesize_single_case(
-            case_name=case_name,
-            coefficients=coefficients,
-            wx_result=wx_result,
-            wy_result=wy_result,
-            wtz_result=wtz_result,
-        )
-
-    return synthesized
+    return SynthesizedWindCases(component_results)
 
 
 def with_synthesized_w1_w24_cases(
     results_dict: Mapping[str, AnalysisResult],
-) -> Dict[str, AnalysisResult]:
+) -> Mapping[str, AnalysisResult]:
     """Return a results map extended with synthesized W1-W24 cases.
 
-    If component wind cases are missing or unsuccessful, logs a warning
-    and returns the original results without W1-W24 synthesis.
+    The W-cases are a lazy coefficient view over Wx/Wy/Wtz
+    (``SynthesizedWindCases``). If component wind cases are missing or
+    unsuccessful, logs a warning and returns a copy of the original results
+    without W1-W24 synthesis.
     """
     merged_results = dict(results_dict)
     try:
-        merged_results.update(synthesize_w1_w24_cases(merged_results))
+        return SynthesizedWindCases(merged_results, base_results=merged_results)
     except ValueError as exc:
         failed_details = []
         for key in COMPONENT_CASE_KEYS:
@@ -157,42 +231,15 @@ def _synthesize_single_case(
 def _combine_vector_field(
     weighted_results: Iterable[Tuple[float, AnalysisResult]],
     field_name: str,
-) -> Dict[int, List[float]]:
-    combined: Dict[int, List[float]] = {}
-
-    for factor, result in weighted_results:
-        if factor == 0.0:
-            continue
-
-        vector_map: Dict[int, List[float]] = getattr(result, field_name, {})
-        for node_tag, values in vector_map.items():
-            if node_tag not in combined:
-                combined[node_tag] = [0.0] * len(values)
-            elif len(values) > len(combined[node_tag]):
-                combined[node_tag].extend([0.0] * (len(values) - len(combined[node_tag])))
-
-            for dof_idx, value in enumerate(values):
-                combined[node_tag][dof_idx] += factor * value
-
-    return combined
+) -> NodeResultTable:
+    return superpose_node_tables(
+        (factor, getattr(result, field_name, {})) for factor, result in weighted_results
+    )
 
 
 def _combine_element_forces(
     weighted_results: Iterable[Tuple[float, AnalysisResult]],
-) -> Dict[int, Dict[str, float]]:
-    combined: Dict[int, Dict[str, float]] = {}
-
-    for factor, result in weighted_results:
-        if factor == 0.0:
-            continue
-
-        for element_id, force_dict in result.element_forces.items():
-            if element_id not in combined:
-                combined[element_id] = {}
-
-            for force_key, force_value in force_dict.items():
-                combined[element_id][force_key] = (
-                    combined[element_id].get(force_key, 0.0) + factor * force_value
-                )
-
-    return combined
+) -> ElementForceTable:
+    return superpose_element_tables(
+        (factor, result.element_forces) for factor, result in weighted_results
+    )
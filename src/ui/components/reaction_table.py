@@ -25,21 +25,14 @@ class ReactionTable:
         if not result or not result.node_reactions:
             return pd.DataFrame()
 
-        data = []
-        # result.node_reactions is Dict[int, List[float]] -> [Fx, Fy, Fz, Mx, My, Mz]
-        for node_id, forces in result.node_reactions.items():
-            row = {
-                "Node ID": node_id,
-                "Fx (kN)": forces[0] / 1000.0,
-                "Fy (kN)": forces[1] / 1000.0,
-                "Fz (kN)": forces[2] / 1000.0,
-                "Mx (kN-m)": forces[3] / 1000.0,
-                "My (kN-m)": forces[4] / 1000.0,
-                "Mz (kN-m)": forces[5] / 1000.0,
-            }
-            data.append(row)
+        # node_reactions is a columnar table: one [Fx, Fy, Fz, Mx, My, Mz] row per node
+        reactions = result.node_reactions
+        df = pd.DataFrame(
+            reactions.array[:, :6] / 1000.0,
+            columns=["Fx (kN)", "Fy (kN)", "Fz (kN)", "Mx (kN-m)", "My (kN-m)", "Mz (kN-m)"],
+        )
+        df.insert(0, "Node ID", reactions.tags)
         
-        df = pd.DataFrame(data)
         if not df.empty:
             df = df.set_index("Node ID").sort_index()
             
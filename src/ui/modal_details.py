@@ -0,0 +1,37 @@
+"""Helpers for rendering modal analysis periods and participation."""
+
+from typing import Dict, List
+
+import pandas as pd
+
+from src.fem.modal_analysis import MODAL_DIRECTIONS, ModalResult
+
+
+def build_modal_dataframe(result: ModalResult) -> pd.DataFrame:
+    """Build the per-mode period and mass participation table."""
+    data: Dict[str, List] = {
+        "Mode": list(range(1, result.n_modes + 1)),
+        "Period (s)": [round(float(t), 4) for t in result.periods],
+        "Frequency (Hz)": [round(float(f), 3) for f in result.frequencies],
+        "Direction": [result.dominant_direction(mode) for mode in range(result.n_modes)],
+    }
+    for direction in MODAL_DIRECTIONS:
+        ratios = result.effective_mass_ratios[direction]
+        data[f"M{direction.lower()} (%)"] = [round(100.0 * float(r), 1) for r in ratios]
+        data[f"ΣM{direction.lower()} (%)"] = [
+            round(100.0 * float(r), 1) for r in result.cumulative_mass_ratio(direction)
+        ]
+    return pd.DataFrame(data)
+
+
+def build_modal_summary(result: ModalResult) -> Dict[str, float]:
+    """Build summary values displayed under the modal table."""
+    summary = {
+        "fundamental_period": result.fundamental_period,
+        "fundamental_frequency": float(result.frequencies[0]) if result.n_modes else 0.0,
+        "total_mass_t": result.total_mass.get("X", 0.0) / 1000.0,
+    }
+    for direction in MODAL_DIRECTIONS:
+        cumulative = result.cumulative_mass_ratio(direction)
+        summary[f"cumulative_{direction.lower()}"] = float(cumulative[-1]) if cumulative.size else 0.0
+    return summary
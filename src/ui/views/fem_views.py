@@ -8,15 +8,34 @@ into a single reusable component.
 
 import streamlit as st
 import logging
+from dataclasses import fields
 from typing import Optional, Dict, Any, List, Tuple
 
 from src.core.data_models import ProjectData
-from src.fem.model_builder import build_fem_model, ModelBuilderOptions
+from src.fem.model_builder import (
+    build_fem_model,
+    update_fem_model_loads,
+    update_fem_model_sections,
+    ModelBuilderOptions,
+)
+from src.fem.model_cache import ModelCache, canonical_key
 from src.fem.fem_engine import FEMModel
-from src.fem.load_combinations import LoadCombinationLibrary
-from src.fem.combination_processor import combine_results, get_applicable_combinations
+from src.fem.result_tables import NodeResultTable
+from src.fem.load_combinations import LoadCombinationCategory, LoadCombinationLibrary
+from src.fem.combination_cache import CombinedResultsCache
+from src.fem.combination_processor import get_applicable_combinations
+from src.fem.modal_analysis import DEFAULT_LIVE_LOAD_MASS_FRACTION, get_modal_result
+from src.fem.solver_autotune import SolverAutotuner, default_cache_dir
+from src.fem.pattern_loading import is_pattern_case, with_pattern_live_load_cases
+from src.fem.unit_load_library import LIBRARY_LOAD_CASES, UnitLoadLibrary
+from src.fem.response_spectrum import (
+    DEFAULT_RSA_MODES,
+    run_response_spectrum,
+    with_orthogonal_seismic_cases,
+)
 from src.fem.design_check_summary import compute_design_checks_summary, ORDERED_TYPE_LABELS
 from src.fem.wind_case_synthesizer import with_synthesized_w1_w24_cases
+from src.fem.sparse_solver import FRAME_ELEMENT_TYPES, SparseFEMSolver
 from src.fem.visualization import (
     create_plan_view,
     create_elevation_view,
@@ -34,6 +53,7 @@ from src.ui.floor_labels import (
     format_floor_label_from_elevation,
     format_floor_label_from_floor_number,
 )
+from src.ui.modal_details import build_modal_dataframe, build_modal_summary
 from src.ui.wind_details import (
     build_wind_details_dataframe,
     build_wind_details_summary,
@@ -45,93 +65,200 @@ logger = logging.getLogger(__name__)
 # Session state keys
 CACHE_KEY_MODEL = "fem_model_cache"
 CACHE_KEY_HASH = "fem_model_hash"
+CACHE_KEY_SECTION_HASH = "fem_model_section_hash"
+CACHE_KEY_LOAD_HASH = "fem_model_load_hash"
+KEY_UNIT_LIBRARY = "fem_unit_load_library"
 KEY_VIEW_MODE = "fem_view_mode_tabs"
+KEY_COMBINED_CACHE = "fem_combined_results_cache"
+KEY_MODAL_RESULT = "fem_modal_result"
+COMBINED_CACHE_MAX_BYTES = 256 * 1024 * 1024
+MODEL_CACHE_MAX_BYTES = 512 * 1024 * 1024
 MODEL_CACHE_SCHEMA_VERSION = "2026-02-13-slab-node-filter"
 
+# ProjectData attributes read by build_fem_model. Member sizes and load
+# magnitudes are keyed separately because they can be patched in place.
+_TOPOLOGY_INPUTS = (
+    "geometry.bay_x", "geometry.bay_y", "geometry.floors", "geometry.story_height",
+    "geometry.num_bays_x", "geometry.num_bays_y",
+    "materials.fcu_beam", "materials.fcu_column",
+    "lateral.core_wall_config", "lateral.core_geometry",
+    "lateral.building_width", "lateral.building_depth",
+    "lateral.custom_center_x", "lateral.custom_center_y",
+)
+_SECTION_INPUTS = (
+    "primary_beam_result.width", "primary_beam_result.depth",
+    "secondary_beam_result.width", "secondary_beam_result.depth",
+    "column_result.dimension", "column_result.width", "column_result.depth",
+    "slab_result.self_weight",
+)
+_LOAD_INPUTS = (
+    "loads.dead_load", "loads.live_load",
+    "wind_result.base_shear", "wind_result.base_shear_x", "wind_result.base_shear_y",
+    "wind_result.floor_wind_x", "wind_result.floor_wind_y", "wind_result.floor_elevations",
+)
+
+
+@st.cache_resource
+def _get_model_cache() -> ModelCache:
+    """Process-wide model cache shared by all sessions, spilling to disk."""
+    return ModelCache(max_bytes=MODEL_CACHE_MAX_BYTES, spill_dir=default_cache_dir() / "models")
+
+
+def _project_inputs(project: ProjectData, paths: Tuple[str, ...]) -> Dict[str, Any]:
+    """Values of dotted attribute ``paths`` on ``project`` (None past a missing result)."""
+    values = {}
+    for path in paths:
+        value: Any = project
+        for name in path.split("."):
+            value = getattr(value, name) if value is not None else None
+        values[path] = value
+    return values
+
 
 def _get_cache_key(project: ProjectData, options: ModelBuilderOptions) -> str:
-    """Generate a stable cache key for the FEM model based on inputs."""
-    geo = project.geometry
-    lat = project.lateral
-    mat = project.materials
-    cg = lat.core_geometry
-    wind = project.wind_result
-    
-    key_parts = [
-        f"schema:{MODEL_CACHE_SCHEMA_VERSION}",
-        f"floors:{geo.floors}",
-        f"story_height:{geo.story_height}",
-        f"bays_x:{geo.num_bays_x}",
-        f"bays_y:{geo.num_bays_y}",
-        f"bay_x:{geo.bay_x}",
-        f"bay_y:{geo.bay_y}",
-        f"fcu_slab:{mat.fcu_slab}",
-        f"fcu_beam:{mat.fcu_beam}",
-        f"fcu_column:{mat.fcu_column}",
-        f"core_config:{cg.config if cg else 'None'}",
-        f"core_lx:{cg.length_x if cg else 0}",
-        f"core_ly:{cg.length_y if cg else 0}",
-        f"core_thick:{cg.wall_thickness if cg else 0}",
-        f"core_flange:{cg.flange_width if cg else 0}",
-        f"core_opening:{cg.opening_width if cg else 0}",
-        f"core_cx:{lat.custom_center_x if lat else 0}",
-        f"core_cy:{lat.custom_center_y if lat else 0}",
-        f"beam_w:{project.primary_beam_result.width if project.primary_beam_result else 0}",
-        f"beam_d:{project.primary_beam_result.depth if project.primary_beam_result else 0}",
-        f"col_dim:{project.column_result.dimension if project.column_result else 0}",
-        f"col_w:{project.column_result.width if project.column_result else 0}",
-        f"col_d:{project.column_result.depth if project.column_result else 0}",
-        f"wind:{options.apply_wind_loads}",
-        f"wind_base:{wind.base_shear if wind else 0.0}",
-        f"wind_base_x:{wind.base_shear_x if wind else 0.0}",
-        f"wind_base_y:{wind.base_shear_y if wind else 0.0}",
-        f"slabs:{options.include_slabs}",
-        f"sec_dir:{options.secondary_beam_direction}",
-        f"sec_num:{options.num_secondary_beams}",
-        f"omit_cols:{sorted(list(options.suggested_omit_columns))}",
-        f"trim:{options.trim_beams_at_core}",
-        f"shell_mesh_type:{options.shell_mesh_type}",
-        f"shell_mesh_density:{options.shell_mesh_density}",
-    ]
-    
-    return "|".join(key_parts)
+    """Canonical hash of the model topology inputs.
+
+    Covers the project inputs in ``_TOPOLOGY_INPUTS`` and every
+    ``ModelBuilderOptions`` field; member sizes are keyed by
+    ``_get_section_cache_key`` and load magnitudes by ``_get_load_cache_key``
+    so that sizing and load edits patch the model instead of rebuilding it.
+    """
+    builder_options = {f.name: getattr(options, f.name) for f in fields(options) if f.name != "slab_thickness"}
+    return canonical_key(MODEL_CACHE_SCHEMA_VERSION, _project_inputs(project, _TOPOLOGY_INPUTS),
+                         builder_options)
+
+
+def _get_section_cache_key(project: ProjectData, options: ModelBuilderOptions) -> str:
+    """Canonical hash of member sizes and slab thickness that can be patched in place."""
+    return canonical_key(_project_inputs(project, _SECTION_INPUTS), options.slab_thickness)
+
+
+def _get_load_cache_key(project: ProjectData) -> str:
+    """Canonical hash of load magnitudes that can be patched in place."""
+    return canonical_key(_project_inputs(project, _LOAD_INPUTS))
+
+
+def _refresh_load_cases(model_key: str, project: ProjectData, model: FEMModel) -> bool:
+    """Re-evaluate solved load cases from the unit-load library.
+
+    Only plain DL/SDL/LL/wind results are refreshed; results with derived
+    cases (pattern live load, response spectrum) need a full re-run. The
+    library is solved on the first load-only edit after a Run and reused
+    for later edits while the topology and member sizes stay the same.
+
+    Returns:
+        True if the analysis results were updated in place
+    """
+    cached = st.session_state.get(KEY_UNIT_LIBRARY)
+    results_dict = st.session_state.get("fem_analysis_results_dict")
+    if not cached or cached[0] != model_key or not results_dict:
+        return False
+    base_results = getattr(results_dict, "base_results", results_dict)
+    if any(case not in LIBRARY_LOAD_CASES for case in base_results):
+        return False
+
+    library: Optional[UnitLoadLibrary] = cached[1]
+    if library is None:
+        try:
+            with st.spinner("Solving unit load cases..."):
+                # The results views only read frame forces; shell vectors
+                # would dominate the stacked arrays kept in session state
+                library = UnitLoadLibrary(model, element_types=FRAME_ELEMENT_TYPES)
+        except ValueError as exc:
+            st.session_state.pop(KEY_UNIT_LIBRARY, None)
+            logger.warning("Unit-load library unavailable: %s", exc)
+            return False
+        st.session_state[KEY_UNIT_LIBRARY] = (model_key, library)
+    refreshed = library.load_case_results(project, list(base_results))
+    if all(case in refreshed for case in ("Wx", "Wy", "Wtz")):
+        refreshed = with_synthesized_w1_w24_cases(refreshed)
+    st.session_state["fem_analysis_results_dict"] = refreshed
+    st.session_state["fem_preview_analysis_result"] = refreshed.get("DL")
+    st.session_state.pop(KEY_MODAL_RESULT, None)  # mass source follows the loads
+    _drop_combined_results_cache()
+    return True
+
+
+def _track_unit_library(model_key: str) -> None:
+    """Keep the session's unit-load library if it matches ``model_key``.
+
+    Otherwise record the key of the analysed model so the library is solved
+    lazily by ``_refresh_load_cases`` on the first load-only edit.
+    """
+    cached = st.session_state.get(KEY_UNIT_LIBRARY)
+    if not cached or cached[0] != model_key:
+        st.session_state[KEY_UNIT_LIBRARY] = (model_key, None)
+
+
+def _patch_model(model: FEMModel, project: ProjectData, options: ModelBuilderOptions,
+                 sections: bool = True, loads: bool = True) -> bool:
+    """Patch member sizes and/or load magnitudes into this session's model."""
+    if sections and not update_fem_model_sections(model, project, options):
+        return False
+    return not loads or update_fem_model_loads(model, project, options)
 
 
 def _get_or_build_cached_model(project: ProjectData, options: ModelBuilderOptions) -> FEMModel:
-    """Retrieve FEM model from cache or build a new one if inputs changed."""
+    """Retrieve the FEM model for the current inputs, building it only if needed.
+
+    The session keeps its own model and patches member size and load edits
+    into it. When the topology changes, a private copy is restored from the
+    process-wide model cache (keyed by ``_get_cache_key``) and patched to
+    the current sizes and loads, so switching back to an earlier
+    configuration never rebuilds. Load-only edits re-evaluate solved load
+    cases from the unit-load library.
+    """
     current_hash = _get_cache_key(project, options)
-    
-    # Initialize cache if needed
-    if CACHE_KEY_MODEL not in st.session_state:
-        st.session_state[CACHE_KEY_MODEL] = None
-    if CACHE_KEY_HASH not in st.session_state:
-        st.session_state[CACHE_KEY_HASH] = ""
-        
-    cached_model = st.session_state[CACHE_KEY_MODEL]
-    cached_hash = st.session_state[CACHE_KEY_HASH]
-    
-    # Check if rebuild needed
-    if cached_model is None or cached_hash != current_hash:
+    section_hash = _get_section_cache_key(project, options)
+    load_hash = _get_load_cache_key(project)
+
+    model = st.session_state.get(CACHE_KEY_MODEL)
+    if model is not None and st.session_state.get(CACHE_KEY_HASH) == current_hash:
+        sections_changed = st.session_state.get(CACHE_KEY_SECTION_HASH) != section_hash
+        loads_changed = st.session_state.get(CACHE_KEY_LOAD_HASH) != load_hash
+        if not sections_changed and not loads_changed:
+            return model
+        if _patch_model(model, project, options, sections_changed, loads_changed):
+            st.session_state[CACHE_KEY_SECTION_HASH] = section_hash
+            st.session_state[CACHE_KEY_LOAD_HASH] = load_hash
+            if sections_changed or not _refresh_load_cases(current_hash + section_hash, project, model):
+                _clear_analysis_state()
+            else:
+                logger.info("Re-evaluated load cases from the unit-load library")
+            return model
+
+    cache = _get_model_cache()
+    found = cache.lookup(current_hash)
+    model = None
+    if found is not None:
+        cached_section_hash, cached_load_hash = found[1].split(" ")
+        if _patch_model(found[0], project, options,
+                        sections=cached_section_hash != section_hash,
+                        loads=cached_load_hash != load_hash):
+            model = found[0]
+            logger.info("Restored FEM model %s from the shared cache", current_hash[:12])
+    if model is None:
         with st.spinner("Building FEM model..."):
             model = build_fem_model(project, options)
-            st.session_state[CACHE_KEY_MODEL] = model
-            st.session_state[CACHE_KEY_HASH] = current_hash
-            logger.info(f"Rebuilt FEM model with hash: {current_hash[:20]}...")
-            
-            # Clear stale analysis results when model changes (prevents mismatch)
-            _clear_analysis_state()
-            
-            return model
-            
-    return cached_model
+        cache.put(current_hash, model, variant=f"{section_hash} {load_hash}")
+        logger.info("Rebuilt FEM model %s", current_hash[:12])
+
+    st.session_state[CACHE_KEY_MODEL] = model
+    st.session_state[CACHE_KEY_HASH] = current_hash
+    st.session_state[CACHE_KEY_SECTION_HASH] = section_hash
+    st.session_state[CACHE_KEY_LOAD_HASH] = load_hash
+    # Clear stale analysis results when model changes (prevents mismatch)
+    _clear_analysis_state()
+    return model
 
 
 def _clear_analysis_state() -> None:
     """Clear all FEM analysis state to prevent stale data."""
+    _drop_combined_results_cache()
     keys_to_clear = [
         "fem_preview_analysis_result",
         "fem_analysis_results_dict",  # Multi-load-case results dict
-        "fem_combined_results_cache",  # Cached combination AnalysisResult objects
+        KEY_MODAL_RESULT,
         "fem_analysis_status", 
         "fem_analysis_message",
     ]
@@ -165,13 +292,13 @@ def _analysis_result_to_displacements(result: Any) -> Optional[Dict[int, Tuple[f
     if not result or not hasattr(result, "node_displacements") or not result.node_displacements:
         return None
         
-    displacements = {}
-    for node_tag, values in result.node_displacements.items():
-        if len(values) >= 3:
-            # Take only dx, dy, dz translation
-            displacements[node_tag] = (values[0], values[1], values[2])
-            
-    return displacements
+    table = result.node_displacements
+    if not isinstance(table, NodeResultTable):
+        table = NodeResultTable(table)
+    if table.width < 3:
+        return {}
+    # Take only dx, dy, dz translation
+    return dict(zip(table.tags.tolist(), map(tuple, table.array[:, :3].tolist())))
 
 
 def _format_floor_label(z: float, floor_levels: List[float], story_height: float) -> str:
@@ -187,12 +314,62 @@ def _get_selected_canonical_combinations(selected_names: set[str]) -> List[Any]:
     return [comb for comb in all_combinations if comb.name in selected_names]
 
 
-def _build_combined_cache_key(
-    combination_name: str,
-    results_dict: Dict[str, Any],
-) -> Tuple[str, Tuple[Tuple[str, int], ...]]:
-    signature = tuple(sorted((case_name, id(result)) for case_name, result in results_dict.items()))
-    return combination_name, signature
+def _with_seismic_cases(model: FEMModel, results_dict: Dict[str, Any]) -> Dict[str, Any]:
+    """Add response spectrum EX/EY/E1/E2 cases when seismic combinations are selected."""
+    selected_names = st.session_state.get("selected_combinations", set())
+    if not any(
+        comb.category == LoadCombinationCategory.ULS_SEISMIC
+        for comb in _get_selected_canonical_combinations(selected_names)
+    ):
+        return results_dict
+    try:
+        # One assembly and factorization serves the eigen solve and the mass source
+        solver = SparseFEMSolver(model)
+        modal = get_modal_result(model, DEFAULT_RSA_MODES, solver=solver)
+        seismic = run_response_spectrum(model, modal=modal, solver=solver)
+    except (ValueError, RuntimeError) as exc:
+        logger.warning("Response spectrum analysis skipped: %s", exc)
+        return results_dict
+    st.session_state[KEY_MODAL_RESULT] = modal
+    return with_orthogonal_seismic_cases({**results_dict, **seismic})
+
+
+def _solver_tuning_ready(model: FEMModel) -> bool:
+    """Whether a tuned solver choice is stored for ``model``'s size class.
+
+    If not, benchmarking starts in a background process and this run uses
+    the default configuration, so the first Run never waits for tuning.
+    """
+    tuner = SolverAutotuner()
+    if tuner.lookup(model) is not None:
+        return True
+    tuner.tune_in_background(model)
+    return False
+
+
+def _get_combined_results_cache() -> CombinedResultsCache:
+    """Session-scoped LRU cache of combined results under a byte budget."""
+    cache = st.session_state.get(KEY_COMBINED_CACHE)
+    if not isinstance(cache, CombinedResultsCache):
+        cache = CombinedResultsCache(max_bytes=COMBINED_CACHE_MAX_BYTES)
+        st.session_state[KEY_COMBINED_CACHE] = cache
+    return cache
+
+
+def _drop_combined_results_cache() -> None:
+    """Remove the session's combined results cache and stop its prefetch thread."""
+    cache = st.session_state.pop(KEY_COMBINED_CACHE, None)
+    if isinstance(cache, CombinedResultsCache):
+        cache.close()
+
+
+def _neighbouring_names(names: List[str], selected: str) -> List[str]:
+    """Next and previous entries around ``selected`` - likely next selections."""
+    if selected not in names or len(names) < 2:
+        return []
+    position = names.index(selected)
+    neighbours = [names[(position + 1) % len(names)], names[position - 1]]
+    return list(dict.fromkeys(name for name in neighbours if name != selected))
 
 
 def render_unified_fem_views(
@@ -395,6 +572,11 @@ def render_unified_fem_views(
         "Wy",
         "Wtz",
         *[f"W{i}" for i in range(1, 25)],
+        "EX",
+        "EY",
+        "E1",
+        "E2",
+        *[lc for lc in results_dict if is_pattern_case(lc)],
     ]
     available_load_cases = [lc for lc in all_load_cases if lc in results_dict] if results_dict else ["DL", "SDL", "LL"]
     result_mode = st.session_state.get("fem_view_result_mode", "Load Case")
@@ -434,9 +616,17 @@ def render_unified_fem_views(
     is_locked = _is_inputs_locked()
     
     col_run1, col_run2, col_run3, col_run4 = st.columns([1, 1, 1, 1])
+    with col_run1:
+        st.checkbox(
+            "Pattern live load",
+            key="fem_pattern_live_load",
+            disabled=is_locked,
+            help="Solve checkerboard and adjacent-bay live load patterns (HK Code 2013 Cl 2.3.2.1); design checks take the worst pattern",
+        )
     with col_run2:
         run_disabled = is_locked
         if st.button("🔧 Run FEM Analysis", key="fem_view_run_analysis", type="primary", disabled=run_disabled):
+            from src.fem.result_store import ResultStore
             from src.fem.solver import analyze_model
             
             progress_bar = st.progress(0.0)
@@ -450,7 +640,16 @@ def render_unified_fem_views(
                 if include_wind:
                     run_load_cases.extend(["Wx", "Wy", "Wtz"])
 
-                results_dict = analyze_model(model, load_cases=run_load_cases)
+                results_dict = analyze_model(
+                    model, load_cases=run_load_cases, reuse_structure=True,
+                    autotune=_solver_tuning_ready(model), store=ResultStore(),
+                )
+                _track_unit_library(
+                    _get_cache_key(project, options) + _get_section_cache_key(project, options)
+                )
+                if st.session_state.get("fem_pattern_live_load", False):
+                    results_dict = with_pattern_live_load_cases(model, results_dict)
+                results_dict = _with_seismic_cases(model, results_dict)
                 if include_wind:
                     results_dict = with_synthesized_w1_w24_cases(results_dict)
                 progress_bar.progress(0.8)
@@ -543,15 +742,19 @@ def render_unified_fem_views(
                     help="Select factored load combination to display",
                 )
 
-                combined_cache = st.session_state.setdefault("fem_combined_results_cache", {})
-                cache_key = _build_combined_cache_key(selected_combination_name, results_dict)
-                if cache_key not in combined_cache:
-                    combined_cache[cache_key] = combine_results(
-                        results_dict,
-                        combination_by_name[selected_combination_name],
-                    )
-
-                analysis_result = combined_cache[cache_key]
+                combined_cache = _get_combined_results_cache()
+                analysis_result = combined_cache.get(
+                    results_dict,
+                    combination_by_name[selected_combination_name],
+                )
+                combined_cache.prefetch(
+                    results_dict,
+                    [
+                        combination_by_name[name]
+                        for name in _neighbouring_names(combination_names, selected_combination_name)
+                    ],
+                )
+                logger.debug("Combined results cache: %r", combined_cache)
                 current_result_label = selected_combination_name
             else:
                 st.info(
@@ -1197,6 +1400,39 @@ def render_unified_fem_views(
             except Exception as e:
                 st.warning(f"Design checks could not be computed: {e}")
 
+    # --- 6e. Modal Analysis ---
+    if has_results:
+        with st.expander("Modal Analysis (Periods & Participation)", expanded=False):
+            try:
+                # The eigen solve is as costly as the static run; only on request
+                modal_result = st.session_state.get(KEY_MODAL_RESULT)
+                if modal_result is None and st.button("Compute modes", key="fem_view_compute_modal"):
+                    with st.spinner("Computing modes..."):
+                        modal_result = get_modal_result(model)
+                    st.session_state[KEY_MODAL_RESULT] = modal_result
+                if modal_result is None:
+                    st.caption("Modes are computed on request for the current model.")
+                else:
+                    st.dataframe(build_modal_dataframe(modal_result), width="stretch", hide_index=True)
+                    modal_summary = build_modal_summary(modal_result)
+                    st.caption(
+                        (
+                            f"T1: {modal_summary['fundamental_period']:.3f} s "
+                            f"({modal_summary['fundamental_frequency']:.2f} Hz) | "
+                            f"Mass: {modal_summary['total_mass_t']:.0f} t | "
+                            f"ΣMx: {100 * modal_summary['cumulative_x']:.0f}% | "
+                            f"ΣMy: {100 * modal_summary['cumulative_y']:.0f}%"
+                        )
+                    )
+                    st.caption(
+                        f"Mass: DL + SDL + {DEFAULT_LIVE_LOAD_MASS_FRACTION:.0%} LL lumped at "
+                        "diaphragm masters (horizontal only)."
+                    )
+            except ImportError:
+                st.info("Modal analysis requires scipy.")
+            except Exception as e:
+                st.warning(f"Modal analysis could not be computed: {e}")
+
     # --- 7. Model Statistics & Export ---
     
     st.markdown("### Model Statistics")
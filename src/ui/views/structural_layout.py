@@ -12,6 +12,7 @@ import numpy as np
 from src.core.data_models import ProjectData, CoreWallConfig
 from src.fem.fem_engine import FEMModel
 from src.fem.core_wall_helpers import get_core_wall_outline, get_coupling_beams
+from src.fem.result_tables import NodeResultTable
 from src.fem.beam_trimmer import BeamTrimmer
 from src.ui.utils import create_beam_geometries_from_project
 
@@ -52,10 +53,11 @@ def build_preview_utilization_map(model: FEMModel, project: ProjectData) -> Dict
 
 def _analysis_result_to_displacements(result) -> Dict[int, Tuple[float, float, float]]:
     """Extract translational displacements from AnalysisResult."""
-    displaced: Dict[int, Tuple[float, float, float]] = {}
-    for node_tag, values in result.node_displacements.items():
-        if len(values) >= 3:
-            displaced[node_tag] = (values[0], values[1], values[2])
-    return displaced
+    table = result.node_displacements
+    if not isinstance(table, NodeResultTable):
+        table = NodeResultTable(table)
+    if table.width < 3:
+        return {}
+    return dict(zip(table.tags.tolist(), map(tuple, table.array[:, :3].tolist())))
 
 
@@ -0,0 +1,106 @@
+"""Unit tests for src.fem.combination_cache."""
+
+import numpy as np
+
+from src.fem.combination_cache import (
+    CombinedResultsCache,
+    estimate_result_nbytes,
+    results_fingerprint,
+)
+from src.fem.combination_processor import combine_results
+from src.fem.load_combinations import LoadCombinationLibrary
+from src.fem.result_tables import ElementForceTable, NodeResultTable
+from src.fem.solver import AnalysisResult
+
+
+def _build_result(scale: float, n_nodes: int = 50) -> AnalysisResult:
+    tags = np.arange(1, n_nodes + 1)
+    return AnalysisResult(
+        success=True,
+        converged=True,
+        message="ok",
+        node_displacements=NodeResultTable.from_arrays(tags, np.full((n_nodes, 6), scale)),
+        node_reactions=NodeResultTable.from_arrays(tags[:4], np.full((4, 6), 10.0 * scale)),
+    )
+
+
+def _solved() -> dict:
+    return {"DL": _build_result(1.0), "SDL": _build_result(2.0), "LL": _build_result(3.0)}
+
+
+def test_fingerprint_tracks_content_not_identity() -> None:
+    first = _solved()
+    second = _solved()
+
+    assert results_fingerprint(first) == results_fingerprint(second)
+    second["LL"].node_displacements.array[0, 2] += 1e-9
+    assert results_fingerprint(first) != results_fingerprint(second)
+
+
+def test_cache_counts_hits_and_evicts_least_recently_used() -> None:
+    results = _solved()
+    combos = LoadCombinationLibrary.get_all_combinations()[:3]
+    entry_bytes = estimate_result_nbytes(_build_result(1.0))
+    cache = CombinedResultsCache(max_bytes=2 * entry_bytes, prefetch=False)
+
+    first = cache.get(results, combos[0])
+    assert cache.get(results, combos[0]) is first
+    cache.get(results, combos[1])
+    cache.get(results, combos[0])  # combos[1] is now least recently used
+    cache.get(results, combos[2])
+
+    assert cache.stats.hits == 2
+    assert cache.stats.misses == 3
+    assert cache.stats.evictions == 1
+    assert cache.current_bytes <= cache.max_bytes
+    assert cache.key_for(results, combos[0]) in cache
+    assert cache.key_for(results, combos[1]) not in cache
+
+    cache.get(_solved(), combos[0])  # equal content, new mapping
+    assert cache.stats.hits == 3
+
+
+def test_prefetch_combines_in_background() -> None:
+    results = _solved()
+    combos = LoadCombinationLibrary.get_uls_gravity_combinations()[:2]
+    cache = CombinedResultsCache()
+
+    cache.prefetch(results, combos)
+    combined = cache.get(results, combos[1])
+    cache._executor.shutdown(wait=True)
+
+    expected = combine_results(results, combos[1])
+    np.testing.assert_allclose(combined.node_displacements.array, expected.node_displacements.array)
+    assert cache.stats.misses == 0
+    assert cache.stats.prefetched == 2
+    assert len(cache) == 2
+
+
+def test_fingerprint_includes_shell_forces() -> None:
+    first = _solved()
+    second = _solved()
+    for results in (first, second):
+        results["DL"].element_forces = ElementForceTable.from_parts(
+            NodeResultTable(width=12), {501: {"force_0": 1.0, "force_1": -2.0}}
+        )
+
+    assert results_fingerprint(first) == results_fingerprint(second)
+    second["DL"].element_forces.other[501]["force_1"] = -2.5
+    assert results_fingerprint(first) != results_fingerprint(second)
+
+
+def test_close_releases_prefetch_thread() -> None:
+    results = _solved()
+    combos = LoadCombinationLibrary.get_uls_gravity_combinations()[:2]
+    cache = CombinedResultsCache()
+    cache.prefetch(results, combos[:1])
+    executor = cache._executor
+
+    cache.close()
+    cache.prefetch(results, combos[1:])
+
+    assert executor._shutdown
+    assert cache._executor is None
+    expected = combine_results(results, combos[1])
+    combined = cache.get(results, combos[1])
+    np.testing.assert_allclose(combined.node_displacements.array, expected.node_displacements.array)
@@ -1,7 +1,11 @@
 """Unit tests for src.fem.combination_processor."""
 
+import numpy as np
+
 from src.fem.combination_processor import (
+    build_factor_matrix,
     combine_results,
+    combine_results_batch,
     compute_envelope,
     get_applicable_combinations,
 )
@@ -96,6 +100,43 @@ def test_combine_results_simplified_wind_combo():
     assert combined.node_reactions[10][2] == 30.0 * expected
 
 
+def test_combine_results_batch_matches_single_combinations():
+    solver_results = {
+        "DL": _build_result(1.0),
+        "SDL": _build_result(2.0),
+        "LL": _build_result(3.0),
+        "W1": _build_result(-0.5),
+    }
+    solver_results["LL"].node_reactions[11] = [1.0] * 6
+    solver_results["DL"].element_forces[200] = {"force_0": 1.0, "force_1": 2.0}
+    combos = get_applicable_combinations(
+        LoadCombinationLibrary.get_all_combinations(), list(solver_results)
+    )
+
+    batched = combine_results_batch(solver_results, combos, chunk_size=3)
+
+    assert list(batched) == [combo.name for combo in combos]
+    for combo in combos:
+        single = combine_results(solver_results, combo)
+        assert batched[combo.name].message == single.message
+        assert batched[combo.name].node_displacements == single.node_displacements
+        assert batched[combo.name].node_reactions == single.node_reactions
+        assert batched[combo.name].element_forces == single.element_forces
+        # Node 11 only exists in LL, so it is absent when LL has no factor
+        has_ll = combo.load_factors.get(LoadComponentType.LL, 0.0) != 0.0
+        assert (11 in batched[combo.name].node_reactions) == has_ll
+
+
+def test_build_factor_matrix_skips_unsolved_components():
+    combo = next(
+        c for c in LoadCombinationLibrary.get_uls_wind_combinations() if c.name == "LC_W1_MAX"
+    )
+
+    factors = build_factor_matrix([combo], ["W1", "DL"])
+
+    np.testing.assert_allclose(factors, [[1.4, 1.4]])
+
+
 def test_get_applicable_combinations_filters_unavailable_components():
     combos = LoadCombinationLibrary.get_all_combinations()
     available_cases = ["DL", "SDL", "LL"]
@@ -163,3 +204,35 @@ def test_compute_envelope_tracks_governing_combination_name():
     assert env.N_min.governing_min_case_name == "LC_B"
     assert env.T_max.max_value == 9.0
     assert env.T_max.governing_max_case_name == "LC_B"
+
+
+def test_compute_envelope_matches_element_loop_on_many_combinations():
+    rng = np.random.default_rng(7)
+    keys = list(_build_result(1.0).element_forces[100])
+    combined = {}
+    for index in range(30):
+        forces = {
+            tag: dict(zip(keys, rng.normal(scale=100.0, size=len(keys)).tolist()))
+            for tag in range(1, 41)
+        }
+        combined[f"LC{index}"] = AnalysisResult(success=True, message="", element_forces=forces)
+    combined["FAILED"] = AnalysisResult(success=False, message="")
+
+    envelopes = compute_envelope(combined)
+
+    assert len(envelopes) == 40
+    for tag in (1, 17, 40):
+        mz_abs = {
+            name: max(abs(r.element_forces[tag]["Mz_i"]), abs(r.element_forces[tag]["Mz_j"]))
+            for name, r in combined.items() if r.success
+        }
+        governing = max(mz_abs, key=mz_abs.get)
+        assert envelopes[tag].Mz_max.max_value == mz_abs[governing]
+        assert envelopes[tag].Mz_max.governing_max_case_name == governing
+        assert envelopes.governing_case(tag, "Mz_max") == governing
+        n_mid = {
+            name: 0.5 * (r.element_forces[tag]["N_i"] + r.element_forces[tag]["N_j"])
+            for name, r in combined.items() if r.success
+        }
+        assert envelopes[tag].N_min.min_value == min(n_mid.values())
+        assert envelopes.governing_case(tag, "N_min") == min(n_mid, key=n_mid.get)
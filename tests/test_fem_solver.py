@@ -74,3 +74,53 @@ def test_fem_solver_frequency_extraction(ops_monkeypatch) -> None:
     assert freqs is not None
     # Frequencies should be sqrt(lambda)/(2*pi) so values become [1, 1.5] Hz
     assert np.allclose(freqs, np.array([1.0, 1.5]))
+
+
+def test_extract_results_reads_each_element_once(ops_monkeypatch, monkeypatch) -> None:
+    ops = ops_monkeypatch
+    for tag in (1, 2, 3, 4):
+        ops.node(tag, 0.0, 0.0, float(tag))
+    ops.fix(1, 1, 1, 1, 1, 1, 1)
+    ops.displacements = {tag: [0.0, 0.0, -0.001 * tag, 0.0, 0.0, 0.0] for tag in (1, 2, 3, 4)}
+    ops._reaction_data = {1: [0, 0, 5000, 0, 0, 0], 4: [1.0, 0, 0, 0, 0, 0]}
+    for tag in (10, 11, 20):
+        ops.element("stub", tag, 1, 2)
+    local = {10: [float(i) for i in range(12)], 11: [2.0 * i for i in range(12)]}
+    ops.element_forces = {10: [9.0] * 12, 11: [9.0] * 12, 20: [1.0] * 24}
+    ops.element_responses = {(tag, "localForce"): forces for tag, forces in local.items()}
+
+    calls = {"eleForce": 0, "eleResponse": 0, "nodeReaction": []}
+    ele_force, ele_response, node_reaction = ops.eleForce, ops.eleResponse, ops.nodeReaction
+
+    def count_force(tag):
+        calls["eleForce"] += 1
+        return ele_force(tag)
+
+    def count_response(tag, query):
+        calls["eleResponse"] += 1
+        return ele_response(tag, query)
+
+    def count_reaction(tag):
+        calls["nodeReaction"].append(tag)
+        return node_reaction(tag)
+
+    monkeypatch.setattr(ops, "eleForce", count_force, raising=False)
+    monkeypatch.setattr(ops, "eleResponse", count_response, raising=False)
+    monkeypatch.setattr(ops, "nodeReaction", count_reaction, raising=False)
+    monkeypatch.setattr(ops, "getEleClassTags", lambda: [5, 5, 53], raising=False)
+    monkeypatch.setattr(ops, "getConstrainedNodes", lambda: [], raising=False)
+    monkeypatch.setattr(ops, "getRetainedNodes", lambda: [], raising=False)
+
+    result = FEMSolver().extract_results()
+
+    assert calls["eleForce"] == 2  # one frame probe + the shell
+    assert calls["eleResponse"] == 2  # probe + second frame, no eleForce for it
+    assert calls["nodeReaction"] == [1]  # only restrained / constrained nodes
+    assert result.element_forces.frame_tags.tolist() == [10, 11]
+    assert result.element_forces[11]["Mz_j"] == 22.0
+    assert result.element_forces[20]["force_23"] == 1.0
+    assert list(result.node_reactions) == [1]
+    assert result.node_displacements.array[:, 2].tolist() == [-0.001, -0.002, -0.003, -0.004]
+
+    shells_only = FEMSolver().extract_results(element_tags={20})
+    assert list(shells_only.element_forces) == [20]
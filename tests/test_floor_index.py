@@ -0,0 +1,91 @@
+"""
+Test FloorIndex elevation bucketing against the linear first-seen scan.
+"""
+
+import random
+
+import pytest
+
+from src.fem.fem_engine import FEMModel, FloorIndex, Node
+from src.fem.model_builder import create_floor_rigid_diaphragms
+
+
+def _linear_groups(nodes, tolerance):
+    floors = {}
+    for node in nodes:
+        matched = next((level for level in floors if abs(level - node.z) <= tolerance), None)
+        if matched is None:
+            floors[node.z] = [node.tag]
+        else:
+            floors[matched].append(node.tag)
+    return floors
+
+
+def _nodes(elevations):
+    return [Node(tag=tag, x=float(tag), y=0.0, z=z) for tag, z in enumerate(elevations, start=1)]
+
+
+def test_exact_floor_levels_match_linear_scan():
+    rng = random.Random(3)
+    elevations = [rng.choice([0.0, 3.0, 6.0, 9.0]) + rng.uniform(-4e-7, 4e-7) for _ in range(400)]
+    nodes = _nodes(elevations)
+
+    index = FloorIndex.from_nodes(nodes, tolerance=1e-6)
+
+    expected = _linear_groups(nodes, 1e-6)
+    assert index.groups() == expected
+    assert list(index.groups()) == list(expected)
+    assert index.sorted_levels() == sorted(expected)
+
+
+def test_chained_elevations_keep_first_seen_level():
+    # 0.0 -> 0.8 -> 1.6 chain: a single sorted run wider than the tolerance
+    nodes = _nodes([0.8, 0.0, 1.6, 1.7, 0.5, 1.2, 2.5])
+
+    index = FloorIndex.from_nodes(nodes, tolerance=1.0)
+
+    assert index.groups() == _linear_groups(nodes, 1.0)
+
+
+def test_nodes_at_arbitrary_level_matches_scan():
+    nodes = _nodes([0.0, 0.9, 1.8, 1.0, 2.0, 0.1])
+    index = FloorIndex.from_nodes(nodes, tolerance=1.0)
+
+    for level in (0.0, 0.95, 1.5, 2.9, 5.0):
+        expected = [node.tag for node in nodes if abs(node.z - level) <= 1.0]
+        assert index.nodes_at(level) == expected
+
+
+def test_model_index_follows_add_node_and_direct_edits():
+    model = FEMModel()
+    for node in _nodes([0.0, 0.0, 3.0]):
+        model.add_node(node)
+    index = model.floor_index()
+
+    model.add_node(Node(tag=10, x=0.0, y=0.0, z=3.0))
+    assert model.floor_index() is index
+    assert index.groups() == {0.0: [1, 2], 3.0: [3, 10]}
+
+    model.nodes.pop(1)
+    assert model.floor_index().groups() == {0.0: [2], 3.0: [3, 10]}
+
+
+def test_explicit_floor_elevations_match_auto_grouping():
+    model = FEMModel()
+    tag = 1
+    for level in (0.0, 3.0, 6.0):
+        for x in (0.0, 6.0, 12.0):
+            model.add_node(Node(tag=tag, x=x, y=0.0, z=level + 1e-7))
+            tag += 1
+
+    masters = create_floor_rigid_diaphragms(model, floor_elevations=[0.0, 3.0, 6.0])
+
+    assert sorted(masters) == [3.0, 6.0]
+    slaves = {d.master_node: d.slave_nodes for d in model.diaphragms}
+    assert slaves[masters[3.0]] == [4, 5, 6]
+    assert slaves[masters[6.0]] == [7, 8, 9]
+
+
+def test_negative_tolerance_rejected():
+    with pytest.raises(ValueError):
+        FloorIndex(tolerance=-1.0)
@@ -0,0 +1,114 @@
+import numpy as np
+import pytest
+
+from src.core.data_models import WindResult
+from src.fem.iterative_solver import floor_blocks
+from src.fem.materials import reset_material_tags
+from src.fem.model_builder import ModelBuilderOptions, build_fem_model
+from src.fem.solver import analyze_model
+from src.fem.sparse_solver import SparseFEMSolver
+from tests.verification.benchmarks import build_benchmark_project_2x3
+
+LOAD_CASES = ["DL", "LL", "Wx", "Wy"]
+
+
+@pytest.fixture(scope="module")
+def model():
+    reset_material_tags()
+    project = build_benchmark_project_2x3()
+    project.wind_result = WindResult(base_shear=600.0, base_shear_x=600.0, base_shear_y=300.0)
+    return build_fem_model(project, ModelBuilderOptions(apply_wind_loads=True))
+
+
+@pytest.fixture(scope="module")
+def direct(model):
+    return SparseFEMSolver(model, method="lu").analyze_load_cases(LOAD_CASES)
+
+
+@pytest.mark.parametrize("method", ["pcg", "minres"])
+def test_block_jacobi_iterative_solve_matches_direct(model, direct, method) -> None:
+    solver = SparseFEMSolver(model, method=method, preconditioner="block_jacobi", rtol=1e-12)
+    results = solver.analyze_load_cases(LOAD_CASES)
+
+    assert "block-jacobi" in solver.factorization_method
+    for case in LOAD_CASES:
+        assert results[case].success and results[case].iterations > 0
+        np.testing.assert_allclose(
+            results[case].node_displacements.array,
+            direct[case].node_displacements.array,
+            rtol=1e-6, atol=1e-12,
+        )
+    assert solver._solve.stats.direct_fallbacks == 0
+
+
+def test_floor_blocks_partition_reduced_dofs_by_elevation(model) -> None:
+    solver = SparseFEMSolver(model)
+    system = solver.assemble()
+    node_z = np.array([model.nodes[int(tag)].z for tag in system.node_tags])
+
+    blocks = floor_blocks(system, node_z)
+
+    assert len(blocks) == len(np.unique(np.round(node_z[node_z > 0.0], 3)))
+    np.testing.assert_array_equal(np.sort(np.concatenate(blocks)), np.arange(system.n_free))
+
+
+def test_warm_start_and_direct_fallback(model, direct) -> None:
+    solver = SparseFEMSolver(model, method="pcg", preconditioner="block_jacobi")
+    first = solver.analyze_load_cases(LOAD_CASES)
+    again = solver.analyze_load_cases(LOAD_CASES)
+    assert all(again[c].iterations < first[c].iterations for c in LOAD_CASES)
+
+    stalled = SparseFEMSolver(model, method="pcg", preconditioner="block_jacobi", maxiter=2)
+    results = stalled.analyze_load_cases(LOAD_CASES)
+    assert stalled._solve.stats.direct_fallbacks == len(LOAD_CASES)
+    assert "direct fallback" in results["DL"].message
+    np.testing.assert_allclose(
+        results["Wx"].node_displacements.array,
+        direct["Wx"].node_displacements.array,
+        rtol=1e-9, atol=1e-14,
+    )
+
+
+def test_analyze_model_routes_iterative_mode_to_sparse_backend(model) -> None:
+    results = analyze_model(model, load_cases=["DL"], sparse_method="pcg")
+
+    assert results["DL"].success
+    assert results["DL"].iterations > 0
+    assert "PCG" in results["DL"].message
+
+
+def test_parallel_iterative_mode_solves_on_scipy_in_workers(model, direct) -> None:
+    results = analyze_model(model, load_cases=LOAD_CASES, parallel=True, max_workers=2,
+                            sparse_method="pcg")
+
+    assert list(results) == LOAD_CASES
+    for lc in LOAD_CASES:
+        assert results[lc].success, results[lc].message
+        assert results[lc].iterations > 0
+        assert "PCG" in results[lc].message
+        np.testing.assert_allclose(
+            results[lc].node_displacements.array,
+            direct[lc].node_displacements.array,
+            rtol=1e-6, atol=1e-10,
+        )
+
+
+def test_pre_1_12_scipy_receives_tol_keyword(model, direct, monkeypatch) -> None:
+    import src.fem.iterative_solver as iterative_solver
+    from src.fem.sparse_solver import spla
+
+    cg = spla.cg
+    received = []
+
+    def legacy_cg(A, b, x0=None, tol=1e-05, maxiter=None, M=None, callback=None):
+        received.append(tol)
+        return cg(A, b, x0=x0, rtol=tol, maxiter=maxiter, M=M, callback=callback)
+
+    monkeypatch.setattr(iterative_solver, "_RTOL_KEYWORD", "tol")
+    monkeypatch.setattr(spla, "cg", legacy_cg)
+    results = SparseFEMSolver(model, method="pcg", preconditioner="block_jacobi",
+                              rtol=1e-12).analyze_load_cases(["DL"])
+
+    assert received and set(received) == {1e-12}
+    np.testing.assert_allclose(results["DL"].node_displacements.array,
+                               direct["DL"].node_displacements.array, rtol=1e-6, atol=1e-12)
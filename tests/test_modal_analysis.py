@@ -0,0 +1,83 @@
+import numpy as np
+import pytest
+
+from src.fem.materials import reset_material_tags
+from src.fem.modal_analysis import ModalResultCache, build_lumped_mass, run_modal_analysis
+from src.fem.model_builder import ModelBuilderOptions, build_fem_model
+from src.fem.sparse_solver import SparseFEMSolver
+from tests.verification.benchmarks import build_benchmark_project_2x3
+
+
+def _build_model():
+    reset_material_tags()
+    return build_fem_model(build_benchmark_project_2x3(), ModelBuilderOptions())
+
+
+def test_periods_match_opensees_eigen_with_same_lumped_mass() -> None:
+    ops = pytest.importorskip("openseespy.opensees", reason="OpenSeesPy not available")
+    model = _build_model()
+    # OpenSees adds shell self-mass from rho; compare with nodal mass only
+    for params in list(model.sections.values()) + list(model.materials.values()):
+        if "rho" in params:
+            params["rho"] = 0.0
+    solver = SparseFEMSolver(model)
+    solver.factorize()
+    result = run_modal_analysis(model, n_modes=4, solver=solver)
+
+    mass = build_lumped_mass(model, solver)
+    model.build_openseespy_model()
+    for row, tag in enumerate(solver.system.node_tags):
+        node_mass = mass[row * 6]
+        if node_mass > 0.0:
+            ops.mass(int(tag), node_mass, node_mass, 0.0, 0.0, 0.0, 0.0)
+    ops.constraints("Transformation")
+    ops.numberer("RCM")
+    ops.system("UmfPack")
+    ops.algorithm("Linear")
+    ops.integrator("LoadControl", 1.0)
+    ops.analysis("Static")
+    expected = 2.0 * np.pi / np.sqrt(ops.eigen(4))
+    ops.wipe()
+
+    np.testing.assert_allclose(result.periods, expected, rtol=1e-6)
+
+
+def test_modes_are_mass_normalized_and_participation_bounded() -> None:
+    result = run_modal_analysis(_build_model(), n_modes=6)
+
+    assert np.all(np.diff(result.periods) <= 0.0)
+    assert result.fundamental_period == pytest.approx(result.periods[0])
+    for direction in ("X", "Y"):
+        cumulative = result.cumulative_mass_ratio(direction)
+        assert 0.9 < cumulative[-1] <= 1.0 + 1e-9
+    assert {result.dominant_direction(0), result.dominant_direction(1)} == {"X", "Y"}
+    assert set(result.mode_shape(0).tags.tolist()) == set(result.node_tags.tolist())
+
+
+def test_cache_is_keyed_by_model_fingerprint() -> None:
+    cache = ModalResultCache(max_entries=2)
+    first = cache.get(_build_model(), n_modes=3)
+    assert cache.get(_build_model(), n_modes=3) is first
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    stiffer = _build_model()
+    for params in stiffer.sections.values():
+        if "Iz" in params:
+            params["Iz"] *= 2.0
+    changed = cache.get(stiffer, n_modes=3)
+    assert cache.misses == 2
+    assert changed.fingerprint != first.fingerprint
+    assert changed.fundamental_period < first.fundamental_period
+
+
+def test_modal_table_reports_periods_and_cumulative_participation() -> None:
+    from src.ui.modal_details import build_modal_dataframe, build_modal_summary
+
+    result = run_modal_analysis(_build_model(), n_modes=4)
+    df = build_modal_dataframe(result)
+    summary = build_modal_summary(result)
+
+    assert list(df["Mode"]) == [1, 2, 3, 4]
+    assert df["Period (s)"].iloc[0] == pytest.approx(result.fundamental_period, abs=1e-4)
+    assert df["ΣMx (%)"].iloc[-1] == pytest.approx(100.0 * summary["cumulative_x"], abs=0.1)
+    assert summary["total_mass_t"] > 0.0
@@ -0,0 +1,85 @@
+"""
+Test canonical model keys and the shared LRU model cache.
+"""
+
+import copy
+from dataclasses import replace
+
+import pytest
+
+from src.core.data_models import GeometryInput, ProjectData
+from src.fem.fem_engine import FEMModel, Node
+from src.fem.model_builder import ModelBuilderOptions
+from src.fem.model_cache import ModelCache, canonical_key
+from src.fem.model_snapshot import snapshot_bytes
+
+
+def _model(n_nodes: int) -> FEMModel:
+    model = FEMModel()
+    for tag in range(1, n_nodes + 1):
+        model.add_node(Node(tag=tag, x=float(tag), y=0.0, z=0.0))
+    return model
+
+
+def test_canonical_key_is_order_and_identity_independent():
+    project = ProjectData(geometry=GeometryInput(bay_x=6.0, bay_y=6.0, floors=12))
+    options = ModelBuilderOptions(suggested_omit_columns=("C1", "C2"))
+
+    key = canonical_key(project, options, {"b": 1, "a": -0.0})
+
+    assert key == canonical_key(copy.deepcopy(project), replace(options), {"a": 0.0, "b": 1})
+    assert key != canonical_key(project, replace(options, shell_mesh_density="fine"), {"a": 0.0, "b": 1})
+    taller = ProjectData(geometry=GeometryInput(bay_x=6.0, bay_y=6.0, floors=13))
+    assert key != canonical_key(taller, options, {"a": 0.0, "b": 1})
+    assert canonical_key(1) != canonical_key(1.5) != canonical_key("1.5")
+
+
+def test_lru_evicts_oldest_within_budget():
+    model = _model(10)
+    cache = ModelCache(max_bytes=2 * len(snapshot_bytes(model)))
+
+    cache.put("a", model)
+    cache.put("b", _model(10))
+    assert cache.get("a") is not None
+    cache.put("c", _model(10))
+
+    assert "b" not in cache
+    assert "a" in cache and "c" in cache
+    assert cache.current_bytes == 2 * len(snapshot_bytes(model))
+    assert (cache.hits, cache.misses) == (1, 0)
+
+
+def test_every_lookup_returns_a_private_model():
+    model = _model(10)
+    cache = ModelCache()
+    cache.put("a", model)
+
+    first = cache.get("a")
+    first.add_node(Node(tag=99, x=0.0, y=1.0, z=0.0))
+    second = cache.get("a")
+
+    assert first is not model and second is not model
+    assert second.fingerprint() == model.fingerprint()
+
+
+def test_evicted_models_spill_to_disk_and_reload(tmp_path):
+    model = _model(10)
+    cache = ModelCache(max_bytes=len(snapshot_bytes(model)), spill_dir=tmp_path)
+
+    cache.put("a", model, variant="sizes-1")
+    cache.put("b", _model(10))
+    assert len(cache) == 1
+    assert "a" in cache
+
+    restored, variant = cache.lookup("a")
+    assert variant == "sizes-1"
+    assert restored.fingerprint() == model.fingerprint()
+    assert len(cache) == 1
+
+    cache.discard("a")
+    assert cache.get("a") is None
+
+
+def test_non_positive_budget_rejected():
+    with pytest.raises(ValueError):
+        ModelCache(max_bytes=0)
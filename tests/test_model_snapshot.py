@@ -0,0 +1,96 @@
+"""
+Test FEMModel snapshot round trips and lazy loading.
+"""
+
+import numpy as np
+import pytest
+
+from src.fem.fem_engine import (
+    Element,
+    ElementType,
+    FEMModel,
+    Load,
+    Node,
+    RigidDiaphragm,
+    SurfaceLoad,
+    UniformLoad,
+    create_simple_frame_model,
+)
+from src.fem.materials import ConcreteGrade, reset_material_tags
+from src.fem.model_snapshot import (
+    ModelSnapshot,
+    load_snapshot,
+    save_snapshot,
+    snapshot_bytes,
+    snapshot_from_bytes,
+)
+
+
+@pytest.fixture
+def model() -> FEMModel:
+    reset_material_tags()
+    model = create_simple_frame_model(
+        bay_width=4.0, bay_height=3.0, n_bays=1, n_stories=1,
+        concrete_grade=ConcreteGrade.C30, beam_width=300, beam_height=500,
+        column_width=400, column_height=400,
+    )
+    model.add_node(Node(tag=10, x=4.0, y=4.0, z=3.0))
+    model.add_node(Node(tag=11, x=0.0, y=4.0, z=3.0))
+    model.add_material(99, {"material_type": "ElasticIsotropic", "E": 30e9, "nu": 0.2})
+    model.add_element(Element(
+        tag=50, element_type=ElementType.SHELL_MITC4, node_tags=[3, 4, 10, 11],
+        material_tag=99, geometry={"vecxz": (0.0, 0.0, 1.0), "panel": {"id": "S1", "holes": [1, 2]}},
+    ))
+    first_element = next(iter(model.elements.values()))
+    first_element.geometry.update({"parent_beam_id": 7, "vecxz": (0.0, 0.0, 1.0)})
+    model.add_load(Load(node_tag=4, load_values=[0, 0, -1e4, 0, 0, 0], load_pattern=2))
+    model.add_uniform_load(UniformLoad(element_tag=first_element.tag, load_type="Gravity",
+                                       magnitude=1500.0, visual_only=True))
+    model.add_surface_load(SurfaceLoad(element_tag=50, pressure=2500.0, load_pattern=3))
+    model.add_rigid_diaphragm(RigidDiaphragm(master_node=11, slave_nodes=[3, 4, 10]))
+    model.omitted_columns.append({"x": 2.0, "y": 2.0, "id": "C7"})
+    return model
+
+
+def _assert_same_model(restored: FEMModel, original: FEMModel) -> None:
+    assert restored.fingerprint() == original.fingerprint()
+    assert list(restored.nodes) == list(original.nodes)
+    for tag, elem in original.elements.items():
+        assert restored.elements[tag].geometry == elem.geometry
+    assert restored.omitted_columns == original.omitted_columns
+
+
+def test_directory_snapshot_round_trip(model, tmp_path):
+    path = save_snapshot(model, tmp_path / "snapshot")
+    snapshot = load_snapshot(path)
+
+    assert snapshot.fingerprint == model.fingerprint()
+    assert snapshot.n_elements == len(model.elements)
+    assert isinstance(snapshot["node_coords"], np.memmap)
+    _assert_same_model(snapshot.to_model(), model)
+
+
+def test_bytes_snapshot_round_trip(model):
+    snapshot = snapshot_from_bytes(snapshot_bytes(model))
+
+    assert snapshot.element_connectivity(len(model.elements) - 1).tolist() == [3, 4, 10, 11]
+    _assert_same_model(snapshot.to_model(), model)
+
+
+def test_arrays_open_lazily(model, tmp_path):
+    opened = []
+    snapshot = load_snapshot(save_snapshot(model, tmp_path / "snapshot"))
+    opener = snapshot._opener
+    snapshot._opener = lambda name: opened.append(name) or opener(name)
+
+    snapshot["node_tags"]
+    snapshot["node_tags"]
+
+    assert opened == ["node_tags"]
+
+
+def test_other_version_is_rejected(model):
+    snapshot = snapshot_from_bytes(snapshot_bytes(model))
+
+    with pytest.raises(ValueError):
+        ModelSnapshot(dict(snapshot.meta, version=0), snapshot._opener)
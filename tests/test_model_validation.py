@@ -0,0 +1,97 @@
+"""
+Test array-based model validation and its revision cache.
+"""
+
+import numpy as np
+
+import src.fem.model_validation as model_validation
+from src.fem.fem_engine import Element, ElementType, FEMModel, Load, Node, SurfaceLoad, UniformLoad
+
+
+def _shell_model() -> FEMModel:
+    model = FEMModel()
+    model.add_node(Node(tag=1, x=0.0, y=0.0, z=0.0, restraints=[1, 1, 1, 1, 1, 1]))
+    model.add_node(Node(tag=2, x=6.0, y=0.0, z=0.0))
+    model.add_node(Node(tag=3, x=6.0, y=1.0, z=0.0))
+    model.add_node(Node(tag=4, x=0.0, y=1.0, z=0.0))
+    model.add_node(Node(tag=5, x=0.0, y=1.0, z=0.0))
+    model.add_node(Node(tag=6, x=9.0, y=9.0, z=9.0))
+    model.add_material(1, {"material_type": "ElasticIsotropic"})
+    model.add_element(Element(tag=10, element_type=ElementType.SHELL_MITC4,
+                              node_tags=[1, 2, 3, 4], material_tag=1))
+    model.add_element(Element(tag=11, element_type=ElementType.SHELL_DKGT,
+                              node_tags=[4, 5, 1], material_tag=1))
+    return model
+
+
+def test_report_lists_structured_diagnostics():
+    report = _shell_model().validation_report()
+
+    assert report.orphan_nodes.tolist() == [6]
+    assert report.zero_length_elements.tolist() == [11]
+    assert report.shell_tags.tolist() == [10, 11]
+    assert report.shell_aspect_ratios[0] == 6.0
+    assert np.isnan(report.shell_aspect_ratios[1])
+    assert report.high_aspect_shells == [(10, 6.0)]
+    assert not report.is_valid
+    assert report.errors[0].startswith("Found 1 orphan node(s)")
+    assert report.errors[1].startswith("Element 11 has zero/near-zero length")
+
+
+def test_unchanged_model_is_not_revalidated(monkeypatch):
+    model = _shell_model()
+    calls = []
+    original = model_validation.validate_model_arrays
+
+    def counting(m):
+        calls.append(m)
+        return original(m)
+
+    monkeypatch.setattr(model_validation, "validate_model_arrays", counting)
+
+    first = model.validate_model()
+    assert model.validate_model() == first
+    assert len(calls) == 1
+
+    model.add_element(Element(tag=12, element_type=ElementType.SHELL_DKGT,
+                              node_tags=[2, 6, 3], material_tag=1))
+    model.validate_model()
+    assert len(calls) == 2
+
+    model.nodes[6].restraints = [1, 1, 1, 0, 0, 0]
+    model.mark_modified()
+    model.validate_model()
+    assert len(calls) == 3
+
+
+def test_elements_with_removed_nodes_are_reported():
+    model = _shell_model()
+    model.nodes.pop(3)
+
+    is_valid, errors = model.validate_model()
+
+    assert not is_valid
+    assert "Element 10 references missing node 3" in errors
+
+
+def test_cached_validation_reports_the_same_diagnostics(caplog):
+    model = _shell_model()
+
+    with caplog.at_level("WARNING", logger="src.fem.fem_engine"):
+        first = model.validate_model()
+        second = model.validate_model()
+
+    assert second == first
+    warnings = [r.getMessage() for r in caplog.records if "aspect ratio warning" in r.getMessage()]
+    assert len(warnings) == 2 and warnings[0] == warnings[1]
+
+
+def test_adding_loads_bumps_the_revision():
+    model = _shell_model()
+    revision = model._revision
+
+    model.add_load(Load(node_tag=2, load_values=[0, 0, -1.0, 0, 0, 0]))
+    model.add_uniform_load(UniformLoad(element_tag=10, load_type="Gravity", magnitude=1.0))
+    model.add_surface_load(SurfaceLoad(element_tag=10, pressure=1.0))
+
+    assert model._revision == revision + 3
@@ -1,12 +1,17 @@
+import dataclasses
+
 import pytest
 
+from src.core.data_models import WindResult
 from src.fem.fem_engine import Load, create_simple_frame_model
 from src.fem.materials import ConcreteGrade, reset_material_tags
+from src.fem.model_builder import ModelBuilderOptions, build_fem_model, update_fem_model_sections
 from src.fem.solver import (
     AnalysisResult,
     LOAD_CASE_PATTERN_MAP,
     analyze_model,
 )
+from tests.verification.benchmarks import build_benchmark_project_2x3
 
 
 def test_analyze_model_returns_dict(ops_monkeypatch) -> None:
@@ -189,3 +194,226 @@ def test_backward_compatibility_single_result(ops_monkeypatch) -> None:
     assert "combined" in results
     result = results["combined"]
     assert isinstance(result, AnalysisResult)
+
+
+def test_analyze_model_factorizes_once_for_multiple_cases(ops_monkeypatch) -> None:
+    reset_material_tags()
+    model = create_simple_frame_model(
+        bay_width=4.0,
+        bay_height=3.0,
+        n_bays=1,
+        n_stories=1,
+        concrete_grade=ConcreteGrade.C30,
+        beam_width=300,
+        beam_height=500,
+        column_width=400,
+        column_height=400,
+    )
+    for pattern_id in (1, 2, 3):
+        model.add_load(
+            Load(node_tag=4, load_values=[0, 0, -1000 * pattern_id, 0, 0, 0], load_pattern=pattern_id)
+        )
+
+    ops_monkeypatch.displacements = {1: [0] * 6, 2: [0] * 6, 3: [0] * 6, 4: [0] * 6}
+    ops_monkeypatch.element_forces = {1: [0.0] * 12, 2: [0.0] * 12, 3: [0.0] * 12}
+
+    results = analyze_model(model, load_cases=["DL", "SDL", "LL"])
+
+    assert all(result.success for result in results.values())
+    assert list(results.keys()) == ["DL", "SDL", "LL"]
+    assert ops_monkeypatch.wipe_calls == 1
+    assert ops_monkeypatch.algorithm_args == [("Linear", "-factorOnce")]
+    analyze_calls = [args for args in ops_monkeypatch.analysis_args if args and args[0] == "analyze"]
+    assert len(analyze_calls) == 3
+
+
+def test_analyze_model_refactorizes_after_failed_case(ops_monkeypatch) -> None:
+    reset_material_tags()
+    model = create_simple_frame_model(
+        bay_width=4.0,
+        bay_height=3.0,
+        n_bays=1,
+        n_stories=1,
+        concrete_grade=ConcreteGrade.C30,
+        beam_width=300,
+        beam_height=500,
+        column_width=400,
+        column_height=400,
+    )
+    model.add_load(Load(node_tag=4, load_values=[0, 0, -1000, 0, 0, 0], load_pattern=1))
+    model.add_load(Load(node_tag=4, load_values=[0, 0, -2000, 0, 0, 0], load_pattern=2))
+    ops_monkeypatch.analyze_result = -3
+
+    results = analyze_model(model, load_cases=["DL", "SDL"])
+
+    assert not results["DL"].success
+    assert not results["SDL"].success
+    assert results["SDL"].message.startswith("SDL:")
+    assert ops_monkeypatch.wipe_calls == 2
+    assert len(ops_monkeypatch.algorithm_args) == 2
+
+
+def test_analyze_model_without_factorize_once_reconfigures_each_case(ops_monkeypatch) -> None:
+    reset_material_tags()
+    model = create_simple_frame_model(
+        bay_width=4.0,
+        bay_height=3.0,
+        n_bays=1,
+        n_stories=1,
+        concrete_grade=ConcreteGrade.C30,
+        beam_width=300,
+        beam_height=500,
+        column_width=400,
+        column_height=400,
+    )
+    model.add_load(Load(node_tag=4, load_values=[0, 0, -1000, 0, 0, 0], load_pattern=1))
+    model.add_load(Load(node_tag=4, load_values=[0, 0, -2000, 0, 0, 0], load_pattern=2))
+
+    results = analyze_model(model, load_cases=["DL", "SDL"], factorize_once=False)
+
+    assert all(result.success for result in results.values())
+    assert ops_monkeypatch.algorithm_args == [("Linear",), ("Linear",)]
+
+
+@pytest.mark.integration
+def test_factorize_once_matches_per_case_solve() -> None:
+    pytest.importorskip("openseespy.opensees", reason="OpenSeesPy not available")
+
+    project = build_benchmark_project_2x3()
+    project.geometry.floors = 3
+    project.wind_result = WindResult(base_shear=600.0, base_shear_x=600.0, base_shear_y=300.0)
+    model = build_fem_model(
+        project,
+        ModelBuilderOptions(
+            include_core_wall=False,
+            include_slabs=True,
+            apply_gravity_loads=True,
+            apply_wind_loads=True,
+        ),
+    )
+    load_cases = ["DL", "SDL", "LL", "Wx", "Wy", "Wtz"]
+
+    reference = analyze_model(model, load_cases=load_cases, factorize_once=False)
+    factorized = analyze_model(model, load_cases=load_cases, factorize_once=True)
+
+    for case in load_cases:
+        assert reference[case].success, reference[case].message
+        assert factorized[case].success, factorized[case].message
+        for tag, disp in reference[case].node_displacements.items():
+            assert factorized[case].node_displacements[tag] == pytest.approx(disp, abs=1e-12)
+        for tag, forces in reference[case].element_forces.items():
+            for key, value in forces.items():
+                assert factorized[case].element_forces[tag][key] == pytest.approx(value, rel=1e-9, abs=1e-6)
+
+
+@pytest.mark.integration
+def test_section_update_reuses_structure_and_matches_rebuild() -> None:
+    pytest.importorskip("openseespy.opensees", reason="OpenSeesPy not available")
+
+    project = build_benchmark_project_2x3()
+    options = ModelBuilderOptions(include_core_wall=False, include_slabs=True, apply_wind_loads=False)
+    load_cases = ["DL", "SDL", "LL"]
+    model = build_fem_model(project, options)
+    analyze_model(model, load_cases=load_cases)
+
+    project.primary_beam_result.width = 400
+    project.primary_beam_result.depth = 800
+    project.column_result.dimension = 700
+    project.slab_result.self_weight = 0.200 * 24.5
+    options = dataclasses.replace(options, slab_thickness=0.200)
+    assert update_fem_model_sections(model, project, options)
+    assert model.has_live_ops_domain()
+    patched = analyze_model(model, load_cases=load_cases, reuse_structure=True)
+    reference = analyze_model(build_fem_model(project, options), load_cases=load_cases)
+
+    for case in load_cases:
+        assert patched[case].success, patched[case].message
+        for tag, disp in reference[case].node_displacements.items():
+            assert patched[case].node_displacements[tag] == pytest.approx(disp, rel=1e-9, abs=1e-12)
+
+
+def test_split_load_case_groups_is_contiguous_and_balanced() -> None:
+    from src.fem.solver import _split_load_case_groups
+
+    cases = ["DL", "SDL", "LL", "Wx", "Wy", "Wtz", "LL_P1"]
+
+    assert _split_load_case_groups(cases, 3) == [
+        ["DL", "SDL", "LL"],
+        ["Wx", "Wy"],
+        ["Wtz", "LL_P1"],
+    ]
+    assert _split_load_case_groups(cases[:2], 8) == [["DL"], ["SDL"]]
+
+
+def test_parallel_analysis_captures_failed_group(monkeypatch) -> None:
+    from concurrent.futures import Future
+
+    import src.fem.solver as solver_module
+
+    class FakeExecutor:
+        def __init__(self, *args, initializer=None, initargs=(), **kwargs):
+            initializer(*initargs)
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+        def submit(self, fn, group, *args):
+            future = Future()
+            if "LL" in group:
+                future.set_exception(RuntimeError("worker crashed"))
+            else:
+                future.set_result(fn(group, *args))
+            return future
+
+    monkeypatch.setattr(solver_module, "ProcessPoolExecutor", FakeExecutor)
+    reset_material_tags()
+    model = build_fem_model(
+        build_benchmark_project_2x3(),
+        ModelBuilderOptions(include_slabs=False, apply_wind_loads=False),
+    )
+
+    results = analyze_model(
+        model,
+        load_cases=["DL", "SDL", "LL"],
+        backend="scipy",
+        parallel=True,
+        max_workers=3,
+    )
+
+    assert list(results) == ["DL", "SDL", "LL"]
+    assert results["DL"].success and results["SDL"].success
+    assert not results["LL"].success
+    assert "worker crashed" in results["LL"].message
+
+
+@pytest.mark.integration
+def test_parallel_load_cases_match_serial() -> None:
+    pytest.importorskip("openseespy.opensees", reason="OpenSeesPy not available")
+
+    project = build_benchmark_project_2x3()
+    project.wind_result = WindResult(base_shear=900.0, base_shear_x=900.0, base_shear_y=600.0)
+    model = build_fem_model(
+        project,
+        ModelBuilderOptions(
+            include_core_wall=False,
+            include_slabs=False,
+            apply_gravity_loads=True,
+            apply_wind_loads=True,
+            apply_rigid_diaphragms=True,
+        ),
+    )
+    load_cases = ["Wy", "DL", "SDL", "LL", "Wx", "Wtz"]
+
+    serial = analyze_model(model, load_cases=load_cases)
+    parallel = analyze_model(model, load_cases=load_cases, parallel=True, max_workers=3)
+
+    assert list(parallel) == load_cases
+    for lc in load_cases:
+        assert parallel[lc].success, parallel[lc].message
+        for tag, disp in serial[lc].node_displacements.items():
+            assert parallel[lc].node_displacements[tag] == pytest.approx(disp, rel=1e-9, abs=1e-15)
+        for tag, forces in serial[lc].element_forces.items():
+            assert parallel[lc].element_forces[tag] == pytest.approx(forces, rel=1e-9, abs=1e-6)
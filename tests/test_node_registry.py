@@ -0,0 +1,79 @@
+"""
+Test NodeRegistry spatial-hash deduplication and the batch API.
+"""
+
+import numpy as np
+import pytest
+
+from src.fem.fem_engine import FEMModel
+from src.fem.model_builder import FLOOR_NODE_BASE, NodeRegistry
+
+
+@pytest.fixture
+def registry():
+    return NodeRegistry(FEMModel(), tolerance=1e-6)
+
+
+def test_points_straddling_rounding_boundary_merge(registry):
+    # round(x, 6) puts these 0.2e-6 apart points in different keys
+    first = registry.get_or_create(0.0000004999, 0.0, 3.0, floor_level=1)
+    second = registry.get_or_create(0.0000005001, 0.0, 3.0, floor_level=1)
+
+    assert first == second
+    assert len(registry.model.nodes) == 1
+
+
+def test_points_straddling_hash_cell_boundary_merge(registry):
+    boundary = registry._cell_size * 0.5
+    first = registry.get_or_create(boundary - 4e-7, 1.0, 3.0)
+    second = registry.get_or_create(boundary + 4e-7, 1.0, 3.0)
+
+    assert first == second
+    assert registry.get_or_create(boundary + 2e-6, 1.0, 3.0) != first
+
+
+def test_nearest_registered_node_wins(registry):
+    near = registry.get_or_create(1.0, 0.0, 0.0)
+    far = registry.get_or_create(1.0 + 1.5e-6, 0.0, 0.0)
+
+    assert far != near
+    assert registry.get_existing(1.0 + 1.0e-6, 0.0, 0.0) == far
+
+
+def test_batch_matches_sequential_calls():
+    coords = np.array([
+        [0.0, 0.0, 4.0],
+        [2.0, 0.0, 4.0],
+        [0.0, 0.0, 4.0 + 1e-7],  # duplicate within the batch
+        [2.0, 3.0, 8.0],
+    ])
+    levels = [1, 1, 1, 2]
+    restraints = np.zeros((4, 6), dtype=int)
+    restraints[2] = 1
+
+    sequential = NodeRegistry(FEMModel())
+    expected = [
+        sequential.get_or_create(*point, restraints=list(r) if r.any() else None, floor_level=level)
+        for point, r, level in zip(coords.tolist(), restraints, levels)
+    ]
+    batched = NodeRegistry(FEMModel())
+    tags = batched.get_or_create_many(coords, restraints=restraints, floor_levels=levels)
+
+    assert tags.tolist() == expected == [FLOOR_NODE_BASE + 1, FLOOR_NODE_BASE + 2, FLOOR_NODE_BASE + 1,
+                                        2 * FLOOR_NODE_BASE + 1]
+    assert batched.model.nodes[tags[0]].restraints == [1, 1, 1, 1, 1, 1]
+    assert batched.nodes_by_floor == sequential.nodes_by_floor
+
+
+def test_find_many_and_register_many(registry):
+    registry.register_many([60001, 60002], [[1.0, 1.0, 4.0], [2.0, 1.0, 4.0]], floor_level=1)
+
+    tags = registry.find_many([[1.0, 1.0, 4.0], [1.5, 1.0, 4.0], [2.0, 1.0 - 1e-7, 4.0]])
+
+    assert tags.tolist() == [60001, -1, 60002]
+    assert registry.nodes_by_floor[1] == [60001, 60002]
+
+
+def test_rejects_non_positive_tolerance():
+    with pytest.raises(ValueError, match="tolerance"):
+        NodeRegistry(FEMModel(), tolerance=0.0)
@@ -0,0 +1,95 @@
+import numpy as np
+import pytest
+
+from src.fem.combination_processor import compute_envelope
+from src.fem.load_combinations import LoadCombinationLibrary, LoadComponentType
+from src.fem.materials import reset_material_tags
+from src.fem.model_builder import ModelBuilderOptions, build_fem_model
+from src.fem.pattern_loading import (
+    analyze_pattern_live_loads,
+    column_grid_lines,
+    combine_with_live_load_bounds,
+    envelope_pattern_results,
+    generate_live_load_patterns,
+    with_pattern_live_load_cases,
+)
+from src.fem.result_tables import ElementForceTable
+from src.fem.solver import AnalysisResult
+from src.fem.sparse_solver import analyze_model_sparse
+from tests.verification.benchmarks import build_benchmark_project_2x3
+
+
+@pytest.fixture(scope="module")
+def model():
+    reset_material_tags()
+    return build_fem_model(build_benchmark_project_2x3(), ModelBuilderOptions())
+
+
+@pytest.fixture(scope="module")
+def pattern_results(model):
+    return analyze_pattern_live_loads(model, mode="all")
+
+
+def test_patterns_follow_column_bays(model) -> None:
+    grid = column_grid_lines(model)
+    cases = generate_live_load_patterns(grid, mode="checkerboard")
+
+    np.testing.assert_allclose(grid["X"], [0.0, 6.0, 12.0])
+    np.testing.assert_allclose(grid["Y"], [0.0, 6.0, 12.0, 18.0])
+    assert list(cases) == ["LL_FULL", "LL_X1", "LL_X2", "LL_Y1", "LL_Y2"]
+    assert cases["LL_Y1"][1].loaded_spans == [0, 2]
+
+
+def test_checkerboard_patterns_partition_the_full_live_load(model, pattern_results) -> None:
+    reference = analyze_model_sparse(model, ["LL"])["LL"]
+    tags = list(model.nodes)
+
+    full = pattern_results["LL_FULL"].node_displacements.rows_for(tags)
+    np.testing.assert_allclose(full, reference.node_displacements.rows_for(tags), atol=1e-12)
+    np.testing.assert_allclose(
+        pattern_results["LL_Y1"].node_displacements.rows_for(tags)
+        + pattern_results["LL_Y2"].node_displacements.rows_for(tags),
+        full,
+        atol=1e-12,
+    )
+
+
+def test_live_load_envelopes_bound_every_pattern_per_element(model, pattern_results) -> None:
+    patterns = [result for name, result in pattern_results.items() if name not in ("LL_MAX", "LL_MIN")]
+    stacked = np.stack([result.element_forces.frame_array for result in patterns])
+
+    np.testing.assert_allclose(pattern_results["LL_MAX"].element_forces.frame_array, stacked.max(axis=0))
+    np.testing.assert_allclose(pattern_results["LL_MIN"].element_forces.frame_array, stacked.min(axis=0))
+    uniform = pattern_results["LL_FULL"].element_forces.frame_array
+    assert np.any(pattern_results["LL_MAX"].element_forces.frame_array > uniform + 1.0)
+
+    merged = with_pattern_live_load_cases(model, {"LL": pattern_results["LL_FULL"]})
+    assert merged["LL"] is pattern_results["LL_FULL"]
+    assert merged["LL_MAX"].message.startswith("LL_MAX: envelope of")
+    assert "LL_X1" in merged and "LL_MIN" in merged
+
+
+def _frame_result(value: float) -> AnalysisResult:
+    return AnalysisResult(
+        success=True,
+        message="ok",
+        element_forces=ElementForceTable.from_frame_arrays([1], np.full((1, 12), value)),
+    )
+
+
+def test_combinations_keep_opposite_sign_pattern_with_dead_load() -> None:
+    patterns = {"LL_X1": _frame_result(100.0), "LL_X2": _frame_result(-80.0)}
+    results = {"DL": _frame_result(-200.0), "LL": _frame_result(20.0), **patterns}
+    results.update(envelope_pattern_results(list(patterns.values())))
+    by_name = {comb.name: comb for comb in LoadCombinationLibrary.get_all_combinations()}
+    combination, wind = by_name["LC1"], by_name["LC_W1_MAX"]  # 1.4DL + 1.4SDL + 1.6LL
+    assert combination.get_factor(LoadComponentType.LL) == 1.6
+
+    combined = combine_with_live_load_bounds(results, [combination, wind])
+    envelope = compute_envelope(combined)
+
+    assert list(combined) == ["LC1 [LL_MAX]", "LC1 [LL_MIN]", "LC_W1_MAX"]
+    # A single signed LL envelope (+100) would give |1.4(-200) + 1.6(100)| = 120
+    worst = 1.4 * -200.0 + 1.6 * -80.0
+    assert envelope[1].Mz_min.min_value == pytest.approx(worst)
+    assert envelope[1].Mz_max.max_value == pytest.approx(abs(worst))
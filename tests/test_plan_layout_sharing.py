@@ -0,0 +1,90 @@
+"""Sharing beam trimming and slab layouts across floors in model building."""
+from dataclasses import replace
+
+import pytest
+
+from src.core.data_models import (
+    CoreWallConfig,
+    CoreWallGeometry,
+    GeometryInput,
+    LateralInput,
+    LoadInput,
+    MaterialInput,
+    ProjectData,
+    TubeOpeningPlacement,
+)
+from src.fem import model_builder
+from src.fem.builders.director import FEMModelDirector
+from src.fem.materials import reset_material_tags
+from src.fem.model_builder import FLOOR_NODE_BASE, ModelBuilderOptions, build_fem_model
+
+OPTIONS = ModelBuilderOptions(include_core_wall=True, include_slabs=True, num_secondary_beams=1)
+
+
+def _tube_project(floors: int, num_bays: int = 2) -> ProjectData:
+    return ProjectData(
+        geometry=GeometryInput(
+            bay_x=8.0,
+            bay_y=8.0,
+            floors=floors,
+            story_height=3.6,
+            num_bays_x=num_bays,
+            num_bays_y=num_bays,
+        ),
+        loads=LoadInput(live_load_class="2", live_load_sub="2.5", dead_load=2.0),
+        materials=MaterialInput(fcu_slab=35, fcu_beam=40, fcu_column=45),
+        lateral=LateralInput(
+            building_width=8.0 * num_bays,
+            building_depth=8.0 * num_bays,
+            core_geometry=CoreWallGeometry(
+                config=CoreWallConfig.TUBE_WITH_OPENINGS,
+                wall_thickness=400.0,
+                length_x=4000.0,
+                length_y=4000.0,
+                opening_width=2000.0,
+                opening_height=None,
+                opening_placement=TubeOpeningPlacement.TOP_BOT,
+            ),
+        ),
+    )
+
+
+def _build(options: ModelBuilderOptions, floors: int = 4, director: bool = False):
+    reset_material_tags()
+    project = _tube_project(floors)
+    if director:
+        return FEMModelDirector(project, options).build()
+    return build_fem_model(project, options)
+
+
+@pytest.mark.parametrize("director", [False, True])
+def test_shared_plan_layouts_match_floor_by_floor_build(director):
+    shared = _build(OPTIONS, director=director)
+    per_floor = _build(replace(OPTIONS, share_plan_layouts=False), director=director)
+
+    assert shared.fingerprint() == per_floor.fingerprint()
+
+
+def test_beam_trimming_runs_once_per_plan(monkeypatch):
+    calls = []
+    trim = model_builder.trim_beam_segment_against_polygon
+
+    def counting_trim(**kwargs):
+        calls.append(kwargs)
+        return trim(**kwargs)
+
+    monkeypatch.setattr(model_builder, "trim_beam_segment_against_polygon", counting_trim)
+    _build(OPTIONS, floors=2)
+    two_floors = len(calls)
+    calls.clear()
+    _build(OPTIONS, floors=6)
+
+    assert len(calls) == two_floors
+
+
+def test_tall_building_slab_nodes_clear_floor_tags():
+    # Floor 61 numbers nodes from 61001, above the default slab base 60000
+    model = _build(replace(OPTIONS, include_core_wall=False), floors=61)
+
+    assert 61 * FLOOR_NODE_BASE + 1 in model.nodes
+    assert 62 * FLOOR_NODE_BASE in model.nodes  # first slab node
@@ -0,0 +1,133 @@
+import copy
+
+import numpy as np
+import pytest
+
+from src.core.data_models import WindResult
+from src.fem.materials import reset_material_tags
+from src.fem.model_builder import ModelBuilderOptions, build_fem_model
+from src.fem.reanalysis import LowRankReanalysis
+from src.fem.sparse_solver import analyze_model_sparse
+from tests.verification.benchmarks import build_benchmark_project_2x3
+
+LOAD_CASES = ["DL", "Wx"]
+
+
+@pytest.fixture(scope="module")
+def frame_model():
+    reset_material_tags()
+    project = build_benchmark_project_2x3()
+    project.wind_result = WindResult(base_shear=600.0, base_shear_x=600.0, base_shear_y=300.0)
+    return build_fem_model(
+        project,
+        ModelBuilderOptions(include_core_wall=False, include_slabs=True, apply_wind_loads=True),
+    )
+
+
+def _groups(model) -> dict:
+    ground_columns = [
+        tag for tag, elem in model.elements.items()
+        if elem.section_tag == 3 and model.nodes[elem.node_tags[0]].z < 4.0
+    ]
+    level_1_beams = [
+        tag for tag, elem in model.elements.items()
+        if elem.section_tag == 1 and model.nodes[elem.node_tags[0]].z == pytest.approx(4.0)
+    ]
+    return {"ground_columns": ground_columns, "level_1_beams": level_1_beams[:8]}
+
+
+def _reference(model, groups: dict, design: dict) -> dict:
+    """Re-assemble and solve a copy with the design sections applied."""
+    changed = copy.deepcopy(model)
+    for offset, (name, section) in enumerate(design.items()):
+        tag = 900 + offset
+        changed.sections[tag] = dict(section, tag=tag)
+        for element_tag in groups[name]:
+            changed.elements[element_tag].section_tag = tag
+    return analyze_model_sparse(changed, LOAD_CASES)
+
+
+def _scaled(section: dict, **factors: float) -> dict:
+    return {**section, **{key: section[key] * factor for key, factor in factors.items()}}
+
+
+def test_woodbury_update_matches_refactorized_solution(frame_model) -> None:
+    groups = _groups(frame_model)
+    # Rank of this design is above the default threshold; keep it low-rank
+    reanalysis = LowRankReanalysis(frame_model, groups, LOAD_CASES, rank_threshold=400)
+    design = {
+        "ground_columns": _scaled(frame_model.sections[3], A=1.5, Iy=2.0, Iz=2.5, J=2.0),
+        "level_1_beams": _scaled(frame_model.sections[1], Iz=1.8),
+    }
+
+    results = reanalysis.analyze(design)
+    reference = _reference(frame_model, groups, design)
+
+    assert reanalysis.stats.refactorizations == 0
+    assert 0 < reanalysis.stats.last_rank <= 6 * sum(len(tags) for tags in groups.values())
+    for case in LOAD_CASES:
+        assert results[case].success
+        np.testing.assert_allclose(
+            results[case].node_displacements.array,
+            reference[case].node_displacements.array,
+            rtol=1e-7, atol=1e-12,
+        )
+        np.testing.assert_allclose(
+            results[case].element_forces.frame_array,
+            reference[case].element_forces.frame_array,
+            rtol=1e-6, atol=1e-3,
+        )
+        for dof in (0, 2):
+            assert results[case].get_total_reaction(dof) == pytest.approx(
+                reference[case].get_total_reaction(dof), abs=1e-3
+            )
+
+
+def test_rank_threshold_falls_back_to_refactorization_and_rebases(frame_model) -> None:
+    groups = _groups(frame_model)
+    reanalysis = LowRankReanalysis(frame_model, groups, LOAD_CASES, rank_threshold=6)
+    design = {"ground_columns": _scaled(frame_model.sections[3], Iz=3.0)}
+
+    u = reanalysis.solve(design)
+    assert reanalysis.stats.refactorizations == 1
+    reference = _reference(frame_model, groups, design)
+    np.testing.assert_allclose(
+        u[:, 1].reshape(-1, 6),
+        reference["Wx"].node_displacements.array,
+        rtol=1e-7, atol=1e-12,
+    )
+
+    # Same design again is the new base: no update needed
+    reanalysis.solve(design)
+    assert reanalysis.stats.last_rank == 0
+    assert reanalysis.stats.refactorizations == 1
+
+
+def test_frame_sizing_optimizer_evaluates_designs_by_reanalysis(frame_model) -> None:
+    from src.ai.optimizer import create_frame_sizing_optimizer
+
+    groups = _groups(frame_model)
+    reanalysis = LowRankReanalysis(frame_model, {"level_1_beams": groups["level_1_beams"]}, LOAD_CASES)
+    optimizer = create_frame_sizing_optimizer(
+        reanalysis, {"level_1_beams": (300.0, 600.0)}, fcu=40.0, max_displacement=0.05,
+    )
+
+    shallow = {"level_1_beams_width": 300.0, "level_1_beams_depth": 300.0}
+    deep = {"level_1_beams_width": 300.0, "level_1_beams_depth": 900.0}
+    constraint = optimizer.constraints[0]
+    assert optimizer.objective_func(deep) == pytest.approx(3.0 * optimizer.objective_func(shallow))
+    assert constraint.evaluate(shallow) > constraint.evaluate(deep)
+    assert reanalysis.stats.refactorizations == 0
+    assert reanalysis.stats.low_rank_solves == 2
+
+
+def test_unchanged_design_is_not_counted_as_low_rank_solve(frame_model) -> None:
+    groups = _groups(frame_model)
+    reanalysis = LowRankReanalysis(frame_model, groups, LOAD_CASES)
+
+    reanalysis.solve({})
+    assert reanalysis.stats.low_rank_solves == 0
+
+    reanalysis.solve({"ground_columns": _scaled(frame_model.sections[3], Iz=2.0)})
+    assert reanalysis.stats.last_rank > 0
+    assert reanalysis.stats.low_rank_solves == 1
@@ -0,0 +1,134 @@
+import dataclasses
+
+import numpy as np
+import pytest
+
+from src.fem.combination_processor import combine_results, get_applicable_combinations
+from src.fem.load_combinations import LoadCombinationLibrary
+from src.fem.materials import reset_material_tags
+from src.fem.modal_analysis import run_modal_analysis
+from src.fem.model_builder import ModelBuilderOptions, build_fem_model
+from src.fem.response_spectrum import (
+    DesignSpectrum,
+    combine_modal_responses,
+    modal_correlation,
+    run_response_spectrum,
+    with_orthogonal_seismic_cases,
+)
+from src.fem.solver import analyze_model
+from tests.verification.benchmarks import build_benchmark_project_2x3
+
+
+@pytest.fixture(scope="module")
+def model():
+    reset_material_tags()
+    return build_fem_model(build_benchmark_project_2x3(), ModelBuilderOptions())
+
+
+@pytest.fixture(scope="module")
+def modal(model):
+    return run_modal_analysis(model, n_modes=6)
+
+
+def test_design_spectrum_branches() -> None:
+    spectrum = DesignSpectrum(ag=2.0, soil_factor=1.2, TB=0.15, TC=0.5, TD=2.0,
+                              behaviour_factor=2.0, lower_bound=0.2)
+    plateau = 2.0 * 1.2 * 2.5 / 2.0
+    values = spectrum(np.array([0.0, 0.15, 0.3, 1.0, 2.5, 100.0]))
+
+    np.testing.assert_allclose(
+        values,
+        [2.0 * 1.2 * 2.0 / 3.0, plateau, plateau, plateau * 0.5, plateau * 0.5 * 2.0 / 6.25, 0.4],
+    )
+
+
+def test_cqc_correlation_and_combination_match_double_sum() -> None:
+    omega = np.array([5.0, 5.5, 20.0])
+    rho = modal_correlation(omega, damping=0.05)
+
+    np.testing.assert_allclose(np.diag(rho), 1.0)
+    np.testing.assert_allclose(rho, rho.T)
+    assert rho[0, 1] > 0.5 > 0.01 > rho[0, 2]
+    np.testing.assert_array_equal(modal_correlation(omega, method="SRSS"), np.eye(3))
+
+    modal = np.random.default_rng(3).normal(size=(4, 7, 3))
+    expected = np.sqrt(np.einsum('...i,ij,...j->...', modal, rho, modal))
+    np.testing.assert_allclose(combine_modal_responses(modal, rho), expected)
+
+
+def test_single_mode_response_matches_hand_calculation(model, modal) -> None:
+    spectrum = DesignSpectrum()
+    first = dataclasses.replace(
+        modal,
+        periods=modal.periods[:1],
+        frequencies=modal.frequencies[:1],
+        mode_shapes=modal.mode_shapes[:, :1],
+        participation_factors={d: g[:1] for d, g in modal.participation_factors.items()},
+        effective_mass_ratios={d: r[:1] for d, r in modal.effective_mass_ratios.items()},
+    )
+    direction = first.dominant_direction(0)
+    case = "E" + direction
+
+    results = run_response_spectrum(model, spectrum, modal=first)
+
+    omega = 2.0 * np.pi * first.frequencies[0]
+    gamma = first.participation_factors[direction][0]
+    sa = spectrum(first.periods)[0]
+    expected = np.abs(first.mode_shapes[:, 0] * gamma * sa / omega**2).reshape(-1, 6)
+    np.testing.assert_allclose(results[case].node_displacements.array, expected, atol=1e-12)
+
+    # Base shear of one mode is its effective mass times Sa
+    dof = "XY".index(direction)
+    base_nodes = [tag for tag, node in model.nodes.items() if any(node.restraints)]
+    base_shear = results[case].node_reactions.rows_for(base_nodes)[:, dof].sum()
+    assert base_shear == pytest.approx(gamma**2 * sa, rel=1e-6)
+
+
+def test_orthogonal_cases_feed_seismic_combinations(model, modal) -> None:
+    results = analyze_model(model, load_cases=["DL", "SDL", "LL"])
+    results.update(run_response_spectrum(model, modal=modal))
+    results = with_orthogonal_seismic_cases(results)
+
+    tags = list(model.nodes)
+    np.testing.assert_allclose(
+        results["E1"].node_displacements.rows_for(tags),
+        results["EX"].node_displacements.rows_for(tags)
+        + 0.3 * results["EY"].node_displacements.rows_for(tags),
+    )
+
+    seismic = LoadCombinationLibrary.get_uls_seismic_combinations()
+    applicable = get_applicable_combinations(seismic, list(results))
+    assert {comb.name for comb in applicable} == {
+        "LC_SEISMIC_E1_POS", "LC_SEISMIC_E1_NEG", "LC_SEISMIC_E2_POS", "LC_SEISMIC_E2_NEG",
+    }
+    pos, neg = (next(c for c in applicable if c.name == f"LC_SEISMIC_E1_{s}") for s in ("POS", "NEG"))
+    upper = combine_results(results, pos).node_displacements.rows_for(tags)
+    lower = combine_results(results, neg).node_displacements.rows_for(tags)
+    np.testing.assert_allclose(
+        0.5 * (upper - lower), results["E1"].node_displacements.rows_for(tags), atol=1e-12,
+    )
+
+
+def test_shared_solver_is_assembled_and_factorized_once(model, monkeypatch) -> None:
+    from src.fem.modal_analysis import ModalResultCache
+    from src.fem.sparse_solver import SparseFEMSolver
+    import src.fem.modal_analysis as modal_analysis
+
+    monkeypatch.setattr(modal_analysis, "_default_cache", ModalResultCache())
+    calls = []
+    for name in ("assemble", "factorize"):
+        original = getattr(SparseFEMSolver, name)
+        monkeypatch.setattr(SparseFEMSolver, name,
+                            lambda self, _f=original, _n=name: calls.append(_n) or _f(self))
+
+    reference = run_response_spectrum(model, modal=run_modal_analysis(model, n_modes=12))
+    calls.clear()
+    shared = run_response_spectrum(model, solver=SparseFEMSolver(model))
+
+    assert calls == ["factorize", "assemble"]
+    tags = list(model.nodes)
+    np.testing.assert_allclose(
+        shared["EX"].node_displacements.rows_for(tags),
+        reference["EX"].node_displacements.rows_for(tags),
+        rtol=1e-6, atol=1e-12,
+    )
@@ -0,0 +1,93 @@
+import numpy as np
+import pytest
+
+from src.fem.materials import reset_material_tags
+from src.fem.model_builder import ModelBuilderOptions, build_fem_model
+from src.fem.result_store import ResultStore
+from src.fem.solver import analyze_model
+from tests.verification.benchmarks import build_benchmark_project_2x3
+
+pytest.importorskip("openseespy.opensees", reason="OpenSeesPy not available")
+
+LOAD_CASES = ["DL", "LL"]
+
+
+@pytest.fixture(scope="module")
+def model():
+    reset_material_tags()
+    return build_fem_model(build_benchmark_project_2x3(), ModelBuilderOptions())
+
+
+@pytest.fixture(scope="module")
+def solved(model):
+    return analyze_model(model, load_cases=LOAD_CASES)
+
+
+def test_round_trip_preserves_results(model, solved, tmp_path) -> None:
+    store = ResultStore(tmp_path)
+    key = store.key(model, LOAD_CASES)
+
+    assert store.get(key) is None
+    assert store.put(key, solved)
+    loaded = store.get(key)
+
+    assert list(loaded) == LOAD_CASES
+    for case in LOAD_CASES:
+        assert loaded[case].success
+        for field in ("node_displacements", "node_reactions"):
+            expected = getattr(solved[case], field)
+            tags = list(expected)
+            np.testing.assert_array_equal(
+                getattr(loaded[case], field).rows_for(tags), expected.rows_for(tags)
+            )
+        assert dict(loaded[case].element_forces) == dict(solved[case].element_forces)
+
+
+def test_analyze_model_hits_store_without_solving(model, solved, tmp_path, monkeypatch) -> None:
+    store = ResultStore(tmp_path)
+    analyze_model(model, load_cases=LOAD_CASES, store=store)
+    monkeypatch.setattr(type(model), "validate_model", lambda self: pytest.fail("re-solved"))
+
+    cached = analyze_model(model, load_cases=LOAD_CASES, store=store)
+
+    tags = list(model.nodes)
+    np.testing.assert_allclose(
+        cached["LL"].node_displacements.rows_for(tags),
+        solved["LL"].node_displacements.rows_for(tags),
+    )
+
+
+def test_key_depends_on_model_and_request(model) -> None:
+    key = ResultStore.key(model, LOAD_CASES)
+
+    assert key == ResultStore.key(model, list(LOAD_CASES))
+    assert key != ResultStore.key(model, ["LL", "DL"])
+    assert key != ResultStore.key(model, LOAD_CASES, include_element_forces=False)
+    assert key != ResultStore.key(model, LOAD_CASES, backend="scipy")
+    assert key != ResultStore.key(model, LOAD_CASES, sparse_method="pcg")
+    assert key != ResultStore.key(model, LOAD_CASES, autotune=True)
+
+
+def test_solver_options_are_not_served_from_another_run(model, tmp_path) -> None:
+    store = ResultStore(tmp_path)
+    direct = analyze_model(model, load_cases=LOAD_CASES, backend="scipy", store=store)
+    iterative = analyze_model(model, load_cases=LOAD_CASES, sparse_method="pcg", store=store)
+
+    assert direct["DL"].iterations == 0
+    assert iterative["DL"].iterations > 0
+    assert "PCG" in iterative["DL"].message
+    assert len(store.entries()) == 2
+
+
+def test_evicts_least_recently_used_entries(model, solved, tmp_path) -> None:
+    store = ResultStore(tmp_path)
+    for name in ("a", "b"):
+        store.put(name, solved)
+    store.get("a")
+    entry_bytes = store.total_bytes() // 2
+
+    store.max_bytes = int(2.5 * entry_bytes)
+    store.put("c", solved)
+
+    assert sorted(key for key, _, _ in store.entries()) == ["a", "c"]
+    assert store.total_bytes() <= store.max_bytes
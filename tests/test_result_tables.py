@@ -0,0 +1,94 @@
+import pickle
+
+import numpy as np
+import pytest
+
+from src.fem.result_tables import (
+    FRAME_FORCE_KEYS,
+    ElementForceTable,
+    NodeResultTable,
+    superpose_element_tables,
+    superpose_node_tables,
+)
+from src.fem.solver import AnalysisResult
+
+
+def _frame_forces(scale: float) -> dict:
+    return {key: scale * (i + 1) for i, key in enumerate(FRAME_FORCE_KEYS)}
+
+
+def test_node_table_behaves_like_dict_and_exposes_arrays() -> None:
+    table = NodeResultTable({5: [1, 2, 3, 4, 5, 6]})
+    table[2] = [0.5] * 6
+    table[5] = [9.0] * 6
+
+    assert list(table) == [5, 2]
+    assert table[2] == [0.5] * 6
+    assert table.get(99) is None
+    assert table.array.shape == (2, 6)
+    assert table.array.dtype == np.float64
+    assert table.index == {5: 0, 2: 1}
+    assert table == {5: [9.0] * 6, 2: [0.5] * 6}
+    np.testing.assert_array_equal(table.rows_for([2, 7])[:, 0], [0.5, 0.0])
+
+    del table[5]
+    assert dict(table.items()) == {2: [0.5] * 6}
+    with pytest.raises(ValueError):
+        table[3] = [1.0, 2.0]
+
+
+def test_from_arrays_rejects_duplicate_tags() -> None:
+    with pytest.raises(ValueError):
+        NodeResultTable.from_arrays([1, 1], np.zeros((2, 6)))
+
+
+def test_element_table_packs_frames_and_keeps_other_layouts() -> None:
+    table = ElementForceTable({
+        1: _frame_forces(1.0),
+        2: {"N_i": 1.0, "V_i": 2.0, "M_i": 3.0, "N_j": 4.0, "V_j": 5.0, "M_j": 6.0},
+        3: {"force_0": 7.0},
+    })
+
+    assert table.frame_tags.tolist() == [1]
+    assert table.frame_array[0, FRAME_FORCE_KEYS.index("Mz_j")] == 12.0
+    assert set(table.other) == {2, 3}
+    assert table[1] == _frame_forces(1.0)
+    assert table[3] == {"force_0": 7.0}
+    assert len(table) == 3
+
+
+def test_analysis_result_wraps_assigned_dicts() -> None:
+    result = AnalysisResult(
+        success=True,
+        message="ok",
+        node_displacements={1: [0.0, 0.0, -2.0, 0.0, 0.0, 0.0], 2: [0.0, 0.0, 3.0, 0.0, 0.0, 0.0]},
+    )
+    result.node_reactions = {1: [0.0, 0.0, 10.0, 0.0, 0.0, 0.0], 2: [0.0, 0.0, 5.0, 0.0, 0.0, 0.0]}
+    result.element_forces = {7: _frame_forces(2.0)}
+
+    assert isinstance(result.node_displacements, NodeResultTable)
+    assert isinstance(result.element_forces, ElementForceTable)
+    assert result.get_max_displacement(2) == (2, 3.0)
+    assert result.get_total_reaction(2) == 15.0
+    assert AnalysisResult(success=True, message="").element_forces == {}
+
+    restored = pickle.loads(pickle.dumps(result))
+    assert restored.node_reactions == result.node_reactions
+    assert restored.element_forces[7] == _frame_forces(2.0)
+
+
+def test_superposition_aligns_rows_by_tag() -> None:
+    first = NodeResultTable.from_arrays([1, 2], np.ones((2, 6)))
+    second = NodeResultTable.from_arrays([3, 1], np.full((2, 6), 2.0))
+
+    combined = superpose_node_tables([(1.5, first), (-1.0, second), (0.0, {9: [1.0] * 6})])
+
+    assert combined.tags.tolist() == [1, 2, 3]
+    np.testing.assert_allclose(combined.array[:, 0], [-0.5, 1.5, -2.0])
+
+    forces = superpose_element_tables([
+        (1.0, ElementForceTable({1: _frame_forces(1.0), 4: {"force_0": 1.0}})),
+        (2.0, ElementForceTable({1: _frame_forces(1.0), 4: {"force_1": 1.0}})),
+    ])
+    assert forces[1] == _frame_forces(3.0)
+    assert forces[4] == {"force_0": 1.0, "force_1": 2.0}
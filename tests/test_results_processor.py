@@ -322,6 +322,28 @@ class TestResultsProcessor:
         assert envelope.Mz_max.max_value == 300.0
         assert envelope.My_max.max_value == 0.0
 
+    def test_element_force_envelopes_materialize_on_lookup(self):
+        """Test that envelopes are built only for elements that are looked up."""
+        forces = {
+            elem_id: {'N_i': 10.0 * elem_id, 'N_j': 10.0 * elem_id, 'Mz_i': float(elem_id)}
+            for elem_id in range(1, 6)
+        }
+        processor = ResultsProcessor()
+        processor.process_load_case_results([LoadCaseResult(
+            combination=LoadCombination.ULS_GRAVITY_1, element_forces=forces,
+            node_displacements={}, reactions={},
+        )])
+
+        envelopes = processor.element_force_envelopes
+        assert len(envelopes) == 5
+        assert envelopes._cache == {}
+
+        critical = processor.get_critical_elements(n_elements=2, criterion="axial")
+        assert [(elem_id, value) for elem_id, value, _ in critical] == [(5, 50.0), (4, 40.0)]
+        assert sorted(envelopes._cache) == [4, 5]
+        assert "Total elements enveloped: 5" in processor.export_envelope_summary()
+        assert sorted(envelopes._cache) == [4, 5]
+
     def test_element_force_envelope_max_tracking(self):
         """Test that maximum values are tracked correctly across multiple load cases."""
         processor = ResultsProcessor()
@@ -0,0 +1,133 @@
+import numpy as np
+import pytest
+
+from src.core.data_models import WindResult
+from src.fem.materials import ConcreteProperties, get_elastic_beam_section, reset_material_tags
+from src.fem.model_builder import ModelBuilderOptions, build_fem_model
+from src.fem.reanalysis import LowRankReanalysis
+from src.fem.sensitivity import (
+    SectionSensitivity,
+    column_drift_responses,
+    element_moment_responses,
+    rectangular_section_derivatives,
+)
+from tests.verification.benchmarks import build_benchmark_project_2x3
+
+LOAD_CASES = ["DL", "Wx"]
+SIZES = {"ground_columns": (500.0, 550.0), "level_1_beams": (300.0, 650.0)}
+
+
+@pytest.fixture(scope="module")
+def sensitivity():
+    reset_material_tags()
+    project = build_benchmark_project_2x3()
+    project.wind_result = WindResult(base_shear=600.0, base_shear_x=600.0, base_shear_y=300.0)
+    model = build_fem_model(
+        project,
+        ModelBuilderOptions(include_core_wall=False, include_slabs=True, apply_wind_loads=True),
+    )
+    groups = {
+        "ground_columns": [
+            tag for tag, elem in model.elements.items()
+            if elem.section_tag == 3 and model.nodes[elem.node_tags[0]].z < 4.0
+        ],
+        "level_1_beams": [
+            tag for tag, elem in model.elements.items()
+            if elem.section_tag == 1 and model.nodes[elem.node_tags[0]].z == pytest.approx(4.0)
+        ][:8],
+    }
+    # Both groups change at once (rank > default threshold); stay low-rank
+    reanalysis = LowRankReanalysis(model, groups, LOAD_CASES, rank_threshold=400)
+    return SectionSensitivity(reanalysis, SIZES)
+
+
+def _central_difference(sensitivity, evaluate, variable: str, step: float = 0.5) -> np.ndarray:
+    group, size = variable.rsplit("_", 1)
+    index = 0 if size == "width" else 1
+    values = []
+    for sign in (1.0, -1.0):
+        sizes = dict(SIZES)
+        perturbed = list(sizes[group])
+        perturbed[index] += sign * step
+        sizes[group] = tuple(perturbed)
+        sensitivity.set_sizes(sizes)
+        values.append(evaluate())
+    sensitivity.set_sizes(SIZES)
+    return (values[0] - values[1]) / (2 * step)
+
+
+def test_section_derivatives_match_material_formulas() -> None:
+    concrete = ConcreteProperties(fcu=40.0)
+    for width, depth in ((300.0, 700.0), (600.0, 400.0), (250.0, 1000.0)):
+        section = rectangular_section_derivatives(width, depth)
+        expected = get_elastic_beam_section(concrete, width, depth, 1)
+        np.testing.assert_allclose(section["value"], [expected[k] for k in ("A", "J", "Iy", "Iz")])
+        for size, (dw, dd) in (("d_width", (1e-3, 0.0)), ("d_depth", (0.0, 1e-3))):
+            plus = get_elastic_beam_section(concrete, width + dw, depth + dd, 1)
+            minus = get_elastic_beam_section(concrete, width - dw, depth - dd, 1)
+            numeric = [(plus[k] - minus[k]) / 2e-3 for k in ("A", "J", "Iy", "Iz")]
+            np.testing.assert_allclose(section[size], numeric, rtol=1e-5)
+
+
+def test_adjoint_gradients_match_finite_differences(sensitivity) -> None:
+    model = sensitivity.reanalysis.model
+    groups = sensitivity.reanalysis.groups
+    responses = [
+        column_drift_responses(model, groups["ground_columns"].tolist()[:1])[0],
+        element_moment_responses(groups["level_1_beams"].tolist()[:1])[0],
+        element_moment_responses(groups["ground_columns"].tolist()[:1], axis="My")[1],
+    ]
+    results = sensitivity.gradients(responses)
+    solves_before = sensitivity.reanalysis.stats.refactorizations
+
+    for index, result in enumerate(results):
+        for variable in sensitivity.variables:
+            numeric = _central_difference(
+                sensitivity, lambda: sensitivity.values(responses)[index], variable
+            )
+            np.testing.assert_allclose(
+                result.gradient[variable], numeric,
+                rtol=1e-4, atol=1e-9 * max(1.0, np.abs(result.values).max()),
+            )
+    assert sensitivity.reanalysis.stats.refactorizations == solves_before
+
+
+def test_utilization_gradient_matches_finite_differences(sensitivity) -> None:
+    result = sensitivity.flexural_utilization("level_1_beams", fcu=40.0)
+    case = result.governing_case
+    assert 0.0 < result.values[case] < 1.0
+    for variable in sensitivity.variables:
+        numeric = _central_difference(
+            sensitivity,
+            lambda: sensitivity.flexural_utilization("level_1_beams", fcu=40.0).values,
+            variable,
+        )
+        np.testing.assert_allclose(result.gradient[variable][case], numeric[case], rtol=1e-4, atol=1e-12)
+
+
+def test_frame_sizing_optimizer_uses_adjoint_gradients(sensitivity) -> None:
+    from src.ai.optimizer import _get_rule_based_suggestions, create_frame_sizing_optimizer
+
+    reanalysis = sensitivity.reanalysis
+    optimizer = create_frame_sizing_optimizer(
+        reanalysis, SIZES, fcu=40.0, max_displacement=2e-4, utilization_limit=0.9,
+    )
+    assert optimizer.has_analytic_gradient()
+
+    design = optimizer._get_design_dict()
+    assert set(design) == set(sensitivity.variables)
+    analytic = optimizer._analytic_gradient(design)
+    for name, value in analytic.items():
+        step = dict(design)
+        step[name] += 0.5
+        back = dict(design)
+        back[name] -= 0.5
+        numeric = (optimizer._evaluate_objective(step) - optimizer._evaluate_objective(back)) / 1.0
+        assert value == pytest.approx(numeric, rel=1e-3)
+
+    optimizer.config.max_iterations = 5
+    result = optimizer.optimize()
+    assert set(result.sensitivities) == {
+        "objective", "displacement_limit", "utilization_ground_columns", "utilization_level_1_beams",
+    }
+    assert "displacement_limit is most sensitive to" in _get_rule_based_suggestions(result)
@@ -0,0 +1,101 @@
+import json
+
+import numpy as np
+import pytest
+
+from src.fem.materials import reset_material_tags
+from src.fem.model_builder import ModelBuilderOptions, build_fem_model
+from src.fem.solver import analyze_model
+from src.fem.solver_autotune import (
+    CACHE_DIR_ENV,
+    TUNING_FILENAME,
+    SolverAutotuner,
+    SolverConfiguration,
+    candidate_configurations,
+    model_size_class,
+)
+from tests.verification.benchmarks import build_benchmark_project_2x3
+
+pytest.importorskip("openseespy.opensees", reason="OpenSeesPy not available")
+
+CANDIDATES = [
+    SolverConfiguration("Transformation", "RCM", "UmfPack"),
+    SolverConfiguration("Transformation", "AMD", "BandGeneral"),
+    SolverConfiguration("Penalty", "RCM", "UmfPack"),
+]
+
+
+@pytest.fixture(scope="module")
+def model():
+    reset_material_tags()
+    return build_fem_model(build_benchmark_project_2x3(), ModelBuilderOptions())
+
+
+def test_candidates_skip_lagrange_on_rigid_diaphragms(model) -> None:
+    labels = [candidate.label for candidate in candidate_configurations(model)]
+
+    assert labels[0] == "Transformation/RCM/UmfPack"
+    assert not any(label.startswith("Lagrange") for label in labels)
+    assert "Transformation/Plain/BandGeneral" not in labels
+    assert "Penalty/Plain/ProfileSPD" not in labels
+    assert "Transformation/Plain/UmfPack" in labels
+    assert model_size_class(model).endswith("-rd")
+
+
+def test_tuning_persists_fastest_equivalent_choice(model, tmp_path) -> None:
+    path = tmp_path / TUNING_FILENAME
+    tuner = SolverAutotuner(path=path, candidates=CANDIDATES, repeats=1, rtol=1e-9)
+
+    report = tuner.tune(model)
+
+    # 1e14 penalty constraints are close to, but not within 1e-9 of, the reference
+    assert set(report.timings) == {CANDIDATES[0].label, CANDIDATES[1].label}
+    assert report.rejected[CANDIDATES[2].label].startswith("displacements differ")
+    assert report.configuration.label == min(report.timings, key=report.timings.get)
+
+    stored = SolverAutotuner(path=path).lookup(model)
+    assert stored.configuration == report.configuration and not stored.tuned
+    assert json.loads(path.read_text())[report.size_class]["system"] == report.configuration.system
+
+
+def test_slow_candidates_and_budget_overrun_are_skipped(model, tmp_path) -> None:
+    pruned = SolverAutotuner(path=tmp_path / TUNING_FILENAME, candidates=CANDIDATES[:2],
+                             repeats=2, prune_factor=1e-9).tune(model)
+    assert set(pruned.timings) == {CANDIDATES[0].label}
+    assert pruned.rejected[CANDIDATES[1].label].startswith("slower than")
+
+    budgeted = SolverAutotuner(path=tmp_path / TUNING_FILENAME, candidates=CANDIDATES,
+                               repeats=1, time_budget=0.0).tune(model)
+    assert set(budgeted.timings) == {CANDIDATES[0].label}
+    assert all(reason.startswith("time budget") for reason in budgeted.rejected.values())
+
+
+def test_background_tuning_stores_choice(model, tmp_path) -> None:
+    from src.fem import solver_autotune
+
+    tuner = SolverAutotuner(path=tmp_path / TUNING_FILENAME, candidates=CANDIDATES[:1], repeats=1)
+
+    assert tuner.tune_in_background(model)
+    assert not tuner.tune_in_background(model)  # already running for this size class
+    solver_autotune._background_runs[(str(tuner.path), model_size_class(model))].join(timeout=120)
+
+    assert tuner.lookup(model).configuration == CANDIDATES[0]
+
+
+def test_analyze_model_reuses_stored_configuration(model, tmp_path, monkeypatch) -> None:
+    monkeypatch.setenv(CACHE_DIR_ENV, str(tmp_path))
+    SolverAutotuner(candidates=CANDIDATES[1:2], repeats=1).tune(model)
+    monkeypatch.setattr(SolverAutotuner, "tune", lambda *args: pytest.fail("re-tuned"))
+
+    tuned = analyze_model(model, load_cases=["DL", "LL"], autotune=True)
+    default = analyze_model(model, load_cases=["DL", "LL"])
+
+    for case in ("DL", "LL"):
+        assert tuned[case].solver_configuration["system"] == "BandGeneral"
+        assert not default[case].solver_configuration
+        tags = list(model.nodes)
+        np.testing.assert_allclose(
+            tuned[case].node_displacements.rows_for(tags),
+            default[case].node_displacements.rows_for(tags),
+            rtol=1e-9, atol=1e-14,
+        )
@@ -0,0 +1,273 @@
+import sys
+
+import numpy as np
+import pytest
+
+from src.core.data_models import WindResult
+from src.fem.fem_engine import (
+    Element,
+    ElementType,
+    FEMModel,
+    Load,
+    Node,
+    RigidDiaphragm,
+    UniformLoad,
+)
+from src.fem.materials import (
+    ConcreteGrade,
+    create_concrete_material,
+    get_elastic_beam_section,
+    get_elastic_membrane_plate_section,
+    get_openseespy_concrete_material,
+)
+from src.fem.model_builder import ModelBuilderOptions, build_fem_model
+from src.fem.solver import analyze_model
+from src.fem.sparse_solver import SparseFEMSolver, assemble_stiffness_system
+from tests.verification.benchmarks import build_benchmark_project_2x3
+
+FIXED = [1, 1, 1, 1, 1, 1]
+
+
+def _beam_section(model: FEMModel, tag: int = 1) -> dict:
+    concrete = create_concrete_material(ConcreteGrade.C30)
+    model.add_material(1, get_openseespy_concrete_material(concrete, 1))
+    section = get_elastic_beam_section(concrete, width=300, height=500, section_tag=tag)
+    model.add_section(tag, section)
+    return section
+
+
+def _cantilever(length: float = 4.0) -> FEMModel:
+    model = FEMModel()
+    model.add_node(Node(1, 0.0, 0.0, 0.0, restraints=list(FIXED)))
+    model.add_node(Node(2, length, 0.0, 0.0))
+    _beam_section(model)
+    model.add_element(Element(
+        tag=1,
+        element_type=ElementType.ELASTIC_BEAM,
+        node_tags=[1, 2],
+        material_tag=1,
+        section_tag=1,
+        geometry={"vecxz": (0.0, 0.0, 1.0)},
+    ))
+    return model
+
+
+def test_cantilever_tip_deflection_matches_beam_theory() -> None:
+    model = _cantilever(length=4.0)
+    model.add_load(Load(node_tag=2, load_values=[0, 10e3, 0, 0, 0, 0], load_pattern=1))
+    model.add_load(Load(node_tag=2, load_values=[0, 0, -20e3, 0, 0, 0], load_pattern=2))
+    section = model.sections[1]
+
+    results = SparseFEMSolver(model).analyze_load_cases(["DL", "SDL"])
+
+    assert results["DL"].success and results["SDL"].success
+    expected_y = 10e3 * 4.0**3 / (3 * section["E"] * section["Iz"])
+    expected_z = -20e3 * 4.0**3 / (3 * section["E"] * section["Iy"])
+    assert results["DL"].node_displacements[2][1] == pytest.approx(expected_y, rel=1e-10)
+    assert results["SDL"].node_displacements[2][2] == pytest.approx(expected_z, rel=1e-10)
+    assert results["SDL"].node_reactions[1][2] == pytest.approx(20e3, rel=1e-10)
+    assert results["SDL"].element_forces[1]["Vz_i"] == pytest.approx(20e3, rel=1e-10)
+
+
+def test_fixed_beam_uniform_load_gives_fixed_end_moments() -> None:
+    model = _cantilever(length=6.0)
+    model.nodes[2].restraints = list(FIXED)
+    model.add_uniform_load(UniformLoad(element_tag=1, load_type="Gravity", magnitude=12e3))
+
+    result = SparseFEMSolver(model).analyze_load_cases(["DL"])["DL"]
+
+    forces = result.element_forces[1]
+    assert forces["Vy_i"] == pytest.approx(12e3 * 6.0 / 2, rel=1e-10)
+    assert forces["Mz_i"] == pytest.approx(12e3 * 6.0**2 / 12, rel=1e-10)
+    assert forces["Mz_j"] == pytest.approx(-12e3 * 6.0**2 / 12, rel=1e-10)
+    assert result.get_total_reaction(1) == pytest.approx(12e3 * 6.0, rel=1e-10)
+
+
+def test_rigid_diaphragm_ties_slaves_to_master() -> None:
+    model = FEMModel()
+    _beam_section(model)
+    for i, (x, y) in enumerate([(0.0, 0.0), (6.0, 0.0), (0.0, 4.0)], start=1):
+        model.add_node(Node(i, x, y, 0.0, restraints=list(FIXED)))
+        model.add_node(Node(10 + i, x, y, 3.0))
+        model.add_element(Element(
+            tag=i,
+            element_type=ElementType.BEAM_COLUMN,
+            node_tags=[i, 10 + i],
+            material_tag=1,
+            section_tag=1,
+            geometry={"vecxz": (0.0, 1.0, 0.0)},
+        ))
+    model.add_node(Node(90001, 2.0, 1.0, 3.0, restraints=[0, 0, 1, 1, 1, 0]))
+    model.add_rigid_diaphragm(RigidDiaphragm(master_node=90001, slave_nodes=[11, 12, 13]))
+    model.add_load(Load(node_tag=90001, load_values=[50e3, 0, 0, 0, 0, 20e3], load_pattern=4))
+
+    result = SparseFEMSolver(model).analyze_load_cases(["Wx"])["Wx"]
+
+    master = result.node_displacements[90001]
+    for slave in (11, 12, 13):
+        node = model.nodes[slave]
+        disp = result.node_displacements[slave]
+        assert disp[0] == pytest.approx(master[0] - (node.y - 1.0) * master[5], rel=1e-9)
+        assert disp[1] == pytest.approx(master[1] + (node.x - 2.0) * master[5], rel=1e-9)
+        assert disp[5] == pytest.approx(master[5], rel=1e-9)
+    base_fx = sum(result.node_reactions[tag][0] for tag in (1, 2, 3))
+    assert base_fx == pytest.approx(-50e3, rel=1e-9)
+
+
+@pytest.mark.parametrize("node_count", [3, 4])
+def test_shell_stiffness_has_six_rigid_body_modes(node_count: int) -> None:
+    model = FEMModel()
+    points = [(0.0, 0.0, 0.0), (2.0, 0.1, 0.0), (2.2, 1.8, 0.3), (-0.1, 1.5, 0.3)]
+    for tag, (x, y, z) in enumerate(points[:node_count], start=1):
+        model.add_node(Node(tag, x, y, z))
+    concrete = create_concrete_material(ConcreteGrade.C40)
+    model.add_section(1, get_elastic_membrane_plate_section(concrete, 0.2, section_tag=1))
+    element_type = ElementType.SHELL_MITC4 if node_count == 4 else ElementType.SHELL_DKGT
+    model.add_element(Element(
+        tag=1,
+        element_type=element_type,
+        node_tags=list(range(1, node_count + 1)),
+        material_tag=1,
+        section_tag=1,
+    ))
+
+    system = assemble_stiffness_system(model)
+    eigenvalues = np.linalg.eigvalsh(system.stiffness.toarray())
+
+    scale = eigenvalues.max()
+    assert np.sum(np.abs(eigenvalues) < 1e-9 * scale) == 6
+    assert eigenvalues.min() > -1e-9 * scale
+
+
+def test_analyze_model_scipy_backend_handles_combined_case() -> None:
+    model = _cantilever()
+    model.add_load(Load(node_tag=2, load_values=[0, 0, -1e3, 0, 0, 0], load_pattern=1))
+    model.add_load(Load(node_tag=2, load_values=[0, 0, -2e3, 0, 0, 0], load_pattern=3))
+
+    results = analyze_model(model, backend="scipy")
+
+    assert list(results) == ["combined"]
+    assert results["combined"].success
+    assert results["combined"].get_total_reaction(2) == pytest.approx(3e3, rel=1e-10)
+
+
+def test_analyze_model_falls_back_to_scipy_when_opensees_missing(monkeypatch) -> None:
+    monkeypatch.setitem(sys.modules, "openseespy", None)
+    monkeypatch.setitem(sys.modules, "openseespy.opensees", None)
+    model = _cantilever()
+    model.add_load(Load(node_tag=2, load_values=[0, 0, -1e3, 0, 0, 0], load_pattern=1))
+
+    results = analyze_model(model, load_cases=["DL", "LL"])
+
+    assert results["DL"].success
+    assert "scipy sparse" in results["DL"].message
+    assert results["LL"].success
+    assert results["LL"].get_max_displacement(2)[1] == 0.0
+
+    opensees_only = analyze_model(model, load_cases=["DL"], backend="opensees")
+    assert not opensees_only["DL"].success
+    assert "OpenSeesPy not available" in opensees_only["DL"].message
+
+
+def test_element_type_filter_skips_unwanted_force_recovery() -> None:
+    model = _cantilever()
+    model.add_load(Load(node_tag=2, load_values=[0, 0, -1e3, 0, 0, 0], load_pattern=1))
+
+    skipped = analyze_model(
+        model, load_cases=["DL"], backend="scipy", element_types=[ElementType.SHELL_MITC4],
+    )["DL"]
+    kept = analyze_model(
+        model, load_cases=["DL"], backend="scipy", element_types=[ElementType.ELASTIC_BEAM],
+    )["DL"]
+
+    assert skipped.success and len(skipped.element_forces) == 0
+    assert kept.element_forces[1]["Vz_i"] == pytest.approx(1e3, rel=1e-10)
+
+
+def test_sparse_solver_reports_singular_model() -> None:
+    model = _cantilever()
+    model.nodes[1].restraints = [0, 0, 0, 0, 0, 0]
+    model.add_load(Load(node_tag=2, load_values=[0, 0, -1e3, 0, 0, 0], load_pattern=1))
+
+    results = analyze_model(model, load_cases=["DL"], backend="scipy")
+
+    assert not results["DL"].success
+
+
+def _compare_results(reference, candidate, rel: float) -> None:
+    tags = sorted(reference.node_displacements)
+    ref_disp = np.array([reference.node_displacements[t] for t in tags])
+    new_disp = np.array([candidate.node_displacements[t] for t in tags])
+    assert np.abs(new_disp - ref_disp).max() <= rel * np.abs(ref_disp).max()
+
+    assert set(candidate.element_forces) == set(reference.element_forces)
+    force_scale = max(
+        abs(v) for forces in reference.element_forces.values() for v in forces.values()
+    )
+    force_error = max(
+        abs(candidate.element_forces[tag][key] - value)
+        for tag, forces in reference.element_forces.items()
+        for key, value in forces.items()
+    )
+    assert force_error <= rel * force_scale
+
+    for dof in range(3):
+        assert candidate.get_total_reaction(dof) == pytest.approx(
+            reference.get_total_reaction(dof), rel=1e-6, abs=1e-3
+        )
+
+
+@pytest.mark.integration
+def test_scipy_backend_matches_opensees_on_frame_and_slab_model() -> None:
+    pytest.importorskip("openseespy.opensees", reason="OpenSeesPy not available")
+
+    project = build_benchmark_project_2x3()
+    project.geometry.floors = 3
+    project.wind_result = WindResult(base_shear=900.0, base_shear_x=900.0, base_shear_y=600.0)
+    model = build_fem_model(
+        project,
+        ModelBuilderOptions(
+            include_core_wall=False,
+            include_slabs=True,
+            apply_gravity_loads=True,
+            apply_wind_loads=True,
+            apply_rigid_diaphragms=True,
+        ),
+    )
+    load_cases = ["DL", "SDL", "LL", "Wx", "Wy", "Wtz"]
+
+    reference = analyze_model(model, load_cases=load_cases, backend="opensees")
+    candidate = analyze_model(model, load_cases=load_cases, backend="scipy")
+
+    for lc in load_cases:
+        assert reference[lc].success and candidate[lc].success
+        _compare_results(reference[lc], candidate[lc], rel=1e-8)
+
+
+@pytest.mark.integration
+def test_scipy_backend_matches_opensees_on_triangle_shells() -> None:
+    pytest.importorskip("openseespy.opensees", reason="OpenSeesPy not available")
+
+    project = build_benchmark_project_2x3()
+    project.geometry.floors = 2
+    project.wind_result = WindResult(base_shear=600.0, base_shear_x=600.0, base_shear_y=400.0)
+    model = build_fem_model(
+        project,
+        ModelBuilderOptions(
+            include_core_wall=False,
+            include_slabs=True,
+            apply_gravity_loads=True,
+            apply_wind_loads=True,
+            apply_rigid_diaphragms=True,
+            shell_mesh_type="tri",
+        ),
+    )
+    assert any(e.element_type == ElementType.SHELL_DKGT for e in model.elements.values())
+    load_cases = ["DL", "Wx"]
+
+    reference = analyze_model(model, load_cases=load_cases, backend="opensees")
+    candidate = analyze_model(model, load_cases=load_cases, backend="scipy")
+
+    for lc in load_cases:
+        assert reference[lc].success and candidate[lc].success
+        _compare_results(reference[lc], candidate[lc], rel=1e-3)
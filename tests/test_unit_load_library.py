@@ -0,0 +1,94 @@
+import copy
+
+import numpy as np
+import pytest
+
+from src.core.data_models import WindResult
+from src.fem.materials import reset_material_tags
+from src.fem.model_builder import ModelBuilderOptions, build_fem_model, update_fem_model_loads
+from src.fem.sparse_solver import analyze_model_sparse
+from src.fem.unit_load_library import LIBRARY_LOAD_CASES, UnitLoadLibrary
+from tests.verification.benchmarks import build_benchmark_project_2x3
+
+OPTIONS = ModelBuilderOptions(apply_wind_loads=True)
+
+
+@pytest.fixture(scope="module")
+def project():
+    project = build_benchmark_project_2x3()
+    project.wind_result = WindResult(base_shear=600.0, base_shear_x=600.0, base_shear_y=300.0)
+    return project
+
+
+@pytest.fixture(scope="module")
+def model(project):
+    reset_material_tags()
+    return build_fem_model(project, OPTIONS)
+
+
+def _edited(project):
+    edited = copy.deepcopy(project)
+    edited.loads.dead_load = 3.7
+    edited.loads.live_load_class = "9"
+    edited.loads.custom_live_load = 6.0
+    edited.wind_result = WindResult(base_shear=900.0, base_shear_x=900.0, base_shear_y=200.0)
+    return edited
+
+
+def test_library_reproduces_solved_cases_of_the_model(project, model) -> None:
+    library = UnitLoadLibrary(model)
+    results = library.load_case_results(project)
+    reference = analyze_model_sparse(model, list(LIBRARY_LOAD_CASES))
+    tags = list(model.nodes)
+
+    for case in LIBRARY_LOAD_CASES:
+        np.testing.assert_allclose(
+            results[case].node_displacements.rows_for(tags),
+            reference[case].node_displacements.rows_for(tags),
+            rtol=1e-9, atol=1e-14,
+        )
+
+
+def test_edited_load_magnitudes_match_patched_model_resolve(project, model) -> None:
+    library = UnitLoadLibrary(model)
+    edited = _edited(project)
+    results = library.load_case_results(edited)
+
+    patched = copy.deepcopy(model)
+    assert update_fem_model_loads(patched, edited, OPTIONS)
+    reference = analyze_model_sparse(patched, list(LIBRARY_LOAD_CASES))
+
+    for case in LIBRARY_LOAD_CASES:
+        np.testing.assert_allclose(
+            results[case].element_forces.frame_array,
+            reference[case].element_forces.frame_array,
+            rtol=1e-9, atol=1e-6,
+        )
+        for dof in range(3):
+            assert results[case].get_total_reaction(dof) == pytest.approx(
+                reference[case].get_total_reaction(dof), abs=1e-3
+            )
+    original = library.load_case_results(project, ["LL"])["LL"]
+    assert results["LL"].get_total_reaction(2) == pytest.approx(
+        6.0 / project.loads.live_load * original.get_total_reaction(2)
+    )
+
+
+def test_frame_only_library_drops_shell_forces(project, model) -> None:
+    from src.fem.sparse_solver import FRAME_ELEMENT_TYPES
+
+    full = UnitLoadLibrary(model).load_case_results(project, ["DL"])["DL"]
+    frames = UnitLoadLibrary(model, element_types=FRAME_ELEMENT_TYPES).load_case_results(
+        project, ["DL"]
+    )["DL"]
+
+    assert full.element_forces.other
+    assert not frames.element_forces.other
+    np.testing.assert_array_equal(frames.element_forces.frame_tags, full.element_forces.frame_tags)
+    np.testing.assert_allclose(frames.element_forces.frame_array, full.element_forces.frame_array)
+
+
+def test_patching_loads_requires_rebuild_when_loaded_elements_change(project, model) -> None:
+    edited = copy.deepcopy(project)
+    edited.loads.dead_load = 0.0
+    assert not update_fem_model_loads(copy.deepcopy(model), edited, OPTIONS)
@@ -1,11 +1,21 @@
 """Unit tests for canonical W1-W24 wind case synthesis."""
 
+import numpy as np
 import pytest
 
+from src.core.data_models import LoadCombination
+from src.fem.combination_processor import combine_results, combine_results_batch
+from src.fem.load_combinations import (
+    LoadCombinationCategory,
+    LoadCombinationDefinition,
+    LoadComponentType,
+)
 from src.fem.solver import AnalysisResult
 from src.fem.wind_case_synthesizer import (
     COMPONENT_CASE_KEYS,
     WIND_CASE_COEFFICIENTS,
+    WIND_CASE_NAMES,
+    WIND_COEFFICIENT_MATRIX,
     synthesize_w1_w24_cases,
     with_synthesized_w1_w24_cases,
 )
@@ -176,3 +186,59 @@ def test_with_synthesized_returns_originals_when_component_fails() -> None:
     assert merged["Wtz"] is wtz  # original preserved
     assert "W1" not in merged  # no synthesis attempted
     assert "W24" not in merged
+
+
+def test_synthesized_cases_materialize_only_on_lookup() -> None:
+    synthesized = synthesize_w1_w24_cases(
+        {
+            "Wx": _build_result(scale=2.0),
+            "Wy": _build_result(scale=3.0),
+            "Wtz": _build_result(scale=4.0),
+        }
+    )
+
+    assert len(synthesized) == 24
+    assert list(synthesized) == list(WIND_CASE_NAMES)
+    assert not any(synthesized.is_materialized(name) for name in WIND_CASE_NAMES)
+
+    w7 = synthesized["W7"]
+    assert synthesized["W7"] is w7
+    assert synthesized.is_materialized("W7")
+    assert not synthesized.is_materialized("W8")
+    assert WIND_COEFFICIENT_MATRIX.shape == (24, 3)
+    np.testing.assert_allclose(
+        WIND_COEFFICIENT_MATRIX[WIND_CASE_NAMES.index("W7")],
+        WIND_CASE_COEFFICIENTS["W7"],
+    )
+
+
+def test_combinations_fold_lazy_wind_cases_into_components() -> None:
+    merged = with_synthesized_w1_w24_cases(
+        {
+            "DL": _build_result(scale=1.0),
+            "Wx": _build_result(scale=2.0),
+            "Wy": _build_result(scale=3.0),
+            "Wtz": _build_result(scale=4.0),
+        }
+    )
+    combo = LoadCombinationDefinition(
+        name="TEST_W",
+        combination_type=LoadCombination.ULS_WIND_1,
+        category=LoadCombinationCategory.ULS_WIND,
+        load_factors={
+            LoadComponentType.DL: 1.2,
+            LoadComponentType.W5: 1.4,
+            LoadComponentType.W18: -0.5,
+        },
+        description="test",
+        code_clause="test",
+    )
+
+    batched = combine_results_batch(merged, [combo])["TEST_W"]
+    single = combine_results(merged, combo)
+
+    assert not any(merged.is_materialized(name) for name in WIND_CASE_NAMES)
+    expected = 1.2 * 1.0 + 1.4 * merged["W5"].node_displacements[1][0] - 0.5 * merged["W18"].node_displacements[1][0]
+    assert batched.node_displacements[1][0] == pytest.approx(expected)
+    assert single.node_displacements[1][0] == pytest.approx(expected)
+    assert batched.element_forces[100]["Mz_j"] == pytest.approx(single.element_forces[100]["Mz_j"])
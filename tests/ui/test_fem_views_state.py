@@ -11,6 +11,7 @@ def test_clear_analysis_state_removes_combination_cache():
     st.session_state["fem_combined_results_cache"] = {"LC1": object()}
     st.session_state["fem_analysis_status"] = "success"
     st.session_state["fem_analysis_message"] = "done"
+    st.session_state["fem_modal_result"] = object()
     st.session_state["fem_inputs_locked"] = True
 
     _clear_analysis_state()
@@ -20,4 +21,135 @@ def test_clear_analysis_state_removes_combination_cache():
     assert "fem_combined_results_cache" not in st.session_state
     assert "fem_analysis_status" not in st.session_state
     assert "fem_analysis_message" not in st.session_state
+    assert "fem_modal_result" not in st.session_state
     assert st.session_state["fem_inputs_locked"] is False
+
+
+def test_clear_analysis_state_closes_combination_cache():
+    from src.fem.combination_cache import CombinedResultsCache
+
+    cache = CombinedResultsCache()
+    closed = []
+    cache.close = lambda: closed.append(True)
+    st.session_state["fem_combined_results_cache"] = cache
+
+    _clear_analysis_state()
+
+    assert closed == [True]
+    assert "fem_combined_results_cache" not in st.session_state
+
+
+def _small_project():
+    from src.core.data_models import BeamResult, GeometryInput, ProjectData
+
+    return ProjectData(
+        geometry=GeometryInput(bay_x=6.0, bay_y=6.0, floors=2, num_bays_x=1, num_bays_y=1),
+        primary_beam_result=BeamResult(element_type="Beam", size="300x600", width=300, depth=600),
+    )
+
+
+def _counting_builds(monkeypatch):
+    from src.fem.model_builder import build_fem_model
+    from src.fem.model_cache import ModelCache
+    import src.ui.views.fem_views as fem_views
+
+    builds = []
+    cache = ModelCache()
+    monkeypatch.setattr(fem_views, "build_fem_model",
+                        lambda project, options: builds.append(options) or build_fem_model(project, options))
+    monkeypatch.setattr(fem_views, "_get_model_cache", lambda: cache)
+    st.session_state.clear()
+    return fem_views, builds
+
+
+def test_toggling_between_configurations_reuses_cached_models(monkeypatch):
+    from src.fem.model_builder import ModelBuilderOptions
+
+    fem_views, builds = _counting_builds(monkeypatch)
+    project = _small_project()
+    coarse = ModelBuilderOptions(include_core_wall=False, shell_mesh_density="coarse")
+    fine = ModelBuilderOptions(include_core_wall=False, shell_mesh_density="fine")
+
+    first = fem_views._get_or_build_cached_model(project, coarse)
+    second = fem_views._get_or_build_cached_model(project, fine)
+    again = fem_views._get_or_build_cached_model(project, coarse)
+    fem_views._get_or_build_cached_model(project, fine)
+
+    assert len(builds) == 2
+    assert again is not first
+    assert again.fingerprint() == first.fingerprint() != second.fingerprint()
+
+
+def test_size_and_load_edits_patch_without_rebuilding(monkeypatch):
+    from dataclasses import replace
+    from src.fem.model_builder import ModelBuilderOptions
+
+    fem_views, builds = _counting_builds(monkeypatch)
+    project = _small_project()
+    options = ModelBuilderOptions(include_core_wall=False)
+    model = fem_views._get_or_build_cached_model(project, options)
+
+    project.primary_beam_result = replace(project.primary_beam_result, depth=750)
+    assert fem_views._get_or_build_cached_model(project, options) is model
+    project.loads = replace(project.loads, dead_load=4.0)
+    assert fem_views._get_or_build_cached_model(project, options) is model
+
+    st.session_state.clear()
+    restored = fem_views._get_or_build_cached_model(project, options)
+    assert restored is not model
+    assert restored.fingerprint() == model.fingerprint()
+    assert len(builds) == 1
+
+
+def test_unit_library_is_solved_on_first_load_edit_and_reused(monkeypatch):
+    from dataclasses import replace
+    from src.fem.model_builder import ModelBuilderOptions
+    from src.fem.sparse_solver import analyze_model_sparse
+
+    fem_views, _ = _counting_builds(monkeypatch)
+    libraries = []
+    library_class = fem_views.UnitLoadLibrary
+    monkeypatch.setattr(fem_views, "UnitLoadLibrary",
+                        lambda *args, **kwargs: libraries.append(library_class(*args, **kwargs))
+                        or libraries[-1])
+    project = _small_project()
+    options = ModelBuilderOptions(include_core_wall=False)
+    model = fem_views._get_or_build_cached_model(project, options)
+    model_key = fem_views._get_cache_key(project, options) + fem_views._get_section_cache_key(project, options)
+
+    def run():
+        st.session_state["fem_analysis_results_dict"] = analyze_model_sparse(model, ["DL", "SDL", "LL"])
+        fem_views._track_unit_library(model_key)
+
+    run()
+    assert libraries == []
+    project.loads = replace(project.loads, dead_load=4.0)
+    assert fem_views._get_or_build_cached_model(project, options) is model
+    assert len(libraries) == 1
+    assert "fem_analysis_results_dict" in st.session_state
+
+    run()
+    project.loads = replace(project.loads, dead_load=5.0)
+    fem_views._get_or_build_cached_model(project, options)
+    assert len(libraries) == 1
+    assert st.session_state["fem_unit_load_library"][1] is libraries[0]
+
+
+def test_design_outputs_do_not_change_model_keys():
+    from dataclasses import replace
+    from src.core.data_models import LoadCombination
+    from src.fem.model_builder import ModelBuilderOptions
+    from src.ui.views.fem_views import _get_cache_key, _get_load_cache_key, _get_section_cache_key
+
+    project = _small_project()
+    options = ModelBuilderOptions()
+    keys = (_get_cache_key(project, options), _get_section_cache_key(project, options),
+            _get_load_cache_key(project))
+
+    project.project_name = "Tower B"
+    project.load_combination = LoadCombination.SLS_CHARACTERISTIC
+    project.reinforcement = replace(project.reinforcement, max_rho_beam=2.0)
+    project.primary_beam_result = replace(project.primary_beam_result, moment=250.0)
+
+    assert keys == (_get_cache_key(project, options), _get_section_cache_key(project, options),
+                    _get_load_cache_key(project))